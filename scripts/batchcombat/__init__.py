@@ -0,0 +1,13 @@
+# NumPy batch evaluator for single-attacker, multi-blocker combats (offline balance analysis).
+# Cross-checked against the TypeScript engine with golden fixtures from scripts/combatFixtures.ts.
+
+from .encoding import (
+    COMBAT_KEYWORDS, GOLDEN_FIXTURE, KEYWORD_FLAGS, CombatBatch, Creatures, combat_batch, creatures, keyword_mask,
+    load_golden, random_batch,
+)
+from .resolve import BatchOutcome, resolve_batch
+
+__all__ = [
+    'COMBAT_KEYWORDS', 'GOLDEN_FIXTURE', 'KEYWORD_FLAGS', 'BatchOutcome', 'CombatBatch', 'Creatures', 'combat_batch',
+    'creatures', 'keyword_mask', 'load_golden', 'random_batch', 'resolve_batch',
+]
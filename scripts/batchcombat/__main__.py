@@ -0,0 +1,36 @@
+# Resolves a large seeded batch of random combats and prints throughput and outcome rates.
+#
+#   python3 -m scripts.batchcombat
+#   python3 -m scripts.batchcombat --combats 5000000 --max-blockers 3 --density 0.5 --seed 7
+
+import argparse
+import time
+
+from .encoding import random_batch
+from .resolve import resolve_batch
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python3 -m scripts.batchcombat', description='Resolve random single-attacker combats in one batch.')
+    parser.add_argument('--combats', type=int, default=1_000_000)
+    parser.add_argument('--max-blockers', type=int, default=4)
+    parser.add_argument('--density', type=float, default=0.3, help='chance of each combat keyword on each creature')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    batch = random_batch(args.combats, args.max_blockers, args.density, args.seed)
+    started = time.perf_counter()
+    outcome = resolve_batch(batch)
+    seconds = time.perf_counter() - started
+
+    blocked = (batch.blockers >= 0).any(axis=1)
+    print(f'{len(batch):,} combats in {seconds:.2f}s ({len(batch) / seconds:,.0f}/s)')
+    print(f'Blocked: {blocked.mean():.1%}, attacker dies: {outcome.attacker_dies.mean():.1%}, '
+          f'blockers lost per block: {outcome.blocker_dies[blocked].sum(axis=1).mean():.2f}')
+    print(f'Damage to defender: {outcome.defender_damage.mean():.2f} per combat, '
+          f'{outcome.defender_damage[blocked].mean():.2f} when blocked')
+    print(f'Life gained per combat: attacker {outcome.attacker_life_gained.mean():.2f}, defender {outcome.defender_life_gained.mean():.2f}')
+
+
+if __name__ == '__main__':
+    main()
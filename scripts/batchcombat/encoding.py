@@ -0,0 +1,108 @@
+# Struct-of-arrays encoding of many single-attacker combats. Creatures live in one table of parallel
+# arrays (printed power and toughness, +1/+1 and -1/-1 counters, keyword bitmask); a combat is an
+# attacker index into that table plus a row of the blocker matrix, blocker indexes in damage assignment
+# order padded with -1. Every combat is resolved on its own, so combats may share creature rows.
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+# Same bits as KEYWORD_FLAGS in src/store/cardStats.ts (the golden fixtures carry a copy to compare).
+KEYWORD_FLAGS = {
+    'Flying': 1 << 0,
+    'Reach': 1 << 1,
+    'Trample': 1 << 2,
+    'Deathtouch': 1 << 3,
+    'First Strike': 1 << 4,
+    'Double Strike': 1 << 5,
+    'Lifelink': 1 << 6,
+    'Vigilance': 1 << 7,
+    'Haste': 1 << 8,
+    'Banding': 1 << 9,
+    'Protection': 1 << 10,
+}
+
+COMBAT_KEYWORDS = ('First Strike', 'Double Strike', 'Deathtouch', 'Trample', 'Lifelink')
+
+GOLDEN_FIXTURE = Path(__file__).parent / 'fixtures' / 'golden.json'
+
+
+def keyword_mask(keywords):
+    mask = 0
+    for name in keywords:
+        mask |= KEYWORD_FLAGS.get(name, 0)
+    return mask
+
+
+@dataclass(frozen=True)
+class Creatures:
+    power: np.ndarray  # printed, before counters
+    toughness: np.ndarray
+    plus_one_counters: np.ndarray
+    minus_one_counters: np.ndarray
+    keywords: np.ndarray
+
+    def __len__(self):
+        return len(self.power)
+
+    # Stats with counters, as getCardStats computes them.
+    def current_power(self):
+        return self.power + self.plus_one_counters - self.minus_one_counters
+
+    def current_toughness(self):
+        return self.toughness + self.plus_one_counters - self.minus_one_counters
+
+
+@dataclass(frozen=True)
+class CombatBatch:
+    creatures: Creatures
+    attacker: np.ndarray  # (n,) creature index
+    blockers: np.ndarray  # (n, max_blockers) creature indexes, -1 for an empty slot
+
+    def __len__(self):
+        return len(self.attacker)
+
+
+def creatures(power, toughness, plus_one_counters=None, minus_one_counters=None, keywords=None):
+    power = np.asarray(power, dtype=np.int32)
+    zeros = np.zeros_like(power)
+    as_int = lambda values: zeros if values is None else np.asarray(values, dtype=np.int32)
+    return Creatures(power, np.asarray(toughness, dtype=np.int32), as_int(plus_one_counters), as_int(minus_one_counters), as_int(keywords))
+
+
+def combat_batch(table: Creatures, attacker, blockers):
+    attacker = np.asarray(attacker, dtype=np.int64)
+    blockers = np.asarray(blockers, dtype=np.int64).reshape(len(attacker), -1)
+    if len(table) == 0 or attacker.min(initial=0) < 0 or max(attacker.max(initial=0), blockers.max(initial=0)) >= len(table):
+        raise ValueError('creature index out of range')
+    return CombatBatch(table, attacker, blockers)
+
+
+# `keyword_density` is the chance of each combat keyword on each creature; the rest of the stats are
+# uniform like the golden fixtures': 0-6 printed, a quarter of creatures with 1-2 of each counter.
+def random_batch(n, max_blockers=4, keyword_density=0.3, seed=None):
+    rng = np.random.default_rng(seed)
+    size = n * (1 + max_blockers)
+    counters = lambda: np.where(rng.integers(0, 4, size) == 0, rng.integers(1, 3, size), 0)
+    keywords = np.zeros(size, dtype=np.int32)
+    for name in COMBAT_KEYWORDS:
+        keywords |= np.where(rng.random(size) < keyword_density, KEYWORD_FLAGS[name], 0).astype(np.int32)
+    table = creatures(rng.integers(0, 7, size), rng.integers(0, 7, size), counters(), counters(), keywords)
+
+    rows = np.arange(n * (1 + max_blockers)).reshape(n, 1 + max_blockers)
+    blocks = rng.integers(0, max_blockers + 1, n)
+    blockers = np.where(np.arange(max_blockers) < blocks[:, None], rows[:, 1:], -1)
+    return combat_batch(table, rows[:, 0], blockers)
+
+
+def load_golden(path=GOLDEN_FIXTURE):
+    fixture = json.loads(Path(path).read_text(encoding='utf-8'))
+    table = fixture['creatures']
+    batch = combat_batch(
+        creatures(table['power'], table['toughness'], table['plusOneCounters'], table['minusOneCounters'], table['keywords']),
+        fixture['attacker'],
+        fixture['blockers'],
+    )
+    return fixture, batch
@@ -0,0 +1,111 @@
+# Vectorized port of resolveCombatSteps (src/store/combatLogic.ts) for boards with one attacker and any
+# number of blockers. Both damage steps run as whole-batch array passes; the only Python loop is over
+# blocker slots, in damage assignment order. Combat-relevant keywords are first strike, double strike,
+# trample, deathtouch and lifelink; flying and reach only decide who may block, which the batch already
+# fixes. Edge cases follow the TypeScript engine, including creatures that start at 0 toughness and
+# negative power from -1/-1 counters.
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .encoding import KEYWORD_FLAGS, CombatBatch
+
+FIRST_STRIKE = KEYWORD_FLAGS['First Strike']
+DOUBLE_STRIKE = KEYWORD_FLAGS['Double Strike']
+TRAMPLE = KEYWORD_FLAGS['Trample']
+DEATHTOUCH = KEYWORD_FLAGS['Deathtouch']
+LIFELINK = KEYWORD_FLAGS['Lifelink']
+
+
+@dataclass(frozen=True)
+class BatchOutcome:
+    attacker_damage: np.ndarray  # (n,) combat damage dealt to the attacker
+    blocker_damage: np.ndarray  # (n, max_blockers)
+    attacker_dies: np.ndarray  # (n,) bool
+    blocker_dies: np.ndarray  # (n, max_blockers) bool, False in empty slots
+    defender_damage: np.ndarray  # (n,) damage to the defending player
+    attacker_life_gained: np.ndarray  # (n,)
+    defender_life_gained: np.ndarray  # (n,)
+
+
+def _lethal(damage, toughness, deathtouched):
+    return (damage >= toughness) | ((damage > 0) & deathtouched)
+
+
+def _strikes(keywords, has_dealt, first_strike_step):
+    if first_strike_step:
+        return (keywords & (FIRST_STRIKE | DOUBLE_STRIKE)) != 0
+    return ~has_dealt | ((keywords & DOUBLE_STRIKE) != 0)
+
+
+def resolve_batch(batch: CombatBatch) -> BatchOutcome:
+    table = batch.creatures
+    power, toughness = table.current_power(), table.current_toughness()
+    n, slots = batch.blockers.shape
+
+    # Blocker arrays are slot-major, (slots, n), so each pass over a slot reads contiguous memory.
+    present = batch.blockers.T >= 0
+    blocked = present.any(axis=0)
+    rows = np.where(present, batch.blockers.T, 0)
+
+    a_power, a_toughness, a_keywords = power[batch.attacker], toughness[batch.attacker], table.keywords[batch.attacker]
+    b_power, b_toughness, b_keywords = power[rows], toughness[rows], table.keywords[rows]
+    a_trample = (a_keywords & TRAMPLE) != 0
+    a_deathtouch = (a_keywords & DEATHTOUCH) != 0
+    a_lifelink = (a_keywords & LIFELINK) != 0
+    b_deathtouch = (b_keywords & DEATHTOUCH) != 0
+    b_lifelink = (b_keywords & LIFELINK) != 0
+
+    a_damage = np.zeros(n, dtype=np.int32)
+    b_damage = np.zeros((slots, n), dtype=np.int32)
+    a_deathtouched = np.zeros(n, dtype=bool)
+    b_deathtouched = np.zeros((slots, n), dtype=bool)
+    a_dealt = np.zeros(n, dtype=bool)
+    b_dealt = np.zeros((slots, n), dtype=bool)
+    defender_damage = np.zeros(n, dtype=np.int32)
+    attacker_life = np.zeros(n, dtype=np.int32)
+    defender_life = np.zeros(n, dtype=np.int32)
+
+    for first_strike_step in (True, False):
+        # Deaths are checked once at the start of the step; damage within a step is simultaneous.
+        a_dead = _lethal(a_damage, a_toughness, a_deathtouched)
+        b_dead = ~present | _lethal(b_damage, b_toughness, b_deathtouched)
+
+        a_deals = ~a_dead & _strikes(a_keywords, a_dealt, first_strike_step)
+        unblocked = a_deals & ~blocked
+        defender_damage += np.where(unblocked, a_power, 0)
+        attacker_life += np.where(unblocked & a_lifelink, a_power, 0)
+
+        # Each living blocker in order takes lethal damage (1 with deathtouch) when the attacker
+        # tramples, and everything that is left otherwise; trample sends the rest to the player.
+        remaining = np.where(a_deals & blocked, a_power, 0)
+        for slot in range(slots):
+            needed = np.where(a_deathtouch, 1, np.maximum(0, b_toughness[slot] - b_damage[slot]))
+            assigned = np.where(a_trample, np.minimum(remaining, needed), remaining)
+            assigned = np.where(~b_dead[slot] & (assigned > 0), assigned, 0)
+            b_damage[slot] += assigned
+            b_deathtouched[slot] |= a_deathtouch & (assigned > 0)
+            attacker_life += np.where(a_lifelink, assigned, 0)
+            remaining -= assigned
+        trample_over = a_deals & blocked & a_trample & (remaining > 0)
+        defender_damage += np.where(trample_over, remaining, 0)
+        attacker_life += np.where(trample_over & a_lifelink, remaining, 0)
+        a_dealt |= a_deals
+
+        b_deals = ~b_dead & ~a_dead & _strikes(b_keywords, b_dealt, first_strike_step)
+        hits = np.where(b_deals, b_power, 0)
+        a_damage += hits.sum(axis=0, dtype=np.int32)
+        a_deathtouched |= (b_deathtouch & (hits > 0)).any(axis=0)
+        defender_life += np.where(b_lifelink, hits, 0).sum(axis=0, dtype=np.int32)
+        b_dealt |= b_deals
+
+    return BatchOutcome(
+        attacker_damage=a_damage,
+        blocker_damage=b_damage.T,
+        attacker_dies=(a_damage >= a_toughness) | a_deathtouched,
+        blocker_dies=(present & ((b_damage >= b_toughness) | b_deathtouched)).T,
+        defender_damage=defender_damage,
+        attacker_life_gained=attacker_life,
+        defender_life_gained=defender_life,
+    )
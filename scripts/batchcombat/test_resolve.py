@@ -0,0 +1,52 @@
+import numpy as np
+
+from .encoding import KEYWORD_FLAGS, combat_batch, creatures, keyword_mask, load_golden, random_batch
+from .resolve import resolve_batch
+
+
+def test_matches_the_typescript_engine_on_the_golden_fixtures():
+    fixture, batch = load_golden()
+    expected = fixture['expected']
+    outcome = resolve_batch(batch)
+
+    assert fixture['keywordFlags'] == KEYWORD_FLAGS
+    np.testing.assert_array_equal(outcome.attacker_damage, expected['attackerDamage'])
+    np.testing.assert_array_equal(outcome.blocker_damage, expected['blockerDamage'])
+    np.testing.assert_array_equal(outcome.attacker_dies, np.asarray(expected['attackerDies'], dtype=bool))
+    np.testing.assert_array_equal(outcome.blocker_dies, np.asarray(expected['blockerDies'], dtype=bool))
+    np.testing.assert_array_equal(outcome.defender_damage, expected['defenderDamage'])
+    np.testing.assert_array_equal(outcome.attacker_life_gained, expected['attackerLifeGained'])
+    np.testing.assert_array_equal(outcome.defender_life_gained, expected['defenderLifeGained'])
+
+
+def test_first_strike_deathtouch_trample_and_lifelink():
+    # 0: 3/3 first strike vs a 2/2: the blocker dies before it strikes back.
+    # 1: 4/4 deathtouch trample vs 5/5 and 1/1: one damage each, two to the player.
+    # 2: 2/2 double strike lifelink, unblocked: four to the player, four life.
+    table = creatures(
+        power=[3, 2, 4, 5, 1, 2],
+        toughness=[3, 2, 4, 5, 1, 2],
+        keywords=[
+            keyword_mask(['First Strike']), 0,
+            keyword_mask(['Deathtouch', 'Trample']), 0, 0,
+            keyword_mask(['Double Strike', 'Lifelink']),
+        ],
+    )
+    outcome = resolve_batch(combat_batch(table, [0, 2, 5], [[1, -1], [3, 4], [-1, -1]]))
+
+    np.testing.assert_array_equal(outcome.attacker_damage, [0, 6, 0])
+    np.testing.assert_array_equal(outcome.blocker_damage, [[3, 0], [1, 1], [0, 0]])
+    np.testing.assert_array_equal(outcome.attacker_dies, [False, True, False])
+    np.testing.assert_array_equal(outcome.blocker_dies, [[True, False], [True, True], [False, False]])
+    np.testing.assert_array_equal(outcome.defender_damage, [0, 2, 4])
+    np.testing.assert_array_equal(outcome.attacker_life_gained, [0, 0, 4])
+
+
+def test_random_batches_are_seeded_and_shaped():
+    a, b = random_batch(1000, max_blockers=3, seed=5), random_batch(1000, max_blockers=3, seed=5)
+    np.testing.assert_array_equal(a.blockers, b.blockers)
+    np.testing.assert_array_equal(resolve_batch(a).defender_damage, resolve_batch(b).defender_damage)
+
+    outcome = resolve_batch(a)
+    assert outcome.blocker_damage.shape == (1000, 3)
+    assert not outcome.blocker_dies[a.blockers < 0].any()
@@ -0,0 +1,51 @@
+// Fails when benchmark throughput regresses against the stored baseline.
+//
+//   npm run bench:gate                     # run the suite, compare with bench-baseline.json
+//   npm run bench:gate -- --threshold 0.1  # allow at most a 10% slowdown
+//   npm run bench:gate -- --update         # accept the current numbers as the new baseline
+//
+// Baselines are machine-specific: record one on the machine (or CI runner class) that runs the gate.
+// When none exists yet, the current results become the baseline and the gate passes.
+import { copyFileSync, existsSync, readFileSync } from 'node:fs';
+import { parseArgs } from 'node:util';
+import { DEFAULT_REGRESSION_THRESHOLD, compareBenchmarks, readBenchReport } from '../src/bench/gate.ts';
+
+const { values, positionals } = parseArgs({
+    allowPositionals: true,
+    options: {
+        baseline: { type: 'string', default: 'bench-baseline.json' },
+        threshold: { type: 'string', default: String(DEFAULT_REGRESSION_THRESHOLD) },
+        update: { type: 'boolean', default: false }
+    }
+});
+
+const resultsPath = positionals[0] || 'bench-results.json';
+const baselinePath = values.baseline;
+const read = (path: string) => readBenchReport(JSON.parse(readFileSync(path, 'utf8')));
+const percent = (change: number) => `${change >= 0 ? '+' : ''}${(change * 100).toFixed(1)}%`;
+
+const current = read(resultsPath);
+
+if (values.update || !existsSync(baselinePath)) {
+    copyFileSync(resultsPath, baselinePath);
+    console.log(`Saved ${current.length} benchmarks as the baseline in ${baselinePath}`);
+    process.exit(0);
+}
+
+const threshold = Number(values.threshold);
+const { comparisons, regressions, added, removed } = compareBenchmarks(read(baselinePath), current, threshold);
+
+console.table(Object.fromEntries(comparisons.map(c => [c.name, {
+    baseline: Math.round(c.baselineHz),
+    current: Math.round(c.currentHz),
+    change: percent(c.change)
+}])));
+if (added.length > 0) console.log(`No baseline yet for: ${added.join(', ')}`);
+if (removed.length > 0) console.log(`No longer run: ${removed.join(', ')}`);
+
+if (regressions.length > 0) {
+    console.error(`${regressions.length} benchmark(s) regressed by more than ${percent(threshold).slice(1)}:`);
+    regressions.forEach(r => console.error(`  ${r.name}: ${percent(r.change)}`));
+    process.exit(1);
+}
+console.log(`All ${comparisons.length} benchmarks within ${percent(threshold).slice(1)} of the baseline.`);
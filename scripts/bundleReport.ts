@@ -0,0 +1,56 @@
+// Prints the startup bundle size and estimated load time of the last `vite build` and writes them to
+// dist/bundle-report.json. Kept out of `npm run build`, which has to work on every Node version Vite
+// supports; this needs Node 22.6+ for type stripping.
+//
+//   npm run build:report                                  # report only
+//   npm run build:report -- --history bundle-history.jsonl
+//   npm run build:report -- --budget 250                  # fail above 250 KB gzipped
+//
+// --history appends one line per build (version, date, totals) so size can be tracked across releases.
+import { appendFileSync, readFileSync, statSync, writeFileSync } from 'node:fs';
+import { join } from 'node:path';
+import { parseArgs } from 'node:util';
+import { gzipSync } from 'node:zlib';
+import { summarizeBundle } from '../src/bench/bundle.ts';
+
+const { values } = parseArgs({
+    options: {
+        dist: { type: 'string', default: 'dist' },
+        history: { type: 'string' },
+        budget: { type: 'string' } // KB, gzipped startup chunks
+    }
+});
+
+const dist = values.dist;
+const manifest = JSON.parse(readFileSync(join(dist, '.vite', 'manifest.json'), 'utf8'));
+const report = summarizeBundle(manifest, file => ({
+    bytes: statSync(join(dist, file)).size,
+    gzipBytes: gzipSync(readFileSync(join(dist, file))).length
+}));
+const kb = (bytes: number) => `${(bytes / 1024).toFixed(1)} KB`;
+
+console.table(Object.fromEntries([...report.startup, ...report.lazy].map(f => [f.file, {
+    loaded: report.startup.includes(f) ? 'startup' : 'lazy',
+    size: kb(f.bytes),
+    gzip: kb(f.gzipBytes)
+}])));
+console.log(`Startup: ${kb(report.startupGzipBytes)} gzipped (${kb(report.startupBytes)} raw), lazy: ${kb(report.lazyGzipBytes)} gzipped`);
+console.log(`Estimated startup on slow 4G: ${report.estimatedStartupMs} ms`);
+
+writeFileSync(join(dist, 'bundle-report.json'), JSON.stringify(report, null, 2));
+
+if (values.history) {
+    const { version } = JSON.parse(readFileSync('package.json', 'utf8'));
+    appendFileSync(values.history, JSON.stringify({
+        version,
+        date: new Date().toISOString(),
+        startupGzipBytes: report.startupGzipBytes,
+        lazyGzipBytes: report.lazyGzipBytes,
+        estimatedStartupMs: report.estimatedStartupMs
+    }) + '\n');
+}
+
+if (values.budget && report.startupGzipBytes > Number(values.budget) * 1024) {
+    console.error(`Startup chunks are ${kb(report.startupGzipBytes)} gzipped, over the ${values.budget} KB budget.`);
+    process.exit(1);
+}
@@ -0,0 +1,49 @@
+// Resolves the Scryfall art of every card in the pools ahead of time and writes the mapping the app
+// loads images through (src/images/cardArtManifest.ts). Re-run it when the card pools change.
+//
+//   npm run card-art                                    # resolve redirects to CDN URLs
+//   npm run card-art -- --download                      # also bundle the art into public/card-art/
+//   npm run card-art -- --origin http://localhost:8080  # ask a local stand-in server instead of Scryfall
+import { mkdirSync, readdirSync, rmSync, writeFileSync } from 'node:fs';
+import { join } from 'node:path';
+import { parseArgs } from 'node:util';
+import { CARD_POOL, COMMANDER_POOL } from '../src/store/cards.ts';
+import { resolveCardArt } from '../src/images/resolveArt.ts';
+
+const { values } = parseArgs({
+    options: {
+        download: { type: 'boolean', default: false },
+        origin: { type: 'string' },
+        out: { type: 'string', default: 'src/images/cardArtManifest.ts' },
+        dir: { type: 'string', default: 'public/card-art' },
+        delay: { type: 'string', default: '100' } // ms between requests, per Scryfall's API guidelines
+    }
+});
+
+const urls = [...CARD_POOL, ...COMMANDER_POOL].map(card => card.imageUrl).filter((url): url is string => !!url);
+const delay = Number(values.delay);
+const { manifest, files, failed } = await resolveCardArt(urls, {
+    fetch: (input, init) => fetch(input, { ...init, headers: { 'user-agent': 'mtg-combat-simulator', accept: 'image/*' } }),
+    download: values.download,
+    origin: values.origin,
+    pause: () => new Promise(resolve => setTimeout(resolve, delay))
+});
+
+if (values.download) {
+    mkdirSync(values.dir, { recursive: true });
+    const keep = new Set(files.map(file => file.name));
+    readdirSync(values.dir).filter(name => !keep.has(name)).forEach(name => rmSync(join(values.dir, name)));
+    files.forEach(file => writeFileSync(join(values.dir, file.name), file.bytes));
+}
+
+writeFileSync(values.out, `// Generated by scripts/cardArt.ts (npm run card-art). Do not edit by hand.
+// Maps each card's Scryfall imageUrl to the URL the app loads instead; cards not listed load their imageUrl.
+
+export const CARD_ART_MANIFEST: Record<string, string> = ${JSON.stringify(manifest, null, 4)};
+`);
+
+console.log(`Resolved ${Object.keys(manifest).length} of ${new Set(urls).size} card images${values.download ? `, ${files.length} files in ${values.dir}` : ''}.`);
+if (failed.length > 0) {
+    console.error(`Could not resolve (these keep loading from Scryfall):\n  ${failed.join('\n  ')}`);
+    process.exitCode = 1;
+}
@@ -0,0 +1,90 @@
+// Exports golden fixtures for the NumPy batch evaluator (scripts/batchcombat): seeded single-attacker,
+// multi-blocker combats in the struct-of-arrays layout the Python side encodes, each with the outcome
+// this engine's calculateCombatOutcome gives. Stats run from 0 to 6 with up to two +1/+1 and -1/-1
+// counters, so negative power and zero toughness are covered along with every keyword combination.
+//
+//   npm run combat-fixtures
+//   npm run combat-fixtures -- --combats 5000 --seed 3 --out /tmp/golden.json
+import { writeFileSync } from 'node:fs';
+import { parseArgs } from 'node:util';
+import type { Card } from '../src/types/index.ts';
+import { KEYWORD_FLAGS, keywordMask } from '../src/store/cardStats.ts';
+import { calculateCombatOutcome } from '../src/store/combatLogic.ts';
+import { createRng } from '../src/store/rng.ts';
+
+const { values } = parseArgs({
+    options: {
+        combats: { type: 'string', default: '1000' },
+        'max-blockers': { type: 'string', default: '4' },
+        seed: { type: 'string', default: '1' },
+        out: { type: 'string', default: 'scripts/batchcombat/fixtures/golden.json' }
+    }
+});
+
+const COMBAT_KEYWORDS = ['First Strike', 'Double Strike', 'Deathtouch', 'Trample', 'Lifelink'];
+
+const rng = createRng(Number(values.seed));
+const maxBlockers = Number(values['max-blockers']);
+
+const creatures = { power: [] as number[], toughness: [] as number[], plusOneCounters: [] as number[], minusOneCounters: [] as number[], keywords: [] as number[] };
+const attacker: number[] = [];
+const blockers: number[][] = [];
+const expected = {
+    attackerDamage: [] as number[],
+    blockerDamage: [] as number[][],
+    attackerDies: [] as number[],
+    blockerDies: [] as number[][],
+    defenderDamage: [] as number[],
+    attackerLifeGained: [] as number[],
+    defenderLifeGained: [] as number[]
+};
+
+const randomCreature = (id: string, owner: string): Card => {
+    const card: Card = {
+        id, name: id, manaCost: '', typeLine: 'Creature', oracleText: '',
+        power: String(rng.int(7)), toughness: String(rng.int(7)), colors: [],
+        keywords: COMBAT_KEYWORDS.filter(() => rng.next() < 0.3),
+        tapped: false, damageTaken: 0, controllerId: owner, ownerId: owner,
+        plusOneCounters: rng.int(4) === 0 ? 1 + rng.int(2) : 0,
+        minusOneCounters: rng.int(4) === 0 ? 1 + rng.int(2) : 0,
+        summoningSickness: false, shieldCounters: 0
+    };
+    creatures.power.push(Number(card.power));
+    creatures.toughness.push(Number(card.toughness));
+    creatures.plusOneCounters.push(card.plusOneCounters);
+    creatures.minusOneCounters.push(card.minusOneCounters);
+    creatures.keywords.push(keywordMask(card.keywords));
+    return card;
+};
+
+// Blocker rows are padded to maxBlockers; -1 marks an empty slot.
+const pad = (row: number[], fill = 0) => [...row, ...Array(maxBlockers - row.length).fill(fill)];
+
+const started = performance.now();
+for (let i = 0; i < Number(values.combats); i++) {
+    const att = randomCreature(`a${i}`, 'player1');
+    attacker.push(creatures.power.length - 1);
+    const blocks = Array.from({ length: rng.int(maxBlockers + 1) }, (_, j) => {
+        const card = randomCreature(`b${i}-${j}`, 'player2');
+        return { card, index: creatures.power.length - 1 };
+    });
+    blockers.push(pad(blocks.map(b => b.index), -1));
+
+    const outcome = calculateCombatOutcome({
+        defenderPlayerId: 'player2',
+        attackers: [att.id],
+        blockers: blocks.length > 0 ? { [att.id]: blocks.map(b => b.card.id) } : {},
+        cards: [att, ...blocks.map(b => b.card)]
+    });
+    expected.attackerDamage.push(outcome.damageByCard[att.id] || 0);
+    expected.blockerDamage.push(pad(blocks.map(b => outcome.damageByCard[b.card.id] || 0)));
+    expected.attackerDies.push(outcome.deathIndex[att.id] ? 1 : 0);
+    expected.blockerDies.push(pad(blocks.map(b => outcome.deathIndex[b.card.id] ? 1 : 0)));
+    expected.defenderDamage.push(outcome.damageEvents.filter(e => e.type === 'toPlayer').reduce((sum, e) => sum + e.damage, 0));
+    expected.attackerLifeGained.push(outcome.attackerLifeGained);
+    expected.defenderLifeGained.push(outcome.defenderLifeGained);
+}
+
+const fixture = { version: 1, seed: Number(values.seed), maxBlockers, keywordFlags: KEYWORD_FLAGS, creatures, attacker, blockers, expected };
+writeFileSync(values.out, JSON.stringify(fixture) + '\n');
+console.log(`${attacker.length} combats, ${creatures.power.length} creatures in ${((performance.now() - started) / 1000).toFixed(2)}s -> ${values.out}`);
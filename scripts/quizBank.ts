@@ -0,0 +1,41 @@
+// Generates the combat quiz bank (public/quiz-bank.bin): random boards and blocks solved by the combat
+// engine, tagged and levelled, up to --per-level distinct scenarios for each level. The file is
+// committed, so dev and build don't need this script (or Node 22.6+ for type stripping); a fixed seed
+// keeps it identical between runs, and --check exits 1 when the committed bank is out of date.
+//
+//   npm run quiz-bank
+//   npm run quiz-bank -- --check
+//   npm run quiz-bank -- --per-level 2000 --seed 7 --out /tmp/quiz-bank.bin
+import { existsSync, readFileSync, writeFileSync } from 'node:fs';
+import { parseArgs } from 'node:util';
+import { QUIZ_TAGS, encodeQuizBank, generateQuizBank } from '../src/quiz/quizBank.ts';
+import { createRng } from '../src/store/rng.ts';
+
+const { values } = parseArgs({
+    options: {
+        'per-level': { type: 'string', default: '400' },
+        seed: { type: 'string', default: '1' },
+        out: { type: 'string', default: 'public/quiz-bank.bin' },
+        check: { type: 'boolean', default: false }
+    }
+});
+
+const started = performance.now();
+const bank = generateQuizBank(createRng(Number(values.seed)), Number(values['per-level']));
+const bytes = encodeQuizBank(bank);
+
+if (values.check) {
+    const current = existsSync(values.out) ? readFileSync(values.out) : null;
+    if (!current || !Buffer.from(bytes).equals(current)) {
+        console.error(`${values.out} is out of date; run \`npm run quiz-bank\`.`);
+        process.exit(1);
+    }
+    console.log(`${values.out} is up to date.`);
+    process.exit(0);
+}
+writeFileSync(values.out, bytes);
+
+const levels = bank.byLevel.slice(1).map((list, i) => `L${i + 1}: ${list.length}`).join(', ');
+const tags = QUIZ_TAGS.map(tag => `${tag}: ${bank.byTag[tag].length}`).join(', ');
+console.log(`${bank.scenarios.length} scenarios (${levels}) in ${(bytes.length / 1024).toFixed(1)} KiB, ${((performance.now() - started) / 1000).toFixed(2)}s -> ${values.out}`);
+console.log(`Tags: ${tags}`);
@@ -0,0 +1,69 @@
+// Records headless games to a binary replay file, or re-resolves every combat in one or more files
+// through the current combat engine and reports any outcome that changed.
+//
+//   npm run replay -- record --games 2000 --seed 42 --out games.mtgr
+//   npm run replay -- verify games.mtgr
+//
+// `verify` exits with status 1 when a recorded outcome no longer matches, so it can gate rule changes.
+import { createReadStream, createWriteStream } from 'node:fs';
+import { parseArgs } from 'node:util';
+import { runBatch } from '../src/sim/batch.ts';
+import { createReplayReader, createReplayVerifier, createReplayWriter } from '../src/sim/replay.ts';
+import { randomSeed } from '../src/store/rng.ts';
+
+const record = async (args: string[]) => {
+    const { values } = parseArgs({
+        args,
+        options: {
+            games: { type: 'string', default: '1000' },
+            'max-turns': { type: 'string', default: '200' },
+            gambles: { type: 'string', default: '0' },
+            seed: { type: 'string' },
+            out: { type: 'string', default: 'games.mtgr' }
+        }
+    });
+
+    const seed = values.seed !== undefined ? Number(values.seed) : randomSeed();
+    const file = createWriteStream(values.out);
+    let bytes = 0;
+    const writer = createReplayWriter(chunk => {
+        bytes += chunk.length;
+        file.write(chunk);
+    });
+
+    const stats = runBatch(Number(values.games), { maxTurns: Number(values['max-turns']), gambles: Number(values.gambles), seed, recorder: writer });
+    writer.flush();
+    await new Promise<void>((resolve, reject) => file.end((err?: Error | null) => (err ? reject(err) : resolve())));
+    console.log(`Recorded ${stats.games} games (seed ${seed}) to ${values.out}: ${(bytes / 1024).toFixed(1)} KiB`);
+};
+
+const verify = async (files: string[]) => {
+    if (files.length === 0) throw new Error('Usage: replay verify <file>...');
+    let failed = false;
+    for (const path of files) {
+        const started = performance.now();
+        const verifier = createReplayVerifier();
+        const reader = createReplayReader(verifier.record);
+        for await (const chunk of createReadStream(path)) reader.push(chunk as Uint8Array);
+        reader.end();
+
+        const { games, combats, mismatches } = verifier.result();
+        const seconds = ((performance.now() - started) / 1000).toFixed(2);
+        console.log(`${path}: ${games} games, ${combats} combats re-resolved in ${seconds}s, ${mismatches.length} mismatches`);
+        mismatches.slice(0, 20).forEach(m => console.log(`  game ${m.game} turn ${m.turn}: expected ${m.expected}, got ${m.actual}`));
+        if (mismatches.length > 0) failed = true;
+    }
+    if (failed) process.exit(1);
+};
+
+const [command, ...rest] = process.argv.slice(2);
+const commands: Record<string, (args: string[]) => Promise<void>> = { record, verify };
+
+if (!commands[command]) {
+    console.error('Usage: replay record [--games N] [--seed S] [--out file] | replay verify <file>...');
+    process.exit(1);
+}
+commands[command](rest).catch(err => {
+    console.error(err);
+    process.exit(1);
+});
@@ -0,0 +1,82 @@
+// Headless Monte Carlo runner: plays N AI-vs-AI games across worker threads and prints aggregate stats.
+//
+//   npm run simulate -- --games 20000 --workers 8 --gambles 3 --seed 42 --json
+//
+// With --seed the results are identical for any worker count.
+//
+// Runs directly under Node's type stripping, which is why the simulator's import graph uses
+// explicit `.ts` extensions.
+import { Worker, isMainThread, parentPort, workerData } from 'node:worker_threads';
+import { availableParallelism } from 'node:os';
+import { parseArgs } from 'node:util';
+import { emptyBatchStats, mergeBatchStats, runBatch, summarizeBatch } from '../src/sim/batch.ts';
+import type { BatchOptions, BatchStats } from '../src/sim/batch.ts';
+import { randomSeed } from '../src/store/rng.ts';
+
+interface WorkerJob {
+    games: number;
+    firstGame: number;
+    options: BatchOptions;
+}
+
+const runWorker = (job: WorkerJob) =>
+    new Promise<BatchStats>((resolve, reject) => {
+        const worker = new Worker(new URL(import.meta.url), { workerData: job });
+        worker.once('message', resolve);
+        worker.once('error', reject);
+        worker.once('exit', code => {
+            if (code !== 0) reject(new Error(`Simulation worker exited with code ${code}`));
+        });
+    });
+
+const main = async () => {
+    const { values } = parseArgs({
+        options: {
+            games: { type: 'string', default: '10000' },
+            workers: { type: 'string', default: String(availableParallelism()) },
+            'max-turns': { type: 'string', default: '200' },
+            gambles: { type: 'string', default: '0' },
+            seed: { type: 'string' },
+            json: { type: 'boolean', default: false }
+        }
+    });
+
+    const games = Number(values.games);
+    const workers = Math.max(1, Math.min(Number(values.workers), games));
+    const seed = values.seed !== undefined ? Number(values.seed) : randomSeed();
+    const options: BatchOptions = { maxTurns: Number(values['max-turns']), gambles: Number(values.gambles), seed };
+
+    const started = performance.now();
+    const perWorker = Math.floor(games / workers);
+    const jobs: WorkerJob[] = [];
+    for (let i = 0, firstGame = 0; i < workers; i++) {
+        const count = perWorker + (i < games % workers ? 1 : 0);
+        jobs.push({ games: count, firstGame, options });
+        firstGame += count;
+    }
+    const results = await Promise.all(jobs.map(runWorker));
+    const stats = results.reduce(mergeBatchStats, emptyBatchStats());
+    const seconds = (performance.now() - started) / 1000;
+
+    const summary = { ...summarizeBatch(stats), seed, workers, seconds: Math.round(seconds * 100) / 100, gamesPerMinute: Math.round((stats.games / seconds) * 60) };
+    if (values.json) {
+        console.log(JSON.stringify(summary, null, 2));
+    } else {
+        console.log(`Simulated ${stats.games} games on ${workers} workers in ${summary.seconds}s (${summary.gamesPerMinute} games/min, seed ${seed})`);
+        console.table({ winRate: summary.winRate, starterWinRate: summary.starterWinRate, averageGoldSpent: summary.averageGoldSpent });
+        console.log(`Draws: ${summary.drawRate}  Average turns: ${summary.averageTurns}  Longest: ${summary.longestGame}`);
+        console.log('Purchases per game:', summary.purchasesPerGame);
+        console.log('Gold curve (player-turn 1..20):', summary.goldCurve);
+        if (stats.gambleSpawns > 0) console.log(`Average Gamble Spawn payout: ${summary.averageGambleGold}`);
+    }
+};
+
+if (isMainThread) {
+    main().catch(err => {
+        console.error(err);
+        process.exit(1);
+    });
+} else {
+    const job = workerData as WorkerJob;
+    parentPort!.postMessage(runBatch(job.games, job.options, job.firstGame));
+}
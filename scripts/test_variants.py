@@ -0,0 +1,70 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+import variants
+
+
+# A copy of what the targets are built from, with stand-ins for the hand-written banding companions.
+@pytest.fixture
+def root(tmp_path):
+    for target in variants.TARGETS:
+        for path in target.inputs():
+            (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(variants.ROOT / path, tmp_path / path)
+    for path in variants.BANDING_COMPANIONS:
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text('export {};\n', encoding='utf-8')
+    return tmp_path
+
+
+def run(root: Path, *args):
+    return variants.main([*args, '--root', str(root), '--jobs', '1'])
+
+
+def states(capsys):
+    return [line.rsplit(': ', 1)[1] for line in capsys.readouterr().out.splitlines()]
+
+
+def test_writes_new_outputs_then_skips_them_while_fresh(root, capsys):
+    assert run(root) == 0
+    assert states(capsys) == ['written', 'written']
+    store = (root / 'src/banding/bandingStore.ts').read_text(encoding='utf-8')
+    assert 'useBandingStore' in store and 'addToBand' in store
+    manifest = variants.load_manifest(root)
+    assert sorted(manifest) == sorted(t.output for t in variants.TARGETS)
+
+    assert run(root) == 0
+    assert states(capsys) == ['fresh', 'fresh']
+    assert run(root, '--check') == 0
+    assert variants.load_manifest(root) == manifest
+
+
+def test_check_reports_an_output_edited_by_hand_without_writing(root, capsys):
+    run(root)
+    output = root / 'src/banding/bandingStore.ts'
+    output.write_text(output.read_text(encoding='utf-8') + '// tweak\n', encoding='utf-8')
+    capsys.readouterr()
+
+    assert run(root, '--check') == 1
+    assert states(capsys) == ['output edited by hand', 'fresh']
+    assert output.read_text(encoding='utf-8').endswith('// tweak\n')
+
+
+def test_a_recipe_that_no_longer_matches_its_source_fails_without_writing(root, capsys):
+    source = root / 'src/store/gameStore.ts'
+    source.write_text(source.read_text(encoding='utf-8').replace('interface GameStore extends GameState {', 'interface GameStore {'), encoding='utf-8')
+
+    assert run(root) == 2
+    assert 'bandingStore: expected 1 match(es)' in capsys.readouterr().err
+    assert not (root / 'src/banding/bandingStore.ts').exists()
+    assert variants.load_manifest(root) == {}
+
+
+def test_targets_without_their_companions_are_blocked(root, capsys):
+    (root / variants.BANDING_COMPANIONS[0]).unlink()
+
+    assert run(root) == 0
+    assert all(state.startswith('blocked') for state in states(capsys))
+    assert not (root / 'src/banding').joinpath('bandingStore.ts').exists()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# Regenerates the files the game variants derive from the main game instead of keeping by hand:
+#
+#   python3 scripts/variants.py              # rebuild whatever is out of date
+#   python3 scripts/variants.py --check      # exit 1 if any output has drifted, write nothing
+#   python3 scripts/variants.py bandingStore --force --jobs 1
+#
+# Each target is built from a template (scripts/variants/*.template, copied as is) or from a source file
+# plus a recipe of anchored edits. An edit must match exactly as often as it expects to, so a recipe that
+# has fallen behind its source fails loudly instead of writing a half-converted file.
+#
+# scripts/variants/manifest.json records, for every output, the hash of what it was built from (the
+# template or source, the recipe, the generator version) and the hash of what was written. A target is
+# skipped when both still match, so --check only hashes files and never applies a recipe. A target whose
+# hand-written companions are missing is reported as blocked and left alone, since its output would not
+# compile without them. Paths are relative to the repository root, wherever the script is run from.
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+GENERATOR_VERSION = 1
+ROOT = Path(__file__).resolve().parent.parent
+TEMPLATES = 'scripts/variants'
+MANIFEST = 'scripts/variants/manifest.json'
+
+
+@dataclass(frozen=True)
+class Edit:
+    find: str
+    replace: str
+    count: int = 1  # exact number of matches expected; 0 means at least one
+
+
+@dataclass(frozen=True)
+class Target:
+    name: str
+    output: str
+    template: str | None = None  # copied verbatim
+    source: str | None = None  # or rewritten with `edits`
+    edits: tuple[Edit, ...] = ()
+    requires: tuple[str, ...] = ()  # hand-written files the output imports
+
+    def inputs(self):
+        return [self.template] if self.template else [self.source]
+
+    def recipe(self):
+        return json.dumps([GENERATOR_VERSION, [[e.find, e.replace, e.count] for e in self.edits]])
+
+
+# The banding lab's store is the main store with the banding card pool, band state and the banding
+# combat resolver swapped in.
+BANDING_STORE_EDITS = (
+    Edit("from './", "from '../store/", count=0),
+    Edit("import { liveCombat } from '../store/incrementalCombat';\n", ''),
+    Edit(
+        "import { CARD_POOL, getLegalCards } from '../store/cards';",
+        "import { getLegalCards } from '../store/cards';\n"
+        "import { BANDING_CARD_POOL as CARD_POOL } from './bandingCards';\n"
+        "import { calculateBandingCombatOutcome } from './BandingLogic';",
+    ),
+    Edit(
+        "interface GameStore extends GameState {\n",
+        "interface GameStore extends GameState {\n"
+        "    // Attackers grouped into bands; a band may hold at most one creature without banding.\n"
+        "    bands: string[][];\n"
+        "    addToBand: (cardId: string, targetCardId: string) => void;\n",
+    ),
+    Edit(
+        "        return board ? liveCombat.resolve(board) : emptyCombatOutcome();",
+        "        return board ? calculateBandingCombatOutcome(board, get().bands) : emptyCombatOutcome();",
+    ),
+    Edit("set({ attackers: [], blockers: {}", "set({ attackers: [], blockers: {}, bands: []", count=2),
+    Edit(
+        "    declareBlocker: (attackerId: string, blockerId: string) => {",
+        "    bands: [],\n"
+        "\n"
+        "    addToBand: (cardId: string, targetCardId: string) => {\n"
+        "        const { bands, players, activePlayerId, addLog } = get();\n"
+        "        const player = players.find(p => p.id === activePlayerId);\n"
+        "        const card = player?.battlefield.find(c => c.id === cardId);\n"
+        "        if (!player || !card || !player.battlefield.some(c => c.id === targetCardId)) return;\n"
+        "\n"
+        "        const withoutBanding = (id: string) => {\n"
+        "            const member = player.battlefield.find(c => c.id === id);\n"
+        "            return !member || !hasKeyword(member, 'Banding');\n"
+        "        };\n"
+        "        const index = bands.findIndex(band => band.includes(targetCardId));\n"
+        "        if (index === -1) {\n"
+        "            set({ bands: [...bands, [targetCardId, cardId]] });\n"
+        "            return;\n"
+        "        }\n"
+        "        if (withoutBanding(cardId) && bands[index].some(withoutBanding)) {\n"
+        "            addLog('A band can only have one creature without banding.');\n"
+        "            return;\n"
+        "        }\n"
+        "        set({ bands: bands.map((band, i) => i === index ? [...band, cardId] : band) });\n"
+        "    },\n"
+        "\n"
+        "    declareBlocker: (attackerId: string, blockerId: string) => {",
+    ),
+    Edit('useGameStore', 'useBandingStore', count=0),
+    Edit('GameStore', 'BandingStore', count=0),
+)
+
+BANDING_COMPANIONS = ('src/banding/BandingLogic.ts', 'src/banding/bandingCards.ts')
+
+TARGETS = (
+    Target(
+        name='bandingStore',
+        output='src/banding/bandingStore.ts',
+        source='src/store/gameStore.ts',
+        edits=BANDING_STORE_EDITS,
+        requires=BANDING_COMPANIONS,
+    ),
+    Target(
+        name='bandingQuizModal',
+        output='src/banding/components/BandingCombatQuizModal.tsx',
+        template=f'{TEMPLATES}/BandingCombatQuizModal.tsx.template',
+        requires=BANDING_COMPANIONS,
+    ),
+)
+
+
+class RecipeError(Exception):
+    pass
+
+
+def sha256(data: bytes):
+    return hashlib.sha256(data).hexdigest()
+
+
+def read_bytes(root: Path, path: str):
+    return (root / path).read_bytes()
+
+
+def input_hash(root: Path, target: Target):
+    digest = hashlib.sha256(target.recipe().encode())
+    for path in target.inputs():
+        data = read_bytes(root, path)
+        digest.update(f'\0{path}\0{len(data)}\0'.encode())
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def apply_edits(text: str, target: Target):
+    for edit in target.edits:
+        found = text.count(edit.find)
+        if found == 0 or (edit.count and found != edit.count):
+            expected = edit.count or 'at least 1'
+            raise RecipeError(f'{target.name}: expected {expected} match(es) of {edit.find[:60]!r} in {target.source}, found {found}')
+        text = text.replace(edit.find, edit.replace)
+    return text
+
+
+def render(root: Path, target: Target):
+    if target.template:
+        return read_bytes(root, target.template)
+    text = read_bytes(root, target.source).decode('utf-8')
+    return apply_edits(text, target).encode('utf-8')
+
+
+def status(root: Path, target: Target, manifest: dict):
+    # -> (state, inputs hash) where state is 'blocked', 'fresh' or a reason to rebuild
+    missing = [path for path in target.requires if not (root / path).exists()]
+    if missing:
+        return f"blocked (missing {', '.join(missing)})", None
+    inputs = input_hash(root, target)
+    entry = manifest.get(target.output)
+    output = root / target.output
+    if not entry:
+        return 'new', inputs
+    if entry['inputs'] != inputs:
+        return 'inputs changed', inputs
+    if not output.exists():
+        return 'output missing', inputs
+    if sha256(output.read_bytes()) != entry['output']:
+        return 'output edited by hand', inputs
+    return 'fresh', inputs
+
+
+def build(root: Path, target: Target, manifest: dict, force: bool, check: bool):
+    state, inputs = status(root, target, manifest)
+    if state.startswith('blocked') or (state == 'fresh' and not force) or check:
+        return target, state, None
+    data = render(root, target)
+    output = root / target.output
+    if output.exists() and output.read_bytes() == data:
+        state = 'unchanged'
+    else:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_bytes(data)
+        state = 'written'
+    return target, state, {'inputs': inputs, 'output': sha256(data)}
+
+
+def load_manifest(root: Path):
+    path = root / MANIFEST
+    return json.loads(path.read_text(encoding='utf-8')) if path.exists() else {}
+
+
+def save_manifest(root: Path, manifest: dict):
+    text = json.dumps(dict(sorted(manifest.items())), indent=2) + '\n'
+    (root / MANIFEST).write_text(text, encoding='utf-8')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Regenerate the game variant files from their templates and recipes.')
+    parser.add_argument('targets', nargs='*', help=f"targets to build (default: all of {', '.join(t.name for t in TARGETS)})")
+    parser.add_argument('--check', action='store_true', help='report drifted outputs and exit 1 without writing anything')
+    parser.add_argument('--force', action='store_true', help='rebuild even when the manifest says an output is fresh')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='targets built in parallel')
+    parser.add_argument('--root', type=Path, default=ROOT, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    names = {t.name for t in TARGETS}
+    unknown = [name for name in args.targets if name not in names]
+    if unknown:
+        parser.error(f"unknown target(s): {', '.join(unknown)}")
+    selected = [t for t in TARGETS if not args.targets or t.name in args.targets]
+
+    root = args.root.resolve()
+    manifest = load_manifest(root)
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        jobs = [pool.submit(build, root, t, manifest, args.force, args.check) for t in selected]
+        try:
+            results = [job.result() for job in jobs]
+        except RecipeError as e:
+            print(f'error: {e}', file=sys.stderr)
+            return 2
+
+    drifted = False
+    for target, state, entry in results:
+        if entry:
+            manifest[target.output] = entry
+        elif args.check and state != 'fresh' and not state.startswith('blocked'):
+            drifted = True
+        print(f'{target.name:<18} {target.output}: {state}')
+
+    if args.check:
+        if drifted:
+            print('Variant outputs are out of date; run `npm run variants`.', file=sys.stderr)
+        return 1 if drifted else 0
+    if any(entry for _, _, entry in results):
+        save_manifest(root, manifest)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,41 @@
+import { describe, it, expect } from 'vitest';
+import { REFERENCE_NETWORK, summarizeBundle } from './bundle';
+import type { Manifest } from './bundle';
+
+const manifest: Manifest = {
+    'index.html': { file: 'assets/index.js', isEntry: true, imports: ['_vendor.js'], dynamicImports: ['src/components/TreasureShop.tsx'], css: ['assets/index.css'] },
+    '_vendor.js': { file: 'assets/vendor.js' },
+    'src/components/TreasureShop.tsx': { file: 'assets/TreasureShop.js', isDynamicEntry: true, imports: ['_vendor.js', '_firebase.js'] },
+    '_firebase.js': { file: 'assets/firebase.js' },
+    'src/images/serviceWorker.ts': { file: 'sw.js', isEntry: true }
+};
+
+const sizes: Record<string, number> = {
+    'assets/index.js': 40_000,
+    'assets/vendor.js': 160_000,
+    'assets/index.css': 20_000,
+    'assets/TreasureShop.js': 8_000,
+    'assets/firebase.js': 100_000,
+    'sw.js': 4_000
+};
+const sizeOf = (file: string) => ({ bytes: sizes[file], gzipBytes: sizes[file] / 4 });
+
+describe('Bundle Report', () => {
+    it('should split startup chunks from lazy ones', () => {
+        const report = summarizeBundle(manifest, sizeOf);
+
+        expect(report.startup.map(f => f.file).sort()).toEqual(['assets/index.css', 'assets/index.js', 'assets/vendor.js']);
+        expect(report.lazy.map(f => f.file)).toEqual(['assets/firebase.js', 'assets/TreasureShop.js', 'sw.js']);
+        expect(report.startupBytes).toBe(220_000);
+        expect(report.startupGzipBytes).toBe(55_000);
+        expect(report.lazyGzipBytes).toBe(28_000);
+    });
+
+    it('should estimate startup time from gzipped startup bytes', () => {
+        const report = summarizeBundle(manifest, sizeOf);
+        const expected = REFERENCE_NETWORK.roundTrips * REFERENCE_NETWORK.rttMs + (55_000 / REFERENCE_NETWORK.bytesPerSecond) * 1000;
+
+        expect(report.estimatedStartupMs).toBe(Math.round(expected));
+        expect(summarizeBundle(manifest, sizeOf, { ...REFERENCE_NETWORK, bytesPerSecond: 1e9 }).estimatedStartupMs).toBeLessThan(report.estimatedStartupMs);
+    });
+});
@@ -0,0 +1,80 @@
+// Startup cost of a production build, read from Vite's manifest (build.manifest in vite.config.ts).
+// Startup chunks are the page entry (index.html), everything it imports statically and their CSS;
+// whatever is only reachable through dynamic import() or another entry (the service worker) is lazy.
+// The startup estimate is a cold load of the startup chunks, gzipped, on a slow reference connection:
+// a few round trips plus transfer time. It is a comparable number between builds, not a measurement.
+
+export interface ManifestChunk {
+    file: string;
+    src?: string;
+    isEntry?: boolean;
+    isDynamicEntry?: boolean;
+    imports?: string[];
+    dynamicImports?: string[];
+    css?: string[];
+}
+
+export type Manifest = Record<string, ManifestChunk>;
+
+export interface FileSize {
+    bytes: number;
+    gzipBytes: number;
+}
+
+export interface BundleFile extends FileSize {
+    file: string;
+}
+
+export interface BundleReport {
+    startup: BundleFile[];
+    lazy: BundleFile[];
+    startupBytes: number;
+    startupGzipBytes: number;
+    lazyBytes: number;
+    lazyGzipBytes: number;
+    estimatedStartupMs: number;
+}
+
+export interface ReferenceNetwork {
+    bytesPerSecond: number;
+    rttMs: number;
+    roundTrips: number; // DNS, TCP, TLS and the HTML before the first script request
+}
+
+// Lighthouse's "slow 4G": 1.6 Mbps down, 150 ms RTT.
+export const REFERENCE_NETWORK: ReferenceNetwork = { bytesPerSecond: 1.6e6 / 8, rttMs: 150, roundTrips: 4 };
+
+const total = (files: BundleFile[], key: keyof FileSize) => files.reduce((sum, f) => sum + f[key], 0);
+
+export const summarizeBundle = (
+    manifest: Manifest,
+    sizeOf: (file: string) => FileSize,
+    network: ReferenceNetwork = REFERENCE_NETWORK
+): BundleReport => {
+    const startupFiles = new Set<string>();
+    const visit = (key: string) => {
+        const chunk = manifest[key];
+        if (!chunk || startupFiles.has(chunk.file)) return;
+        startupFiles.add(chunk.file);
+        chunk.css?.forEach(css => startupFiles.add(css));
+        chunk.imports?.forEach(visit);
+    };
+    Object.keys(manifest).filter(key => manifest[key].isEntry && key.endsWith('.html')).forEach(visit);
+
+    const allFiles = new Set(Object.values(manifest).flatMap(chunk => [chunk.file, ...(chunk.css || [])]));
+    const toFile = (file: string) => ({ file, ...sizeOf(file) });
+    const bySize = (a: BundleFile, b: BundleFile) => b.gzipBytes - a.gzipBytes;
+    const startup = [...startupFiles].map(toFile).sort(bySize);
+    const lazy = [...allFiles].filter(file => !startupFiles.has(file)).map(toFile).sort(bySize);
+
+    const startupGzipBytes = total(startup, 'gzipBytes');
+    return {
+        startup,
+        lazy,
+        startupBytes: total(startup, 'bytes'),
+        startupGzipBytes,
+        lazyBytes: total(lazy, 'bytes'),
+        lazyGzipBytes: total(lazy, 'gzipBytes'),
+        estimatedStartupMs: Math.round(network.roundTrips * network.rttMs + (startupGzipBytes / network.bytesPerSecond) * 1000)
+    };
+};
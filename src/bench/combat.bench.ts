@@ -0,0 +1,12 @@
+import { bench, describe } from 'vitest';
+import { calculateCombatOutcome } from '../store/combatLogic';
+import { FIXTURE_DENSITIES, FIXTURE_SIZES, buildFixtureBoard, fixtureName } from './fixtures';
+
+describe('calculateCombatOutcome', () => {
+    FIXTURE_SIZES.forEach(size => FIXTURE_DENSITIES.forEach(keywordDensity => {
+        const board = buildFixtureBoard({ size, keywordDensity });
+        bench(fixtureName({ size, keywordDensity }), () => {
+            calculateCombatOutcome(board);
+        });
+    }));
+});
@@ -0,0 +1,82 @@
+import type { Card, CombatBoard, Player } from '../types';
+import { canBlock } from '../store/cardStats';
+import { createRng } from '../store/rng';
+
+// Seeded boards for the benchmark suite. `size` creatures per side; `keywordDensity` is the share of
+// them carrying combat keywords, cycling through the sets below (Banding has no rules support yet, so
+// it only costs the parser and the keyword mask). Every untapped attacker attacks and the defenders
+// spread out as single, double and triple blocks, so damage assignment order matters.
+
+export interface FixtureSpec {
+    size: number;
+    keywordDensity: number; // 0..1
+    seed?: number;
+}
+
+export const FIXTURE_SIZES = [6, 20, 100, 500];
+export const FIXTURE_DENSITIES = [0, 0.5, 1];
+
+const KEYWORD_SETS = [
+    ['First Strike'],
+    ['Double Strike'],
+    ['Deathtouch'],
+    ['Trample'],
+    ['Lifelink'],
+    ['Banding'],
+    ['Trample', 'Deathtouch'],
+    ['Double Strike', 'Lifelink'],
+    ['First Strike', 'Trample', 'Lifelink'],
+    ['Flying'],
+    ['Reach', 'Deathtouch']
+];
+
+export const fixtureName = ({ size, keywordDensity }: FixtureSpec) =>
+    `${size} per side, ${Math.round(keywordDensity * 100)}% keywords`;
+
+const buildArmy = (spec: FixtureSpec, owner: string, rng: ReturnType<typeof createRng>): Card[] =>
+    Array.from({ length: spec.size }, (_, i) => {
+        const keywords = rng.next() < spec.keywordDensity ? rng.pick(KEYWORD_SETS)! : [];
+        return {
+            id: `${owner}-${i}`, name: `${owner} creature ${i}`, manaCost: '', typeLine: 'Creature', oracleText: '',
+            power: String(1 + rng.int(6)), toughness: String(1 + rng.int(6)), colors: [], keywords,
+            tapped: false, damageTaken: 0, controllerId: owner, ownerId: owner,
+            plusOneCounters: 0, minusOneCounters: 0, summoningSickness: false, shieldCounters: rng.int(4) === 0 ? 1 : 0
+        };
+    });
+
+export const buildFixturePlayers = (spec: FixtureSpec): Player[] => {
+    const rng = createRng(spec.seed ?? spec.size * 1000 + Math.round(spec.keywordDensity * 100));
+    return ['player1', 'player2'].map(id => ({
+        id, name: id === 'player1' ? 'Player 1' : 'Player 2', life: 40, colorIdentity: [], commanderDamage: {}, poisonCounters: 0,
+        library: [], hand: [], graveyard: [], exile: [], commandZone: [], battlefield: buildArmy(spec, id, rng), gold: 0
+    }));
+};
+
+// Legal blocks only: each defender joins the next attacker it can block, up to three per attacker.
+export const buildFixtureBlocks = (attackers: Card[], defenders: Card[]): Record<string, string[]> => {
+    const blockers: Record<string, string[]> = {};
+    let next = 0;
+    defenders.forEach((defender, i) => {
+        for (let tries = 0; tries < attackers.length; tries++) {
+            const attacker = attackers[(next + tries) % attackers.length];
+            const group = blockers[attacker.id] || [];
+            if (group.length < 1 + (i % 3) && canBlock(attacker, defender)) {
+                blockers[attacker.id] = [...group, defender.id];
+                next = (next + tries + 1) % attackers.length;
+                return;
+            }
+        }
+    });
+    return blockers;
+};
+
+export const buildFixtureBoard = (spec: FixtureSpec): CombatBoard => {
+    const [attackerPlayer, defender] = buildFixturePlayers(spec);
+    const attackers = attackerPlayer.battlefield;
+    return {
+        defenderPlayerId: defender.id,
+        attackers: attackers.map(c => c.id),
+        blockers: buildFixtureBlocks(attackers, defender.battlefield),
+        cards: [...attackers, ...defender.battlefield]
+    };
+};
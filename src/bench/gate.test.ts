@@ -0,0 +1,43 @@
+import { describe, it, expect } from 'vitest';
+import { compareBenchmarks, readBenchReport } from './gate';
+
+const report = (hz: Record<string, number>) => ({
+    files: [{
+        filepath: 'src/bench/combat.bench.ts',
+        groups: [{
+            fullName: 'src/bench/combat.bench.ts > calculateCombatOutcome',
+            benchmarks: Object.entries(hz).map(([name, value]) => ({ name, hz: value, mean: 1000 / value }))
+        }]
+    }]
+});
+
+describe('Bench Gate', () => {
+    it('should flatten a vitest bench report into named throughputs', () => {
+        expect(readBenchReport(report({ small: 2000, large: 50 }))).toEqual([
+            { name: 'src/bench/combat.bench.ts > calculateCombatOutcome > small', hz: 2000 },
+            { name: 'src/bench/combat.bench.ts > calculateCombatOutcome > large', hz: 50 }
+        ]);
+        expect(() => readBenchReport({})).toThrow();
+    });
+
+    it('should fail only benchmarks that slowed down past the threshold', () => {
+        const baseline = readBenchReport(report({ a: 1000, b: 1000, c: 1000 }));
+        const current = readBenchReport(report({ a: 800, b: 700, c: 1500 }));
+        const result = compareBenchmarks(baseline, current, 0.25);
+
+        expect(result.comparisons).toHaveLength(3);
+        expect(result.regressions.map(r => r.name)).toEqual(['src/bench/combat.bench.ts > calculateCombatOutcome > b']);
+        expect(result.regressions[0].change).toBeCloseTo(-0.3);
+    });
+
+    it('should list benchmarks added or removed since the baseline', () => {
+        const result = compareBenchmarks(
+            readBenchReport(report({ old: 100, kept: 100 })),
+            readBenchReport(report({ kept: 100, fresh: 100 }))
+        );
+
+        expect(result.regressions).toEqual([]);
+        expect(result.added).toEqual(['src/bench/combat.bench.ts > calculateCombatOutcome > fresh']);
+        expect(result.removed).toEqual(['src/bench/combat.bench.ts > calculateCombatOutcome > old']);
+    });
+});
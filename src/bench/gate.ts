@@ -0,0 +1,62 @@
+// Throughput regression gate over `vitest bench --outputJson` reports. The baseline is simply an
+// earlier report (so `vitest bench --compare <baseline>` works on it too); a benchmark fails the gate
+// when its operations per second drop by more than `threshold` against it.
+
+export const DEFAULT_REGRESSION_THRESHOLD = 0.25;
+
+export interface BenchResult {
+    name: string; // "<file> > <describe> > <bench>"
+    hz: number;
+}
+
+interface BenchReport {
+    files?: {
+        filepath?: string;
+        groups?: { fullName: string; benchmarks: { name: string; hz: number }[] }[];
+    }[];
+}
+
+export const readBenchReport = (report: unknown): BenchResult[] => {
+    const { files } = report as BenchReport;
+    if (!Array.isArray(files)) throw new Error('Not a vitest bench JSON report');
+    return files.flatMap(file => (file.groups || []).flatMap(group =>
+        group.benchmarks.map(b => ({ name: `${group.fullName} > ${b.name}`, hz: b.hz }))
+    ));
+};
+
+export interface BenchComparison {
+    name: string;
+    baselineHz: number;
+    currentHz: number;
+    change: number; // relative: -0.3 is 30% slower
+}
+
+export interface GateResult {
+    comparisons: BenchComparison[];
+    regressions: BenchComparison[];
+    added: string[]; // benchmarks with no baseline yet
+    removed: string[]; // baseline entries that no longer run
+}
+
+export const compareBenchmarks = (
+    baseline: BenchResult[],
+    current: BenchResult[],
+    threshold = DEFAULT_REGRESSION_THRESHOLD
+): GateResult => {
+    const before = new Map(baseline.map(b => [b.name, b.hz]));
+    const names = new Set(current.map(b => b.name));
+
+    const comparisons = current
+        .filter(b => before.has(b.name))
+        .map(b => {
+            const baselineHz = before.get(b.name)!;
+            return { name: b.name, baselineHz, currentHz: b.hz, change: baselineHz > 0 ? b.hz / baselineHz - 1 : 0 };
+        });
+
+    return {
+        comparisons,
+        regressions: comparisons.filter(c => c.change < -threshold),
+        added: current.filter(b => !before.has(b.name)).map(b => b.name),
+        removed: baseline.filter(b => !names.has(b.name)).map(b => b.name)
+    };
+};
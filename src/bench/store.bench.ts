@@ -0,0 +1,78 @@
+import { bench, describe, vi } from 'vitest';
+import { useGameStore } from '../store/gameStore';
+import { buildFixtureBlocks, buildFixturePlayers, fixtureName } from './fixtures';
+import type { FixtureSpec } from './fixtures';
+
+// The store's own actions, as the UI drives them. Without a Worker global the planners run on the
+// main thread, so these time the planning itself. Fake timers keep the auto-battle loop, banners and
+// AI shop visits from firing between iterations.
+vi.useFakeTimers();
+
+const SPECS: FixtureSpec[] = [
+    { size: 6, keywordDensity: 0.5 },
+    { size: 20, keywordDensity: 0.5 },
+    { size: 20, keywordDensity: 1 }
+];
+
+const load = (spec: FixtureSpec, state: Parameters<typeof useGameStore.setState>[0] = {}) =>
+    useGameStore.setState({
+        players: buildFixturePlayers(spec),
+        attackers: [],
+        blockers: {},
+        pendingOutcome: null,
+        showQuiz: false,
+        quizMode: false,
+        autoBattle: false,
+        winner: null,
+        ...state
+    });
+
+describe('performOpponentBlocks', () => {
+    SPECS.forEach(spec => {
+        bench(fixtureName(spec), async () => {
+            load(spec, { phase: 'combat', combatStep: 'declareBlockers', activePlayerId: 'player1' });
+            useGameStore.setState(state => ({ attackers: state.players[0].battlefield.map(c => c.id) }));
+            await useGameStore.getState().performOpponentBlocks();
+        });
+    });
+});
+
+describe('getCombatHints', () => {
+    SPECS.forEach(spec => {
+        bench(`${fixtureName(spec)}, attacking`, () => {
+            load(spec, { phase: 'combat', combatStep: 'declareAttackers', activePlayerId: 'player1' });
+            useGameStore.getState().getCombatHints();
+        });
+        bench(`${fixtureName(spec)}, blocking`, () => {
+            load(spec, { phase: 'combat', combatStep: 'declareBlockers', activePlayerId: 'player2' });
+            useGameStore.setState(({ players: [defender, attacker] }) => ({
+                attackers: attacker.battlefield.map(c => c.id),
+                blockers: buildFixtureBlocks(attacker.battlefield, defender.battlefield)
+            }));
+            useGameStore.getState().getCombatHints();
+        });
+    });
+});
+
+// Beginning → Main 1 → combat (attack with everything, fixture blocks, damage) → Main 2 → End.
+describe('nextPhase full turn', () => {
+    SPECS.forEach(spec => {
+        bench(fixtureName(spec), () => {
+            load(spec, { phase: 'beginning', combatStep: undefined, activePlayerId: 'player2' });
+            const { nextPhase } = useGameStore.getState();
+            nextPhase(); // main1
+            nextPhase(); // combat: begin
+            nextPhase(); // declare attackers
+            useGameStore.setState(({ players: [defender, attacker] }) => ({
+                attackers: attacker.battlefield.map(c => c.id),
+                blockers: buildFixtureBlocks(attacker.battlefield, defender.battlefield)
+            }));
+            nextPhase(); // declare blockers
+            nextPhase(); // combat damage
+            nextPhase(); // end of combat
+            nextPhase(); // main2
+            nextPhase(); // end
+            nextPhase(); // next turn
+        });
+    });
+});
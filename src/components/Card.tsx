@@ -2,6 +2,8 @@ import type { Card as CardType } from '../types';
 import { clsx } from 'clsx';
 import { motion, AnimatePresence } from 'framer-motion';
 import { Shield } from 'lucide-react';
+import { getCardStats, hasKeyword } from '../store/cardStats';
+import { cardArtUrl } from '../images/cardArt';
 
 interface CardProps {
     card: CardType;
@@ -29,10 +31,7 @@ const KEYWORD_COLORS: Record<string, string> = {
 
 export const Card = ({ card, onClick, className, isAttacking, isBlocking, isLocked, blockIndicatorColor, blockOrder }: CardProps) => {
     const isTapped = card.tapped;
-    const basePower = parseInt(card.power || '0');
-    const baseToughness = parseInt(card.toughness || '0');
-    const power = basePower + (card.plusOneCounters || 0) - (card.minusOneCounters || 0);
-    const toughness = baseToughness + (card.plusOneCounters || 0) - (card.minusOneCounters || 0);
+    const { power, toughness } = getCardStats(card);
     const currentToughness = toughness - card.damageTaken;
 
     return (
@@ -65,7 +64,7 @@ export const Card = ({ card, onClick, className, isAttacking, isBlocking, isLock
             <div className="relative h-full w-full bg-black">
                 {card.imageUrl ? (
                     <img
-                        src={card.imageUrl}
+                        src={cardArtUrl(card.imageUrl)}
                         alt={card.name}
                         className="w-full h-full object-contain rounded-[18px]"
                     />
@@ -93,7 +92,7 @@ export const Card = ({ card, onClick, className, isAttacking, isBlocking, isLock
                 )}
 
                 {/* Summoning Sickness Indicator */}
-                {card.summoningSickness && !card.keywords?.includes('Haste') && (
+                {card.summoningSickness && !hasKeyword(card, 'Haste') && (
                     <motion.div
                         initial={{ scale: 0, rotate: -10 }}
                         animate={{
@@ -1,48 +1,153 @@
-import { useEffect, useRef } from 'react';
+import { useCallback, useEffect, useLayoutEffect, useMemo, useRef, useState } from 'react';
 import { useGameStore } from '../store/gameStore';
-import { ScrollText } from 'lucide-react';
+import { exportLog, logEntry } from '../store/gameLog';
+import { Download, ScrollText } from 'lucide-react';
+
+// Only the rows in view (plus a few either side) are mounted. Rows wrap to different heights, so each
+// is measured once it has rendered; unmeasured rows are assumed to be ESTIMATED_ROW_HEIGHT tall.
+const ESTIMATED_ROW_HEIGHT = 28;
+const OVERSCAN = 8;
+const PADDING = 12;
+
+// The log only holds its most recent entries; with "Keep all" on, the download also has everything
+// that has scrolled out of it since.
+const downloadLog = () => {
+    const { log, seed } = useGameStore.getState();
+    const blob = new Blob([exportLog(log).join('\n')], { type: 'text/plain' });
+    const url = URL.createObjectURL(blob);
+    const link = document.createElement('a');
+    link.href = url;
+    link.download = `combat-log-${seed}.txt`;
+    link.click();
+    URL.revokeObjectURL(url);
+};
 
 export const CombatLog = () => {
     const log = useGameStore(state => state.log);
+    const keepFullLog = useGameStore(state => state.keepFullLog);
+    const setKeepFullLog = useGameStore(state => state.setKeepFullLog);
     const scrollRef = useRef<HTMLDivElement>(null);
+    const rowObserver = useRef<ResizeObserver | null>(null);
+    const stickToBottom = useRef(true);
+    const [heights, setHeights] = useState(() => new Map<number, number>()); // by sequence number
+    const [viewport, setViewport] = useState({ top: 0, height: 0 });
 
-    // Auto-scroll to bottom
-    useEffect(() => {
-        if (scrollRef.current) {
-            scrollRef.current.scrollTop = scrollRef.current.scrollHeight;
+    // Rows past the end of the previous log animate in; rows scrolled back into view don't.
+    const [seen, setSeen] = useState({ log, animateFrom: log.first + log.length });
+    if (seen.log !== log) setSeen({ log, animateFrom: seen.log.first + seen.log.length });
+
+    const offsets = useMemo(() => {
+        const offsets = new Array<number>(log.length + 1);
+        offsets[0] = 0;
+        for (let i = 0; i < log.length; i++) {
+            offsets[i + 1] = offsets[i] + (heights.get(log.first + i) ?? ESTIMATED_ROW_HEIGHT);
+        }
+        return offsets;
+    }, [log, heights]);
+    const totalHeight = offsets[log.length];
+
+    // First row whose bottom edge is below `y`.
+    const rowAt = (y: number) => {
+        let low = 0;
+        let high = log.length;
+        while (low < high) {
+            const mid = (low + high) >> 1;
+            if (offsets[mid + 1] <= y) low = mid + 1;
+            else high = mid;
         }
-    }, [log]);
+        return low;
+    };
+    const start = Math.max(rowAt(viewport.top - PADDING) - OVERSCAN, 0);
+    const end = Math.min(rowAt(viewport.top - PADDING + viewport.height) + 1 + OVERSCAN, log.length);
+
+    // Rows report their height when they mount or reflow; rows that left the ring are forgotten.
+    const measureRow = useCallback((row: HTMLDivElement | null) => {
+        if (!row) return;
+        rowObserver.current ??= new ResizeObserver(entries => setHeights(previous => {
+            const first = useGameStore.getState().log.first;
+            const next = new Map([...previous].filter(([seq]) => seq >= first));
+            entries.forEach(entry => {
+                const el = entry.target as HTMLElement;
+                next.set(Number(el.dataset.seq), el.offsetHeight);
+            });
+            return next;
+        }));
+        const observer = rowObserver.current;
+        observer.observe(row);
+        return () => observer.unobserve(row);
+    }, []);
+
+    // Follow new entries while the reader is at the bottom.
+    useLayoutEffect(() => {
+        const el = scrollRef.current;
+        if (el && stickToBottom.current) el.scrollTop = el.scrollHeight;
+    }, [log, totalHeight]);
+
+    useEffect(() => {
+        const el = scrollRef.current;
+        if (!el) return;
+        const observer = new ResizeObserver(() => setViewport({ top: el.scrollTop, height: el.clientHeight }));
+        observer.observe(el);
+        return () => {
+            observer.disconnect();
+            rowObserver.current?.disconnect();
+        };
+    }, []);
+
+    const onScroll = () => {
+        const el = scrollRef.current;
+        if (!el) return;
+        stickToBottom.current = el.scrollTop + el.clientHeight >= el.scrollHeight - 8;
+        setViewport({ top: el.scrollTop, height: el.clientHeight });
+    };
+
+    const rows = [];
+    for (let i = start; i < end; i++) {
+        const seq = log.first + i;
+        const entry = logEntry(log, i);
+        const isAI = entry.startsWith('🤖');
+        const isNew = seq >= seen.animateFrom;
+        rows.push(
+            <div key={seq} ref={measureRow} data-seq={seq} className="absolute left-0 right-0 pb-2" style={{ top: offsets[i] }}>
+                <div
+                    className={`pb-1 rounded px-1.5 py-0.5 ${isNew ? 'animate-in fade-in slide-in-from-left-2 duration-300' : ''} ${isAI
+                            ? 'bg-gradient-to-r from-red-900/80 to-orange-900/60 border-l-4 border-l-red-500 text-white font-bold shadow-[0_0_8px_rgba(239,68,68,0.3)] my-1'
+                            : i === log.length - 1 ? '' : 'border-b border-slate-800/50'
+                        }`}
+                >
+                    <span className={`mr-2 ${isAI ? 'text-red-300' : 'text-blue-400'}`}>[{seq + 1}]</span>
+                    {entry}
+                </div>
+            </div>
+        );
+    }
 
     return (
         <div className="w-64 bg-slate-900 border-r border-slate-700 flex flex-col h-full shrink-0">
             <div className="p-3 bg-slate-950 border-b border-slate-800 flex items-center gap-2 shadow-sm">
                 <ScrollText size={18} className="text-slate-400" />
                 <h3 className="font-bold text-slate-200 text-sm uppercase tracking-wider">Combat Log</h3>
+                <label className="ml-auto flex items-center gap-1 text-[10px] text-slate-400" title="Keep entries older than the panel shows, for the download">
+                    <input type="checkbox" checked={keepFullLog} onChange={e => setKeepFullLog(e.target.checked)} />
+                    Keep all
+                </label>
+                <button onClick={downloadLog} className="p-1 text-slate-400 hover:text-white" title="Download log">
+                    <Download size={14} />
+                </button>
             </div>
 
             <div
                 ref={scrollRef}
-                className="flex-grow overflow-y-auto p-3 space-y-2 font-mono text-xs text-slate-300 scrollbar-thin scrollbar-thumb-slate-700 scrollbar-track-transparent"
+                onScroll={onScroll}
+                className="flex-grow overflow-y-auto p-3 font-mono text-xs text-slate-300 scrollbar-thin scrollbar-thumb-slate-700 scrollbar-track-transparent"
             >
                 {log.length === 0 && (
                     <div className="text-slate-600 italic text-center mt-4">No actions yet.</div>
                 )}
 
-                {log.map((entry, index) => {
-                    const isAI = entry.startsWith('🤖');
-                    return (
-                        <div
-                            key={index}
-                            className={`pb-1 last:border-0 animate-in fade-in slide-in-from-left-2 duration-300 rounded px-1.5 py-0.5 ${isAI
-                                    ? 'bg-gradient-to-r from-red-900/80 to-orange-900/60 border-l-4 border-l-red-500 text-white font-bold shadow-[0_0_8px_rgba(239,68,68,0.3)] my-1'
-                                    : 'border-b border-slate-800/50'
-                                }`}
-                        >
-                            <span className={`mr-2 ${isAI ? 'text-red-300' : 'text-blue-400'}`}>[{index + 1}]</span>
-                            {entry}
-                        </div>
-                    );
-                })}
+                <div className="relative" style={{ height: totalHeight }}>
+                    {rows}
+                </div>
             </div>
         </div>
     );
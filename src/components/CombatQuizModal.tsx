@@ -4,6 +4,8 @@ import type { Card } from '../types';
 import { motion } from 'framer-motion';
 import { Sword, CheckCircle, XCircle, ChevronRight, Info, RotateCcw, Coins, ChevronUp, ChevronDown } from 'lucide-react';
 import { clsx } from 'clsx';
+import { getCardStats } from '../store/cardStats';
+import { cardArtUrl } from '../images/cardArt';
 
 const KEYWORD_COLORS: Record<string, string> = {
     'Flying': 'bg-sky-500 text-white',
@@ -40,7 +42,7 @@ export const CombatQuizModal = () => {
         if (!isSubmitted || !pendingOutcome) return 0;
         let correctCount = 0;
         Object.entries(predictions).forEach(([cardId, prediction]) => {
-            const isDead = pendingOutcome.deaths.includes(cardId);
+            const isDead = !!pendingOutcome.deathIndex[cardId];
             const actualOutcome = isDead ? 'Dies' : 'Survives';
             if (prediction === actualOutcome) {
                 correctCount++;
@@ -49,9 +51,7 @@ export const CombatQuizModal = () => {
 
         let damageGold = 0;
         Object.entries(damageGuesses).forEach(([cardId, guess]) => {
-            const actualDamage = pendingOutcome.damageEvents
-                .filter(e => e.targetId === cardId)
-                .reduce((sum, e) => sum + e.damage, 0);
+            const actualDamage = pendingOutcome.damageByCard[cardId] || 0;
             if (guess === actualDamage) {
                 damageGold += 1;
             }
@@ -167,7 +167,7 @@ export const CombatQuizModal = () => {
                                 <div className="flex items-center gap-4">
                                     <div className="relative">
                                         <div className="w-12 h-12 bg-slate-700 rounded-lg overflow-hidden border border-slate-600">
-                                            <img src={pair.attacker.imageUrl} alt="" className="w-full h-full object-cover" />
+                                            <img src={cardArtUrl(pair.attacker.imageUrl)} alt="" className="w-full h-full object-cover" />
                                         </div>
                                         {(pair.attacker.plusOneCounters || 0) > 0 && (
                                             <div className="absolute -top-1 -left-1 bg-emerald-600 text-[8px] font-bold px-1 rounded text-white border border-white/20">
@@ -181,7 +181,7 @@ export const CombatQuizModal = () => {
                                         )}
                                         <div className="absolute -bottom-1 -right-1 bg-red-600 text-[9px] font-black px-1.5 py-0.5 rounded text-white border border-white/20 shadow-lg flex items-center gap-1">
                                             <span className="text-[7px] opacity-70">TOTAL</span>
-                                            {parseInt(pair.attacker.power || '0') + (pair.attacker.plusOneCounters || 0) - (pair.attacker.minusOneCounters || 0)}/{parseInt(pair.attacker.toughness || '0') + (pair.attacker.plusOneCounters || 0) - (pair.attacker.minusOneCounters || 0)}
+                                            {getCardStats(pair.attacker).power}/{getCardStats(pair.attacker).toughness}
                                         </div>
                                     </div>
                                     <div>
@@ -208,16 +208,14 @@ export const CombatQuizModal = () => {
                                         guess={damageGuesses[pair.attacker.id] || 0}
                                         onAdjust={adjustDamageGuess}
                                         isSubmitted={isSubmitted}
-                                        actual={pendingOutcome.damageEvents
-                                            .filter(e => e.targetId === pair.attacker.id)
-                                            .reduce((sum, e) => sum + e.damage, 0)}
+                                        actual={pendingOutcome.damageByCard[pair.attacker.id] || 0}
                                     />
                                     <QuizToggle
                                         cardId={pair.attacker.id}
                                         prediction={predictions[pair.attacker.id]}
                                         onSelect={togglePrediction}
                                         isSubmitted={isSubmitted}
-                                        actual={pendingOutcome.deaths.includes(pair.attacker.id) ? 'Dies' : 'Survives'}
+                                        actual={pendingOutcome.deathIndex[pair.attacker.id] ? 'Dies' : 'Survives'}
                                     />
                                 </div>
                             </div>
@@ -235,7 +233,7 @@ export const CombatQuizModal = () => {
                                                 <ChevronRight className="text-slate-600" />
                                                 <div className="relative">
                                                     <div className="w-10 h-10 bg-slate-700 rounded-lg overflow-hidden border border-slate-600">
-                                                        <img src={blocker.imageUrl} alt="" className="w-full h-full object-cover" />
+                                                        <img src={cardArtUrl(blocker.imageUrl)} alt="" className="w-full h-full object-cover" />
                                                     </div>
                                                     {(blocker.plusOneCounters || 0) > 0 && (
                                                         <div className="absolute -top-1 -left-1 bg-emerald-600 text-[8px] font-bold px-1 rounded text-white border border-white/20">
@@ -249,7 +247,7 @@ export const CombatQuizModal = () => {
                                                     )}
                                                     <div className="absolute -bottom-1 -right-1 bg-blue-600 text-[9px] font-black px-1.5 py-0.5 rounded text-white border border-white/20 shadow-lg flex items-center gap-1">
                                                         <span className="text-[7px] opacity-70">TOTAL</span>
-                                                        {parseInt(blocker.power || '0') + (blocker.plusOneCounters || 0) - (blocker.minusOneCounters || 0)}/{parseInt(blocker.toughness || '0') + (blocker.plusOneCounters || 0) - (blocker.minusOneCounters || 0)}
+                                                        {getCardStats(blocker).power}/{getCardStats(blocker).toughness}
                                                     </div>
                                                 </div>
                                                 <div>
@@ -298,16 +296,14 @@ export const CombatQuizModal = () => {
                                                         guess={damageGuesses[blocker.id] || 0}
                                                         onAdjust={adjustDamageGuess}
                                                         isSubmitted={isSubmitted}
-                                                        actual={pendingOutcome.damageEvents
-                                                            .filter(e => e.targetId === blocker.id)
-                                                            .reduce((sum, e) => sum + e.damage, 0)}
+                                                        actual={pendingOutcome.damageByCard[blocker.id] || 0}
                                                     />
                                                     <QuizToggle
                                                         cardId={blocker.id}
                                                         prediction={predictions[blocker.id]}
                                                         onSelect={togglePrediction}
                                                         isSubmitted={isSubmitted}
-                                                        actual={pendingOutcome.deaths.includes(blocker.id) ? 'Dies' : 'Survives'}
+                                                        actual={pendingOutcome.deathIndex[blocker.id] ? 'Dies' : 'Survives'}
                                                     />
                                                 </div>
                                             </div>
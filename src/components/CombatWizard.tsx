@@ -1,10 +1,13 @@
 import { useState } from 'react';
 import { useGameStore } from '../store/gameStore';
+import { hasKeyword } from '../store/cardStats';
+import { suggestDamageOrder } from '../store/blockPlanner';
+import type { Card } from '../types';
 import { motion, AnimatePresence } from 'framer-motion';
-import { Sword, Shield, Skull, CheckCircle, ArrowRight, ChevronDown, ChevronUp, RotateCcw } from 'lucide-react';
+import { Sword, Shield, Skull, CheckCircle, ArrowRight, ChevronDown, ChevronUp, RotateCcw, Sparkles } from 'lucide-react';
 
 export const CombatWizard = () => {
-    const { phase, combatStep, activePlayerId, nextPhase, getCombatHints, attackers, blockers, players, setShowSkipCombatConfirmation, resetBlockers, reorderBlockers } = useGameStore();
+    const { phase, combatStep, activePlayerId, nextPhase, getCombatHints, attackers, blockers, players, setShowSkipCombatConfirmation, resetBlockers, reorderBlockers, setBlockerOrder } = useGameStore();
     const [isCollapsed, setIsCollapsed] = useState(false);
 
     // Only show during combat
@@ -18,7 +21,7 @@ export const CombatWizard = () => {
             // Check if there are any creatures that WOULD have been able to attack
             const myBattlefield = players.find(p => p.id === 'player1')?.battlefield || [];
             const hasPotentialAttackers = myBattlefield.some(c =>
-                !c.tapped && (!c.summoningSickness || c.keywords?.includes('Haste'))
+                !c.tapped && (!c.summoningSickness || hasKeyword(c, 'Haste'))
             );
 
             if (hasPotentialAttackers) {
@@ -112,11 +115,26 @@ export const CombatWizard = () => {
                                             const p2 = players.find(p => p.id === 'player2');
                                             const p1 = players.find(p => p.id === 'player1');
                                             const attacker = p2?.battlefield.find(c => c.id === attId);
+                                            // Live suggestion: the damage order that serves the defender best.
+                                            const group = bIds.map(id => p1?.battlefield.find(c => c.id === id)).filter((c): c is Card => !!c);
+                                            const suggestion = attacker && group.length > 1 ? suggestDamageOrder(attacker, group, 'defender') : null;
 
                                             return (
                                                 <div key={attId} className="space-y-2 bg-slate-800/30 rounded-lg p-2 border border-slate-700/30">
                                                     <div className="flex items-center gap-2 text-[10px] text-slate-400 font-bold mb-1 italic">
                                                         <Sword size={10} className="text-red-500" /> vs {attacker?.name}
+                                                        {suggestion && suggestion.gain > 0.01 && (
+                                                            <button
+                                                                onClick={(e) => {
+                                                                    e.stopPropagation();
+                                                                    setBlockerOrder(attId, suggestion.order);
+                                                                }}
+                                                                className="ml-auto flex items-center gap-1 px-1.5 py-0.5 rounded bg-amber-500/10 border border-amber-500/30 text-amber-300 not-italic hover:bg-amber-500/20 transition-all"
+                                                                title="Use the damage order that loses the least"
+                                                            >
+                                                                <Sparkles size={10} /> Best order
+                                                            </button>
+                                                        )}
                                                     </div>
                                                     {bIds.map((blkId, idx) => {
                                                         const blocker = p1?.battlefield.find(c => c.id === blkId);
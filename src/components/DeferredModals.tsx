@@ -0,0 +1,135 @@
+import { lazy, Suspense, useEffect, useState } from 'react';
+import { Settings } from 'lucide-react';
+import { useGameStore } from '../store/gameStore';
+import {
+    loadCombatQuizModal, loadCombatSummaryModal, loadLivePlayersIndicator, loadPenaltyNotification, loadProfilerOverlay,
+    loadSettingsMenu, loadSkipCombatModal, loadStartBattleModal, loadTreasureShop, loadVictoryModal, whenIdle
+} from './lazyComponents';
+
+// Stand-ins for the code-split components (see lazyComponents.ts). A modal mounts the first time the
+// store says it is open and then stays mounted, so exit animations and local state behave as before.
+
+type StoreState = ReturnType<typeof useGameStore.getState>;
+
+// True from the first time `isOpen` holds.
+const useOpenedOnce = (isOpen: (state: StoreState) => boolean) => {
+    const open = useGameStore(isOpen);
+    const [opened, setOpened] = useState(open);
+    if (open && !opened) setOpened(true);
+    return opened || open;
+};
+
+const LazyVictoryModal = lazy(loadVictoryModal);
+const LazyCombatQuizModal = lazy(loadCombatQuizModal);
+const LazyCombatSummaryModal = lazy(loadCombatSummaryModal);
+const LazyTreasureShop = lazy(loadTreasureShop);
+const LazyStartBattleModal = lazy(loadStartBattleModal);
+const LazySkipCombatModal = lazy(loadSkipCombatModal);
+const LazyPenaltyNotification = lazy(loadPenaltyNotification);
+
+export const VictoryModal = () => {
+    const opened = useOpenedOnce(s => !!s.winner);
+    if (!opened) return null;
+    return (
+        <Suspense fallback={null}>
+            <LazyVictoryModal />
+        </Suspense>
+    );
+};
+
+export const CombatQuizModal = () => {
+    const opened = useOpenedOnce(s => s.showQuiz && !!s.pendingOutcome);
+    if (!opened) return null;
+    return (
+        <Suspense fallback={null}>
+            <LazyCombatQuizModal />
+        </Suspense>
+    );
+};
+
+export const CombatSummaryModal = () => {
+    const opened = useOpenedOnce(s => s.showSummary && !!s.lastCombatSummary);
+    if (!opened) return null;
+    return (
+        <Suspense fallback={null}>
+            <LazyCombatSummaryModal />
+        </Suspense>
+    );
+};
+
+export const TreasureShop = () => {
+    const opened = useOpenedOnce(s => s.showShop);
+    if (!opened) return null;
+    return (
+        <Suspense fallback={null}>
+            <LazyTreasureShop />
+        </Suspense>
+    );
+};
+
+export const StartBattleModal = () => {
+    const opened = useOpenedOnce(s => s.showStartPrompt);
+    if (!opened) return null;
+    return (
+        <Suspense fallback={null}>
+            <LazyStartBattleModal />
+        </Suspense>
+    );
+};
+
+export const SkipCombatModal = () => {
+    const opened = useOpenedOnce(s => s.showSkipCombatConfirmation);
+    if (!opened) return null;
+    return (
+        <Suspense fallback={null}>
+            <LazySkipCombatModal />
+        </Suspense>
+    );
+};
+
+export const PenaltyNotification = () => {
+    const opened = useOpenedOnce(s => !!s.penaltyNotice?.visible);
+    if (!opened) return null;
+    return (
+        <Suspense fallback={null}>
+            <LazyPenaltyNotification />
+        </Suspense>
+    );
+};
+
+const LazyLivePlayers = lazy(loadLivePlayersIndicator);
+
+// Presence is a nicety: connect to Firebase once the game is on screen and the browser is idle.
+export const LivePlayersIndicator = () => {
+    const [ready, setReady] = useState(false);
+    useEffect(() => whenIdle(() => setReady(true)), []);
+    if (!ready) return null;
+    return (
+        <Suspense fallback={null}>
+            <LazyLivePlayers />
+        </Suspense>
+    );
+};
+
+const LazySettingsMenu = lazy(loadSettingsMenu);
+
+// The gear shows from the first paint; it works once the menu behind it has loaded.
+export const SettingsMenu = () => (
+    <Suspense
+        fallback={
+            <button disabled className="p-2 rounded-lg bg-slate-800 text-slate-300 border border-slate-700" title="Settings">
+                <Settings size={20} />
+            </button>
+        }
+    >
+        <LazySettingsMenu />
+    </Suspense>
+);
+
+const LazyProfilerOverlay = lazy(loadProfilerOverlay);
+
+export const ProfilerOverlay = () => (
+    <Suspense fallback={null}>
+        <LazyProfilerOverlay />
+    </Suspense>
+);
@@ -1,21 +1,21 @@
+import { useEffect } from 'react';
 import { useGameStore } from '../store/gameStore';
 import { PlayerHUD } from './PlayerHUD';
 import { Battlefield } from './Battlefield';
 import { CombatLog } from './CombatLog';
 import { CombatWizard } from './CombatWizard';
-import { CombatQuizModal } from './CombatQuizModal';
-import { CombatSummaryModal } from './CombatSummaryModal';
 import { TurnBanner } from './TurnBanner';
-import { VictoryModal } from './VictoryModal';
-import { TreasureShop } from './TreasureShop';
-import { StartBattleModal } from './StartBattleModal';
 import { MechanicsGuide } from './MechanicsGuide';
 import { CombatTimeline } from './CombatTimeline';
-import { SkipCombatModal } from './SkipCombatModal';
-import { PenaltyNotification } from './PenaltyNotification';
-import { SettingsMenu } from './SettingsMenu';
-import { LivePlayersIndicator } from './LivePlayersIndicator';
-import { Shuffle, GraduationCap } from 'lucide-react';
+import {
+    CombatQuizModal, CombatSummaryModal, LivePlayersIndicator, PenaltyNotification, ProfilerOverlay, SettingsMenu,
+    SkipCombatModal, StartBattleModal, TreasureShop, VictoryModal
+} from './DeferredModals';
+import { profiler } from '../store/profiler';
+import { preloadCardArt, upcomingCardArt } from '../images/cardArt';
+import { whenIdle } from './lazyComponents';
+import { QUIZ_LEVELS } from '../quiz/quizBank';
+import { Shuffle, GraduationCap, FastForward } from 'lucide-react';
 import { motion } from 'framer-motion';
 
 export const GameInterface = () => {
@@ -29,12 +29,27 @@ export const GameInterface = () => {
         toggleQuizMode,
         toggleShop,
         showStartPrompt,
-        isAdminMode
+        isAdminMode,
+        winner,
+        turbo,
+        startTurbo,
+        stopTurbo,
+        seed,
+        nextSeed,
+        startQuizDrill,
+        snapshots,
+        currentSnapshot,
+        restoreSnapshot
     } = useGameStore();
 
     const player1 = players[0];
     const player2 = players[1];
 
+    // While this battle is played, fetch the art of the next one and of the creatures the shop can summon.
+    useEffect(() => {
+        whenIdle(() => preloadCardArt(upcomingCardArt(useGameStore.getState().players, nextSeed)));
+    }, [seed, nextSeed]);
+
     return (
         <div className="h-screen bg-neutral-950 text-white flex flex-col font-sans overflow-hidden">
             <VictoryModal />
@@ -47,7 +62,7 @@ export const GameInterface = () => {
             <div className="bg-neutral-900 p-3 shadow-md flex justify-between items-center z-30 border-b border-slate-800 shrink-0 relative">
                 <div className="flex items-center gap-4">
                     <button
-                        onClick={shuffleBoard}
+                        onClick={() => shuffleBoard()}
                         className="bg-emerald-600 hover:bg-emerald-500 active:scale-95 text-white px-4 py-2 rounded-lg font-bold flex items-center gap-2 transition-all shadow-md"
                     >
                         <Shuffle size={18} /> New Battle
@@ -67,6 +82,47 @@ export const GameInterface = () => {
                         {quizMode ? "Quiz Mode: ON" : "Quiz Mode: OFF"}
                     </button>
 
+                    {!turbo && (
+                        <select
+                            value=""
+                            onChange={e => e.target.value && startQuizDrill(Number(e.target.value))}
+                            className="px-3 py-2 rounded-lg font-bold transition-all shadow-md border bg-slate-800 border-slate-700 text-slate-400 hover:text-slate-200"
+                            title="Deal a pre-solved combat from the quiz bank"
+                        >
+                            <option value="">Quiz Drill</option>
+                            {Array.from({ length: QUIZ_LEVELS }, (_, i) => (
+                                <option key={i + 1} value={i + 1}>Level {i + 1}</option>
+                            ))}
+                        </select>
+                    )}
+
+                    {!turbo && snapshots.length > 1 && (
+                        <select
+                            value={currentSnapshot ?? ''}
+                            onChange={e => restoreSnapshot(Number(e.target.value))}
+                            className="px-3 py-2 rounded-lg font-bold transition-all shadow-md border bg-slate-800 border-slate-700 text-slate-400 hover:text-slate-200"
+                            title="Go back to an earlier decision in this battle"
+                        >
+                            {snapshots.map(snapshot => (
+                                <option key={snapshot.id} value={snapshot.id}>{snapshot.label}</option>
+                            ))}
+                        </select>
+                    )}
+
+                    {!showStartPrompt && !winner && (
+                        <button
+                            onClick={turbo ? stopTurbo : startTurbo}
+                            className={`px-4 py-2 rounded-lg font-bold flex items-center gap-2 transition-all shadow-md border ${turbo
+                                ? "bg-amber-600 border-amber-400 text-white animate-pulse"
+                                : "bg-slate-800 border-slate-700 text-slate-400 hover:text-slate-200"
+                                }`}
+                            title="Let the AI play both sides to the end of the battle, without delays (a few hundred turns a second)"
+                        >
+                            <FastForward size={18} />
+                            {turbo ? "Stop Turbo" : "Turbo"}
+                        </button>
+                    )}
+
                     <div className="flex flex-col">
                         <span className="text-[10px] text-slate-500 font-bold uppercase">Active Player</span>
                         <span className={`font-bold ${activePlayerId === player1.id ? "text-green-400" : "text-red-400"}`}>
@@ -93,6 +149,7 @@ export const GameInterface = () => {
                     <LivePlayersIndicator />
 
                     <div className="h-8 w-px bg-slate-700 mx-1"></div>
+                    {(import.meta.env.DEV || profiler.isEnabled()) && <ProfilerOverlay />}
                     <SettingsMenu />
                 </div>
             </div >
@@ -137,7 +194,7 @@ export const GameInterface = () => {
 
                             {/* Opponent Battlefield (Center-Top) */}
                             <div className="flex-grow flex items-end justify-center pb-8 p-4 z-10 w-full">
-                                <Battlefield player={player2} />
+                                <Battlefield playerId={player2.id} />
                             </div>
                         </div>
 
@@ -154,7 +211,7 @@ export const GameInterface = () => {
 
                             {/* Player Battlefield (Center-Bottom) */}
                             <div className="flex-grow flex items-start justify-center pt-8 p-4 z-10 w-full">
-                                <Battlefield player={player1} />
+                                <Battlefield playerId={player1.id} />
                             </div>
 
                             <div className="absolute bottom-4 left-4 z-30 flex items-end gap-4">
@@ -1,58 +1,20 @@
 import { useState, useEffect } from 'react';
 import { Users } from 'lucide-react';
 import { motion, AnimatePresence } from 'framer-motion';
-import { ref, onValue, onDisconnect, set, serverTimestamp } from 'firebase/database';
 import { rtdb } from '../firebase';
+import { createFirebaseBackend } from '../presence/firebaseBackend';
+import { createPresence } from '../presence/presence';
+
+const presenceBackend = createFirebaseBackend(rtdb);
 
 export const LivePlayersIndicator = () => {
     const [livePlayers, setLivePlayers] = useState<number | null>(null);
 
     useEffect(() => {
-        // Unique ID for this specific browser tab/session
-        const sessionId = Math.random().toString(36).substring(2, 10);
-
-        // References to the database
-        const amOnlineRef = ref(rtdb, '.info/connected');
-        const userPresenceRef = ref(rtdb, `presence/${sessionId}`);
-        const allPresenceRef = ref(rtdb, 'presence');
-
-        // 1. Listen for connection state changes
-        const unsubConnected = onValue(amOnlineRef, (snapshot) => {
-            if (snapshot.val() === true) {
-                // When we connect, set up the disconnect behavior
-                // (if we lose connection, remove our presence from the DB)
-                onDisconnect(userPresenceRef).remove().then(() => {
-                    // Then add our presence to the DB
-                    set(userPresenceRef, {
-                        online: true,
-                        last_changed: serverTimestamp()
-                    });
-                });
-            }
-        });
-
-        // 2. Listen for the total count of everyone currently in the 'presence' node
-        const unsubPresence = onValue(allPresenceRef, (snapshot) => {
-            if (snapshot.exists()) {
-                const data = snapshot.val();
-                let count = 0;
-                for (const key in data) {
-                    if (data[key] && data[key].online) {
-                        count++;
-                    }
-                }
-                setLivePlayers(count);
-            } else {
-                setLivePlayers(0);
-            }
-        });
-
-        // Cleanup on unmount
+        // Sharded counters, not the session list: see presence.ts
+        const presence = createPresence(presenceBackend, { onCount: setLivePlayers });
         return () => {
-            unsubConnected();
-            unsubPresence();
-            // Remove ourselves when we navigate away cleanly
-            set(userPresenceRef, null);
+            presence.stop();
         };
     }, []);
 
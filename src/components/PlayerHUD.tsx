@@ -3,6 +3,7 @@ import type { Player } from '../types';
 import { Heart, Skull, Shield, Coins, ChevronDown, ChevronUp, Infinity as InfinityIcon } from 'lucide-react';
 import { motion } from 'framer-motion';
 import { useGameStore } from '../store/gameStore';
+import { cardArtUrl } from '../images/cardArt';
 
 interface PlayerHUDProps {
     player: Player;
@@ -135,7 +136,7 @@ export const PlayerHUD = ({ player, isActive }: PlayerHUDProps) => {
                         </div>
                         <div className="w-8 h-8 rounded-lg overflow-hidden border border-white/10 shrink-0 shadow-lg transition-transform group-hover:scale-110">
                             <img
-                                src={player.commander.imageUrl}
+                                src={cardArtUrl(player.commander.imageUrl)}
                                 alt={player.commander.name}
                                 className="w-full h-full object-cover scale-150"
                             />
@@ -0,0 +1,130 @@
+import { useEffect, useState } from 'react';
+import { Activity, Download, RotateCcw, X } from 'lucide-react';
+import { HISTOGRAM_BOUNDS_MS, histogramPercentile, profiler, rememberProfilerEnabled } from '../store/profiler';
+import type { Histogram } from '../store/profiler';
+
+const REFRESH_MS = 500;
+
+const formatMs = (ms: number) => (ms === Infinity ? `>${HISTOGRAM_BOUNDS_MS[HISTOGRAM_BOUNDS_MS.length - 1]}` : ms < 1 ? ms.toFixed(2) : ms.toFixed(1));
+
+const formatBytes = (bytes: number) =>
+    bytes === 0 ? '–' : bytes < 1024 * 1024 ? `${(bytes / 1024).toFixed(0)} KB` : `${(bytes / 1024 / 1024).toFixed(1)} MB`;
+
+// Bucket counts as a row of bars, fastest on the left.
+const Sparkline = ({ histogram }: { histogram: Histogram }) => {
+    const peak = Math.max(...histogram.buckets, 1);
+    return (
+        <div className="flex items-end gap-px h-4 w-16">
+            {histogram.buckets.map((n, i) => (
+                <div key={i} className="flex-1 bg-emerald-500/70" style={{ height: `${(n / peak) * 100}%` }} />
+            ))}
+        </div>
+    );
+};
+
+const downloadTrace = () => {
+    const blob = new Blob([JSON.stringify(profiler.exportTrace())], { type: 'application/json' });
+    const url = URL.createObjectURL(blob);
+    const link = document.createElement('a');
+    link.href = url;
+    link.download = `combat-sim-trace-${new Date().toISOString().replace(/[:.]/g, '-')}.json`;
+    link.click();
+    URL.revokeObjectURL(url);
+};
+
+// Developer overlay for the store profiler: per-action timings, refreshed while open, and a trace
+// export that opens in Chrome's Performance panel or ui.perfetto.dev.
+export const ProfilerOverlay = () => {
+    const [isOpen, setIsOpen] = useState(false);
+    const [enabled, setEnabled] = useState(profiler.isEnabled);
+    const [stats, setStats] = useState(profiler.snapshot);
+
+    useEffect(() => {
+        if (!isOpen) return;
+        const timer = setInterval(() => setStats(profiler.snapshot()), REFRESH_MS);
+        return () => clearInterval(timer);
+    }, [isOpen]);
+
+    const toggleEnabled = () => {
+        profiler.setEnabled(!enabled);
+        rememberProfilerEnabled(!enabled);
+        setEnabled(!enabled);
+    };
+
+    const reset = () => {
+        profiler.reset();
+        setStats(profiler.snapshot());
+    };
+
+    const rows = Object.entries(stats).sort(([, a], [, b]) => b.totalMs - a.totalMs);
+
+    return (
+        <div className="relative">
+            <button
+                onClick={() => {
+                    setStats(profiler.snapshot());
+                    setIsOpen(!isOpen);
+                }}
+                className={`p-2 rounded-lg bg-slate-800 hover:bg-slate-700 transition-colors border border-slate-700 ${enabled ? 'text-emerald-400' : 'text-slate-300'}`}
+                title="Profiler"
+            >
+                <Activity size={20} />
+            </button>
+
+            {isOpen && (
+                <div className="absolute right-0 mt-2 w-[34rem] bg-slate-900/95 border border-slate-700 rounded-lg shadow-xl z-50 text-xs text-slate-300">
+                    <div className="flex items-center justify-between p-2 border-b border-slate-800">
+                        <label className="flex items-center gap-2 font-bold uppercase tracking-wider text-slate-400">
+                            <input type="checkbox" checked={enabled} onChange={toggleEnabled} />
+                            Profile store actions
+                        </label>
+                        <div className="flex items-center gap-1">
+                            <button onClick={reset} className="p-1 hover:text-white" title="Reset">
+                                <RotateCcw size={14} />
+                            </button>
+                            <button onClick={downloadTrace} className="p-1 hover:text-white" title="Export trace (Chrome / Perfetto)">
+                                <Download size={14} />
+                            </button>
+                            <button onClick={() => setIsOpen(false)} className="p-1 hover:text-white" title="Close">
+                                <X size={14} />
+                            </button>
+                        </div>
+                    </div>
+
+                    {rows.length === 0 ? (
+                        <div className="p-4 text-center italic text-slate-500">
+                            {enabled ? 'No measured calls yet. Play a turn.' : 'Profiling is off.'}
+                        </div>
+                    ) : (
+                        <table className="w-full font-mono">
+                            <thead className="text-slate-500">
+                                <tr>
+                                    <th className="text-left p-1.5">action / section</th>
+                                    <th className="text-right p-1.5">calls</th>
+                                    <th className="text-right p-1.5">mean ms</th>
+                                    <th className="text-right p-1.5">p95 ms</th>
+                                    <th className="text-right p-1.5">max ms</th>
+                                    <th className="text-right p-1.5">heap</th>
+                                    <th className="p-1.5"></th>
+                                </tr>
+                            </thead>
+                            <tbody>
+                                {rows.map(([name, h]) => (
+                                    <tr key={name} className="border-t border-slate-800">
+                                        <td className="p-1.5 text-slate-200">{name}</td>
+                                        <td className="p-1.5 text-right">{h.count}</td>
+                                        <td className="p-1.5 text-right">{formatMs(h.totalMs / h.count)}</td>
+                                        <td className="p-1.5 text-right">{formatMs(histogramPercentile(h, 0.95))}</td>
+                                        <td className="p-1.5 text-right">{formatMs(h.maxMs)}</td>
+                                        <td className="p-1.5 text-right">{formatBytes(h.heapBytes)}</td>
+                                        <td className="p-1.5"><Sparkline histogram={h} /></td>
+                                    </tr>
+                                ))}
+                            </tbody>
+                        </table>
+                    )}
+                </div>
+            )}
+        </div>
+    );
+};
@@ -6,13 +6,13 @@ import { useState, useEffect } from 'react';
 type RollStage = 'init' | 'npcRolling' | 'userTurn' | 'userRolling' | 'result';
 
 export const StartBattleModal = () => {
-    const { showStartPrompt, startGame, closeStartPrompt } = useGameStore();
+    const { showStartPrompt, startGame, closeStartPrompt, rollD20 } = useGameStore();
     const [rollStage, setRollStage] = useState<RollStage>('init');
     const [npcRoll, setNpcRoll] = useState(0);
     const [userRoll, setUserRoll] = useState(0);
     const [tempRoll, setTempRoll] = useState(1);
 
-    // Dice animation interval
+    // Dice animation interval; only the final rolls come from the battle's rng, so a seed replays them
     useEffect(() => {
         let interval: any;
         if (rollStage === 'npcRolling' || rollStage === 'userRolling') {
@@ -27,7 +27,7 @@ export const StartBattleModal = () => {
     const startNpcRoll = () => {
         setRollStage('npcRolling');
         setTimeout(() => {
-            const roll = Math.floor(Math.random() * 20) + 1;
+            const roll = rollD20();
             setNpcRoll(roll);
             setRollStage('userTurn');
         }, 1500);
@@ -37,7 +37,7 @@ export const StartBattleModal = () => {
     const startUserRoll = () => {
         setRollStage('userRolling');
         setTimeout(() => {
-            const roll = Math.floor(Math.random() * 20) + 1;
+            const roll = rollD20();
             // Ensure no ties for simplicity or just handle them
             const finalRoll = roll === npcRoll ? (roll === 20 ? 19 : roll + 1) : roll;
             setUserRoll(finalRoll);
@@ -107,7 +107,7 @@ export const VictoryModal = () => {
 
                         {/* Actions */}
                         <button
-                            onClick={shuffleBoard}
+                            onClick={() => shuffleBoard()}
                             className={clsx(
                                 "group relative w-full py-4 rounded-xl font-black text-xl transition-all active:scale-95 shadow-xl flex items-center justify-center gap-3 overflow-hidden",
                                 isPlayerWin
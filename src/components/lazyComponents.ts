@@ -0,0 +1,56 @@
+import { loadQuizBank } from '../quiz/bankLoader';
+
+// Components kept out of the startup bundle: the modals, the settings menu, the mechanics encyclopedia,
+// the profiler overlay and the live player counter (which brings in the Firebase SDK). Each loads the first time it
+// is needed; prefetchDeferredComponents warms them (and the quiz bank) one at a time while the browser
+// is idle after the first paint, so opening one later rarely waits on the network.
+
+const named = <K extends string, M extends Record<K, unknown>>(load: () => Promise<M>, name: K) =>
+    () => load().then(module => ({ default: module[name] }));
+
+export const loadVictoryModal = named(() => import('./VictoryModal'), 'VictoryModal');
+export const loadCombatQuizModal = named(() => import('./CombatQuizModal'), 'CombatQuizModal');
+export const loadCombatSummaryModal = named(() => import('./CombatSummaryModal'), 'CombatSummaryModal');
+export const loadTreasureShop = named(() => import('./TreasureShop'), 'TreasureShop');
+export const loadStartBattleModal = named(() => import('./StartBattleModal'), 'StartBattleModal');
+export const loadSkipCombatModal = named(() => import('./SkipCombatModal'), 'SkipCombatModal');
+export const loadPenaltyNotification = named(() => import('./PenaltyNotification'), 'PenaltyNotification');
+export const loadLivePlayersIndicator = named(() => import('./LivePlayersIndicator'), 'LivePlayersIndicator');
+export const loadSettingsMenu = named(() => import('./SettingsMenu'), 'SettingsMenu');
+export const loadProfilerOverlay = named(() => import('./ProfilerOverlay'), 'ProfilerOverlay');
+export const mechanicsGuidePanel = named(() => import('./MechanicsGuidePanel'), 'MechanicsGuidePanel');
+
+// Most likely first.
+const PREFETCH_ORDER = [
+    loadStartBattleModal,
+    loadLivePlayersIndicator,
+    loadSettingsMenu,
+    loadCombatQuizModal,
+    loadCombatSummaryModal,
+    loadTreasureShop,
+    loadPenaltyNotification,
+    loadSkipCombatModal,
+    loadVictoryModal,
+    mechanicsGuidePanel,
+    loadQuizBank
+];
+
+// Safari has no requestIdleCallback.
+export const whenIdle = (callback: () => void) => {
+    if (typeof requestIdleCallback === 'function') requestIdleCallback(callback, { timeout: 5000 });
+    else setTimeout(callback, 1000);
+};
+
+let prefetched = false;
+
+export const prefetchDeferredComponents = () => {
+    if (prefetched) return;
+    prefetched = true;
+    const next = (i: number) => {
+        if (i >= PREFETCH_ORDER.length) return;
+        whenIdle(() => {
+            PREFETCH_ORDER[i]().catch(() => { }).finally(() => next(i + 1));
+        });
+    };
+    next(0);
+};
@@ -1,5 +1,5 @@
 import { initializeApp } from 'firebase/app';
-import { getDatabase } from 'firebase/database';
+import { connectDatabaseEmulator, getDatabase } from 'firebase/database';
 
 const firebaseConfig = {
     projectId: "mtgcombat",
@@ -14,3 +14,10 @@ const firebaseConfig = {
 
 const app = initializeApp(firebaseConfig);
 export const rtdb = getDatabase(app);
+
+// `VITE_DATABASE_EMULATOR=localhost:9000 npm run dev` talks to `firebase emulators:start --only database` instead.
+const emulator = import.meta.env.VITE_DATABASE_EMULATOR as string | undefined;
+if (emulator) {
+    const [host, port] = emulator.split(':');
+    connectDatabaseEmulator(rtdb, host, Number(port) || 9000);
+}
@@ -0,0 +1,88 @@
+import { describe, it, expect } from 'vitest';
+import { createArtCache, isCardArtRequest } from './artCache';
+import type { ArtCacheStore } from './artCache';
+
+// Stand-in for Scryfall: the API redirects to the CDN, the CDN serves the bytes. Counts every request.
+const createImageServer = () => {
+    const hits: string[] = [];
+    const fetch = async (input: string) => {
+        let url = new URL(input);
+        hits.push(url.pathname);
+        if (url.pathname === '/cards/named') {
+            url = new URL(`https://cards.scryfall.io/normal/${url.searchParams.get('exact')}.jpg`);
+            hits.push(url.pathname);
+        }
+        if (url.pathname.includes('missing')) return new Response('not found', { status: 404 });
+        return new Response(`art:${url.pathname}`, { headers: { 'content-type': 'image/jpeg' } });
+    };
+    return { hits, fetch };
+};
+
+// Cache Storage keeps entries in insertion order; so does a Map.
+const createMemoryCache = () => {
+    const entries = new Map<string, Response>();
+    const store: ArtCacheStore = {
+        match: async request => entries.get(request.url)?.clone(),
+        put: async (request, response) => {
+            entries.set(request.url, response);
+        },
+        delete: async request => entries.delete(request.url),
+        keys: async () => [...entries.keys()].map(url => new Request(url))
+    };
+    return { entries, store };
+};
+
+const artUrl = (name: string) => `https://api.scryfall.com/cards/named?exact=${name}&format=image&version=normal`;
+
+// Runs the request and waits for the bookkeeping the service worker would have kept alive.
+const request = async (cache: ReturnType<typeof createArtCache>, url: string) => {
+    const work: Promise<unknown>[] = [];
+    const response = await cache.handle(new Request(url), p => work.push(p));
+    await Promise.all(work);
+    return response.text();
+};
+
+describe('Card Art Cache', () => {
+    it('should serve repeat requests from the cache without touching the server', async () => {
+        const server = createImageServer();
+        const memory = createMemoryCache();
+        const cache = createArtCache({ open: async () => memory.store, fetch: server.fetch });
+
+        expect(await request(cache, artUrl('Serra'))).toBe('art:/normal/Serra.jpg');
+        expect(server.hits).toEqual(['/cards/named', '/normal/Serra.jpg']);
+
+        expect(await request(cache, artUrl('Serra'))).toBe('art:/normal/Serra.jpg');
+        expect(server.hits).toHaveLength(2);
+    });
+
+    it('should evict the least recently used art past maxEntries', async () => {
+        const server = createImageServer();
+        const memory = createMemoryCache();
+        const cache = createArtCache({ open: async () => memory.store, fetch: server.fetch, maxEntries: 2 });
+
+        await request(cache, artUrl('a'));
+        await request(cache, artUrl('b'));
+        await request(cache, artUrl('a'));
+        await request(cache, artUrl('c'));
+
+        expect([...memory.entries.keys()]).toEqual([artUrl('a'), artUrl('c')]);
+    });
+
+    it('should not cache failed responses', async () => {
+        const server = createImageServer();
+        const memory = createMemoryCache();
+        const cache = createArtCache({ open: async () => memory.store, fetch: server.fetch });
+
+        await request(cache, artUrl('missing'));
+        expect(memory.entries.size).toBe(0);
+    });
+
+    it('should only claim card art requests', () => {
+        const origin = 'https://combat.example';
+        expect(isCardArtRequest(new URL(artUrl('x')), origin)).toBe(true);
+        expect(isCardArtRequest(new URL('https://cards.scryfall.io/normal/front/x.jpg'), origin)).toBe(true);
+        expect(isCardArtRequest(new URL(`${origin}/card-art/0123abcd.jpg`), origin)).toBe(true);
+        expect(isCardArtRequest(new URL('https://api.scryfall.com/cards/named?exact=x'), origin)).toBe(false);
+        expect(isCardArtRequest(new URL(`${origin}/assets/index.js`), origin)).toBe(false);
+    });
+});
@@ -0,0 +1,69 @@
+// Cache Storage layer behind the service worker (serviceWorker.ts). Card art is served cache-first:
+// a miss follows Scryfall's redirect once, stores the image under the URL the page asked for and
+// evicts the least recently used images past `maxEntries`. Cache and fetch are injected so the
+// whole thing runs against an in-memory cache and a stand-in image server in tests.
+
+export const ART_CACHE_NAME = 'card-art-v1';
+export const ART_CACHE_MAX_ENTRIES = 300;
+
+// The subset of the Cache interface used here.
+export interface ArtCacheStore {
+    match: (request: Request) => Promise<Response | undefined>;
+    put: (request: Request, response: Response) => Promise<void>;
+    delete: (request: Request) => Promise<boolean>;
+    keys: () => Promise<readonly Request[]>;
+}
+
+export interface ArtCacheOptions {
+    open: () => Promise<ArtCacheStore>;
+    fetch: (input: string, init?: RequestInit) => Promise<Response>;
+    maxEntries?: number;
+}
+
+// Scryfall's image redirects, its image CDN and art bundled by scripts/cardArt.ts.
+export const isCardArtRequest = (url: URL, origin: string) =>
+    (url.hostname === 'api.scryfall.com' && url.searchParams.get('format') === 'image') ||
+    url.hostname === 'cards.scryfall.io' ||
+    (url.origin === origin && url.pathname.includes('/card-art/'));
+
+export const createArtCache = ({ open, fetch, maxEntries = ART_CACHE_MAX_ENTRIES }: ArtCacheOptions) => {
+    const evict = async (cache: ArtCacheStore) => {
+        const keys = await cache.keys();
+        await Promise.all(keys.slice(0, Math.max(0, keys.length - maxEntries)).map(key => cache.delete(key)));
+    };
+
+    // Cache keys are kept in insertion order, so re-inserting a hit makes it the most recent entry.
+    const touch = async (cache: ArtCacheStore, key: Request, response: Response) => {
+        await cache.delete(key);
+        await cache.put(key, response);
+    };
+
+    const store = async (cache: ArtCacheStore, key: Request, response: Response) => {
+        await cache.put(key, response);
+        await evict(cache);
+    };
+
+    // `waitUntil` keeps the worker alive for the bookkeeping that happens after the response is sent.
+    const handle = async (request: Request, waitUntil: (work: Promise<unknown>) => void = () => { }) => {
+        const cache = await open();
+        const key = new Request(request.url);
+        const hit = await cache.match(key);
+        if (hit) {
+            waitUntil(touch(cache, key, hit.clone()));
+            return hit;
+        }
+
+        // A CORS fetch gives a readable response that can be cached at its real size; an opaque
+        // no-cors one would be padded to megabytes against the quota, so those are passed through.
+        let response: Response;
+        try {
+            response = await fetch(request.url, { mode: 'cors', credentials: 'omit' });
+        } catch {
+            return fetch(request.url, { mode: 'no-cors' });
+        }
+        if (response.ok) waitUntil(store(cache, key, response.clone()));
+        return response;
+    };
+
+    return { handle };
+};
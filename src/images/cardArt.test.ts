@@ -0,0 +1,17 @@
+import { describe, it, expect } from 'vitest';
+import { useGameStore } from '../store/gameStore';
+import { upcomingCardArt } from './cardArt';
+
+describe('Card Art Preload', () => {
+    it('should include the art of the board New Battle deals next', () => {
+        const { players, nextSeed } = useGameStore.getState();
+        const upcoming = upcomingCardArt(players, nextSeed);
+
+        useGameStore.getState().shuffleBoard();
+        const dealt = useGameStore.getState().players.flatMap(p => [p.commander!, ...p.battlefield]).map(c => c.imageUrl);
+
+        expect(dealt.every(url => upcoming.includes(url!))).toBe(true);
+        expect(useGameStore.getState().seed).toBe(nextSeed);
+        expect(useGameStore.getState().nextSeed).not.toBe(nextSeed);
+    });
+});
@@ -0,0 +1,49 @@
+import type { Player } from '../types';
+import { createBattle } from '../store/gameRules';
+import { getLegalCards } from '../store/cards';
+import { createRng } from '../store/rng';
+import { CARD_ART_MANIFEST } from './cardArtManifest';
+
+// Page side of the image cache: every <img> of card art goes through cardArtUrl, which swaps a
+// Scryfall redirect for the URL resolved or bundled at build time, and the art for what can appear
+// next is fetched ahead of time while the browser is idle. The service worker (serviceWorker.ts)
+// keeps it all in Cache Storage across visits.
+
+export const cardArtUrl = (imageUrl: string | undefined) => (imageUrl ? CARD_ART_MANIFEST[imageUrl] || imageUrl : undefined);
+
+const boardArt = (players: Player[]) =>
+    players.flatMap(p => [p.commander?.imageUrl, ...p.battlefield.map(c => c.imageUrl)]);
+
+// The next New Battle board is dealt from `nextSeed`, so it can be dealt here first; Summon Creature
+// and the gamble draw from the current commanders' legal pools.
+export const upcomingCardArt = (players: Player[], nextSeed: number) => {
+    const urls = [
+        ...boardArt(createBattle(players, createRng(nextSeed))),
+        ...players.flatMap(p => getLegalCards(p.colorIdentity).map(c => c.imageUrl))
+    ];
+    return [...new Set(urls.filter((url): url is string => !!url))];
+};
+
+const requested = new Set<string>();
+
+// One image at a time, so preloading never competes with the art on screen.
+export const preloadCardArt = (imageUrls: readonly string[]) => {
+    const queue = imageUrls.map(cardArtUrl).filter((url): url is string => !!url && !requested.has(url));
+    queue.forEach(url => requested.add(url));
+    const next = () => {
+        const url = queue.shift();
+        if (!url) return;
+        const image = new Image();
+        image.decoding = 'async';
+        image.onload = image.onerror = next;
+        image.src = url;
+    };
+    next();
+};
+
+export const registerArtCache = () => {
+    if (!import.meta.env.PROD || !('serviceWorker' in navigator)) return;
+    window.addEventListener('load', () => {
+        navigator.serviceWorker.register(`${import.meta.env.BASE_URL}sw.js`).catch(() => { });
+    });
+};
@@ -0,0 +1,4 @@
+// Generated by scripts/cardArt.ts (npm run card-art). Do not edit by hand.
+// Maps each card's Scryfall imageUrl to the URL the app loads instead; cards not listed load their imageUrl.
+
+export const CARD_ART_MANIFEST: Record<string, string> = {};
@@ -0,0 +1,38 @@
+import { describe, it, expect } from 'vitest';
+import { resolveCardArt } from './resolveArt';
+
+// Stand-in image server on a local origin: `cards/named` redirects, `/img/` serves the bytes.
+const LOCAL = 'http://localhost:4173';
+const standInFetch = async (input: string) => {
+    const url = new URL(input);
+    if (!url.href.startsWith(LOCAL)) throw new Error(`unexpected request to ${url.origin}`);
+    const name = url.searchParams.get('exact');
+    if (url.pathname === '/cards/named' && name === 'Missing') return new Response('', { status: 404 });
+    if (url.pathname === '/cards/named') return new Response(null, { status: 302, headers: { location: `/img/${name}.png` } });
+    // Two names share one print, so they share its bytes.
+    const bytes = url.pathname.includes('Twin') ? 'twin' : url.pathname;
+    return new Response(bytes, { headers: { 'content-type': 'image/png' } });
+};
+
+const urls = ['Serra', 'TwinA', 'TwinB', 'Missing'].map(name =>
+    `https://api.scryfall.com/cards/named?exact=${name}&format=image&version=normal`);
+
+describe('Card Art Resolution', () => {
+    it('should replace redirects with the URLs they point to', async () => {
+        const { manifest, files, failed } = await resolveCardArt(urls, { fetch: standInFetch, origin: LOCAL });
+
+        expect(manifest[urls[0]]).toBe(`${LOCAL}/img/Serra.png`);
+        expect(Object.keys(manifest)).toHaveLength(3);
+        expect(files).toHaveLength(0);
+        expect(failed).toEqual([urls[3]]);
+    });
+
+    it('should bundle downloaded art under content hashes', async () => {
+        const { manifest, files } = await resolveCardArt(urls, { fetch: standInFetch, origin: LOCAL, download: true });
+
+        expect(files).toHaveLength(2);
+        expect(manifest[urls[1]]).toBe(manifest[urls[2]]);
+        expect(manifest[urls[0]]).not.toBe(manifest[urls[1]]);
+        expect(/^\/card-art\/[0-9a-f]{16}\.png$/.test(manifest[urls[0]])).toBe(true);
+    });
+});
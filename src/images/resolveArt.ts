@@ -0,0 +1,70 @@
+// Build-time half of the image cache (scripts/cardArt.ts). Scryfall's `cards/named?format=image` URLs
+// answer with a redirect to the image CDN, which costs every cold card image an extra round trip to
+// a rate-limited API. This resolves each redirect once, ahead of time. With `download` it also
+// fetches the image and names it by a hash of its bytes, so the art can ship with the app under an
+// immutable URL.
+
+export interface ArtFile {
+    name: string; // <hash>.<ext>, relative to the card-art directory
+    bytes: Uint8Array;
+}
+
+export interface ResolvedArt {
+    manifest: Record<string, string>; // source imageUrl -> URL to load instead
+    files: ArtFile[];
+    failed: string[];
+}
+
+export interface ResolveArtOptions {
+    fetch: (input: string, init?: RequestInit) => Promise<Response>;
+    download?: boolean;
+    publicPath?: string; // where downloaded files are served from
+    origin?: string; // send the requests to a stand-in server instead of the URL's own origin
+    pause?: () => Promise<void>; // between requests; Scryfall asks for 50-100 ms
+}
+
+const EXTENSIONS: Record<string, string> = { 'image/jpeg': 'jpg', 'image/png': 'png', 'image/webp': 'webp' };
+
+const contentHash = async (bytes: Uint8Array) => {
+    const digest = new Uint8Array(await crypto.subtle.digest('SHA-256', bytes));
+    return Array.from(digest.slice(0, 8), b => b.toString(16).padStart(2, '0')).join('');
+};
+
+const follow = async (url: string, fetch: ResolveArtOptions['fetch']) => {
+    const response = await fetch(url, { redirect: 'manual' });
+    const location = response.headers.get('location');
+    if (response.status >= 300 && response.status < 400 && location) return new URL(location, url).href;
+    if (!response.ok) throw new Error(`${response.status} ${response.statusText}`);
+    return url;
+};
+
+export const resolveCardArt = async (urls: readonly string[], options: ResolveArtOptions): Promise<ResolvedArt> => {
+    const { fetch, download = false, publicPath = '/card-art/', origin, pause = async () => { } } = options;
+    const manifest: Record<string, string> = {};
+    const files = new Map<string, ArtFile>();
+    const failed: string[] = [];
+
+    for (const url of new Set(urls)) {
+        try {
+            const source = new URL(url);
+            const requested = origin ? new URL(source.pathname + source.search, origin).href : url;
+            const resolved = await follow(requested, fetch);
+            if (!download) {
+                manifest[url] = resolved;
+            } else {
+                const response = await fetch(resolved);
+                if (!response.ok) throw new Error(`${response.status} ${response.statusText}`);
+                const bytes = new Uint8Array(await response.arrayBuffer());
+                const type = (response.headers.get('content-type') || '').split(';')[0].trim();
+                const name = `${await contentHash(bytes)}.${EXTENSIONS[type] || 'jpg'}`;
+                files.set(name, { name, bytes });
+                manifest[url] = publicPath + name;
+            }
+        } catch {
+            failed.push(url);
+        }
+        await pause();
+    }
+
+    return { manifest, files: [...files.values()], failed };
+};
@@ -0,0 +1,46 @@
+import { ART_CACHE_NAME, createArtCache, isCardArtRequest } from './artCache';
+
+// Service worker, built to /sw.js (see vite.config.ts) and registered in production only. It
+// intercepts card art and nothing else; every other request goes straight to the network.
+
+// The app compiles against the DOM lib, so describe the few worker globals used here.
+interface ExtendableEvent extends Event {
+    waitUntil: (work: Promise<unknown>) => void;
+}
+
+interface FetchEvent extends ExtendableEvent {
+    request: Request;
+    respondWith: (response: Promise<Response>) => void;
+}
+
+const worker = self as unknown as {
+    location: Location;
+    skipWaiting: () => Promise<void>;
+    clients: { claim: () => Promise<void> };
+    addEventListener: (type: string, listener: (event: Event) => void) => void;
+};
+
+const artCache = createArtCache({
+    open: () => caches.open(ART_CACHE_NAME),
+    fetch: (input, init) => fetch(input, init)
+});
+
+worker.addEventListener('install', () => {
+    worker.skipWaiting();
+});
+
+// Drop the art caches of older versions.
+worker.addEventListener('activate', event => {
+    (event as ExtendableEvent).waitUntil((async () => {
+        const names = await caches.keys();
+        await Promise.all(names.filter(name => name.startsWith('card-art-') && name !== ART_CACHE_NAME).map(name => caches.delete(name)));
+        await worker.clients.claim();
+    })());
+});
+
+worker.addEventListener('fetch', event => {
+    const fetchEvent = event as FetchEvent;
+    const { request } = fetchEvent;
+    if (request.method !== 'GET' || !isCardArtRequest(new URL(request.url), worker.location.origin)) return;
+    fetchEvent.respondWith(artCache.handle(request, work => fetchEvent.waitUntil(work)));
+});
@@ -2,9 +2,14 @@ import { StrictMode } from 'react'
 import { createRoot } from 'react-dom/client'
 import './index.css'
 import App from './App.tsx'
+import { prefetchDeferredComponents } from './components/lazyComponents'
+import { registerArtCache } from './images/cardArt'
 
 createRoot(document.getElementById('root')!).render(
   <StrictMode>
     <App />
   </StrictMode>,
 )
+
+prefetchDeferredComponents()
+registerArtCache()
@@ -0,0 +1,29 @@
+import type { Database } from 'firebase/database';
+import { get, increment, onDisconnect, onValue, ref, remove, runTransaction, set } from 'firebase/database';
+import type { PresenceBackend } from './presence';
+
+// PresenceBackend on the Realtime Database SDK. Point `rtdb` at the emulator (see firebase.ts) to run
+// presence against it locally.
+export const createFirebaseBackend = (db: Database): PresenceBackend => {
+    let serverTimeOffset = 0;
+    onValue(ref(db, '.info/serverTimeOffset'), snapshot => {
+        serverTimeOffset = snapshot.val() || 0;
+    });
+
+    return {
+        onConnectedChange: callback => onValue(ref(db, '.info/connected'), snapshot => callback(snapshot.val() === true)),
+        subscribe: (path, callback) => onValue(ref(db, path), snapshot => callback(snapshot.val())),
+        get: async path => (await get(ref(db, path))).val(),
+        set: (path, value) => set(ref(db, path), value),
+        remove: path => remove(ref(db, path)),
+        transaction: async (path, update) => {
+            await runTransaction(ref(db, path), update);
+        },
+        onDisconnect: (path, action) => {
+            const disconnect = onDisconnect(ref(db, path));
+            return 'remove' in action ? disconnect.remove() : disconnect.set(increment(action.increment));
+        },
+        cancelOnDisconnect: path => onDisconnect(ref(db, path)).cancel(),
+        now: () => Date.now() + serverTimeOffset
+    };
+};
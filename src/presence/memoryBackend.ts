@@ -0,0 +1,109 @@
+import type { DisconnectAction, PresenceBackend } from './presence';
+
+// In-memory stand-in for the Realtime Database with the semantics presence relies on: subscribers
+// see every change under their path, transactions apply atomically, and each connection's
+// onDisconnect actions run when it drops. Used by the tests; no Firebase SDK or emulator needed.
+
+type Tree = Record<string, unknown>;
+
+const segments = (path: string) => path.split('/').filter(Boolean);
+
+const read = (root: Tree, path: string): unknown =>
+    segments(path).reduce<unknown>((node, key) => (node && typeof node === 'object' ? (node as Tree)[key] : undefined), root) ?? null;
+
+// Empty objects disappear, like in the Realtime Database.
+const write = (node: Tree, keys: string[], value: unknown): void => {
+    const [key, ...rest] = keys;
+    if (rest.length === 0) {
+        if (value === null || value === undefined) delete node[key];
+        else node[key] = structuredClone(value);
+        return;
+    }
+    const child = node[key] && typeof node[key] === 'object' ? (node[key] as Tree) : {};
+    node[key] = child;
+    write(child, rest, value);
+    if (Object.keys(child).length === 0) delete node[key];
+};
+
+export const createMemoryDatabase = (startTime = 0) => {
+    const root: Tree = {};
+    const listeners = new Set<{ path: string; callback: (value: unknown) => void }>();
+    let clock = startTime;
+
+    const related = (a: string, b: string) => a === b || a.startsWith(`${b}/`) || b.startsWith(`${a}/`);
+
+    const commit = (path: string, value: unknown) => {
+        write(root, segments(path), value);
+        listeners.forEach(l => {
+            if (related(l.path, path)) l.callback(structuredClone(read(root, l.path)));
+        });
+    };
+
+    const connect = () => {
+        let connected = true;
+        const connectionListeners = new Set<(connected: boolean) => void>();
+        const disconnectActions = new Map<string, DisconnectAction>();
+        // Writes made while offline never reach the server here.
+        const whenConnected = (write: () => void) => {
+            if (connected) write();
+        };
+
+        const backend: PresenceBackend = {
+            onConnectedChange: callback => {
+                connectionListeners.add(callback);
+                callback(connected);
+                return () => connectionListeners.delete(callback);
+            },
+            subscribe: (path, callback) => {
+                const listener = { path, callback };
+                listeners.add(listener);
+                callback(structuredClone(read(root, path)));
+                return () => listeners.delete(listener);
+            },
+            get: async path => structuredClone(read(root, path)),
+            set: async (path, value) => whenConnected(() => commit(path, value)),
+            remove: async path => whenConnected(() => commit(path, null)),
+            transaction: async (path, update) => whenConnected(() => commit(path, update(structuredClone(read(root, path))))),
+            onDisconnect: async (path, action) => {
+                disconnectActions.set(path, action);
+            },
+            cancelOnDisconnect: async path => {
+                disconnectActions.delete(path);
+            },
+            now: () => clock
+        };
+
+        // The server noticing the connection is gone: run its onDisconnect actions.
+        const disconnect = () => {
+            connected = false;
+            disconnectActions.forEach((action, path) => {
+                if ('remove' in action) commit(path, null);
+                else commit(path, ((read(root, path) as number | null) ?? 0) + action.increment);
+            });
+            disconnectActions.clear();
+            connectionListeners.forEach(callback => callback(false));
+        };
+
+        // The client dying without the server running anything (what heartbeats clean up after).
+        const vanish = () => {
+            connected = false;
+            disconnectActions.clear();
+            connectionListeners.clear();
+        };
+
+        const reconnect = () => {
+            connected = true;
+            connectionListeners.forEach(callback => callback(true));
+        };
+
+        return { backend, disconnect, vanish, reconnect };
+    };
+
+    return {
+        connect,
+        read: (path: string) => structuredClone(read(root, path)),
+        advance: (ms: number) => {
+            clock += ms;
+        }
+    };
+};
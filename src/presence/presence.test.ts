@@ -0,0 +1,146 @@
+import { describe, it, expect } from 'vitest';
+import { PRESENCE_ROOT, createPresence, shardFor, totalCount } from './presence';
+import { createMemoryDatabase } from './memoryBackend';
+
+// Timers under test control: `run` fires everything due, in order.
+const createScheduler = () => {
+    let now = 0;
+    let tasks: { at: number; callback: () => void }[] = [];
+    const schedule = (callback: () => void, ms: number) => {
+        const task = { at: now + ms, callback };
+        tasks.push(task);
+        return () => {
+            tasks = tasks.filter(t => t !== task);
+        };
+    };
+    const run = async (ms: number) => {
+        now += ms;
+        const due = tasks.filter(t => t.at <= now).sort((a, b) => a.at - b.at);
+        tasks = tasks.filter(t => t.at > now);
+        for (const task of due) await task.callback();
+    };
+    return { schedule, run };
+};
+
+const settle = () => new Promise(resolve => setTimeout(resolve, 0));
+
+describe('Presence', () => {
+    it('should count sessions through the shard counters', async () => {
+        const db = createMemoryDatabase();
+        const scheduler = createScheduler();
+        const seen: number[] = [];
+        const clients = Array.from({ length: 40 }, () => db.connect());
+        const sessions = clients.map((client, i) => createPresence(client.backend, {
+            sessionId: `session-${i}`,
+            onCount: count => (i === 0 ? seen.push(count) : undefined),
+            schedule: scheduler.schedule
+        }));
+        await settle();
+
+        expect(totalCount(db.read(`${PRESENCE_ROOT}/counts`))).toBe(40);
+        expect(new Set(sessions.map(s => s.shard)).size).toBeGreaterThan(1);
+
+        clients[5].disconnect();
+        await sessions[6].stop();
+        await settle();
+        expect(totalCount(db.read(`${PRESENCE_ROOT}/counts`))).toBe(38);
+
+        // Counted changes arrive at most once per debounce window.
+        await scheduler.run(2_000);
+        expect(seen.at(-1)).toBe(38);
+        expect(seen.length).toBeLessThanOrEqual(3);
+    });
+
+    it('should count a session again after it reconnects', async () => {
+        const db = createMemoryDatabase();
+        const client = db.connect();
+        createPresence(client.backend, { onCount: () => { }, schedule: createScheduler().schedule });
+        await settle();
+
+        client.disconnect();
+        expect(totalCount(db.read(`${PRESENCE_ROOT}/counts`))).toBe(0);
+        client.reconnect();
+        await settle();
+        expect(totalCount(db.read(`${PRESENCE_ROOT}/counts`))).toBe(1);
+    });
+
+    it('should reap sessions that stopped heartbeating', async () => {
+        const db = createMemoryDatabase();
+        const scheduler = createScheduler();
+        // Every session in one shard, so the survivor reconciles the dead ones.
+        const options = { onCount: () => { }, shards: 1, heartbeatMs: 1_000, staleMs: 3_000, random: () => 0, schedule: scheduler.schedule };
+        const survivor = db.connect();
+        createPresence(survivor.backend, { ...options, sessionId: 'alive' });
+        const crashed = [db.connect(), db.connect()];
+        crashed.forEach((client, i) => createPresence(client.backend, { ...options, sessionId: `crashed-${i}` }));
+        await settle();
+        expect(db.read(`${PRESENCE_ROOT}/counts/0`)).toBe(3);
+
+        crashed.forEach(client => client.vanish());
+        for (let t = 0; t < 5; t++) {
+            db.advance(1_000);
+            await scheduler.run(1_000);
+        }
+
+        expect(db.read(`${PRESENCE_ROOT}/counts/0`)).toBe(1);
+        expect(Object.keys(db.read(`${PRESENCE_ROOT}/sessions/0`) as object)).toEqual(['alive']);
+    });
+
+    it('should keep joins that land while a shard is reconciled and reap each session once', async () => {
+        const db = createMemoryDatabase();
+        const scheduler = createScheduler();
+        const options = { onCount: () => { }, shards: 1, heartbeatMs: 1_000, staleMs: 3_000, schedule: scheduler.schedule };
+        const crashed = db.connect();
+        createPresence(crashed.backend, { ...options, sessionId: 'crashed' });
+        await settle();
+        crashed.vanish();
+        db.advance(5_000);
+
+        // A session joins between the reconciler reading the shard and fixing the counter.
+        const reconciler = db.connect();
+        const joiner = db.connect();
+        const backend = {
+            ...reconciler.backend,
+            get: async (path: string) => {
+                const value = await reconciler.backend.get(path);
+                createPresence(joiner.backend, { ...options, sessionId: 'joiner' });
+                await settle();
+                return value;
+            }
+        };
+        const [a, b] = [createPresence(backend, { ...options, sessionId: 'a' }), createPresence(reconciler.backend, { ...options, sessionId: 'b' })];
+        await settle();
+        await Promise.all([a.reconcile(), b.reconcile()]);
+
+        expect(db.read(`${PRESENCE_ROOT}/counts/0`)).toBe(3);
+        expect(Object.keys(db.read(`${PRESENCE_ROOT}/sessions/0`) as object).sort()).toEqual(['a', 'b', 'joiner']);
+    });
+
+    it('should undo a registration still in flight when stopped', async () => {
+        const db = createMemoryDatabase();
+        const client = db.connect();
+        const options = { onCount: () => { }, sessionId: 'strict', shards: 1, schedule: createScheduler().schedule };
+
+        // StrictMode: the effect mounts, is cleaned up before registering has finished, and mounts again.
+        const first = createPresence(client.backend, options);
+        await first.stop();
+        await settle();
+        expect(totalCount(db.read(`${PRESENCE_ROOT}/counts`))).toBe(0);
+        expect(db.read(`${PRESENCE_ROOT}/sessions/0`)).toBe(null);
+
+        createPresence(client.backend, options);
+        await settle();
+        expect(db.read(`${PRESENCE_ROOT}/counts/0`)).toBe(1);
+
+        // Only the second presence's cleanup is left armed.
+        client.disconnect();
+        expect(db.read(`${PRESENCE_ROOT}/counts/0`)).toBe(0);
+    });
+
+    it('should shard sessions stably and ignore negative counters', () => {
+        expect(shardFor('abc', 16)).toBe(shardFor('abc', 16));
+        expect(shardFor('abc', 16)).toBeLessThan(16);
+        expect(totalCount({ 0: 3, 1: -2, 2: 4 })).toBe(7);
+        expect(totalCount(null)).toBe(0);
+    });
+});
@@ -0,0 +1,198 @@
+// Live player count without reading every session. Sessions are spread over PRESENCE_SHARDS shards by
+// id; each shard keeps its own counter, bumped in a transaction when a session connects and
+// decremented server-side by an onDisconnect increment(-1) when it drops. Clients only subscribe to
+// the small counters node, so a join or leave costs everyone a few bytes instead of the whole
+// session tree, and count updates are debounced before they reach the UI.
+//
+// Counters can drift when a client dies without its onDisconnect firing. Every session heartbeats its
+// `lastSeen`; on a heartbeat a client occasionally (about once per heartbeat per shard across all its
+// members) reconciles its own shard: it removes sessions not seen for `staleMs`, each in a transaction
+// so only one client gets to remove it, and takes those it removed off the counter, in a transaction
+// too, so joins and leaves that land meanwhile still count.
+//
+// database.rules.json holds the Realtime Database rules for this layout.
+//
+// Layout:
+//   livePresence/counts/<shard>                 number of sessions in the shard
+//   livePresence/sessions/<shard>/<sessionId>   { lastSeen }
+
+export const PRESENCE_ROOT = 'livePresence';
+export const PRESENCE_SHARDS = 16;
+export const HEARTBEAT_MS = 60_000;
+export const STALE_SESSION_MS = 5 * HEARTBEAT_MS; // background tabs may only get to run timers once a minute
+export const COUNT_DEBOUNCE_MS = 2_000;
+
+export type DisconnectAction = { remove: true } | { increment: number };
+
+// The handful of Realtime Database operations presence needs; firebaseBackend.ts implements them on
+// the Firebase SDK (or its emulator), memoryBackend.ts in memory for tests.
+export interface PresenceBackend {
+    onConnectedChange: (callback: (connected: boolean) => void) => () => void;
+    subscribe: (path: string, callback: (value: unknown) => void) => () => void;
+    get: (path: string) => Promise<unknown>;
+    set: (path: string, value: unknown) => Promise<void>;
+    remove: (path: string) => Promise<void>;
+    transaction: (path: string, update: (current: unknown) => unknown) => Promise<void>;
+    onDisconnect: (path: string, action: DisconnectAction) => Promise<void>;
+    cancelOnDisconnect: (path: string) => Promise<void>;
+    now: () => number; // server time in ms
+}
+
+export interface PresenceOptions {
+    onCount: (count: number) => void;
+    sessionId?: string;
+    shards?: number;
+    heartbeatMs?: number;
+    staleMs?: number;
+    debounceMs?: number;
+    random?: () => number;
+    schedule?: (callback: () => void, ms: number) => () => void; // returns a cancel function
+}
+
+// FNV-1a, so a session always lands in the same shard.
+export const shardFor = (sessionId: string, shards: number) => {
+    let hash = 0x811c9dc5;
+    for (let i = 0; i < sessionId.length; i++) hash = Math.imul(hash ^ sessionId.charCodeAt(i), 0x01000193);
+    return (hash >>> 0) % shards;
+};
+
+// Counters are summed as they are; a shard that drifted below zero counts as empty.
+export const totalCount = (counts: unknown) =>
+    counts && typeof counts === 'object'
+        ? Object.values(counts).reduce((sum: number, n) => sum + (typeof n === 'number' && n > 0 ? n : 0), 0)
+        : 0;
+
+const isStale = (session: unknown, now: number, staleMs: number) => {
+    const lastSeen = (session as { lastSeen?: unknown } | null)?.lastSeen;
+    return !(typeof lastSeen === 'number' && now - lastSeen <= staleMs);
+};
+
+export const staleSessions = (sessions: unknown, now: number, staleMs: number) =>
+    Object.entries((sessions || {}) as Record<string, unknown>)
+        .filter(([, session]) => isStale(session, now, staleMs))
+        .map(([id]) => id);
+
+const defaultSchedule = (callback: () => void, ms: number) => {
+    const timer = setTimeout(callback, ms);
+    return () => clearTimeout(timer);
+};
+
+export const createPresence = (backend: PresenceBackend, options: PresenceOptions) => {
+    const {
+        onCount,
+        sessionId = Math.random().toString(36).substring(2, 10),
+        shards = PRESENCE_SHARDS,
+        heartbeatMs = HEARTBEAT_MS,
+        staleMs = STALE_SESSION_MS,
+        debounceMs = COUNT_DEBOUNCE_MS,
+        random = Math.random,
+        schedule = defaultSchedule
+    } = options;
+    const shard = shardFor(sessionId, shards);
+    const countPath = `${PRESENCE_ROOT}/counts/${shard}`;
+    const shardPath = `${PRESENCE_ROOT}/sessions/${shard}`;
+    const sessionPath = `${shardPath}/${sessionId}`;
+
+    // What registering has done so far, so stopping can undo exactly that.
+    let armed = false; // onDisconnect cleanup set up on the server
+    let written = false; // session entry written
+    let registered = false; // and counted
+    let registering: Promise<void> | null = null;
+    let stopped = false;
+    let shardCount = 0;
+    let reported: number | null = null;
+    let pendingCount = 0;
+    let cancelReport: (() => void) | null = null;
+    let cancelHeartbeat: (() => void) | null = null;
+
+    const register = async () => {
+        // Arm the cleanup before announcing ourselves, so a drop in between cannot leave us counted.
+        armed = true;
+        await backend.onDisconnect(sessionPath, { remove: true });
+        await backend.onDisconnect(countPath, { increment: -1 });
+        if (stopped) return;
+        written = true;
+        await backend.set(sessionPath, { lastSeen: backend.now() });
+        await backend.transaction(countPath, n => (typeof n === 'number' ? n : 0) + 1);
+        registered = true;
+    };
+
+    // Removes the session if it is still there and still stale; true when this call removed it.
+    const reap = async (id: string) => {
+        let removed = false;
+        await backend.transaction(`${shardPath}/${id}`, session => {
+            removed = session !== null && isStale(session, backend.now(), staleMs);
+            return removed ? null : session;
+        });
+        return removed;
+    };
+
+    const reconcile = async () => {
+        const stale = staleSessions(await backend.get(shardPath), backend.now(), staleMs);
+        const reaped = (await Promise.all(stale.map(reap))).filter(Boolean).length;
+        if (reaped > 0) await backend.transaction(countPath, n => Math.max(0, (typeof n === 'number' ? n : 0) - reaped));
+    };
+
+    const heartbeat = async () => {
+        if (stopped) return;
+        cancelHeartbeat = schedule(heartbeat, heartbeatMs);
+        if (!registered) return;
+        await backend.set(sessionPath, { lastSeen: backend.now() });
+        if (random() * Math.max(1, shardCount) < 1) await reconcile();
+    };
+
+    // The first count shows right away; after that, changes are coalesced.
+    const report = (count: number) => {
+        pendingCount = count;
+        if (reported === null) {
+            reported = count;
+            onCount(count);
+            return;
+        }
+        if (cancelReport) return;
+        cancelReport = schedule(() => {
+            cancelReport = null;
+            if (pendingCount !== reported) {
+                reported = pendingCount;
+                onCount(pendingCount);
+            }
+        }, debounceMs);
+    };
+
+    const unsubscribeConnected = backend.onConnectedChange(connected => {
+        if (connected && !stopped) {
+            registering = register().catch(() => { });
+        } else if (!connected) {
+            // The server has run our onDisconnect actions.
+            armed = written = registered = false;
+        }
+    });
+    const unsubscribeCounts = backend.subscribe(`${PRESENCE_ROOT}/counts`, counts => {
+        const value = (counts as Record<string, unknown> | null)?.[shard];
+        shardCount = typeof value === 'number' ? value : 0;
+        report(totalCount(counts));
+    });
+    cancelHeartbeat = schedule(heartbeat, heartbeatMs);
+
+    // Leave cleanly: take ourselves out now instead of waiting for the server to notice. A registration
+    // still in flight finishes first and is then undone, so an early stop (React StrictMode mounts,
+    // unmounts and remounts effects) doesn't leave a session counted until the tab closes.
+    const stop = async () => {
+        stopped = true;
+        unsubscribeConnected();
+        unsubscribeCounts();
+        cancelHeartbeat?.();
+        cancelReport?.();
+        await registering;
+        const [wasArmed, wasWritten, wasRegistered] = [armed, written, registered];
+        armed = written = registered = false;
+        if (wasArmed) {
+            await backend.cancelOnDisconnect(sessionPath);
+            await backend.cancelOnDisconnect(countPath);
+        }
+        if (wasWritten) await backend.remove(sessionPath);
+        if (wasRegistered) await backend.transaction(countPath, n => Math.max(0, (typeof n === 'number' ? n : 1) - 1));
+    };
+
+    return { sessionId, shard, heartbeat, reconcile, stop };
+};
@@ -0,0 +1,20 @@
+import { decodeQuizBank } from './quizBank';
+import type { QuizBank } from './quizBank';
+
+// The bank ships as public/quiz-bank.bin (committed; regenerate with npm run quiz-bank). It is fetched
+// and indexed once; a failed load is retried on the next call.
+let bank: Promise<QuizBank> | null = null;
+
+export const loadQuizBank = () => {
+    bank ||= fetch(`${import.meta.env.BASE_URL}quiz-bank.bin`)
+        .then(response => {
+            if (!response.ok) throw new Error(`Quiz bank: ${response.status} ${response.statusText}`);
+            return response.arrayBuffer();
+        })
+        .then(buffer => decodeQuizBank(new Uint8Array(buffer)))
+        .catch(error => {
+            bank = null;
+            throw error;
+        });
+    return bank;
+};
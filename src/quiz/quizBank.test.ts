@@ -0,0 +1,43 @@
+import { describe, it, expect } from 'vitest';
+import { QUIZ_LEVELS, decodeQuizBank, dealScenario, drawScenario, encodeQuizBank, generateQuizBank, hasTag } from './quizBank';
+import { calculateCombatOutcome } from '../store/combatLogic';
+import { createRng } from '../store/rng';
+
+const bank = generateQuizBank(createRng(5), 30);
+
+describe('Quiz Bank', () => {
+    it('should fill every level with distinct scenarios', () => {
+        for (let level = 1; level <= QUIZ_LEVELS; level++) {
+            expect(bank.byLevel[level]).toHaveLength(30);
+        }
+        expect(bank.byTag.multiBlock.every(i => hasTag(bank.scenarios[i], 'multiBlock'))).toBe(true);
+        expect(bank.scenarios.filter(s => s.level === 5).every(s => s.tags !== 0)).toBe(true);
+    });
+
+    it('should round-trip through the binary format', () => {
+        const bytes = encodeQuizBank(bank);
+        expect(decodeQuizBank(bytes)).toEqual(bank);
+        expect(bytes.length / bank.scenarios.length).toBeLessThan(40);
+        expect(() => decodeQuizBank(new Uint8Array([1, 2, 3, 4, 5]))).toThrow();
+    });
+
+    it('should hold answer keys the engine agrees with', () => {
+        const decoded = decodeQuizBank(encodeQuizBank(bank));
+        let counter = 0;
+        decoded.scenarios.forEach(scenario => {
+            const { board } = dealScenario(decoded, scenario, 'p1', 'p2', prefix => `${prefix}-${counter++}`);
+            const outcome = calculateCombatOutcome(board);
+            board.cards.forEach((card, i) => {
+                expect(!!outcome.deathIndex[card.id]).toBe((scenario.deaths & (1 << i)) !== 0);
+                expect(outcome.damageByCard[card.id] || 0).toBe(scenario.damage[i]);
+            });
+        });
+    });
+
+    it('should draw by level or tag', () => {
+        const rng = createRng(9);
+        expect(drawScenario(bank, { level: 3 }, rng)!.level).toBe(3);
+        expect(hasTag(drawScenario(bank, { tag: 'doubleStrike' }, rng)!, 'doubleStrike')).toBe(true);
+        expect(drawScenario({ ...bank, byLevel: bank.byLevel.map(() => []) }, { level: 2 }, rng)).toBeUndefined();
+    });
+});
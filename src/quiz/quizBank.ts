@@ -0,0 +1,286 @@
+import type { Card, CombatBoard, CombatOutcome } from '../types';
+import { CARD_POOL, COMMANDER_POOL, createCardInstance } from '../store/cards.ts';
+import type { CardTemplate } from '../store/cards.ts';
+import { KEYWORD_FLAGS, canBlock, getCardStats, hasKeyword, keywordMask } from '../store/cardStats.ts';
+import type { KeywordName } from '../store/cardStats.ts';
+import { calculateCombatOutcome } from '../store/combatLogic.ts';
+import { GRANTABLE_KEYWORDS } from '../store/gameRules.ts';
+import { hashCombatBoard } from '../store/outcomeCache.ts';
+import type { Rng } from '../store/rng.ts';
+
+// Pre-solved combat quizzes. scripts/quizBank.ts deals many random boards and blocks offline, solves
+// each with the combat engine, tags what makes it tricky and keeps a spread of difficulties in a
+// compact binary file. The game loads it once and draws a scenario of the wanted level or tag in
+// constant time.
+//
+// File: "MTGQ", a version byte, the template names used (count, then length-prefixed UTF-8), the
+// scenario count, then per scenario:
+//   level << 5 | tags, attackerCount << 4 | defenderCount,
+//   per card: template index, plusOne << 4 | minusOne, granted keyword mask (varint),
+//   attacking-card mask, per defending card the 1-based attacker it blocks (0: none),
+//   the answer key: death mask (varint) and damage dealt to each card.
+// Blockers are ordered for damage assignment in defending-card order.
+
+export const QUIZ_BANK_VERSION = 1;
+export const QUIZ_LEVELS = 5;
+export const MAX_CREATURES_PER_SIDE = 4;
+
+export const QUIZ_TAGS = ['firstStrike', 'doubleStrike', 'deathtouchTrample', 'multiBlock', 'lifelink'] as const;
+export type QuizTag = typeof QUIZ_TAGS[number];
+
+const TAG_BIT = Object.fromEntries(QUIZ_TAGS.map((tag, i) => [tag, 1 << i])) as Record<QuizTag, number>;
+const MAGIC = [0x4d, 0x54, 0x47, 0x51]; // "MTGQ"
+
+export interface ScenarioCard {
+    template: number; // index into the bank's template names
+    plusOne: number;
+    minusOne: number;
+    granted: number; // keyword flags on top of the template's own
+}
+
+export interface QuizScenario {
+    level: number; // 1 (one plain block) to QUIZ_LEVELS
+    tags: number; // one bit per QUIZ_TAGS entry
+    attacking: ScenarioCard[];
+    defending: ScenarioCard[];
+    attackers: number[]; // indexes into `attacking`
+    blocks: number[]; // per defending card, the index in `attacking` it blocks, or -1
+    deaths: number; // bit per card, attacking cards first
+    damage: number[]; // combat damage dealt to each card, attacking cards first
+}
+
+export interface QuizBank {
+    templates: string[];
+    scenarios: QuizScenario[];
+    byLevel: number[][]; // level -> scenario indexes
+    byTag: Record<QuizTag, number[]>;
+}
+
+const TEMPLATES = new Map<string, CardTemplate>([...CARD_POOL, ...COMMANDER_POOL].map(t => [t.name, t]));
+const KEYWORD_NAMES = Object.keys(KEYWORD_FLAGS) as KeywordName[];
+
+const toCard = (card: ScenarioCard, templates: string[], id: string, playerId: string): Card => {
+    const template = TEMPLATES.get(templates[card.template])!;
+    const granted = KEYWORD_NAMES.filter(k => (card.granted & KEYWORD_FLAGS[k]) !== 0 && !template.keywords.includes(k));
+    return {
+        ...createCardInstance(template, id, playerId),
+        keywords: [...template.keywords, ...granted],
+        plusOneCounters: card.plusOne,
+        minusOneCounters: card.minusOne
+    };
+};
+
+// Lays a scenario out as cards for two players. Ids come from `nextId`, so a dealt drill gets fresh ones.
+export const dealScenario = (
+    bank: Pick<QuizBank, 'templates'>,
+    scenario: QuizScenario,
+    attackerPlayerId: string,
+    defenderPlayerId: string,
+    nextId: (prefix: string) => string
+) => {
+    const attackerCards = scenario.attacking.map(c => toCard(c, bank.templates, nextId(`${attackerPlayerId}-creature`), attackerPlayerId));
+    const defenderCards = scenario.defending.map(c => toCard(c, bank.templates, nextId(`${defenderPlayerId}-creature`), defenderPlayerId));
+    const attackers = scenario.attackers.map(i => attackerCards[i].id);
+    const blockers: Record<string, string[]> = {};
+    scenario.blocks.forEach((target, i) => {
+        if (target < 0) return;
+        const attackerId = attackerCards[target].id;
+        (blockers[attackerId] ||= []).push(defenderCards[i].id);
+    });
+    const board: CombatBoard = { defenderPlayerId, attackers, blockers, cards: [...attackerCards, ...defenderCards] };
+    return { attackerCards, defenderCards, attackers, blockers, board };
+};
+
+// What makes a combat hard to call, and a level from 1 to QUIZ_LEVELS.
+export const tagCombat = (board: CombatBoard, outcome: CombatOutcome) => {
+    const cards = new Map(board.cards.map(c => [c.id, c]));
+    let tags = 0;
+    let blockedGroups = 0;
+    let extraBlockers = 0;
+    Object.entries(board.blockers).forEach(([attackerId, blockerIds]) => {
+        if (blockerIds.length === 0) return;
+        blockedGroups++;
+        extraBlockers += blockerIds.length - 1;
+        const attacker = cards.get(attackerId)!;
+        const group = [attacker, ...blockerIds.map(id => cards.get(id)!)];
+        if (group.some(c => hasKeyword(c, 'First Strike'))) tags |= TAG_BIT.firstStrike;
+        if (group.some(c => hasKeyword(c, 'Double Strike'))) tags |= TAG_BIT.doubleStrike;
+        if (hasKeyword(attacker, 'Deathtouch') && hasKeyword(attacker, 'Trample')) tags |= TAG_BIT.deathtouchTrample;
+        if (blockerIds.length > 1) tags |= TAG_BIT.multiBlock;
+    });
+    if (outcome.damageEvents.some(e => e.isLifelink && e.damage > 0)) tags |= TAG_BIT.lifelink;
+
+    let tagCount = 0;
+    for (let t = tags; t; t &= t - 1) tagCount++;
+    const score = 2 * tagCount + extraBlockers + Math.max(0, blockedGroups - 1);
+    return { tags, level: Math.min(QUIZ_LEVELS, 1 + Math.floor(score / 2)) };
+};
+
+export const hasTag = (scenario: QuizScenario, tag: QuizTag) => (scenario.tags & TAG_BIT[tag]) !== 0;
+
+const randomCard = (rng: Rng, templates: string[], templateIndex: Map<string, number>): ScenarioCard => {
+    const template = rng.pick(CARD_POOL)!;
+    let index = templateIndex.get(template.name);
+    if (index === undefined) {
+        index = templates.length;
+        templates.push(template.name);
+        templateIndex.set(template.name, index);
+    }
+    const toughness = parseInt(template.toughness || '0');
+    const plusOne = rng.next() < 0.25 ? 1 + rng.int(2) : 0;
+    const minusOne = rng.next() < 0.1 && toughness + plusOne > 1 ? 1 : 0;
+    // Keyword grants like the shop's, so the tricky combinations the pool lacks come up.
+    const grants = rng.next() < 0.35 ? (rng.next() < 0.3 ? 2 : 1) : 0;
+    const granted = keywordMask(Array.from({ length: grants }, () => rng.pick(GRANTABLE_KEYWORDS)!));
+    return { template: index, plusOne, minusOne, granted };
+};
+
+// One random combat with at least one block, solved, plus a key for spotting duplicates; null when
+// the deal had no legal block.
+export const generateScenario = (rng: Rng, templates: string[], templateIndex: Map<string, number>) => {
+    const attacking = Array.from({ length: 1 + rng.int(MAX_CREATURES_PER_SIDE) }, () => randomCard(rng, templates, templateIndex));
+    const defending = Array.from({ length: 1 + rng.int(MAX_CREATURES_PER_SIDE) }, () => randomCard(rng, templates, templateIndex));
+    const attackers = attacking.map((_, i) => i).filter(() => rng.next() < 0.8);
+    if (attackers.length === 0) attackers.push(0);
+
+    let counter = 0;
+    const nextId = (prefix: string) => `${prefix}-${counter++}`;
+    const attackerCards = attacking.map(c => toCard(c, templates, nextId('a'), 'a'));
+    const blocks = defending.map(c => {
+        const blocker = toCard(c, templates, nextId('d'), 'd');
+        if (rng.next() < 0.25 || getCardStats(blocker).toughness <= 0) return -1;
+        const legal = attackers.filter(i => canBlock(attackerCards[i], blocker));
+        return legal.length > 0 ? rng.pick(legal)! : -1;
+    });
+    if (blocks.every(b => b < 0)) return null;
+
+    const unsolved: QuizScenario = { level: 0, tags: 0, attacking, defending, attackers, blocks, deaths: 0, damage: [] };
+    const { board } = dealScenario({ templates }, unsolved, 'a', 'd', nextId);
+    const outcome = calculateCombatOutcome(board);
+    const scenario: QuizScenario = {
+        ...unsolved,
+        ...tagCombat(board, outcome),
+        deaths: board.cards.reduce((mask, c, i) => (outcome.deathIndex[c.id] ? mask | (1 << i) : mask), 0),
+        damage: board.cards.map(c => outcome.damageByCard[c.id] || 0)
+    };
+    return { scenario, key: hashCombatBoard(board) };
+};
+
+// Deals `attempts` combats and keeps up to `perLevel` distinct ones at each level.
+export const generateQuizBank = (rng: Rng, perLevel: number, attempts = perLevel * QUIZ_LEVELS * 40): QuizBank => {
+    const templates: string[] = [];
+    const templateIndex = new Map<string, number>();
+    const seen = new Set<string>();
+    const scenarios: QuizScenario[] = [];
+    const filled = new Array(QUIZ_LEVELS + 1).fill(0);
+
+    for (let i = 0; i < attempts && scenarios.length < perLevel * QUIZ_LEVELS; i++) {
+        const generated = generateScenario(rng, templates, templateIndex);
+        if (!generated || filled[generated.scenario.level] >= perLevel || seen.has(generated.key)) continue;
+        seen.add(generated.key);
+        filled[generated.scenario.level]++;
+        scenarios.push(generated.scenario);
+    }
+    return indexQuizBank(templates, scenarios);
+};
+
+export const indexQuizBank = (templates: string[], scenarios: QuizScenario[]): QuizBank => {
+    const byLevel: number[][] = Array.from({ length: QUIZ_LEVELS + 1 }, () => []);
+    const byTag = Object.fromEntries(QUIZ_TAGS.map(tag => [tag, [] as number[]])) as Record<QuizTag, number[]>;
+    scenarios.forEach((s, i) => {
+        byLevel[s.level].push(i);
+        QUIZ_TAGS.forEach(tag => {
+            if (hasTag(s, tag)) byTag[tag].push(i);
+        });
+    });
+    return { templates, scenarios, byLevel, byTag };
+};
+
+// A random scenario at `level`, or with `tag`; undefined when the bank has none.
+export const drawScenario = (bank: QuizBank, query: { level?: number; tag?: QuizTag }, rng: Rng): QuizScenario | undefined => {
+    const pool = query.tag ? bank.byTag[query.tag] : query.level ? bank.byLevel[query.level] : undefined;
+    const index = pool ? rng.pick(pool) : rng.int(bank.scenarios.length);
+    return index === undefined ? undefined : bank.scenarios[index];
+};
+
+export const encodeQuizBank = ({ templates, scenarios }: Pick<QuizBank, 'templates' | 'scenarios'>): Uint8Array => {
+    const out: number[] = [...MAGIC, QUIZ_BANK_VERSION];
+    const varint = (value: number) => {
+        let v = value >>> 0;
+        while (v >= 0x80) {
+            out.push((v & 0x7f) | 0x80);
+            v >>>= 7;
+        }
+        out.push(v);
+    };
+    const utf8 = new TextEncoder();
+
+    varint(templates.length);
+    templates.forEach(name => {
+        const bytes = utf8.encode(name);
+        varint(bytes.length);
+        out.push(...bytes);
+    });
+    varint(scenarios.length);
+    scenarios.forEach(s => {
+        out.push((s.level << 5) | s.tags, (s.attacking.length << 4) | s.defending.length);
+        [...s.attacking, ...s.defending].forEach(c => {
+            varint(c.template);
+            out.push((c.plusOne << 4) | c.minusOne);
+            varint(c.granted);
+        });
+        out.push(s.attackers.reduce((mask, i) => mask | (1 << i), 0));
+        s.blocks.forEach(b => out.push(b + 1));
+        varint(s.deaths);
+        s.damage.forEach(d => out.push(Math.min(d, 255)));
+    });
+    return Uint8Array.from(out);
+};
+
+export const decodeQuizBank = (bytes: Uint8Array): QuizBank => {
+    if (MAGIC.some((b, i) => bytes[i] !== b)) throw new Error('Not a quiz bank file');
+    if (bytes[4] !== QUIZ_BANK_VERSION) throw new Error(`Unsupported quiz bank version ${bytes[4]}`);
+    let offset = 5;
+    const byte = () => bytes[offset++];
+    const varint = () => {
+        let value = 0;
+        for (let shift = 0; ; shift += 7) {
+            const b = byte();
+            value |= (b & 0x7f) << shift;
+            if (b < 0x80) return value >>> 0;
+        }
+    };
+    const utf8 = new TextDecoder();
+
+    const templates = Array.from({ length: varint() }, () => {
+        const length = varint();
+        offset += length;
+        return utf8.decode(bytes.subarray(offset - length, offset));
+    });
+    const scenarios: QuizScenario[] = [];
+    for (let n = varint(); n > 0; n--) {
+        const head = byte();
+        const sides = byte();
+        const card = (): ScenarioCard => {
+            const template = varint();
+            const counters = byte();
+            return { template, plusOne: counters >> 4, minusOne: counters & 0xf, granted: varint() };
+        };
+        const attacking = Array.from({ length: sides >> 4 }, card);
+        const defending = Array.from({ length: sides & 0xf }, card);
+        const attackMask = byte();
+        scenarios.push({
+            level: head >> 5,
+            tags: head & 0x1f,
+            attacking,
+            defending,
+            attackers: attacking.map((_, i) => i).filter(i => attackMask & (1 << i)),
+            blocks: defending.map(() => byte() - 1),
+            deaths: varint(),
+            damage: Array.from({ length: attacking.length + defending.length }, byte)
+        });
+    }
+    // Scenarios naming a card the pool no longer has are dropped.
+    const known = scenarios.filter(s => [...s.attacking, ...s.defending].every(c => TEMPLATES.has(templates[c.template])));
+    return indexQuizBank(templates, known);
+};
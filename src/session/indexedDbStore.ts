@@ -0,0 +1,42 @@
+import type { SnapshotStore } from './snapshots';
+
+// SnapshotStore on IndexedDB: one object store of records, each commit in a single readwrite
+// transaction so a save lands completely or not at all.
+const OBJECT_STORE = 'records';
+
+const request = <T>(req: IDBRequest<T>) => new Promise<T>((resolve, reject) => {
+    req.onsuccess = () => resolve(req.result);
+    req.onerror = () => reject(req.error);
+});
+
+export const createIndexedDbSnapshotStore = (name = 'mtg-combat-session'): SnapshotStore => {
+    let opened: Promise<IDBDatabase> | null = null;
+    const open = () => {
+        opened ??= new Promise<IDBDatabase>((resolve, reject) => {
+            const req = indexedDB.open(name, 1);
+            req.onupgradeneeded = () => req.result.createObjectStore(OBJECT_STORE);
+            req.onsuccess = () => resolve(req.result);
+            req.onerror = () => reject(req.error);
+        });
+        return opened;
+    };
+
+    return {
+        load: async () => {
+            const records = (await open()).transaction(OBJECT_STORE, 'readonly').objectStore(OBJECT_STORE);
+            const [keys, values] = await Promise.all([request(records.getAllKeys()), request(records.getAll())]);
+            return new Map(keys.map((key, i) => [String(key), values[i]] as const));
+        },
+        commit: async (puts, deletes) => {
+            const transaction = (await open()).transaction(OBJECT_STORE, 'readwrite');
+            const records = transaction.objectStore(OBJECT_STORE);
+            deletes.forEach(key => records.delete(key));
+            puts.forEach((value, key) => records.put(value, key));
+            await new Promise<void>((resolve, reject) => {
+                transaction.oncomplete = () => resolve();
+                transaction.onerror = () => reject(transaction.error);
+                transaction.onabort = () => reject(transaction.error);
+            });
+        }
+    };
+};
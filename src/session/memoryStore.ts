@@ -0,0 +1,18 @@
+import type { SnapshotStore } from './snapshots';
+
+// SnapshotStore in memory, for tests. Values are cloned on the way in and out like IndexedDB does, so
+// nothing can reach a stored record by reference; `commits` records what each commit wrote.
+export const createMemorySnapshotStore = () => {
+    const records = new Map<string, unknown>();
+    const commits: { puts: string[]; deletes: string[] }[] = [];
+
+    const store: SnapshotStore = {
+        load: async () => structuredClone(records),
+        commit: async (puts, deletes) => {
+            deletes.forEach(key => records.delete(key));
+            puts.forEach((value, key) => records.set(key, structuredClone(value)));
+            commits.push({ puts: [...puts.keys()], deletes });
+        }
+    };
+    return { ...store, records, commits };
+};
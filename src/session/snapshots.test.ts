@@ -0,0 +1,140 @@
+import { describe, it, expect } from 'vitest';
+import { createSessionHistory } from './snapshots';
+import type { SessionState } from './snapshots';
+import { createMemorySnapshotStore } from './memoryStore';
+import { patchCard, patchPlayer } from '../store/cardTable';
+import { createBattle, createPlayer } from '../store/gameRules';
+import { appendLog, createGameLog, exportLog } from '../store/gameLog';
+import { createRng } from '../store/rng';
+
+const startingState = (): SessionState => {
+    const rng = createRng(24);
+    const players = createBattle([createPlayer('player1', 'Player 1', rng), createPlayer('player2', 'Player 2', rng)], rng);
+    return {
+        players,
+        activePlayerId: 'player1',
+        priorityPlayerId: 'player1',
+        phase: 'combat',
+        combatStep: 'declareAttackers',
+        turnCount: 1,
+        attackers: [],
+        blockers: {},
+        log: createGameLog(['--- BATTLE COMMENCES ---'], 200),
+        winner: null,
+        gambleCount: 0,
+        seed: rng.seed,
+        rng: rng.save()
+    };
+};
+
+// Log chunks are shared and appended in place, so states compare by what each one reads.
+const comparable = (state: SessionState) =>
+    JSON.stringify(Object.keys(state).sort().map(key => key === 'log' ? exportLog(state.log) : state[key as keyof SessionState]));
+
+// One turn's worth of change: a card takes damage, a player loses life, the log grows.
+const playTurn = (state: SessionState, turn: number): SessionState => {
+    const card = state.players[1].battlefield[0];
+    const players = patchPlayer(patchCard(state.players, card.id, c => ({ ...c, damageTaken: c.damageTaken + 1 })), 'player1', p => ({ ...p, life: p.life - 1 }));
+    const messages = Array.from({ length: 30 }, (_, i) => `Turn ${turn}, event ${i}`);
+    return { ...state, players, turnCount: turn, log: appendLog(state.log, messages), rng: { ...state.rng, state: state.rng.state + turn } };
+};
+
+describe('Session Snapshots', () => {
+    it('should go back to any checkpoint and forget the ones after it once play diverges', () => {
+        const history = createSessionHistory();
+        const first = startingState();
+        const second = playTurn(first, 2);
+        const third = playTurn(second, 3);
+        const ids = [first, second, third].map((state, i) => history.capture(state, `Turn ${i + 1}`).id);
+
+        expect(history.capture(third, 'again').id).toBe(ids[2]);
+        expect(history.restore(ids[0])).toBe(first);
+        expect(history.latest()?.id).toBe(ids[0]);
+        expect(history.list().length).toBe(3);
+
+        history.capture(playTurn(first, 2), 'Turn 2, played differently');
+        expect(history.list().map(s => s.label)).toEqual(['Turn 1', 'Turn 2, played differently']);
+        expect(history.restore(ids[2])).toBe(null);
+    });
+
+    it('should only write what changed since the last save', async () => {
+        const store = createMemorySnapshotStore();
+        const history = createSessionHistory({ store });
+        let state = startingState();
+        history.capture(state, 'Turn 1');
+        const firstSave = await history.save();
+        const cards = state.players.reduce((sum, p) => sum + p.battlefield.length + p.commandZone.length, 0);
+        expect(firstSave.written).toBe(cards + 2 + 2); // cards, players, snapshot, head
+
+        state = playTurn(state, 2);
+        history.capture(state, 'Turn 2');
+        const written = (await history.save()).written;
+        // The damaged card, both players (one holds the card, the other lost life), the snapshot and
+        // the head; the log hasn't filled a chunk yet, so its entries ride along in the snapshot.
+        expect(written).toBe(5);
+        expect(store.commits[1].puts.filter(key => key.startsWith('card:')).length).toBe(1);
+
+        expect((await history.save()).written).toBe(1);
+    });
+
+    it('should load a saved session back with its structure shared', async () => {
+        const store = createMemorySnapshotStore();
+        const history = createSessionHistory({ store });
+        const states = [startingState()];
+        for (let turn = 2; turn <= 5; turn++) states.push(playTurn(states[states.length - 1], turn));
+        const ids = states.map((state, i) => history.capture(state, `Turn ${i + 1}`).id);
+        history.restore(ids[3]);
+        await history.save();
+
+        const reloaded = createSessionHistory({ store });
+        const state = await reloaded.load();
+        expect(reloaded.latest()?.id).toBe(ids[3]);
+        expect(comparable(state!)).toBe(comparable(states[3]));
+
+        const [early, late] = [reloaded.restore(ids[3])!, reloaded.restore(ids[4])!];
+        expect(comparable(late)).toBe(comparable(states[4]));
+        expect(late.players[1].battlefield[1]).toBe(early.players[1].battlefield[1]);
+        expect(late.log.chunks[0]).toBe(early.log.chunks[0]);
+
+        // Carrying on from the loaded session writes only the new turn.
+        reloaded.capture(playTurn(late, 6), 'Turn 6');
+        expect((await reloaded.save()).written).toBeLessThanOrEqual(6);
+    });
+
+    it('should delete records that no kept snapshot uses', async () => {
+        const store = createMemorySnapshotStore();
+        const history = createSessionHistory({ store, limit: 2 });
+        let state = startingState();
+        for (let turn = 2; turn <= 8; turn++) {
+            state = playTurn(state, turn);
+            history.capture(state, `Turn ${turn}`);
+            await history.save();
+        }
+        expect([...store.records.keys()].filter(key => key.startsWith('snap:')).length).toBe(2);
+        expect([...store.records.keys()].filter(key => key.startsWith('player:')).length).toBe(4);
+
+        history.reset();
+        const cleared = await history.save();
+        expect(cleared.deleted).toBeGreaterThan(0);
+        expect([...store.records.keys()]).toEqual(['head']);
+        expect(await createSessionHistory({ store }).load()).toBe(null);
+    });
+
+    it('should replace a stored session once play has moved on without it', async () => {
+        const store = createMemorySnapshotStore();
+        const old = createSessionHistory({ store });
+        old.capture(playTurn(startingState(), 2), 'Old battle');
+        await old.save();
+
+        const history = createSessionHistory({ store });
+        const state = startingState();
+        history.capture(state, 'New battle');
+        expect(await history.load()).toBe(null);
+        expect(history.list().map(s => s.label)).toEqual(['New battle']);
+
+        await history.save();
+        const reloaded = createSessionHistory({ store });
+        expect(comparable((await reloaded.load())!)).toBe(comparable(state));
+        expect(store.records.size).toBe(store.commits[1].puts.length);
+    });
+});
@@ -0,0 +1,319 @@
+import type { Card, CombatPhaseStep, GameLog, Phase, Player } from '../types';
+import { LOG_CHUNK_SIZE } from '../store/gameLog';
+import type { RngState } from '../store/rng';
+
+// Checkpoints of a battle, for undo and for picking a battle back up after a reload. The store is
+// immutable with structural sharing (patchPlayer/patchCard replace only what changed, full log chunks
+// never change), so a snapshot is just the references of the game slice: taking one costs O(1) and
+// two snapshots share everything that didn't change between them.
+//
+// Persistence keeps that sharing. Every card, player and full log chunk is written once, under a key
+// tied to the object's identity; a player record refers to its cards by key and a snapshot record to
+// its players and chunks. Saving writes only the objects no earlier save has seen, so a checkpoint
+// costs what changed since the last one. Dropping snapshots (past `limit`, or the ones after an undo
+// once play carries on differently) deletes whatever no kept snapshot still reaches.
+//
+// Layout of a SnapshotStore:
+//   head      { snapshots: [id...], current, nextKey, nextId }
+//   snap:<id> { info, state, players: [player key...], log }
+//   player:n  a Player with card keys in its zones
+//   card:n    a Card
+//   chunk:n   a full log chunk
+
+export const SNAPSHOT_LIMIT = 50;
+
+// The part of the store a checkpoint restores: the board and whose decision it is, not the UI around it.
+export interface SessionState {
+    players: Player[];
+    activePlayerId: string;
+    priorityPlayerId: string;
+    phase: Phase;
+    combatStep?: CombatPhaseStep;
+    turnCount: number;
+    attackers: string[];
+    blockers: Record<string, string[]>;
+    log: GameLog;
+    winner: string | null;
+    gambleCount: number;
+    seed: number;
+    rng: RngState;
+}
+
+export interface SnapshotInfo {
+    id: number;
+    label: string;
+    turnCount: number;
+    activePlayerId: string;
+    phase: Phase;
+    combatStep?: CombatPhaseStep;
+}
+
+// A flat key-value store that applies each commit atomically; indexedDbStore.ts keeps it in IndexedDB,
+// memoryStore.ts in memory for tests.
+export interface SnapshotStore {
+    load: () => Promise<Map<string, unknown>>;
+    commit: (puts: Map<string, unknown>, deletes: string[]) => Promise<void>;
+}
+
+export interface SaveResult {
+    written: number;
+    deleted: number;
+}
+
+const CARD_ZONES = ['library', 'hand', 'graveyard', 'exile', 'commandZone', 'battlefield'] as const;
+
+type PlayerRecord = Omit<Player, (typeof CARD_ZONES)[number] | 'commander'>
+    & Record<(typeof CARD_ZONES)[number], string[]>
+    & { commander?: string };
+
+interface LogRecord {
+    chunks: string[]; // full chunks, by key
+    tail: string[]; // the entries of the last chunk
+    length: number;
+    first: number;
+    capacity: number;
+    archive: string[] | null;
+}
+
+interface SnapshotRecord {
+    info: SnapshotInfo;
+    state: Omit<SessionState, 'players' | 'log'>;
+    players: string[];
+    log: LogRecord;
+}
+
+interface HeadRecord {
+    snapshots: number[];
+    current: number | null;
+    nextKey: number;
+    nextId: number;
+}
+
+interface Snapshot {
+    info: SnapshotInfo;
+    state: SessionState;
+}
+
+const HEAD = 'head';
+const snapshotKey = (id: number) => `snap:${id}`;
+
+const sameState = (a: SessionState, b: SessionState) =>
+    (Object.keys(a) as (keyof SessionState)[]).every(key => key === 'rng' || a[key] === b[key])
+    && a.rng.seed === b.rng.seed && a.rng.state === b.rng.state && a.rng.idCounter === b.rng.idCounter;
+
+export const createSessionHistory = ({ store = null, limit = SNAPSHOT_LIMIT }: { store?: SnapshotStore | null; limit?: number } = {}) => {
+    let snapshots: Snapshot[] = [];
+    let current = -1; // index of the snapshot the board is at
+    let nextId = 1;
+
+    // What the store holds: object identity -> key, the keys written, and what each record refers to.
+    let keys = new WeakMap<object, string>();
+    let nextKey = 1;
+    const persisted = new Set<string>();
+    const references = new Map<string, string[]>(); // snapshot and player keys -> keys they refer to
+    let stale = new Set<string>(); // records of a stored session this history didn't take over
+    let queue: Promise<unknown> = Promise.resolve();
+
+    // Loads and saves run one at a time, in the order they were asked for.
+    const enqueue = <T>(task: () => Promise<T>): Promise<T> => {
+        const run = queue.catch(() => undefined).then(task);
+        queue = run;
+        return run;
+    };
+
+    const list = (): SnapshotInfo[] => snapshots.map(s => s.info);
+
+    // Records the state as the newest checkpoint. Taking one right after an undo drops the checkpoints
+    // that came after it; taking the same state twice in a row keeps one.
+    const capture = (state: SessionState, label: string): SnapshotInfo => {
+        const at = snapshots[current];
+        if (at && sameState(at.state, state)) return at.info;
+
+        const info: SnapshotInfo = {
+            id: nextId++,
+            label,
+            turnCount: state.turnCount,
+            activePlayerId: state.activePlayerId,
+            phase: state.phase,
+            combatStep: state.combatStep
+        };
+        snapshots = [...snapshots.slice(0, current + 1), { info, state }].slice(-limit);
+        current = snapshots.length - 1;
+        return info;
+    };
+
+    const restore = (id: number): SessionState | null => {
+        const index = snapshots.findIndex(s => s.info.id === id);
+        if (index < 0) return null;
+        current = index;
+        return snapshots[index].state;
+    };
+
+    const latest = (): SnapshotInfo | null => snapshots[current]?.info ?? null;
+
+    const reset = () => {
+        snapshots = [];
+        current = -1;
+    };
+
+    const encode = (puts: Map<string, unknown>, snapshot: Snapshot) => {
+        const keyFor = (object: object, prefix: string, record: (key: string) => unknown) => {
+            let key = keys.get(object);
+            if (!key) {
+                key = `${prefix}:${nextKey++}`;
+                keys.set(object, key);
+            }
+            if (!persisted.has(key) && !puts.has(key)) puts.set(key, record(key));
+            return key;
+        };
+        const cardKey = (card: Card) => keyFor(card, 'card', () => card);
+        const chunkKey = (chunk: string[]) => keyFor(chunk, 'chunk', () => chunk);
+        const playerKey = (player: Player) => keyFor(player, 'player', key => {
+            const record = { ...player } as unknown as PlayerRecord;
+            CARD_ZONES.forEach(zone => {
+                record[zone] = player[zone].map(cardKey);
+            });
+            if (player.commander) record.commander = cardKey(player.commander);
+            references.set(key, [...CARD_ZONES.flatMap(zone => record[zone]), ...(record.commander ? [record.commander] : [])]);
+            return record;
+        });
+
+        const { players, log, ...state } = snapshot.state;
+        const full = log.chunks.length === 0 ? 0 : log.chunks.length - 1;
+        const tailLength = log.length - full * LOG_CHUNK_SIZE;
+        const record: SnapshotRecord = {
+            info: snapshot.info,
+            state,
+            players: players.map(playerKey),
+            log: {
+                chunks: log.chunks.slice(0, full).map(chunkKey),
+                tail: log.chunks[full]?.slice(0, tailLength) ?? [],
+                length: log.length,
+                first: log.first,
+                capacity: log.capacity,
+                archive: log.archive ? log.archive.slice(0, log.archived).map(chunkKey) : null
+            }
+        };
+        const key = snapshotKey(snapshot.info.id);
+        references.set(key, [...record.players, ...record.log.chunks, ...(record.log.archive ?? [])]);
+        puts.set(key, record);
+    };
+
+    // Everything a kept snapshot still reaches, for deleting the rest.
+    const reachable = (roots: string[]) => {
+        const seen = new Set<string>();
+        const visit = (key: string) => {
+            if (seen.has(key)) return;
+            seen.add(key);
+            references.get(key)?.forEach(visit);
+        };
+        roots.forEach(visit);
+        return seen;
+    };
+
+    const writeChanges = async (): Promise<SaveResult> => {
+        if (!store) return { written: 0, deleted: 0 };
+        const puts = new Map<string, unknown>();
+        snapshots.forEach(snapshot => {
+            if (!persisted.has(snapshotKey(snapshot.info.id))) encode(puts, snapshot);
+        });
+
+        const roots = snapshots.map(s => snapshotKey(s.info.id));
+        const dropped = [...persisted].some(key => key.startsWith('snap:') && !roots.includes(key));
+        const kept = dropped ? reachable(roots) : null;
+        const deletes = [
+            ...(kept ? [...persisted].filter(key => key !== HEAD && !kept.has(key)) : []),
+            ...[...stale].filter(key => !puts.has(key))
+        ];
+
+        const head: HeadRecord = { snapshots: snapshots.map(s => s.info.id), current: latest()?.id ?? null, nextKey, nextId };
+        puts.set(HEAD, head);
+        await store.commit(puts, deletes);
+
+        stale = new Set();
+        puts.forEach((_, key) => persisted.add(key));
+        deletes.forEach(key => {
+            persisted.delete(key);
+            references.delete(key);
+        });
+        return { written: puts.size, deleted: deletes.length };
+    };
+
+    const readStore = async (): Promise<SessionState | null> => {
+        if (!store) return null;
+        const records = await store.load();
+        const head = records.get(HEAD) as HeadRecord | undefined;
+        if (!head) return null;
+        if (snapshots.length > 0) {
+            // Play moved on before the stored session arrived; the next save clears it out.
+            stale = new Set(records.keys());
+            return null;
+        }
+
+        keys = new WeakMap();
+        persisted.clear();
+        references.clear();
+        records.forEach((_, key) => persisted.add(key));
+        nextKey = head.nextKey;
+        nextId = head.nextId;
+
+        // Each record decodes once, so snapshots share objects the way they did when saved.
+        const decoded = new Map<string, object>();
+        const shared = <T extends object>(key: string, decode: (record: never) => T): T => {
+            let object = decoded.get(key) as T | undefined;
+            if (!object) {
+                object = decode(records.get(key) as never);
+                decoded.set(key, object);
+                keys.set(object, key);
+            }
+            return object;
+        };
+        const card = (key: string) => shared(key, (record: Card) => record);
+        const chunk = (key: string) => shared(key, (record: string[]) => record);
+        const player = (key: string) => shared(key, (record: PlayerRecord) => {
+            const decodedPlayer = { ...record } as unknown as Player;
+            CARD_ZONES.forEach(zone => {
+                decodedPlayer[zone] = record[zone].map(card);
+            });
+            if (record.commander) decodedPlayer.commander = card(record.commander);
+            references.set(key, [...CARD_ZONES.flatMap(zone => record[zone]), ...(record.commander ? [record.commander] : [])]);
+            return decodedPlayer;
+        });
+
+        snapshots = head.snapshots.map(id => {
+            const key = snapshotKey(id);
+            const record = records.get(key) as SnapshotRecord;
+            const { log } = record;
+            const archive = log.archive?.map(chunk) ?? null;
+            references.set(key, [...record.players, ...log.chunks, ...(log.archive ?? [])]);
+            return {
+                info: record.info,
+                state: {
+                    ...record.state,
+                    players: record.players.map(player),
+                    log: {
+                        chunks: [...log.chunks.map(chunk), ...(log.tail.length > 0 ? [[...log.tail]] : [])],
+                        length: log.length,
+                        first: log.first,
+                        capacity: log.capacity,
+                        archive,
+                        archived: archive?.length ?? 0
+                    }
+                }
+            };
+        });
+        current = snapshots.findIndex(s => s.info.id === head.current);
+        return snapshots[current]?.state ?? null;
+    };
+
+    // Writes what changed since the last save, as the history is when the save starts.
+    const save = () => enqueue(writeChanges);
+
+    // Takes over the session in the store, unless this history already has checkpoints of its own,
+    // and returns the state it was at.
+    const load = () => enqueue(readStore);
+
+    return { capture, restore, latest, list, reset, save, load };
+};
+
+export type SessionHistory = ReturnType<typeof createSessionHistory>;
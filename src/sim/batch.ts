@@ -0,0 +1,128 @@
+import { playHeadlessGame } from './headlessGame.ts';
+import type { GameRecord, HeadlessGameOptions } from './headlessGame.ts';
+import { createRng, randomSeed } from '../store/rng.ts';
+
+const PLAYER_IDS = ['player1', 'player2'];
+
+// Only sums and counts, so batches from different workers merge by simple addition.
+export interface BatchStats {
+    games: number;
+    draws: number;
+    wins: Record<string, number>;
+    gamesStartedBy: Record<string, number>;
+    winsWhenStarting: Record<string, number>;
+    totalTurns: number;
+    longestGame: number;
+    goldSpent: Record<string, number>;
+    purchases: Record<string, number>;
+    goldCurve: Record<string, { sum: number[]; count: number[] }>; // indexed by player-turn
+    gambleSpawns: number;
+    gambleGold: number;
+}
+
+export const emptyBatchStats = (): BatchStats => ({
+    games: 0,
+    draws: 0,
+    wins: { player1: 0, player2: 0 },
+    gamesStartedBy: { player1: 0, player2: 0 },
+    winsWhenStarting: { player1: 0, player2: 0 },
+    totalTurns: 0,
+    longestGame: 0,
+    goldSpent: { player1: 0, player2: 0 },
+    purchases: {},
+    goldCurve: { player1: { sum: [], count: [] }, player2: { sum: [], count: [] } },
+    gambleSpawns: 0,
+    gambleGold: 0
+});
+
+const addInto = (target: Record<string, number>, source: Record<string, number>) => {
+    Object.entries(source).forEach(([key, value]) => {
+        target[key] = (target[key] || 0) + value;
+    });
+};
+
+const addSeries = (target: number[], source: number[]) => {
+    source.forEach((value, i) => {
+        target[i] = (target[i] || 0) + value;
+    });
+};
+
+export const recordGame = (stats: BatchStats, game: GameRecord) => {
+    stats.games++;
+    stats.totalTurns += game.turns;
+    stats.longestGame = Math.max(stats.longestGame, game.turns);
+    stats.gamesStartedBy[game.startingPlayerId]++;
+
+    if (game.winner) {
+        stats.wins[game.winner]++;
+        if (game.winner === game.startingPlayerId) stats.winsWhenStarting[game.winner]++;
+    } else {
+        stats.draws++;
+    }
+
+    addInto(stats.goldSpent, game.goldSpent);
+    addInto(stats.purchases, game.purchases);
+    PLAYER_IDS.forEach(id => {
+        addSeries(stats.goldCurve[id].sum, game.goldByTurn[id]);
+        addSeries(stats.goldCurve[id].count, game.goldByTurn[id].map(() => 1));
+    });
+    stats.gambleSpawns += game.gambleSpawns;
+    stats.gambleGold += game.gambleGold;
+};
+
+export const mergeBatchStats = (a: BatchStats, b: BatchStats): BatchStats => {
+    const merged = emptyBatchStats();
+    [a, b].forEach(s => {
+        merged.games += s.games;
+        merged.draws += s.draws;
+        merged.totalTurns += s.totalTurns;
+        merged.longestGame = Math.max(merged.longestGame, s.longestGame);
+        addInto(merged.wins, s.wins);
+        addInto(merged.gamesStartedBy, s.gamesStartedBy);
+        addInto(merged.winsWhenStarting, s.winsWhenStarting);
+        addInto(merged.goldSpent, s.goldSpent);
+        addInto(merged.purchases, s.purchases);
+        PLAYER_IDS.forEach(id => {
+            addSeries(merged.goldCurve[id].sum, s.goldCurve[id].sum);
+            addSeries(merged.goldCurve[id].count, s.goldCurve[id].count);
+        });
+        merged.gambleSpawns += s.gambleSpawns;
+        merged.gambleGold += s.gambleGold;
+    });
+    return merged;
+};
+
+export interface BatchOptions extends Omit<HeadlessGameOptions, 'rng'> {
+    seed?: number;
+}
+
+// Game `n` of a seeded batch always plays on stream `n` of the seed, so splitting a batch across
+// workers (by `firstGame`) gives the same results as running it in one go.
+export const runBatch = (games: number, options: BatchOptions = {}, firstGame = 0): BatchStats => {
+    const { seed = randomSeed(), ...gameOptions } = options;
+    const root = createRng(seed);
+    const stats = emptyBatchStats();
+    for (let i = 0; i < games; i++) {
+        recordGame(stats, playHeadlessGame({ ...gameOptions, rng: root.fork(firstGame + i) }));
+    }
+    return stats;
+};
+
+const ratio = (a: number, b: number) => (b > 0 ? Math.round((a / b) * 1000) / 1000 : 0);
+
+// Human-readable aggregate view of a batch.
+export const summarizeBatch = (stats: BatchStats, curveLength = 20) => ({
+    games: stats.games,
+    winRate: Object.fromEntries(PLAYER_IDS.map(id => [id, ratio(stats.wins[id], stats.games)])),
+    drawRate: ratio(stats.draws, stats.games),
+    starterWinRate: Object.fromEntries(PLAYER_IDS.map(id => [id, ratio(stats.winsWhenStarting[id], stats.gamesStartedBy[id])])),
+    averageTurns: ratio(stats.totalTurns, stats.games),
+    longestGame: stats.longestGame,
+    averageGoldSpent: Object.fromEntries(PLAYER_IDS.map(id => [id, ratio(stats.goldSpent[id], stats.games)])),
+    purchasesPerGame: Object.fromEntries(Object.entries(stats.purchases).map(([item, n]) => [item, ratio(n, stats.games)])),
+    goldCurve: Object.fromEntries(PLAYER_IDS.map(id => [
+        id,
+        stats.goldCurve[id].sum.slice(0, curveLength).map((sum, i) => ratio(sum, stats.goldCurve[id].count[i]))
+    ])),
+    averageGambleGold: ratio(stats.gambleGold, stats.gambleSpawns)
+});
@@ -0,0 +1,43 @@
+import { describe, it, expect } from 'vitest';
+import { playHeadlessGame } from './headlessGame';
+import { emptyBatchStats, mergeBatchStats, runBatch, summarizeBatch } from './batch';
+import { createRng } from '../store/rng';
+
+describe('Headless Game Simulator', () => {
+    it('should play a complete game to a winner without timers', () => {
+        const game = playHeadlessGame();
+
+        expect(game.winner === 'player1' || game.winner === 'player2').toBe(true);
+        expect(game.turns).toBeGreaterThan(0);
+        expect(game.goldByTurn.player1).toHaveLength(game.turns);
+    });
+
+    it('should score games that hit the turn cap as draws', () => {
+        const game = playHeadlessGame({ maxTurns: 0 });
+
+        expect(game.winner).toBeNull();
+        expect(game.turns).toBe(0);
+    });
+
+    it('should merge batch stats by addition', () => {
+        const a = runBatch(20);
+        const b = runBatch(30, { gambles: 3 });
+        const merged = mergeBatchStats(mergeBatchStats(emptyBatchStats(), a), b);
+
+        expect(merged.games).toBe(50);
+        expect(merged.wins.player1 + merged.wins.player2 + merged.draws).toBe(50);
+        expect(merged.gambleSpawns).toBe(a.gambleSpawns + b.gambleSpawns);
+        expect(summarizeBatch(merged).averageTurns).toBeGreaterThan(0);
+    });
+
+    it('should replay the same game from the same seed', () => {
+        expect(playHeadlessGame({ rng: createRng(123), gambles: 3 })).toEqual(playHeadlessGame({ rng: createRng(123), gambles: 3 }));
+    });
+
+    it('should give seeded batches the same result however they are split', () => {
+        const whole = runBatch(40, { seed: 5 });
+        const split = mergeBatchStats(runBatch(15, { seed: 5 }), runBatch(25, { seed: 5 }, 15));
+
+        expect(split).toEqual(whole);
+    });
+});
@@ -0,0 +1,170 @@
+import type { Card, Player } from '../types';
+import { buildCombatBoard, calculateCombatOutcome } from '../store/combatLogic.ts';
+import { planAttacks } from '../store/attackPlanner.ts';
+import { planBlocks } from '../store/blockPlanner.ts';
+import {
+    AI_ATTACK_OPTIONS, AI_BLOCK_OPTIONS, MAX_GAMBLES_PER_GAME,
+    applyAIShopItem, applyCombatOutcome, awardVictory, beginTurn, createBattle, createPlayer, findWinner, gambleSpawn, pickAIShopItem, tapAttackers
+} from '../store/gameRules.ts';
+import type { ShopItem } from '../store/gameRules.ts';
+import { createRng, randomSeed } from '../store/rng.ts';
+import type { Rng } from '../store/rng.ts';
+import type { ReplayRecorder } from './replay.ts';
+
+// Plays the same turn structure as the store's auto-battle loop (shop at the start of a turn,
+// declare attackers, AI blocks, combat damage, cleanup) with both seats driven by the AI and no timers.
+
+export interface HeadlessGameOptions {
+    rng?: Rng; // a fresh random seed when omitted
+    maxTurns?: number; // player-turns before the game is scored as a draw
+    gambles?: number; // Gamble Spawns Player 1 takes at the start of its turns (capped at 3 per game)
+    recorder?: ReplayRecorder; // receives every turn's battlefield and every combat (see replay.ts)
+}
+
+export interface GameRecord {
+    winner: string | null; // null when maxTurns was reached
+    startingPlayerId: string;
+    turns: number;
+    finalLife: Record<string, number>;
+    goldByTurn: Record<string, number[]>; // each player's gold at the end of every player-turn
+    goldSpent: Record<string, number>;
+    purchases: Record<string, number>; // shop item id -> times bought (both players)
+    gambleSpawns: number;
+    gambleGold: number;
+}
+
+export const DEFAULT_MAX_TURNS = 200;
+
+export interface TurnOptions {
+    opening?: boolean; // the battle's first turn goes straight to combat (startGame): no untap, no shop
+    gamble?: boolean; // take a Gamble Spawn before shopping (Player 1 only)
+    recorder?: ReplayRecorder;
+    turn?: number; // player-turn number, for the recorder
+    log?: string[]; // receives the turn's log lines when given
+}
+
+export interface TurnResult {
+    players: Player[];
+    winner: string | null;
+    decidedInShop: boolean; // the shop (a -1/-1 counter) ended the game before combat
+    purchase: ShopItem | null;
+    gambleGold: number | null; // set when a Gamble Spawn was taken
+}
+
+// One player-turn: untap, optional Gamble Spawn, AI shop visit, AI attacks, AI blocks, combat damage.
+export const playTurn = (players: Player[], activePlayerId: string, rng: Rng, options: TurnOptions = {}): TurnResult => {
+    const { recorder, log } = options;
+    const result: TurnResult = { players, winner: null, decidedInShop: false, purchase: null, gambleGold: null };
+
+    if (!options.opening) {
+        players = beginTurn(players, activePlayerId);
+
+        if (options.gamble && activePlayerId === 'player1') {
+            const gamble = gambleSpawn(players, 'player1', rng);
+            if (gamble) {
+                players = gamble.players;
+                result.gambleGold = gamble.goldEarned;
+            }
+        }
+
+        const buyer = players.find(p => p.id === activePlayerId)!;
+        const item = pickAIShopItem(buyer, rng);
+        if (item) {
+            const purchase = applyAIShopItem(players, activePlayerId, item, rng);
+            players = purchase.players;
+            result.purchase = item;
+            if (log && purchase.message) log.push(purchase.message);
+        }
+
+        const winnerAfterShop = findWinner(players);
+        if (winnerAfterShop) {
+            return { ...result, players, winner: winnerAfterShop, decidedInShop: true };
+        }
+    }
+
+    recorder?.turn(options.turn ?? 0, activePlayerId, players);
+    const attackerPlayer = players.find(p => p.id === activePlayerId)!;
+    const defenderPlayer = players.find(p => p.id !== activePlayerId)!;
+    const attackers = planAttacks({ attackerPlayer, defender: defenderPlayer }, AI_ATTACK_OPTIONS).attackers;
+
+    if (attackers.length > 0) {
+        const attackerCards = attackers
+            .map(id => attackerPlayer.battlefield.find(c => c.id === id))
+            .filter((c): c is Card => !!c);
+        const blockers = planBlocks({ attackers: attackerCards, attackerPlayer, defender: defenderPlayer }, AI_BLOCK_OPTIONS).blockers;
+        players = tapAttackers(players, activePlayerId, attackers);
+
+        const board = buildCombatBoard({ players, activePlayerId, attackers, blockers })!;
+        const outcome = calculateCombatOutcome(board);
+        recorder?.combat(attackers, blockers, outcome);
+        const application = applyCombatOutcome(players, outcome, activePlayerId);
+        players = application.players;
+        if (log) {
+            log.push(`${attackerPlayer.name} attacks with ${attackerCards.map(c => c.name).join(', ')}.`);
+            log.push(...application.log);
+        }
+    } else if (log) {
+        log.push(`${attackerPlayer.name} does not attack.`);
+    }
+
+    return { ...result, players, winner: findWinner(players) };
+};
+
+export const playHeadlessGame = (options: HeadlessGameOptions = {}): GameRecord => {
+    const rng = options.rng || createRng(randomSeed());
+    const maxTurns = options.maxTurns ?? DEFAULT_MAX_TURNS;
+    const gambles = Math.min(options.gambles ?? 0, MAX_GAMBLES_PER_GAME);
+
+    let players: Player[] = createBattle([createPlayer('player1', 'Player 1', rng), createPlayer('player2', 'Player 2', rng)], rng);
+    const startingPlayerId = rng.next() > 0.5 ? 'player1' : 'player2';
+    let activePlayerId = startingPlayerId;
+    const recorder = options.recorder;
+    recorder?.beginGame(rng.seed, startingPlayerId);
+
+    const record: GameRecord = {
+        winner: null,
+        startingPlayerId,
+        turns: 0,
+        finalLife: {},
+        goldByTurn: { player1: [], player2: [] },
+        goldSpent: { player1: 0, player2: 0 },
+        purchases: {},
+        gambleSpawns: 0,
+        gambleGold: 0
+    };
+
+    while (record.turns < maxTurns) {
+        record.turns++;
+
+        const turn = playTurn(players, activePlayerId, rng, {
+            opening: record.turns === 1,
+            gamble: record.gambleSpawns < gambles,
+            recorder,
+            turn: record.turns
+        });
+        players = turn.players;
+        if (turn.gambleGold !== null) {
+            record.gambleSpawns++;
+            record.gambleGold += turn.gambleGold;
+        }
+        if (turn.purchase) {
+            record.goldSpent[activePlayerId] += turn.purchase.cost;
+            record.purchases[turn.purchase.id] = (record.purchases[turn.purchase.id] || 0) + 1;
+        }
+        if (!turn.decidedInShop) players.forEach(p => record.goldByTurn[p.id].push(p.gold));
+
+        if (turn.winner) {
+            record.winner = turn.winner;
+            players = awardVictory(players, turn.winner);
+            break;
+        }
+
+        activePlayerId = activePlayerId === 'player1' ? 'player2' : 'player1';
+    }
+
+    players.forEach(p => {
+        record.finalLife[p.id] = p.life;
+    });
+    recorder?.endGame(record.winner, record.turns);
+    return record;
+};
@@ -0,0 +1,86 @@
+import { describe, it, expect } from 'vitest';
+import { playHeadlessGame } from './headlessGame';
+import { REPLAY_VERSION, createReplayReader, createReplayVerifier, createReplayWriter, readReplay, verifyReplay } from './replay';
+import type { ReplayRecord } from './replay';
+import { createRng } from '../store/rng';
+
+const record = (seeds: number[], chunkSize?: number) => {
+    const chunks: Uint8Array[] = [];
+    const writer = createReplayWriter(chunk => chunks.push(chunk), chunkSize);
+    const games = seeds.map(seed => playHeadlessGame({ rng: createRng(seed), maxTurns: 40, recorder: writer }));
+    writer.flush();
+    const bytes = new Uint8Array(chunks.reduce((n, c) => n + c.length, 0));
+    chunks.reduce((at, c) => (bytes.set(c, at), at + c.length), 0);
+    return { bytes, chunks, games };
+};
+
+describe('Replay Format', () => {
+    it('should read back the game, its turns and its combats', () => {
+        const { bytes, games } = record([7, 8]);
+        const records = readReplay(bytes);
+
+        const starts = records.filter(r => r.type === 'game');
+        const ends = records.filter((r): r is Extract<ReplayRecord, { type: 'end' }> => r.type === 'end');
+        expect(starts).toEqual([
+            { type: 'game', seed: 7, startingPlayerId: games[0].startingPlayerId },
+            { type: 'game', seed: 8, startingPlayerId: games[1].startingPlayerId }
+        ]);
+        expect(ends.map(e => [e.winner, e.turns])).toEqual(games.map(g => [g.winner, g.turns]));
+        expect(records.filter(r => r.type === 'turn')).toHaveLength(games[0].turns + games[1].turns);
+
+        const firstTurn = records.find((r): r is Extract<ReplayRecord, { type: 'turn' }> => r.type === 'turn')!;
+        expect(firstTurn.players.map(p => p.id)).toEqual(['player1', 'player2']);
+        expect(firstTurn.players[0].battlefield.length).toBeGreaterThan(0);
+    });
+
+    it('should stream records out of arbitrarily small chunks', () => {
+        const { bytes } = record([11], 256);
+        const streamed: ReplayRecord[] = [];
+        const reader = createReplayReader(r => streamed.push(r));
+        for (let at = 0; at < bytes.length; at += 7) reader.push(bytes.subarray(at, at + 7));
+        reader.end();
+
+        expect(streamed).toEqual(readReplay(bytes));
+    });
+
+    it('should re-resolve every combat to the recorded outcome', () => {
+        const { bytes } = record([1, 2, 3]);
+        const check = verifyReplay(bytes);
+
+        expect(check.games).toBe(3);
+        expect(check.combats).toBeGreaterThan(0);
+        expect(check.mismatches).toEqual([]);
+    });
+
+    it('should report combats whose outcome no longer matches', () => {
+        const { bytes } = record([5]);
+        const verifier = createReplayVerifier();
+        let tampered = false;
+        readReplay(bytes).forEach(r => {
+            // As if the engine now resolved the first combat differently.
+            if (r.type === 'combat' && !tampered) {
+                tampered = true;
+                verifier.record({ ...r, digest: r.digest ^ 1 });
+            } else {
+                verifier.record(r);
+            }
+        });
+
+        expect(verifier.result().mismatches).toHaveLength(1);
+        expect(verifier.result().mismatches[0].game).toBe(0);
+    });
+
+    it('should reject data that is not a replay', () => {
+        expect(() => readReplay(new TextEncoder().encode('not a replay'))).toThrow('Not a replay file');
+        const { bytes } = record([9]);
+        expect(() => readReplay(bytes.subarray(0, bytes.length - 1))).toThrow();
+    });
+
+    it('should reject records too short for what they hold', () => {
+        const header = [...new TextEncoder().encode('MTGR'), REPLAY_VERSION];
+        // A combat record (type 4) with no attackers, no blocks and only 2 of its 4 digest bytes.
+        expect(() => readReplay(new Uint8Array([...header, 4, 4, 0, 0, 0xab, 0xcd]))).toThrow('Truncated replay record');
+        // A strings record (type 1) whose one string claims 5 bytes and has 2.
+        expect(() => readReplay(new Uint8Array([...header, 1, 4, 1, 5, 0x61, 0x62]))).toThrow('Truncated replay record');
+    });
+});
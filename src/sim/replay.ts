@@ -0,0 +1,359 @@
+import type { CombatOutcome, Player } from '../types';
+import { buildCombatBoard, calculateCombatOutcome } from '../store/combatLogic.ts';
+import { tapAttackers } from '../store/gameRules.ts';
+import { createStringTable, decodePlayers, encodePlayers, internString } from '../store/boardCodec.ts';
+
+// Binary replay format: every turn's battlefield and every combat's declarations, compact enough to
+// keep thousands of games around and replay them through the combat engine after a rules change.
+//
+// A file is "MTGR", a format version byte, then records: a type byte, the payload length (varint)
+// and the payload.
+//   STRINGS  strings first used by the records that follow: count, then (utf-8 length, bytes) each
+//   GAME     seed, starting player
+//   TURN     turn number, active player, the battlefield before attacks (boardCodec layout)
+//   COMBAT   attackers, then per blocked attacker: the attacker and its blockers in damage assignment
+//            order, then a 32-bit digest of the CombatOutcome the engine produced
+//   END      winner (0 for a draw, otherwise the string reference + 1), turns played
+// Strings are interned once per file and referenced by index. Integers are varints, zigzag-encoded
+// in snapshots since life totals can go negative.
+
+export const REPLAY_VERSION = 1;
+
+const MAGIC = [0x4d, 0x54, 0x47, 0x52];
+const RECORD = { strings: 1, game: 2, turn: 3, combat: 4, end: 5 } as const;
+
+export type ReplayRecord =
+    | { type: 'game'; seed: number; startingPlayerId: string }
+    | { type: 'turn'; turn: number; activePlayerId: string; players: Player[] }
+    | { type: 'combat'; attackers: string[]; blockers: Record<string, string[]>; digest: number }
+    | { type: 'end'; winner: string | null; turns: number };
+
+export interface ReplayRecorder {
+    beginGame: (seed: number, startingPlayerId: string) => void;
+    turn: (turn: number, activePlayerId: string, players: Player[]) => void;
+    combat: (attackers: string[], blockers: Record<string, string[]>, outcome: CombatOutcome) => void;
+    endGame: (winner: string | null, turns: number) => void;
+}
+
+export interface ReplayWriter extends ReplayRecorder {
+    flush: () => void; // hand everything buffered to the sink
+}
+
+// FNV-1a over the outcome's JSON: the engine builds outcomes in a fixed order, so equal outcomes
+// serialise identically. The per-card indexes are derived from the other fields and left out, which
+// keeps digests recorded before they existed valid.
+export const outcomeDigest = (outcome: CombatOutcome): number => {
+    const { damageEvents, deaths, deathDescriptions, attackerLifeGained, defenderLifeGained, explanation } = outcome;
+    const text = JSON.stringify({ damageEvents, deaths, deathDescriptions, attackerLifeGained, defenderLifeGained, explanation });
+    let hash = 0x811c9dc5;
+    for (let i = 0; i < text.length; i++) {
+        hash ^= text.charCodeAt(i);
+        hash = Math.imul(hash, 0x01000193);
+    }
+    return hash >>> 0;
+};
+
+const utf8 = new TextEncoder();
+const fromUtf8 = new TextDecoder();
+
+// Growable byte buffer.
+const createBytes = (initial = 1024) => {
+    let buffer = new Uint8Array(initial);
+    let length = 0;
+
+    const reserve = (n: number) => {
+        if (length + n <= buffer.length) return;
+        const grown = new Uint8Array(Math.max(buffer.length * 2, length + n));
+        grown.set(buffer.subarray(0, length));
+        buffer = grown;
+    };
+    const byte = (value: number) => {
+        reserve(1);
+        buffer[length++] = value;
+    };
+    const varint = (value: number) => {
+        let v = value >>> 0;
+        while (v >= 0x80) {
+            byte((v & 0x7f) | 0x80);
+            v >>>= 7;
+        }
+        byte(v);
+    };
+    const bytes = (values: ArrayLike<number>) => {
+        reserve(values.length);
+        buffer.set(values, length);
+        length += values.length;
+    };
+
+    return {
+        byte,
+        varint,
+        zigzag: (value: number) => varint((value << 1) ^ (value >> 31)),
+        bytes,
+        uint32: (value: number) => {
+            for (let i = 0; i < 4; i++) byte((value >>> (i * 8)) & 0xff);
+        },
+        length: () => length,
+        view: () => buffer.subarray(0, length),
+        reset: () => {
+            length = 0;
+        }
+    };
+};
+
+export const createReplayWriter = (sink: (chunk: Uint8Array) => void, chunkSize = 64 * 1024): ReplayWriter => {
+    const table = createStringTable();
+    let stringsWritten = 0;
+    const out = createBytes(chunkSize);
+    const payload = createBytes();
+    out.bytes(MAGIC);
+    out.byte(REPLAY_VERSION);
+
+    const ref = (value: string) => internString(table, value);
+
+    const writeRecord = (type: number, body: Uint8Array) => {
+        out.byte(type);
+        out.varint(body.length);
+        out.bytes(body);
+    };
+
+    // Strings interned while building the payload go out first, so the reader always knows them.
+    const emit = (type: number) => {
+        if (table.strings.length > stringsWritten) {
+            const strings = createBytes();
+            strings.varint(table.strings.length - stringsWritten);
+            table.strings.slice(stringsWritten).forEach(s => {
+                const encoded = utf8.encode(s);
+                strings.varint(encoded.length);
+                strings.bytes(encoded);
+            });
+            stringsWritten = table.strings.length;
+            writeRecord(RECORD.strings, strings.view());
+        }
+        writeRecord(type, payload.view());
+        payload.reset();
+        if (out.length() >= chunkSize) flush();
+    };
+
+    const flush = () => {
+        if (out.length() === 0) return;
+        sink(out.view().slice());
+        out.reset();
+    };
+
+    return {
+        beginGame: (seed, startingPlayerId) => {
+            payload.varint(seed);
+            payload.varint(ref(startingPlayerId));
+            emit(RECORD.game);
+        },
+        turn: (turn, activePlayerId, players) => {
+            payload.varint(turn);
+            payload.varint(ref(activePlayerId));
+            const { numbers } = encodePlayers(players, table);
+            payload.varint(numbers.length);
+            numbers.forEach(n => payload.zigzag(n));
+            emit(RECORD.turn);
+        },
+        combat: (attackers, blockers, outcome) => {
+            payload.varint(attackers.length);
+            attackers.forEach(id => payload.varint(ref(id)));
+            const blocked = Object.entries(blockers);
+            payload.varint(blocked.length);
+            blocked.forEach(([attackerId, blockerIds]) => {
+                payload.varint(ref(attackerId));
+                payload.varint(blockerIds.length);
+                blockerIds.forEach(id => payload.varint(ref(id)));
+            });
+            payload.uint32(outcomeDigest(outcome));
+            emit(RECORD.combat);
+        },
+        endGame: (winner, turns) => {
+            payload.varint(winner === null ? 0 : ref(winner) + 1);
+            payload.varint(turns);
+            emit(RECORD.end);
+        },
+        flush
+    };
+};
+
+// Streaming reader: push chunks as they arrive (from a file stream, a fetch body...) and records come
+// out as soon as they are complete. Payloads are parsed in place; only a record split across two
+// chunks is copied.
+export const createReplayReader = (onRecord: (record: ReplayRecord) => void) => {
+    const strings: string[] = [];
+    let pending = new Uint8Array(0);
+    let headerRead = false;
+
+    const parse = (data: Uint8Array) => {
+        let pos = 0;
+
+        // Varint at `at`, or null when the data ends first.
+        const peekVarint = (at: number): [number, number] | null => {
+            let value = 0;
+            for (let shift = 0, i = at; i < data.length; shift += 7, i++) {
+                value += (data[i] & 0x7f) * 2 ** shift;
+                if (data[i] < 0x80) return [value, i + 1];
+            }
+            return null;
+        };
+
+        if (!headerRead) {
+            if (data.length < MAGIC.length + 1) return 0;
+            if (MAGIC.some((b, i) => data[i] !== b)) throw new Error('Not a replay file');
+            if (data[MAGIC.length] !== REPLAY_VERSION) throw new Error(`Unsupported replay version ${data[MAGIC.length]}`);
+            headerRead = true;
+            pos = MAGIC.length + 1;
+        }
+
+        while (pos < data.length) {
+            const length = peekVarint(pos + 1);
+            if (!length || length[1] + length[0] > data.length) break;
+            const type = data[pos];
+            const start = length[1];
+            const end = start + length[0];
+            readRecord(type, data, start, end);
+            pos = end;
+        }
+        return pos;
+    };
+
+    const readRecord = (type: number, data: Uint8Array, start: number, end: number) => {
+        let at = start;
+        const varint = () => {
+            let value = 0;
+            for (let shift = 0; ; shift += 7) {
+                if (at >= end) throw new Error('Truncated replay record');
+                const b = data[at++];
+                value += (b & 0x7f) * 2 ** shift;
+                if (b < 0x80) return value;
+            }
+        };
+        const bytes = (length: number) => {
+            if (at + length > end) throw new Error('Truncated replay record');
+            at += length;
+            return data.subarray(at - length, at);
+        };
+        const zigzag = () => {
+            const v = varint();
+            return (v >>> 1) ^ -(v & 1);
+        };
+        const str = () => strings[varint()];
+
+        switch (type) {
+            case RECORD.strings: {
+                const count = varint();
+                for (let i = 0; i < count; i++) {
+                    strings.push(fromUtf8.decode(bytes(varint())));
+                }
+                return;
+            }
+            case RECORD.game:
+                onRecord({ type: 'game', seed: varint(), startingPlayerId: str() });
+                return;
+            case RECORD.turn: {
+                const turn = varint();
+                const activePlayerId = str();
+                const numbers = new Int32Array(varint());
+                for (let i = 0; i < numbers.length; i++) numbers[i] = zigzag();
+                onRecord({ type: 'turn', turn, activePlayerId, players: decodePlayers({ strings, numbers }) });
+                return;
+            }
+            case RECORD.combat: {
+                const attackers = Array.from({ length: varint() }, str);
+                const blockers: Record<string, string[]> = {};
+                const blocked = varint();
+                for (let i = 0; i < blocked; i++) {
+                    const attackerId = str();
+                    blockers[attackerId] = Array.from({ length: varint() }, str);
+                }
+                const [b0, b1, b2, b3] = bytes(4);
+                const digest = (b0 | (b1 << 8) | (b2 << 16) | (b3 << 24)) >>> 0;
+                onRecord({ type: 'combat', attackers, blockers, digest });
+                return;
+            }
+            case RECORD.end: {
+                const winner = varint();
+                onRecord({ type: 'end', winner: winner === 0 ? null : strings[winner - 1], turns: varint() });
+                return;
+            }
+            default:
+                throw new Error(`Unknown replay record type ${type}`);
+        }
+    };
+
+    return {
+        push: (chunk: Uint8Array) => {
+            const data = pending.length === 0 ? chunk : concat(pending, chunk);
+            pending = data.slice(parse(data));
+        },
+        end: () => {
+            if (!headerRead || pending.length > 0) throw new Error('Replay ends in the middle of a record');
+        }
+    };
+};
+
+const concat = (a: Uint8Array, b: Uint8Array) => {
+    const joined = new Uint8Array(a.length + b.length);
+    joined.set(a);
+    joined.set(b, a.length);
+    return joined;
+};
+
+export const readReplay = (bytes: Uint8Array): ReplayRecord[] => {
+    const records: ReplayRecord[] = [];
+    const reader = createReplayReader(record => records.push(record));
+    reader.push(bytes);
+    reader.end();
+    return records;
+};
+
+export interface ReplayMismatch {
+    game: number; // 0-based position in the file
+    turn: number;
+    expected: number;
+    actual: number;
+}
+
+export interface ReplayCheck {
+    games: number;
+    combats: number;
+    mismatches: ReplayMismatch[];
+}
+
+// Re-resolves every recorded combat from its turn snapshot (tapping attackers as the game did) and
+// compares the outcome digest with the recorded one.
+export const createReplayVerifier = () => {
+    const check: ReplayCheck = { games: 0, combats: 0, mismatches: [] };
+    let turn: Extract<ReplayRecord, { type: 'turn' }> | null = null;
+
+    return {
+        record: (record: ReplayRecord) => {
+            if (record.type === 'game') {
+                check.games++;
+                turn = null;
+            } else if (record.type === 'turn') {
+                turn = record;
+            } else if (record.type === 'combat') {
+                if (!turn) throw new Error('Combat recorded before any turn');
+                check.combats++;
+                const { attackers, blockers } = record;
+                const players = tapAttackers(turn.players, turn.activePlayerId, attackers);
+                const board = buildCombatBoard({ players, activePlayerId: turn.activePlayerId, attackers, blockers });
+                const actual = board ? outcomeDigest(calculateCombatOutcome(board)) : 0;
+                if (actual !== record.digest) {
+                    check.mismatches.push({ game: check.games - 1, turn: turn.turn, expected: record.digest, actual });
+                }
+            }
+        },
+        result: () => check
+    };
+};
+
+export const verifyReplay = (bytes: Uint8Array): ReplayCheck => {
+    const verifier = createReplayVerifier();
+    const reader = createReplayReader(verifier.record);
+    reader.push(bytes);
+    reader.end();
+    return verifier.result();
+};
@@ -0,0 +1,61 @@
+import { describe, it, expect } from 'vitest';
+import { startTurbo } from './turbo';
+import type { TurboCommit, TurboPosition } from './turbo';
+import { playHeadlessGame } from './headlessGame';
+import { createBattle, createPlayer } from '../store/gameRules';
+import { createRng } from '../store/rng';
+
+// The position playHeadlessGame starts from for `seed`, right before the opening combat.
+const openingPosition = (seed: number): TurboPosition => {
+    const rng = createRng(seed);
+    const players = createBattle([createPlayer('player1', 'Player 1', rng), createPlayer('player2', 'Player 2', rng)], rng);
+    const activePlayerId = rng.next() > 0.5 ? 'player1' : 'player2';
+    return { players, activePlayerId, turnCount: 1, rng, resumeAtCombat: true };
+};
+
+// Runs to the end with chunks drained synchronously.
+const runToEnd = (position: TurboPosition, commitEvery: number, maxTurns?: number) => {
+    const commits: TurboCommit[] = [];
+    const queue: (() => void)[] = [];
+    startTurbo(position, { commitEvery, maxTurns, onCommit: c => commits.push(c), schedule: next => queue.push(next) });
+    while (queue.length > 0) queue.shift()!();
+    return commits;
+};
+
+describe('Turbo Mode', () => {
+    it('should finish the battle exactly as the simulator plays it', () => {
+        [3, 4, 5].forEach(seed => {
+            const record = playHeadlessGame({ rng: createRng(seed) });
+            const last = runToEnd(openingPosition(seed), 10).at(-1)!;
+
+            expect(last.done).toBe(true);
+            expect(last.winner).toBe(record.winner);
+            expect(last.turnsPlayed).toBe(record.turns);
+            expect(Object.fromEntries(last.players.map(p => [p.id, p.life]))).toEqual(record.finalLife);
+        });
+    });
+
+    it('should reach the same position whatever the commit interval', () => {
+        const everyTurn = runToEnd(openingPosition(11), 1);
+        const chunked = runToEnd(openingPosition(11), 25);
+
+        expect(everyTurn.length).toBeGreaterThan(chunked.length);
+        expect(chunked.at(-1)!.players).toEqual(everyTurn.at(-1)!.players);
+        expect(chunked.at(-1)!.turnCount).toBe(everyTurn.at(-1)!.turnCount);
+        expect(chunked.flatMap(c => c.log)).toEqual(everyTurn.flatMap(c => c.log));
+    });
+
+    it('should stop between chunks and at maxTurns', () => {
+        const commits: TurboCommit[] = [];
+        const queue: (() => void)[] = [];
+        const turbo = startTurbo(openingPosition(2), { commitEvery: 1, onCommit: c => commits.push(c), schedule: next => queue.push(next) });
+        queue.shift()!();
+        turbo.stop();
+        queue.forEach(next => next());
+        expect(commits).toHaveLength(1);
+
+        const capped = runToEnd(openingPosition(2), 4, 6).at(-1)!;
+        expect(capped.turnsPlayed).toBeLessThanOrEqual(6);
+        expect(capped.done).toBe(true);
+    });
+});
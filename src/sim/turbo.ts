@@ -0,0 +1,82 @@
+import type { Player } from '../types';
+import { awardVictory } from '../store/gameRules.ts';
+import type { Rng } from '../store/rng.ts';
+import { DEFAULT_MAX_TURNS, playTurn } from './headlessGame.ts';
+
+// Fast-forward for a battle in progress: the AI plays both seats through the simulator's turn loop
+// (the rules the store's auto-battle uses, minus its timers, banners, summaries and quiz), running
+// `commitEvery` turns back to back before handing the position to `onCommit`. Every chunk starts
+// from a macrotask so the UI gets one render per commit. Turns only depend on the position and the
+// RNG stream, so the commit interval never changes the result.
+
+export const TURBO_COMMIT_TURNS = 10;
+
+export interface TurboPosition {
+    players: Player[];
+    activePlayerId: string; // whose turn is played next
+    turnCount: number; // the store's round counter, which goes up when the first player's turn begins
+    rng: Rng;
+    resumeAtCombat?: boolean; // that turn has already begun (untap, shop); play only its combat
+}
+
+export interface TurboCommit {
+    players: Player[];
+    activePlayerId: string; // whose turn was played last
+    turnCount: number;
+    turnsPlayed: number;
+    log: string[]; // lines since the previous commit
+    winner: string | null;
+    done: boolean; // a winner was found or maxTurns was reached
+}
+
+export interface TurboOptions {
+    onCommit: (commit: TurboCommit) => void;
+    commitEvery?: number;
+    maxTurns?: number; // player-turns before turbo stops and leaves the battle undecided
+    schedule?: (next: () => void) => void;
+}
+
+export const startTurbo = (position: TurboPosition, options: TurboOptions) => {
+    const commitEvery = Math.max(1, options.commitEvery ?? TURBO_COMMIT_TURNS);
+    const maxTurns = options.maxTurns ?? DEFAULT_MAX_TURNS;
+    const schedule = options.schedule || (next => setTimeout(next, 0));
+    const { rng } = position;
+    let { players, turnCount } = position;
+    let nextPlayerId = position.activePlayerId;
+    let resumeAtCombat = position.resumeAtCombat ?? false;
+    let turnsPlayed = 0;
+    let stopped = false;
+
+    const runChunk = () => {
+        if (stopped) return;
+        const log: string[] = [];
+        let activePlayerId = nextPlayerId;
+        let winner: string | null = null;
+
+        for (let i = 0; i < commitEvery && turnsPlayed < maxTurns && !winner; i++) {
+            activePlayerId = nextPlayerId;
+            if (!resumeAtCombat) {
+                if (activePlayerId === players[0].id) turnCount++;
+                log.push(`Turn ${turnCount}: ${players.find(p => p.id === activePlayerId)?.name}'s Turn`);
+            }
+            const turn = playTurn(players, activePlayerId, rng, { opening: resumeAtCombat, log });
+            resumeAtCombat = false;
+            turnsPlayed++;
+            players = turn.players;
+            winner = turn.winner;
+            nextPlayerId = players.find(p => p.id !== activePlayerId)!.id;
+        }
+
+        if (winner) players = awardVictory(players, winner);
+        const done = !!winner || turnsPlayed >= maxTurns;
+        options.onCommit({ players, activePlayerId, turnCount, turnsPlayed, log, winner, done });
+        if (!done) schedule(runChunk);
+    };
+
+    schedule(runChunk);
+    return {
+        stop: () => {
+            stopped = true;
+        }
+    };
+};
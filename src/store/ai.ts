@@ -0,0 +1,54 @@
+import type { Card } from '../types';
+import { canBlock, getCardStats, hasKeyword } from './cardStats.ts';
+
+// Simple AI: Just attack with everyone available. The AI now attacks with attackPlanner; this stays as
+// the all-out baseline.
+export const chooseAttackers = (battlefield: Card[]): string[] =>
+    battlefield.filter(c => !c.tapped).map(c => c.id);
+
+// Greedy blocks, one blocker per attacker, taking the first untapped blocker in battlefield order that
+// kills and survives, survives (stall), or kills and trades. The AI now blocks with blockPlanner; this
+// stays as the baseline the planner is benchmarked against.
+export const chooseBlocks = (attackerCards: Card[], defenderBattlefield: Card[]): Record<string, string[]> => {
+    const newBlockers: Record<string, string[]> = {};
+    const availableBlockers = defenderBattlefield.filter(c => !c.tapped);
+    const usedBlockers = new Set<string>();
+
+    attackerCards.forEach(attacker => {
+        const { power: attPower, toughness: attToughness } = getCardStats(attacker);
+        const isAttDeathtouch = hasKeyword(attacker, 'Deathtouch');
+
+        // Find best blocker
+        // Strategy: 1. Kill and Survive, 2. Kill and Trade, 3. Survive (Stall), 4. Last Resort
+        const bestBlocker = availableBlockers.find(blocker => {
+            if (usedBlockers.has(blocker.id)) return false;
+
+            // Flying Logic
+            if (!canBlock(attacker, blocker)) return false;
+
+            const { power: blkPower, toughness: blkToughness } = getCardStats(blocker);
+            const isBlkDeathtouch = hasKeyword(blocker, 'Deathtouch');
+
+            const blockerKills = blkPower >= attToughness || (isBlkDeathtouch && blkPower > 0);
+            const blockerSurvives = blkToughness > attPower && (attPower === 0 || !isAttDeathtouch);
+
+            // Kill and Survive
+            if (blockerKills && blockerSurvives) return true;
+
+            // Survive (Stall)
+            if (blockerSurvives) return true;
+
+            // Kill and Trade
+            if (blockerKills) return true;
+
+            return false;
+        });
+
+        if (bestBlocker) {
+            newBlockers[attacker.id] = [bestBlocker.id];
+            usedBlockers.add(bestBlocker.id);
+        }
+    });
+
+    return newBlockers;
+};
@@ -0,0 +1,47 @@
+import { describe, it, expect } from 'vitest';
+import { planAttacks } from './attackPlanner';
+import type { AttackSituation } from './attackPlanner';
+import type { Card, Player } from '../types';
+import { creature } from './testCards';
+
+const situation = (attackerCards: Card[], defenderCards: Card[], defenderLife = 40): AttackSituation => ({
+    attackerPlayer: { id: 'p1', name: 'p1', life: 40, battlefield: attackerCards } as Player,
+    defender: { id: 'p2', name: 'p2', life: defenderLife, battlefield: defenderCards } as Player
+});
+
+// No clock, so results don't depend on machine speed.
+const DETERMINISTIC = { timeBudgetMs: Infinity, blockOptions: { timeBudgetMs: Infinity } };
+
+describe('Attack Planner', () => {
+    it('should hold back creatures that can only die', () => {
+        const walls = [1, 2, 3, 4, 5].map(i => creature(`wall${i}`, 4, 4, [], 'p2'));
+        const plan = planAttacks(situation([creature('bear', 2, 2), creature('cub', 1, 1)], walls), DETERMINISTIC);
+
+        expect(plan.attackers).toEqual([]);
+        expect(plan.score).toBe(0);
+    });
+
+    it('should always send attackers nothing can block', () => {
+        const plan = planAttacks(situation([creature('bird', 2, 2, ['Flying']), creature('bear', 2, 2)], [creature('wall', 4, 4, [], 'p2')]), DETERMINISTIC);
+
+        expect(plan.attackers).toContain('bird');
+        expect(plan.attackers).not.toContain('bear');
+    });
+
+    it('should swing for lethal through too few blockers', () => {
+        const attackers = [creature('a1', 3, 3), creature('a2', 3, 3), creature('a3', 3, 3)];
+        const plan = planAttacks(situation(attackers, [creature('wall', 0, 5, [], 'p2')], 5), DETERMINISTIC);
+
+        expect(plan.attackers).toHaveLength(3);
+        expect(plan.score).toBeGreaterThan(100);
+    });
+
+    it('should evaluate interchangeable attackers by count, not subset', () => {
+        const tokens = Array.from({ length: 8 }, (_, i) => creature(`token${i}`, 1, 1));
+        const plan = planAttacks(situation(tokens, [creature('blocker', 1, 2, [], 'p2')]), DETERMINISTIC);
+
+        // 9 possible counts instead of 256 subsets; the empty attack is free.
+        expect(plan.evaluations).toBeLessThanOrEqual(8);
+        expect(plan.complete).toBe(true);
+    });
+});
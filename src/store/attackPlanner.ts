@@ -0,0 +1,181 @@
+import type { Card, Player } from '../types';
+import { canBlock, getCardStats, hasKeyword } from './cardStats.ts';
+import { DEFAULT_BLOCK_WEIGHTS, creatureValue, planBlocks } from './blockPlanner.ts';
+import type { BlockPlanOptions } from './blockPlanner.ts';
+
+// Attack planner for the AI. An attack is worth minus the defender's best blocking reply (found by
+// blockPlanner, on the same scale), minus a small cost for every creature left tapped for the
+// opponent's turn. This is minimax over the blocking reply:
+//   - attackers that can only lose are dropped and unblockable ones are always sent, before searching;
+//   - attackers with identical stats are interchangeable, so the search picks how many of each kind
+//     attack instead of which ones, and each count combination is evaluated at most once;
+//   - each reply search stops as soon as the defender has shown the attack can't beat the best one
+//     found so far (an alpha-beta cutoff), so most candidate attacks are refuted cheaply;
+//   - small spaces are searched exhaustively, larger ones by hill climbing from "everyone attacks",
+//     and the best attack so far is returned when the time budget runs out.
+
+export interface AttackPlanOptions {
+    timeBudgetMs?: number;
+    maxEvaluations?: number; // cap on blocking replies searched; with an infinite budget the plan is deterministic
+    exposure?: number; // cost per point of creature value left tapped for the opponent's turn
+    exhaustiveLimit?: number; // largest number of count combinations searched exhaustively
+    blockOptions?: BlockPlanOptions; // how the defender's replies are searched
+}
+
+export interface AttackSituation {
+    attackerPlayer: Player;
+    defender: Player;
+}
+
+export interface AttackPlan {
+    attackers: string[];
+    score: number; // attacker's point of view, higher is better; 0 is not attacking
+    complete: boolean;
+    evaluations: number;
+}
+
+export const DEFAULT_ATTACK_BUDGET_MS = 20;
+const DEFAULT_REPLY_BUDGET_MS = 2;
+const DEFAULT_EXPOSURE = 0.1;
+const MAX_GANG_SIZE = 3;
+
+const now = () => performance.now();
+
+const signature = (card: Card) => {
+    const { power, toughness, keywordMask } = getCardStats(card);
+    return `${power}/${toughness}/${keywordMask}/${card.shieldCounters}/${card.damageTaken}`;
+};
+
+const exposureCost = (attackers: Card[], exposure: number) =>
+    attackers
+        .filter(c => !hasKeyword(c, 'Vigilance'))
+        .reduce((sum, c) => sum + creatureValue(c) * exposure, 0);
+
+// Blockers that kill `attacker` in a one-on-one block and survive it.
+const countFreeKillers = (attacker: Card, blockers: Card[]) => {
+    const { power: attPower, toughness: attToughness } = getCardStats(attacker);
+    const attDeathtouch = hasKeyword(attacker, 'Deathtouch') && attPower > 0;
+    const attFirstStrike = hasKeyword(attacker, 'First Strike') || hasKeyword(attacker, 'Double Strike');
+    return blockers.filter(blocker => {
+        if (!canBlock(attacker, blocker)) return false;
+        const { power, toughness } = getCardStats(blocker);
+        const kills = (power >= attToughness - attacker.damageTaken || (hasKeyword(blocker, 'Deathtouch') && power > 0)) && attacker.shieldCounters === 0;
+        const survives = !attDeathtouch && attPower < toughness - blocker.damageTaken;
+        return kills && survives && (!attFirstStrike || hasKeyword(blocker, 'First Strike') || hasKeyword(blocker, 'Double Strike'));
+    }).length;
+};
+
+export const planAttacks = (situation: AttackSituation, options: AttackPlanOptions = {}): AttackPlan => {
+    const deadline = now() + (options.timeBudgetMs ?? DEFAULT_ATTACK_BUDGET_MS);
+    const maxEvaluations = options.maxEvaluations ?? Infinity;
+    const exposure = options.exposure ?? DEFAULT_EXPOSURE;
+    const exhaustiveLimit = options.exhaustiveLimit ?? 256;
+    const lifeWeight = options.blockOptions?.weights?.life ?? DEFAULT_BLOCK_WEIGHTS.life;
+    const { attackerPlayer, defender } = situation;
+
+    const eligible = attackerPlayer.battlefield.filter(c => !c.tapped && getCardStats(c).power > 0);
+    const blockers = defender.battlefield.filter(c => !c.tapped);
+
+    // Dominated attackers. Every reply uses at most MAX_GANG_SIZE blockers per other attacker, so with
+    // more free killers than that the defender always has one spare: attacking only loses the creature.
+    // An attacker nothing can block is always sent when its damage outweighs the exposure.
+    const forced: Card[] = [];
+    const open: Card[] = [];
+    eligible.forEach(card => {
+        const unblockable = blockers.every(b => !canBlock(card, b));
+        if (unblockable && getCardStats(card).power * lifeWeight >= exposureCost([card], exposure)) {
+            forced.push(card);
+            return;
+        }
+        if (countFreeKillers(card, blockers) > (eligible.length - 1) * MAX_GANG_SIZE) return;
+        open.push(card);
+    });
+
+    // Interchangeable attackers collapse into classes; a candidate attack is a count per class.
+    const classes: Card[][] = [];
+    const classOf = new Map<string, number>();
+    open.forEach(card => {
+        const key = signature(card);
+        if (!classOf.has(key)) {
+            classOf.set(key, classes.length);
+            classes.push([]);
+        }
+        classes[classOf.get(key)!].push(card);
+    });
+
+    const memo = new Map<string, number>();
+    let evaluations = 0;
+    let complete = true;
+    let best = { counts: classes.map(() => 0), value: -Infinity };
+
+    const attackersFor = (counts: number[]) => [...forced, ...classes.flatMap((cards, i) => cards.slice(0, counts[i]))];
+
+    // Value of an attack, or an upper bound on it when the reply search was cut off below `best`.
+    const evaluate = (counts: number[]): number => {
+        const key = counts.join(',');
+        const known = memo.get(key);
+        if (known !== undefined) return known;
+
+        const attackers = attackersFor(counts);
+        let value = 0;
+        if (attackers.length > 0) {
+            if (evaluations >= maxEvaluations || now() > deadline) {
+                complete = false;
+                return -Infinity;
+            }
+            evaluations++;
+            const cost = exposureCost(attackers, exposure);
+            const reply = planBlocks({ attackers, attackerPlayer, defender }, {
+                ...options.blockOptions,
+                timeBudgetMs: Math.min(options.blockOptions?.timeBudgetMs ?? DEFAULT_REPLY_BUDGET_MS, Math.max(deadline - now(), 0)),
+                stopAt: -best.value - cost
+            });
+            value = -reply.score - cost;
+        }
+        memo.set(key, value);
+        if (value > best.value) best = { counts: [...counts], value };
+        return value;
+    };
+
+    // "Everyone attacks" first: it was the old behaviour and gives the cutoffs a strong bound early.
+    evaluate(classes.map(cards => cards.length));
+    evaluate(classes.map(() => 0));
+
+    const combinations = classes.reduce((total, cards) => total * (cards.length + 1), 1);
+    if (combinations <= exhaustiveLimit) {
+        const counts = classes.map(() => 0);
+        for (let i = 0; i < combinations && complete; i++) {
+            let rest = i;
+            classes.forEach((cards, c) => {
+                counts[c] = rest % (cards.length + 1);
+                rest = Math.floor(rest / (cards.length + 1));
+            });
+            evaluate(counts);
+        }
+    } else {
+        // Hill climb: move one attacker in or out at a time while that improves the best attack.
+        let improved = true;
+        while (improved && complete) {
+            improved = false;
+            const start = best.value;
+            const base = best.counts;
+            for (let c = 0; c < classes.length && complete; c++) {
+                for (const step of [-1, 1]) {
+                    const next = [...base];
+                    next[c] += step;
+                    if (next[c] < 0 || next[c] > classes[c].length) continue;
+                    evaluate(next);
+                }
+            }
+            if (best.value > start) improved = true;
+        }
+    }
+
+    return {
+        attackers: attackersFor(best.counts).map(c => c.id),
+        score: best.value,
+        complete,
+        evaluations
+    };
+};
+
@@ -0,0 +1,39 @@
+import { bench, describe } from 'vitest';
+import { planBlocks } from './blockPlanner';
+import type { BlockSituation } from './blockPlanner';
+import { chooseBlocks } from './ai';
+import { createRng } from './rng';
+import { CARD_POOL, createCardInstance } from './cards';
+import type { Player } from '../types';
+
+// Seeded random boards of `size` attackers against `size` untapped defenders.
+const buildSituations = (size: number, count: number): BlockSituation[] => {
+    const rng = createRng(size);
+    const army = (owner: string) =>
+        Array.from({ length: size }, () => createCardInstance(rng.pick(CARD_POOL)!, rng.nextId(owner), owner));
+
+    return Array.from({ length: count }, () => {
+        const attackers = army('p1');
+        return {
+            attackers,
+            attackerPlayer: { id: 'p1', name: 'P1', life: 40, battlefield: attackers } as Player,
+            defender: { id: 'p2', name: 'P2', life: 5 + rng.int(36), battlefield: army('p2') } as Player
+        };
+    });
+};
+
+[6, 20].forEach(size => {
+    // Speed only; blockPlanner.test.ts checks the planner never does worse than greedy.
+    const situations = buildSituations(size, 20);
+
+    describe(`blocking ${size}x${size}`, () => {
+        let i = 0;
+        bench('greedy chooseBlocks', () => {
+            const s = situations[i++ % situations.length];
+            chooseBlocks(s.attackers, s.defender.battlefield);
+        });
+        bench('planBlocks (10 ms budget)', () => {
+            planBlocks(situations[i++ % situations.length]);
+        });
+    });
+});
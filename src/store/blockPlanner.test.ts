@@ -0,0 +1,78 @@
+import { describe, it, expect } from 'vitest';
+import { planBlocks, scoreBlocks, solveAssignment } from './blockPlanner';
+import type { BlockSituation } from './blockPlanner';
+import { chooseBlocks } from './ai';
+import { createRng } from './rng';
+import { CARD_POOL, createCardInstance } from './cards';
+import { AI_BLOCK_OPTIONS } from './gameRules';
+import type { Card, Player } from '../types';
+import { creature } from './testCards';
+
+const player = (id: string, life: number, battlefield: Card[]) => ({ id, name: id, life, battlefield } as Player);
+
+const situation = (attackers: Card[], defenderCards: Card[], defenderLife = 40, idle: Card[] = []): BlockSituation => ({
+    attackers,
+    attackerPlayer: player('p1', 40, [...attackers, ...idle]),
+    defender: player('p2', defenderLife, defenderCards)
+});
+
+// Large budgets keep these deterministic on slow machines.
+const EXHAUSTIVE = { timeBudgetMs: Infinity };
+
+describe('Block Planner', () => {
+    it('should solve the assignment problem optimally', () => {
+        expect(solveAssignment([[4, 1, 3], [2, 0, 5], [3, 2, 2]])).toEqual([1, 0, 2]);
+        expect(solveAssignment([[9, 1, 9, 9], [1, 9, 9, 9]])).toEqual([1, 0]);
+    });
+
+    it('should chump block to survive lethal damage', () => {
+        const attacker = creature('dragon', 5, 5, [], 'p1');
+        const sit = situation([attacker], [creature('squire', 1, 1, [], 'p2'), creature('knight', 2, 2, [], 'p2')], 3);
+
+        const plan = planBlocks(sit, EXHAUSTIVE);
+
+        expect(plan.blockers.dragon).toHaveLength(1);
+        expect(chooseBlocks([attacker], sit.defender.battlefield)).toEqual({});
+        expect(plan.score).toBeGreaterThan(scoreBlocks(sit, {}));
+    });
+
+    it('should gang block an attacker no single blocker can kill', () => {
+        const attacker = creature('ogre', 3, 3, [], 'p1');
+        const sit = situation([attacker], [creature('b1', 2, 2, [], 'p2'), creature('b2', 2, 2, [], 'p2'), creature('b3', 1, 1, [], 'p2')], 40, [creature('idle', 1, 1)]);
+
+        const plan = planBlocks(sit, EXHAUSTIVE);
+
+        // b3 soaks up all of the ogre's damage in front of b1, so only the 1/1 is lost.
+        expect(plan.blockers.ogre).toEqual(['b3', 'b1']);
+        expect(plan.complete).toBe(true);
+    });
+
+    it('should never score below the greedy blocks', () => {
+        const rng = createRng(2024);
+        const army = (owner: string, size: number) =>
+            Array.from({ length: size }, () => createCardInstance(rng.pick(CARD_POOL)!, rng.nextId(owner), owner));
+
+        for (let i = 0; i < 30; i++) {
+            const attackers = army('p1', 1 + rng.int(6));
+            const sit = situation(attackers, army('p2', 1 + rng.int(6)), 1 + rng.int(20));
+            const plan = planBlocks(sit, EXHAUSTIVE);
+
+            expect(scoreBlocks(sit, plan.blockers)).toBeCloseTo(plan.score);
+            expect(plan.score).toBeGreaterThanOrEqual(scoreBlocks(sit, chooseBlocks(attackers, sit.defender.battlefield)));
+        }
+    });
+
+    it('should not score below the greedy blocks on large boards under the AI\'s search caps', () => {
+        const rng = createRng(12);
+        const army = (owner: string) =>
+            Array.from({ length: 12 }, () => createCardInstance(rng.pick(CARD_POOL)!, rng.nextId(owner), owner));
+
+        for (let i = 0; i < 8; i++) {
+            const attackers = army('p1');
+            const sit = situation(attackers, army('p2'), 5 + rng.int(36));
+            const plan = planBlocks(sit, AI_BLOCK_OPTIONS);
+
+            expect(plan.score).toBeGreaterThanOrEqual(scoreBlocks(sit, chooseBlocks(attackers, sit.defender.battlefield)));
+        }
+    });
+});
@@ -0,0 +1,391 @@
+import type { Card, Player } from '../types';
+import { createOutcomeCache } from './outcomeCache.ts';
+import { canBlock, getCardStats } from './cardStats.ts';
+import { planDamageOrder, scoreDamageOrder } from './damageOrder.ts';
+import type { DamageOrderSide, DamageOrderValuation } from './damageOrder.ts';
+
+// Blocking planner for the AI defender. Every candidate block is scored by running the real combat
+// engine on just that attacker and its blockers; combats are independent per attacker, so a full
+// assignment scores as the sum of its groups plus the game-ending terms (lethal damage, a wiped board).
+//
+//   1. Score single blocks and solve the one-blocker-per-attacker assignment (Hungarian algorithm).
+//   2. Score gang blocks from each attacker's strongest blockers, each in the damage order best for the
+//      defender (damageOrder.ts), dropping groups that a smaller group beats outright.
+//   3. Branch and bound over attackers, starting from the assignment, until the time budget runs out.
+
+export interface BlockWeights {
+    life: number; // per point of life lost or gained
+    shield: number; // losing a shield counter instead of the creature
+    gameOver: number; // the defender losing (or winning) the game in this combat
+}
+
+export const DEFAULT_BLOCK_WEIGHTS: BlockWeights = { life: 0.5, shield: 1.5, gameOver: 1000 };
+
+export interface BlockPlanOptions {
+    timeBudgetMs?: number;
+    maxNodes?: number; // search-node cap; with an infinite time budget the plan is deterministic
+    maxGangSize?: number; // most blockers on one attacker
+    gangCandidates?: number; // strongest blockers per attacker considered for gang blocks
+    weights?: Partial<BlockWeights>;
+    stopAt?: number; // give up improving once a plan scores this much (an alpha-beta cutoff for callers)
+}
+
+export interface BlockSituation {
+    attackers: Card[];
+    attackerPlayer: Player;
+    defender: Player;
+}
+
+export interface BlockPlan {
+    blockers: Record<string, string[]>;
+    score: number; // defender's point of view, higher is better
+    complete: boolean; // false when the search stopped on the time budget or node cap
+    nodes: number;
+}
+
+export const DEFAULT_BLOCK_BUDGET_MS = 10;
+
+// Rough worth of keeping a creature on the battlefield.
+export const creatureValue = (card: Card): number => {
+    const { power, toughness, keywordMask } = getCardStats(card);
+    let keywords = 0;
+    for (let mask = keywordMask; mask; mask &= mask - 1) keywords++;
+    return Math.max(power, 0) + Math.max(toughness, 0) + keywords;
+};
+
+// Losing a shielded creature only costs the shield.
+const valuationFor = (weights: BlockWeights): DamageOrderValuation => ({
+    lostValue: card => (card.shieldCounters > 0 ? weights.shield : creatureValue(card)),
+    life: weights.life
+});
+
+export interface DamageOrderSuggestion {
+    order: string[]; // blocker ids, best first
+    score: number; // the side's own point of view, higher is better
+    gain: number; // how much better than the current order
+}
+
+// Best damage assignment order for one attacker's blockers, from `side`'s point of view.
+export const suggestDamageOrder = (
+    attacker: Card,
+    blockers: Card[],
+    side: DamageOrderSide,
+    weights: Partial<BlockWeights> = {}
+): DamageOrderSuggestion => {
+    const valuation = valuationFor({ ...DEFAULT_BLOCK_WEIGHTS, ...weights });
+    const sign = side === 'defender' ? 1 : -1;
+    const plan = planDamageOrder(attacker, blockers, side, valuation);
+    return {
+        order: plan.order.map(i => blockers[i].id),
+        score: sign * plan.score,
+        gain: sign * (plan.score - scoreDamageOrder(attacker, blockers, valuation))
+    };
+};
+
+interface GroupResult {
+    blockers: number[]; // indices into the defender's untapped creatures
+    value: number; // creature and life swing, without the game-over terms
+    lifeLost: number; // net: damage taken minus lifelink gained
+    defenderLosses: number;
+    attackerLost: boolean;
+}
+
+const now = () => performance.now();
+
+// Transposition table: attack planning asks for the same attacker-versus-group combats over and over.
+export const plannerOutcomeCache = createOutcomeCache(8192);
+
+// Score one attacker against one blocking group with the combat engine.
+const evaluateGroup = (
+    attacker: Card,
+    group: Card[],
+    indices: number[],
+    defenderPlayerId: string,
+    weights: BlockWeights
+): GroupResult => {
+    const outcome = plannerOutcomeCache.resolve({
+        defenderPlayerId,
+        attackers: [attacker.id],
+        blockers: group.length > 0 ? { [attacker.id]: group.map(c => c.id) } : {},
+        cards: [attacker, ...group]
+    });
+    const dead = outcome.deathIndex;
+
+    let value = 0;
+    let defenderLosses = 0;
+    const { lostValue } = valuationFor(weights);
+
+    const attackerLost = !!dead[attacker.id] && attacker.shieldCounters === 0;
+    if (dead[attacker.id]) value += lostValue(attacker);
+    group.forEach(blocker => {
+        if (!dead[blocker.id]) return;
+        value -= lostValue(blocker);
+        if (blocker.shieldCounters === 0) defenderLosses++;
+    });
+
+    const damage = outcome.damageEvents
+        .filter(e => e.type === 'toPlayer' && e.targetId === defenderPlayerId)
+        .reduce((sum, e) => sum + e.damage, 0);
+    const lifeLost = damage - outcome.defenderLifeGained;
+    value -= (lifeLost + outcome.attackerLifeGained) * weights.life;
+
+    return { blockers: indices, value, lifeLost, defenderLosses, attackerLost };
+};
+
+// Rectangular Hungarian algorithm (rows <= columns), minimising total cost. Returns the column per row.
+export const solveAssignment = (cost: number[][]): number[] => {
+    const n = cost.length;
+    if (n === 0) return [];
+    const m = cost[0].length;
+    const u = new Float64Array(n + 1);
+    const v = new Float64Array(m + 1);
+    const p = new Int32Array(m + 1); // row matched to each column (1-based, 0 = free)
+    const way = new Int32Array(m + 1);
+
+    for (let i = 1; i <= n; i++) {
+        p[0] = i;
+        let j0 = 0;
+        const minv = new Float64Array(m + 1).fill(Infinity);
+        const used = new Uint8Array(m + 1);
+        do {
+            used[j0] = 1;
+            const i0 = p[j0];
+            let delta = Infinity;
+            let j1 = 0;
+            for (let j = 1; j <= m; j++) {
+                if (used[j]) continue;
+                const cur = cost[i0 - 1][j - 1] - u[i0] - v[j];
+                if (cur < minv[j]) {
+                    minv[j] = cur;
+                    way[j] = j0;
+                }
+                if (minv[j] < delta) {
+                    delta = minv[j];
+                    j1 = j;
+                }
+            }
+            for (let j = 0; j <= m; j++) {
+                if (used[j]) {
+                    u[p[j]] += delta;
+                    v[j] -= delta;
+                } else {
+                    minv[j] -= delta;
+                }
+            }
+            j0 = j1;
+        } while (p[j0] !== 0);
+        do {
+            const j1 = way[j0];
+            p[j0] = p[j1];
+            j0 = j1;
+        } while (j0 !== 0);
+    }
+
+    const result = new Array<number>(n).fill(-1);
+    for (let j = 1; j <= m; j++) {
+        if (p[j] !== 0) result[p[j] - 1] = j - 1;
+    }
+    return result;
+};
+
+const FORBIDDEN = 1e9;
+
+const combinations = (items: number[], size: number): number[][] => {
+    if (size === 0) return [[]];
+    const result: number[][] = [];
+    items.forEach((item, i) => {
+        combinations(items.slice(i + 1), size - 1).forEach(rest => result.push([item, ...rest]));
+    });
+    return result;
+};
+
+// A group is dominated when a smaller group from the same blockers is at least as good on every count.
+const dominates = (small: GroupResult, big: GroupResult) =>
+    small.value >= big.value && small.lifeLost <= big.lifeLost && small.defenderLosses <= big.defenderLosses;
+
+// Game-over terms: the defender dies or loses every creature; the attacker loses every creature.
+// Creatures that are not attacking can't die this combat, so only an all-out attack can be wiped.
+const canWipeAttacker = ({ attackers, attackerPlayer }: BlockSituation) => attackerPlayer.battlefield.length === attackers.length;
+
+const scoreGroups = (groups: GroupResult[], situation: BlockSituation, weights: BlockWeights) => {
+    const { defender } = situation;
+    let score = 0;
+    let lifeLost = 0;
+    let defenderLosses = 0;
+    let attackerLosses = 0;
+    groups.forEach(g => {
+        score += g.value;
+        lifeLost += g.lifeLost;
+        defenderLosses += g.defenderLosses;
+        if (g.attackerLost) attackerLosses++;
+    });
+    if (defender.life - lifeLost <= 0 || defenderLosses >= defender.battlefield.length) score -= weights.gameOver;
+    else if (canWipeAttacker(situation) && attackerLosses >= groups.length) score += weights.gameOver;
+    return score;
+};
+
+// Score any blocking assignment (e.g. the greedy AI's) on the planner's scale.
+export const scoreBlocks = (
+    situation: BlockSituation,
+    blockers: Record<string, string[]>,
+    weights: Partial<BlockWeights> = {}
+): number => {
+    const merged = { ...DEFAULT_BLOCK_WEIGHTS, ...weights };
+    const byId = new Map(situation.defender.battlefield.map(c => [c.id, c]));
+    const groups = situation.attackers.map(attacker => {
+        const group = (blockers[attacker.id] || []).map(id => byId.get(id)).filter((c): c is Card => !!c);
+        return evaluateGroup(attacker, group, [], situation.defender.id, merged);
+    });
+    return scoreGroups(groups, situation, merged);
+};
+
+export const planBlocks = (situation: BlockSituation, options: BlockPlanOptions = {}): BlockPlan => {
+    const started = now();
+    const deadline = started + (options.timeBudgetMs ?? DEFAULT_BLOCK_BUDGET_MS);
+    const maxNodes = options.maxNodes ?? Infinity;
+    const maxGangSize = options.maxGangSize ?? 3;
+    const gangCandidates = options.gangCandidates ?? 6;
+    const weights = { ...DEFAULT_BLOCK_WEIGHTS, ...options.weights };
+    const valuation = valuationFor(weights);
+    const stopAt = options.stopAt ?? Infinity;
+
+    const { attackers, defender } = situation;
+    const available = defender.battlefield.filter(c => !c.tapped);
+    const nA = attackers.length;
+    const nB = available.length;
+
+    if (nA === 0) return { blockers: {}, score: 0, complete: true, nodes: 0 };
+    const scoreAssignment = (groups: GroupResult[]) => scoreGroups(groups, situation, weights);
+
+    // 1. Unblocked and single-blocker outcomes.
+    const groupsByAttacker: GroupResult[][] = attackers.map(attacker => [
+        evaluateGroup(attacker, [], [], defender.id, weights)
+    ]);
+    const legal = attackers.map(attacker => available.map(blocker => canBlock(attacker, blocker)));
+    attackers.forEach((attacker, a) => {
+        available.forEach((blocker, b) => {
+            if (legal[a][b]) groupsByAttacker[a].push(evaluateGroup(attacker, [blocker], [b], defender.id, weights));
+        });
+    });
+
+    // One blocker per attacker: columns are the blockers, then one "no block" column per attacker.
+    // Solved twice: once on value alone, once pricing every point of damage as a share of a lost game,
+    // which finds the chump blocks that keep the defender alive.
+    const singles = groupsByAttacker.map(groups => new Map(groups.slice(1).map(g => [g.blockers[0], g])));
+    const assign = (lifePenalty: number) => {
+        const cost = attackers.map((_, a) => {
+            const row = new Array<number>(nB + nA).fill(FORBIDDEN);
+            singles[a].forEach((g, b) => {
+                row[b] = -g.value + g.lifeLost * lifePenalty;
+            });
+            const unblocked = groupsByAttacker[a][0];
+            row[nB + a] = -unblocked.value + unblocked.lifeLost * lifePenalty;
+            return row;
+        });
+        return solveAssignment(cost).map((column, a) => (column < nB ? singles[a].get(column)! : groupsByAttacker[a][0]));
+    };
+    let bestGroups = assign(0);
+    let bestScore = scoreAssignment(bestGroups);
+    const survival = assign(weights.gameOver / Math.max(defender.life, 1));
+    const survivalScore = scoreAssignment(survival);
+    if (survivalScore > bestScore) {
+        bestGroups = survival;
+        bestScore = survivalScore;
+    }
+
+    // 2. Gang blocks from each attacker's hardest-hitting legal blockers, within half the budget so
+    // the search always gets a turn.
+    const gangDeadline = started + (deadline - started) / 2;
+    let complete = bestScore < stopAt;
+    for (let a = 0; a < nA && maxGangSize > 1 && complete; a++) {
+        const pool = available
+            .map((blocker, b) => ({ b, power: getCardStats(blocker).power }))
+            .filter(({ b }) => legal[a][b])
+            .sort((x, y) => y.power - x.power)
+            .slice(0, gangCandidates)
+            .map(({ b }) => b)
+            .sort((x, y) => x - y);
+        for (let size = 2; size <= Math.min(maxGangSize, pool.length) && complete; size++) {
+            for (const indices of combinations(pool, size)) {
+                if (now() > gangDeadline) {
+                    complete = false;
+                    break;
+                }
+                const cards = indices.map(b => available[b]);
+                const ordered = planDamageOrder(attackers[a], cards, 'defender', valuation).order;
+                const group = evaluateGroup(attackers[a], ordered.map(i => cards[i]), ordered.map(i => indices[i]), defender.id, weights);
+                const dominated = indices.some(b => dominates(singles[a].get(b)!, group));
+                if (!dominated) groupsByAttacker[a].push(group);
+            }
+        }
+    }
+
+    // 3. Branch and bound. Attackers with the biggest swing go first; each one's groups best-first.
+    const spread = groupsByAttacker.map(groups => Math.max(...groups.map(g => g.value)) - groups[0].value);
+    const order = attackers.map((_, a) => a).sort((x, y) => spread[y] - spread[x]);
+    const depthOf = new Int32Array(nA);
+    order.forEach((a, depth) => { depthOf[a] = depth; });
+    const ranked = order.map(a => [...groupsByAttacker[a]].sort((x, y) => y.value - x.value));
+    const used = new Uint8Array(nB);
+    const chosen: GroupResult[] = new Array(nA);
+    let nodes = 0;
+    let stopped = bestScore >= stopAt;
+
+    // Upper bound for the attackers from `depth` on: each takes its best group among the blockers still
+    // free, ignoring conflicts between them. Groups are sorted, so the first free one is the best.
+    const freeBound = (depth: number) => {
+        let total = 0;
+        for (let i = depth; i < nA; i++) {
+            for (const group of ranked[i]) {
+                if (group.blockers.every(b => !used[b])) {
+                    total += group.value;
+                    break;
+                }
+            }
+        }
+        return total;
+    };
+    // The wipe bonus stays reachable only while every attacker so far dies and every later one can.
+    const killableFrom = new Uint8Array(nA + 1).fill(1);
+    for (let i = nA - 1; i >= 0; i--) killableFrom[i] = killableFrom[i + 1] && ranked[i].some(g => g.attackerLost) ? 1 : 0;
+    const attackerCanBeWiped = canWipeAttacker(situation);
+    const wipeBonus = (depth: number, allKilled: boolean) =>
+        attackerCanBeWiped && allKilled && killableFrom[depth] ? weights.gameOver : 0;
+
+    const search = (depth: number, partial: number, allKilled: boolean) => {
+        if (stopped) return;
+        if (++nodes > maxNodes || ((nodes & 255) === 0 && now() > deadline)) {
+            stopped = true;
+            return;
+        }
+        if (depth === nA) {
+            const score = scoreAssignment(chosen);
+            if (score > bestScore) {
+                bestScore = score;
+                bestGroups = attackers.map((_, a) => chosen[depthOf[a]]);
+                if (bestScore >= stopAt) stopped = true;
+            }
+            return;
+        }
+
+        for (const group of ranked[depth]) {
+            if (group.blockers.some(b => used[b])) continue;
+            const killed = allKilled && group.attackerLost;
+            group.blockers.forEach(b => { used[b] = 1; });
+            if (partial + group.value + freeBound(depth + 1) + wipeBonus(depth + 1, killed) > bestScore) {
+                chosen[depth] = group;
+                search(depth + 1, partial + group.value, killed);
+            }
+            group.blockers.forEach(b => { used[b] = 0; });
+            if (stopped) return;
+        }
+    };
+    search(0, 0, true);
+
+    const blockers: Record<string, string[]> = {};
+    bestGroups.forEach((group, a) => {
+        if (group.blockers.length > 0) blockers[attackers[a].id] = group.blockers.map(b => available[b].id);
+    });
+
+    return { blockers, score: bestScore, complete: complete && !stopped, nodes };
+};
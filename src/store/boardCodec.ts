@@ -0,0 +1,123 @@
+import type { Card, Player } from '../types';
+import { KEYWORD_FLAGS, getCardStats } from './cardStats.ts';
+import type { KeywordName } from './cardStats.ts';
+
+// Compact encoding of the players for the evaluation worker. Everything the rules engine and the
+// planners read goes into one Int32Array (transferred, not copied) plus a table of interned strings;
+// display-only fields (mana cost, oracle text, images, colours) are left behind. Keywords travel as
+// the engine's bit mask, so keywords the engine ignores are dropped.
+//
+// Layout: playerCount, then per player: id, name, life, cardCount, then CARD_FIELDS ints per card.
+
+export interface EncodedPlayers {
+    strings: string[];
+    numbers: Int32Array;
+}
+
+// Interned strings, shared by every snapshot encoded with it (a replay file keeps one for the file).
+export interface StringTable {
+    strings: string[];
+    index: Map<string, number>;
+}
+
+export const createStringTable = (): StringTable => ({ strings: [], index: new Map() });
+
+export const internString = ({ strings, index }: StringTable, value: string): number => {
+    let i = index.get(value);
+    if (i === undefined) {
+        i = strings.length;
+        strings.push(value);
+        index.set(value, i);
+    }
+    return i;
+};
+
+const CARD_FIELDS = 11;
+const TAPPED = 1;
+const SUMMONING_SICK = 2;
+
+const KEYWORDS = Object.keys(KEYWORD_FLAGS) as KeywordName[];
+
+export const encodePlayers = (players: Player[], table: StringTable = createStringTable()): EncodedPlayers => {
+    const intern = (value: string) => internString(table, value);
+
+    const size = 1 + players.reduce((sum, p) => sum + 4 + p.battlefield.length * CARD_FIELDS, 0);
+    const numbers = new Int32Array(size);
+    let at = 0;
+    numbers[at++] = players.length;
+    players.forEach(player => {
+        numbers[at++] = intern(player.id);
+        numbers[at++] = intern(player.name);
+        numbers[at++] = player.life;
+        numbers[at++] = player.battlefield.length;
+        player.battlefield.forEach(card => {
+            // Power and toughness stay strings: the engine parses them itself ("*" included).
+            numbers[at++] = intern(card.id);
+            numbers[at++] = intern(card.name);
+            numbers[at++] = intern(card.power ?? '');
+            numbers[at++] = intern(card.toughness ?? '');
+            numbers[at++] = intern(card.controllerId);
+            numbers[at++] = card.plusOneCounters;
+            numbers[at++] = card.minusOneCounters;
+            numbers[at++] = card.damageTaken;
+            numbers[at++] = card.shieldCounters;
+            numbers[at++] = getCardStats(card).keywordMask;
+            numbers[at++] = (card.tapped ? TAPPED : 0) | (card.summoningSickness ? SUMMONING_SICK : 0);
+        });
+    });
+    return { strings: table.strings, numbers };
+};
+
+export const decodePlayers = ({ strings, numbers }: EncodedPlayers): Player[] => {
+    let at = 0;
+    const players: Player[] = [];
+    const playerCount = numbers[at++];
+    for (let p = 0; p < playerCount; p++) {
+        const id = strings[numbers[at++]];
+        const name = strings[numbers[at++]];
+        const life = numbers[at++];
+        const cardCount = numbers[at++];
+        const battlefield: Card[] = [];
+        for (let c = 0; c < cardCount; c++) {
+            const controllerId = strings[numbers[at + 4]];
+            const mask = numbers[at + 9];
+            const flags = numbers[at + 10];
+            battlefield.push({
+                id: strings[numbers[at]],
+                name: strings[numbers[at + 1]],
+                manaCost: '',
+                typeLine: '',
+                oracleText: '',
+                power: strings[numbers[at + 2]] || undefined,
+                toughness: strings[numbers[at + 3]] || undefined,
+                colors: [],
+                keywords: KEYWORDS.filter(k => (mask & KEYWORD_FLAGS[k]) !== 0),
+                tapped: (flags & TAPPED) !== 0,
+                damageTaken: numbers[at + 7],
+                controllerId,
+                ownerId: controllerId,
+                plusOneCounters: numbers[at + 5],
+                minusOneCounters: numbers[at + 6],
+                summoningSickness: (flags & SUMMONING_SICK) !== 0,
+                shieldCounters: numbers[at + 8]
+            });
+            at += CARD_FIELDS;
+        }
+        players.push({
+            id,
+            name,
+            life,
+            colorIdentity: [],
+            commanderDamage: {},
+            poisonCounters: 0,
+            library: [],
+            hand: [],
+            graveyard: [],
+            exile: [],
+            commandZone: [],
+            battlefield,
+            gold: 0
+        });
+    }
+    return players;
+};
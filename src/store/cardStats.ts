@@ -0,0 +1,71 @@
+import type { Card } from '../types';
+
+// One bit per keyword the rules engine cares about.
+export const KEYWORD_FLAGS = {
+    'Flying': 1 << 0,
+    'Reach': 1 << 1,
+    'Trample': 1 << 2,
+    'Deathtouch': 1 << 3,
+    'First Strike': 1 << 4,
+    'Double Strike': 1 << 5,
+    'Lifelink': 1 << 6,
+    'Vigilance': 1 << 7,
+    'Haste': 1 << 8,
+    'Banding': 1 << 9,
+    'Protection': 1 << 10,
+} as const;
+
+export type KeywordName = keyof typeof KEYWORD_FLAGS;
+
+export interface CardStats {
+    basePower: number;
+    baseToughness: number;
+    power: number; // including +1/+1 and -1/-1 counters
+    toughness: number; // including +1/+1 and -1/-1 counters
+    keywordMask: number;
+}
+
+const FLAG_BY_LOWERCASE: Record<string, number> = Object.fromEntries(
+    Object.entries(KEYWORD_FLAGS).map(([name, flag]) => [name.toLowerCase(), flag])
+);
+
+export const keywordMask = (keywords: string[] | undefined): number => {
+    let mask = 0;
+    keywords?.forEach(k => {
+        mask |= FLAG_BY_LOWERCASE[k.toLowerCase()] || 0;
+    });
+    return mask;
+};
+
+// Cards are replaced (never mutated) whenever upgrades, counters or keyword grants change them,
+// so keying on object identity invalidates an entry exactly when the card changes.
+const statsCache = new WeakMap<Card, CardStats>();
+
+export const getCardStats = (card: Card): CardStats => {
+    let stats = statsCache.get(card);
+    if (!stats) {
+        const basePower = parseInt(card.power || '0');
+        const baseToughness = parseInt(card.toughness || '0');
+        const counters = (card.plusOneCounters || 0) - (card.minusOneCounters || 0);
+        stats = {
+            basePower,
+            baseToughness,
+            power: basePower + counters,
+            toughness: baseToughness + counters,
+            keywordMask: keywordMask(card.keywords)
+        };
+        statsCache.set(card, stats);
+    }
+    return stats;
+};
+
+// Only needed by code that mutates a card object in place.
+export const invalidateCardStats = (card: Card) => {
+    statsCache.delete(card);
+};
+
+export const hasKeyword = (card: Card, keyword: KeywordName): boolean =>
+    (getCardStats(card).keywordMask & KEYWORD_FLAGS[keyword]) !== 0;
+
+export const canBlock = (attacker: Card, blocker: Card): boolean =>
+    !hasKeyword(attacker, 'Flying') || hasKeyword(blocker, 'Flying') || hasKeyword(blocker, 'Reach');
@@ -0,0 +1,37 @@
+import { bench, describe } from 'vitest';
+import { indexCards } from './cardTable';
+import { applyCombatOutcome } from './gameRules';
+import { calculateCombatOutcome } from './combatLogic';
+import { createRng } from './rng';
+import { CARD_POOL, createCardInstance } from './cards';
+import type { Card, CombatBoard, Player } from '../types';
+
+// 200 creatures, a quarter of each side in combat: 25 blocked attackers and 25 unblocked ones.
+const rng = createRng(200);
+const army = (owner: string) =>
+    Array.from({ length: 100 }, () => createCardInstance(rng.pick(CARD_POOL)!, rng.nextId(owner), owner));
+const players = [
+    { id: 'p1', name: 'P1', life: 1000, gold: 0, graveyard: [] as Card[], battlefield: army('p1') },
+    { id: 'p2', name: 'P2', life: 1000, gold: 0, graveyard: [] as Card[], battlefield: army('p2') }
+] as Player[];
+const attackers = players[0].battlefield.slice(0, 50).map(c => c.id);
+const blockers = Object.fromEntries(attackers.slice(0, 25).map((id, i) => [id, [players[1].battlefield[i].id]]));
+const board: CombatBoard = { defenderPlayerId: 'p2', attackers, blockers, cards: [...players[0].battlefield, ...players[1].battlefield] };
+const outcome = calculateCombatOutcome(board);
+
+// What a full rebuild did before: every player, battlefield and card replaced. cardTable.test.ts
+// checks that with structural sharing only the cards a combat changed get new table entries.
+const rebuildAll = (updated: Player[]) =>
+    updated.map(p => ({ ...p, battlefield: p.battlefield.map(c => ({ ...c })) }));
+
+const table = indexCards(players);
+
+describe('combat update on a 200-creature board', () => {
+    bench('full rebuild + re-index', () => {
+        indexCards(rebuildAll(applyCombatOutcome(players, outcome, 'p1').players), table);
+    });
+
+    bench('structural sharing + re-index', () => {
+        indexCards(applyCombatOutcome(players, outcome, 'p1').players, table);
+    });
+});
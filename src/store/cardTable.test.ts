@@ -0,0 +1,70 @@
+import { describe, it, expect } from 'vitest';
+import { indexCards, patchCard, selectCardRole } from './cardTable';
+import { applyCombatOutcome, beginTurn } from './gameRules';
+import { buildCombatBoard, calculateCombatOutcome } from './combatLogic';
+import type { Player } from '../types';
+import { creature } from './testCards';
+
+const bear = (id: string, controllerId = 'p1') => creature(id, 2, 2, [], controllerId);
+
+const players = (): Player[] => [
+    { id: 'p1', name: 'P1', life: 40, battlefield: [bear('a'), bear('b')] } as Player,
+    { id: 'p2', name: 'P2', life: 40, battlefield: [bear('x', 'p2'), bear('y', 'p2')] } as Player
+];
+
+describe('Card Table', () => {
+    it('should replace only the patched card and its owners', () => {
+        const before = players();
+        const after = patchCard(before, 'b', c => ({ ...c, damageTaken: 1 }));
+
+        expect(after[0] === before[0]).toBe(false);
+        expect(after[0].battlefield[0] === before[0].battlefield[0]).toBe(true);
+        expect(after[1] === before[1]).toBe(true);
+        expect(patchCard(before, 'b', c => c) === before).toBe(true);
+    });
+
+    it('should reuse the previous table wherever nothing changed', () => {
+        const before = players();
+        const table = indexCards(before);
+        const after = indexCards(patchCard(before, 'x', c => ({ ...c, plusOneCounters: 1 })), table);
+
+        expect(indexCards(before, table) === table).toBe(true);
+        expect(after.battlefields === table.battlefields).toBe(true);
+        expect(after.cards.a === table.cards.a).toBe(true);
+        expect(after.cards.x.plusOneCounters).toBe(1);
+
+        const removed = indexCards([before[0], { ...before[1], battlefield: [before[1].battlefield[1]] }], after);
+        expect(removed.battlefields.p1 === after.battlefields.p1).toBe(true);
+        expect(removed.battlefields.p2).toEqual(['y']);
+        expect(removed.cards.x).toBeUndefined();
+    });
+
+    it('should leave untouched creatures alone at the start of a turn', () => {
+        const before = players();
+        before[0].battlefield[0] = { ...before[0].battlefield[0], tapped: true };
+
+        const after = beginTurn(before, 'p1');
+        expect(after[0].battlefield[0].tapped).toBe(false);
+        expect(after[0].battlefield[1] === before[0].battlefield[1]).toBe(true);
+        expect(after[1] === before[1]).toBe(true);
+    });
+
+    it('should only hand new entries to the cards a combat changed', () => {
+        const before = players().map(p => ({ ...p, graveyard: [] }));
+        const table = indexCards(before);
+        const board = buildCombatBoard({ players: before, activePlayerId: 'p1', attackers: ['a', 'b'], blockers: { a: ['x'] } })!;
+        const after = indexCards(applyCombatOutcome(before, calculateCombatOutcome(board), 'p1').players, table);
+
+        // a and x trade; b hits the player and y sits out, so neither re-renders.
+        expect(Object.keys(after.cards).sort()).toEqual(['b', 'y']);
+        expect(Object.keys(after.cards).filter(id => after.cards[id] !== table.cards[id])).toEqual([]);
+    });
+
+    it('should describe each card\'s part in combat', () => {
+        const state = { attackers: ['a', 'b'], blockers: { b: ['x', 'y'] } };
+
+        expect(selectCardRole(state, 'a')).toEqual({ isAttacking: true, isBlocking: false, blockGroup: undefined, blockOrder: undefined });
+        expect(selectCardRole(state, 'b')).toEqual({ isAttacking: true, isBlocking: false, blockGroup: 0, blockOrder: undefined });
+        expect(selectCardRole(state, 'y')).toEqual({ isAttacking: false, isBlocking: true, blockGroup: 0, blockOrder: 2 });
+    });
+});
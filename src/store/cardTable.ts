@@ -0,0 +1,91 @@
+import type { Card, CardTable, GameState, Player } from '../types';
+
+// Structural sharing for battlefield updates. The helpers below replace only the cards an update
+// touches, and only the battlefields and players that hold them; everything else keeps its object
+// identity. The store indexes `players` into a normalized table (cards by id, ordered id lists per
+// battlefield) that reuses the previous table wherever nothing changed, so a component subscribed
+// to one card re-renders only when that card does.
+
+const EMPTY_TABLE: CardTable = { cards: {}, battlefields: {} };
+
+// Map every battlefield card, keeping the players, battlefields and cards the update leaves alone.
+export const mapCards = (players: Player[], update: (card: Card, player: Player) => Card): Player[] => {
+    let playersChanged = false;
+    const next = players.map(player => {
+        let changed = false;
+        const battlefield = player.battlefield.map(card => {
+            const updated = update(card, player);
+            if (updated !== card) changed = true;
+            return updated;
+        });
+        if (!changed) return player;
+        playersChanged = true;
+        return { ...player, battlefield };
+    });
+    return playersChanged ? next : players;
+};
+
+export const patchCard = (players: Player[], cardId: string, update: (card: Card) => Card): Player[] =>
+    mapCards(players, card => (card.id === cardId ? update(card) : card));
+
+export const patchPlayer = (players: Player[], playerId: string, update: (player: Player) => Player): Player[] =>
+    players.map(p => (p.id === playerId ? update(p) : p));
+
+const sameIds = (a: string[] | undefined, b: Card[]) =>
+    !!a && a.length === b.length && a.every((id, i) => id === b[i].id);
+
+export const indexCards = (players: Player[], previous: CardTable = EMPTY_TABLE): CardTable => {
+    let cardsChanged = false;
+    const cards: Record<string, Card> = {};
+    let count = 0;
+    players.forEach(p => p.battlefield.forEach(card => {
+        cards[card.id] = card;
+        count++;
+        if (previous.cards[card.id] !== card) cardsChanged = true;
+    }));
+    if (!cardsChanged && count !== Object.keys(previous.cards).length) cardsChanged = true;
+
+    let listsChanged = players.length !== Object.keys(previous.battlefields).length;
+    const battlefields: Record<string, string[]> = {};
+    players.forEach(p => {
+        const last = previous.battlefields[p.id];
+        if (sameIds(last, p.battlefield)) {
+            battlefields[p.id] = last;
+        } else {
+            battlefields[p.id] = p.battlefield.map(c => c.id);
+            listsChanged = true;
+        }
+    });
+
+    if (!cardsChanged && !listsChanged) return previous;
+    return {
+        cards: cardsChanged ? cards : previous.cards,
+        battlefields: listsChanged ? battlefields : previous.battlefields
+    };
+};
+
+export interface CardRole {
+    isAttacking: boolean;
+    isBlocking: boolean;
+    blockGroup: number | undefined; // which blocked attacker the card belongs to, for colouring
+    blockOrder: number | undefined; // 1-based position in its attacker's damage assignment order
+}
+
+// Primitive fields only, so a shallow comparison tells whether the card needs to re-render.
+export const selectCardRole = (state: Pick<GameState, 'attackers' | 'blockers'>, cardId: string): CardRole => {
+    const { attackers, blockers } = state;
+    const isAttacking = attackers.includes(cardId);
+    const blockedAttacker = Object.keys(blockers).find(attId => blockers[attId].includes(cardId));
+    const groupOf = (attackerId: string) => attackers.filter(id => (blockers[id] || []).length > 0).indexOf(attackerId);
+
+    let blockGroup: number | undefined;
+    if (isAttacking && (blockers[cardId] || []).length > 0) blockGroup = groupOf(cardId);
+    if (blockedAttacker) blockGroup = groupOf(blockedAttacker);
+
+    return {
+        isAttacking,
+        isBlocking: !!blockedAttacker,
+        blockGroup,
+        blockOrder: blockedAttacker ? blockers[blockedAttacker].indexOf(cardId) + 1 : undefined
+    };
+};
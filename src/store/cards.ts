@@ -0,0 +1,66 @@
+import type { Card } from '../types';
+
+// Printed characteristics of a card, before it becomes an instance on the battlefield.
+export type CardTemplate = Omit<Card, 'id' | 'controllerId' | 'ownerId' | 'tapped' | 'damageTaken' | 'plusOneCounters' | 'minusOneCounters' | 'summoningSickness' | 'shieldCounters'>;
+
+// Card Pool - ~20 varied creatures
+export const CARD_POOL: CardTemplate[] = [
+    { name: "Serra Angel", manaCost: "{3}{W}{W}", typeLine: "Creature — Angel", oracleText: "Flying, Vigilance", power: "4", toughness: "4", colors: ["W"], keywords: ["Flying", "Vigilance"], imageUrl: "https://api.scryfall.com/cards/named?exact=Serra+Angel&format=image&version=normal" },
+    { name: "Shivan Dragon", manaCost: "{4}{R}{R}", typeLine: "Creature — Dragon", oracleText: "Flying", power: "5", toughness: "5", colors: ["R"], keywords: ["Flying"], imageUrl: "https://api.scryfall.com/cards/named?exact=Shivan+Dragon&format=image&version=normal" },
+    { name: "Elite Vanguard", manaCost: "{W}", typeLine: "Creature — Human Soldier", oracleText: "", power: "2", toughness: "1", colors: ["W"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Elite+Vanguard&format=image&version=normal" },
+    { name: "Goblin Piker", manaCost: "{1}{R}", typeLine: "Creature — Goblin", oracleText: "", power: "2", toughness: "1", colors: ["R"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Goblin+Piker&format=image&version=normal" },
+    { name: "Garruk's Companion", manaCost: "{G}{G}", typeLine: "Creature — Beast", oracleText: "Trample", power: "3", toughness: "2", colors: ["G"], keywords: ["Trample"], imageUrl: "https://api.scryfall.com/cards/named?exact=Garruk%27s+Companion&format=image&version=normal" },
+    { name: "Vampire Nighthawk", manaCost: "{1}{B}{B}", typeLine: "Creature — Vampire Shaman", oracleText: "Flying, Deathtouch, Lifelink", power: "2", toughness: "3", colors: ["B"], keywords: ["Flying", "Deathtouch", "Lifelink"], imageUrl: "https://api.scryfall.com/cards/named?exact=Vampire+Nighthawk&format=image&version=normal" },
+    { name: "Giant Spider", manaCost: "{3}{G}", typeLine: "Creature — Spider", oracleText: "Reach", power: "2", toughness: "4", colors: ["G"], keywords: ["Reach"], imageUrl: "https://api.scryfall.com/cards/named?exact=Giant+Spider&format=image&version=normal" },
+    { name: "Llanowar Elves", manaCost: "{G}", typeLine: "Creature — Elf Druid", oracleText: "", power: "1", toughness: "1", colors: ["G"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Llanowar+Elves&format=image&version=normal" },
+    { name: "Air Elemental", manaCost: "{3}{U}{U}", typeLine: "Creature — Elemental", oracleText: "Flying", power: "4", toughness: "4", colors: ["U"], keywords: ["Flying"], imageUrl: "https://api.scryfall.com/cards/named?exact=Air+Elemental&format=image&version=normal" },
+    { name: "Hypnotic Specter", manaCost: "{1}{B}{B}", typeLine: "Creature — Specter", oracleText: "Flying", power: "2", toughness: "2", colors: ["B"], keywords: ["Flying"], imageUrl: "https://api.scryfall.com/cards/named?exact=Hypnotic+Specter&format=image&version=normal" },
+    { name: "Craw Wurm", manaCost: "{4}{G}{G}", typeLine: "Creature — Wurm", oracleText: "", power: "6", toughness: "4", colors: ["G"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Craw+Wurm&format=image&version=normal" },
+    { name: "Savannah Lions", manaCost: "{W}", typeLine: "Creature — Cat", oracleText: "", power: "2", toughness: "1", colors: ["W"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Savannah+Lions&format=image&version=normal" },
+    { name: "Woolly Thoctar", manaCost: "{R}{G}{W}", typeLine: "Creature — Beast", oracleText: "", power: "5", toughness: "4", colors: ["R", "G", "W"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Woolly+Thoctar&format=image&version=normal" },
+    { name: "Storm Crow", manaCost: "{1}{U}", typeLine: "Creature — Bird", oracleText: "Flying", power: "1", toughness: "2", colors: ["U"], keywords: ["Flying"], imageUrl: "https://api.scryfall.com/cards/named?exact=Storm+Crow&format=image&version=normal" },
+    { name: "Dark Confidant", manaCost: "{1}{B}", typeLine: "Creature — Human Wizard", oracleText: "", power: "2", toughness: "1", colors: ["B"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Dark+Confidant&format=image&version=normal" },
+    { name: "Baneslayer Angel", manaCost: "{3}{W}{W}", typeLine: "Creature — Angel", oracleText: "Flying, First Strike, Lifelink", power: "5", toughness: "5", colors: ["W"], keywords: ["Flying", "First Strike", "Lifelink"], imageUrl: "https://api.scryfall.com/cards/named?exact=Baneslayer+Angel&format=image&version=normal" },
+    { name: "Stoneforge Mystic", manaCost: "{1}{W}", typeLine: "Creature — Kor Artificer", oracleText: "", power: "1", toughness: "2", colors: ["W"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Stoneforge+Mystic&format=image&version=normal" },
+    { name: "Gravecrawler", manaCost: "{B}", typeLine: "Creature — Zombie", oracleText: "", power: "2", toughness: "1", colors: ["B"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Gravecrawler&format=image&version=normal" },
+    { name: "Diregraf Ghoul", manaCost: "{B}", typeLine: "Creature — Zombie", oracleText: "", power: "2", toughness: "2", colors: ["B"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Diregraf+Ghoul&format=image&version=normal" },
+    { name: "Gray Merchant of Asphodel", manaCost: "{3}{B}{B}", typeLine: "Creature — Zombie Cleric", oracleText: "", power: "2", toughness: "4", colors: ["B"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Gray+Merchant+of+Asphodel&format=image&version=normal" },
+    { name: "Liliana's Reaver", manaCost: "{2}{B}{B}", typeLine: "Creature — Zombie", oracleText: "Deathtouch", power: "4", toughness: "3", colors: ["B"], keywords: ["Deathtouch"], imageUrl: "https://api.scryfall.com/cards/named?exact=Liliana%27s+Reaver&format=image&version=normal" },
+    { name: "Soul Warden", manaCost: "{W}", typeLine: "Creature — Human Cleric", oracleText: "", power: "1", toughness: "1", colors: ["W"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Soul+Warden&format=image&version=normal" },
+    { name: "Grand Abolisher", manaCost: "{W}{W}", typeLine: "Creature — Human Cleric", oracleText: "", power: "2", toughness: "2", colors: ["W"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Grand+Abolisher&format=image&version=normal" },
+    { name: "Thalia, Guardian of Thraben", manaCost: "{1}{W}", typeLine: "Legendary Creature — Human Soldier", oracleText: "First Strike", power: "2", toughness: "1", colors: ["W"], keywords: ["First Strike"], imageUrl: "https://api.scryfall.com/cards/named?exact=Thalia%2C+Guardian+of+Thraben&format=image&version=normal" },
+    { name: "Olivia Voldaren", manaCost: "{2}{B}{R}", typeLine: "Legendary Creature — Vampire", oracleText: "Flying", power: "3", toughness: "3", colors: ["B", "R"], keywords: ["Flying"], imageUrl: "https://api.scryfall.com/cards/named?exact=Olivia+Voldaren&format=image&version=normal" },
+    { name: "Aurelia, the Warleader", manaCost: "{2}{R}{R}{W}{W}", typeLine: "Legendary Creature — Angel", oracleText: "Flying, Vigilance, Haste", power: "3", toughness: "4", colors: ["R", "W"], keywords: ["Flying", "Vigilance", "Haste"], imageUrl: "https://api.scryfall.com/cards/named?exact=Aurelia%2C+the+Warleader&format=image&version=normal" },
+    { name: "Liliana's Standard Bearer", manaCost: "{2}{B}", typeLine: "Creature — Zombie Knight", oracleText: "", power: "3", toughness: "1", colors: ["B"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Liliana%27s+Standard+Bearer&format=image&version=normal" },
+    { name: "Steel Overseer", manaCost: "{2}", typeLine: "Artifact Creature — Construct", oracleText: "", power: "1", toughness: "1", colors: [], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Steel+Overseer&format=image&version=normal" },
+    { name: "Solemn Simulacrum", manaCost: "{4}", typeLine: "Artifact Creature — Golem", oracleText: "", power: "2", toughness: "2", colors: [], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Solemn+Simulacrum&format=image&version=normal" }
+].filter(c => c.typeLine.includes("Creature"));
+
+export const COMMANDER_POOL: CardTemplate[] = [
+    { name: "Aurelia, the Warleader", manaCost: "{2}{R}{R}{W}{W}", typeLine: "Legendary Creature — Angel", oracleText: "Flying, Vigilance, Haste", power: "3", toughness: "4", colors: ["R", "W"], keywords: ["Flying", "Vigilance", "Haste"], imageUrl: "https://api.scryfall.com/cards/named?exact=Aurelia%2C+the+Warleader&format=image&version=normal" },
+    { name: "Olivia Voldaren", manaCost: "{2}{B}{R}", typeLine: "Legendary Creature — Vampire", oracleText: "Flying", power: "3", toughness: "3", colors: ["B", "R"], keywords: ["Flying"], imageUrl: "https://api.scryfall.com/cards/named?exact=Olivia+Voldaren&format=image&version=normal" },
+    { name: "Questing Beast", manaCost: "{2}{G}{G}", typeLine: "Legendary Creature — Beast", oracleText: "Vigilance, Deathtouch, Haste", power: "4", toughness: "4", colors: ["G"], keywords: ["Vigilance", "Deathtouch", "Haste"], imageUrl: "https://api.scryfall.com/cards/named?exact=Questing+Beast&format=image&version=normal" },
+    { name: "Talrand, Sky Summoner", manaCost: "{2}{U}{U}", typeLine: "Legendary Creature — Merfolk Wizard", oracleText: "Flying", power: "2", toughness: "2", colors: ["U"], keywords: ["Flying"], imageUrl: "https://api.scryfall.com/cards/named?exact=Talrand%2C+Sky+Summoner&format=image&version=normal" },
+    { name: "Thalia, Guardian of Thraben", manaCost: "{1}{W}", typeLine: "Legendary Creature — Human Soldier", oracleText: "First Strike", power: "2", toughness: "1", colors: ["W"], keywords: ["First Strike"], imageUrl: "https://api.scryfall.com/cards/named?exact=Thalia%2C+Guardian+of+Thraben&format=image&version=normal" }
+];
+
+// A card is legal if all its colors are within the commander's color identity.
+// Colorless cards are always legal.
+export const getLegalCards = (identity: string[]): CardTemplate[] =>
+    CARD_POOL.filter(card => {
+        if (card.colors.length === 0) return true; // Colorless
+        return card.colors.every(c => identity.includes(c));
+    });
+
+export const createCardInstance = (template: CardTemplate, id: string, playerId: string, summoningSickness = false): Card => ({
+    ...template,
+    id,
+    controllerId: playerId,
+    ownerId: playerId,
+    tapped: false,
+    damageTaken: 0,
+    plusOneCounters: 0,
+    minusOneCounters: 0,
+    summoningSickness,
+    shieldCounters: 0
+});
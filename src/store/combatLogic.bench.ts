@@ -0,0 +1,32 @@
+import { bench, describe } from 'vitest';
+import { calculateCombatOutcome } from './combatLogic';
+import type { CombatBoard } from '../types';
+import { creature } from './testCards';
+
+const KEYWORD_MIX = [[], ['Trample'], ['Deathtouch'], ['First Strike'], ['Lifelink'], ['Double Strike'], ['Trample', 'Deathtouch']];
+
+const mixedCreature = (id: string, i: number, controllerId: string) =>
+    creature(id, 1 + (i % 6), 1 + ((i * 7) % 6), KEYWORD_MIX[i % KEYWORD_MIX.length], controllerId);
+
+// Half the creatures attack; the defenders are spread across attackers as single and double blocks.
+const buildBoard = (size: number): CombatBoard => {
+    const half = size / 2;
+    const attackers = Array.from({ length: half }, (_, i) => mixedCreature(`a${i}`, i, 'p1'));
+    const defenders = Array.from({ length: half }, (_, i) => mixedCreature(`d${i}`, i + 3, 'p2'));
+    const blockers: Record<string, string[]> = {};
+    defenders.forEach((d, i) => {
+        const target = attackers[Math.floor(i / 2) * 2 + (i % 3 === 0 ? 0 : 1)] || attackers[0];
+        (blockers[target.id] ||= []).push(d.id);
+    });
+
+    return { defenderPlayerId: 'p2', attackers: attackers.map(a => a.id), blockers, cards: [...attackers, ...defenders] };
+};
+
+describe('calculateCombatOutcome scaling', () => {
+    [100, 500, 1000].forEach(size => {
+        const board = buildBoard(size);
+        bench(`${size} creatures`, () => {
+            calculateCombatOutcome(board);
+        });
+    });
+});
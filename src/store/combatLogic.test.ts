@@ -1,5 +1,11 @@
 import { describe, it, expect, beforeEach } from 'vitest';
 import { useGameStore } from './gameStore';
+import { calculateCombatOutcome } from './combatLogic';
+import { getCardStats, hasKeyword } from './cardStats';
+import type { CombatBoard } from '../types';
+import { creature } from './testCards';
+import { planBlocks } from './blockPlanner';
+import { AI_BLOCK_OPTIONS } from './gameRules';
 
 describe('Combat Logic', () => {
     beforeEach(() => {
@@ -139,3 +145,164 @@ describe('Combat Logic', () => {
         expect(playerDamage?.damage).toBe(2);
     });
 });
+
+describe('Headless Combat Engine', () => {
+    it('should resolve a board without touching the store', () => {
+        const board: CombatBoard = {
+            defenderPlayerId: 'p2',
+            attackers: ['a1'],
+            blockers: { a1: ['b1'] },
+            cards: [creature('a1', 3, 3), creature('b1', 2, 2, [], 'p2')]
+        };
+
+        const outcome = calculateCombatOutcome(board);
+
+        expect(outcome.deaths).toEqual(['b1']);
+        expect(outcome.deathDescriptions).toEqual(['a1 killed b1.']);
+    });
+
+    it('should let first strike kill a blocker before it deals damage', () => {
+        const outcome = calculateCombatOutcome({
+            defenderPlayerId: 'p2',
+            attackers: ['a1'],
+            blockers: { a1: ['b1'] },
+            cards: [creature('a1', 2, 1, ['First Strike']), creature('b1', 3, 2, [], 'p2')]
+        });
+
+        expect(outcome.deaths).toEqual(['b1']);
+        expect(outcome.damageEvents.filter(e => e.targetId === 'a1')).toHaveLength(0);
+    });
+
+    it('should deal damage twice with double strike and sum lifelink', () => {
+        const outcome = calculateCombatOutcome({
+            defenderPlayerId: 'p2',
+            attackers: ['a1'],
+            blockers: {},
+            cards: [creature('a1', 3, 3, ['Double Strike', 'Lifelink'])]
+        });
+
+        expect(outcome.damageEvents.filter(e => e.targetId === 'p2')).toHaveLength(2);
+        expect(outcome.attackerLifeGained).toBe(6);
+    });
+
+    it('should match the store action for the same board', () => {
+        const cards = [creature('c1', 4, 4, ['Trample']), creature('c2', 1, 1, [], 'p2'), creature('c3', 2, 2, [], 'p2')];
+        useGameStore.setState({
+            players: [
+                { id: 'p1', name: 'P1', life: 20, battlefield: [cards[0]] } as any,
+                { id: 'p2', name: 'P2', life: 20, battlefield: [cards[1], cards[2]] } as any
+            ],
+            activePlayerId: 'p1',
+            attackers: ['c1'],
+            blockers: { c1: ['c2', 'c3'] }
+        });
+
+        const fromStore = useGameStore.getState().calculateCombatOutcome();
+        const fromEngine = calculateCombatOutcome({ defenderPlayerId: 'p2', attackers: ['c1'], blockers: { c1: ['c2', 'c3'] }, cards });
+
+        expect(fromStore).toEqual(fromEngine);
+        expect(fromEngine.damageEvents.find(e => e.targetId === 'p2')?.damage).toBe(1);
+    });
+
+    it('should index deaths and damage per card', () => {
+        const cards = [creature('a', 4, 4, ['Double Strike']), creature('b', 2, 2, [], 'p2'), creature('c', 3, 5, [], 'p2')];
+        const outcome = calculateCombatOutcome({ defenderPlayerId: 'p2', attackers: ['a'], blockers: { a: ['b', 'c'] }, cards });
+
+        expect(outcome.deathIndex).toEqual(Object.fromEntries(outcome.deaths.map(id => [id, true])));
+        cards.forEach(card => {
+            const total = outcome.damageEvents.filter(e => e.targetId === card.id).reduce((sum, e) => sum + e.damage, 0);
+            expect(outcome.damageByCard[card.id] || 0).toBe(total);
+        });
+        expect(outcome.deathIndex.b).toBe(true);
+    });
+});
+
+describe('Card Stats Cache', () => {
+    it('should fold counters into power and toughness', () => {
+        const card = { ...creature('c1', 3, 3), plusOneCounters: 2, minusOneCounters: 1 };
+
+        expect(getCardStats(card)).toMatchObject({ basePower: 3, baseToughness: 3, power: 4, toughness: 4 });
+    });
+
+    it('should match keywords case-insensitively and recompute for an upgraded copy', () => {
+        const card = creature('c1', 2, 2, ['flying']);
+        const upgraded = { ...card, keywords: [...card.keywords, 'Deathtouch'] };
+
+        expect(hasKeyword(card, 'Flying')).toBe(true);
+        expect(hasKeyword(card, 'Deathtouch')).toBe(false);
+        expect(hasKeyword(upgraded, 'Deathtouch')).toBe(true);
+        expect(getCardStats(card)).toBe(getCardStats(card));
+    });
+});
+
+describe('Opponent AI', () => {
+    const side = (id: string, battlefield: ReturnType<typeof creature>[]) => ({
+        id, name: id, life: 40, colorIdentity: [], commanderDamage: {}, poisonCounters: 0,
+        library: [], hand: [], graveyard: [], exile: [], commandZone: [], battlefield, gold: 0
+    });
+
+    it('should plan its attack again from the board as it is after a change mid-plan', async () => {
+        const army = ['x', 'y', 'z'].map(id => creature(id, 5, 5, [], 'player2'));
+        useGameStore.setState({
+            players: [side('player1', []), side('player2', army)],
+            activePlayerId: 'player2',
+            phase: 'combat',
+            combatStep: 'declareAttackers',
+            attackers: [],
+            blockers: {},
+            turbo: false,
+            winner: null
+        });
+
+        const planned = useGameStore.getState().performOpponentAttacks();
+        // The board changes while the plan is in flight: one attacker leaves.
+        useGameStore.setState(state => ({ players: state.players.map(p => p.id === 'player2' ? { ...p, battlefield: army.slice(1) } : p) }));
+        await planned;
+
+        expect([...useGameStore.getState().attackers].sort()).toEqual(['y', 'z']);
+    });
+
+    it('should block with the same search caps as the simulator', async () => {
+        const attackers = Array.from({ length: 5 }, (_, i) => creature(`a${i}`, 1 + (i % 4), 2 + (i % 3), i % 2 ? ['Trample'] : [], 'player1'));
+        const defenders = Array.from({ length: 6 }, (_, i) => creature(`d${i}`, 1 + ((i * 3) % 5), 1 + (i % 4), i === 2 ? ['Deathtouch'] : [], 'player2'));
+        const players = [side('player1', attackers), side('player2', defenders)];
+        useGameStore.setState({
+            players,
+            activePlayerId: 'player1',
+            phase: 'combat',
+            combatStep: 'declareBlockers',
+            attackers: attackers.map(c => c.id),
+            blockers: {},
+            turbo: false,
+            winner: null
+        });
+
+        await useGameStore.getState().performOpponentBlocks();
+
+        const expected = planBlocks({ attackers, attackerPlayer: players[0], defender: players[1] }, AI_BLOCK_OPTIONS).blockers;
+        expect(useGameStore.getState().blockers).toEqual(Object.keys(expected).length > 0 ? expected : {});
+    });
+
+    it('should go back to where turbo started when it is stopped before playing a turn', () => {
+        const attackers = [creature('a', 3, 3, [], 'player1')];
+        useGameStore.setState({
+            players: [side('player1', attackers), side('player2', [creature('d', 2, 2, [], 'player2')])],
+            activePlayerId: 'player1',
+            phase: 'combat',
+            combatStep: 'declareAttackers',
+            attackers: ['a'],
+            blockers: {},
+            turbo: false,
+            winner: null,
+            showStartPrompt: false
+        });
+
+        useGameStore.getState().startTurbo();
+        expect(useGameStore.getState().combatStep).toBe(undefined);
+        useGameStore.getState().stopTurbo();
+
+        const state = useGameStore.getState();
+        expect([state.turbo, state.phase, state.combatStep, state.activePlayerId]).toEqual([false, 'combat', 'declareAttackers', 'player1']);
+        expect(state.attackers).toEqual(['a']);
+    });
+});
@@ -0,0 +1,296 @@
+import type { Card, CombatBoard, CombatOutcome, DamageEvent, GameState } from '../types';
+import { KEYWORD_FLAGS, getCardStats } from './cardStats.ts';
+
+export const emptyCombatOutcome = (): CombatOutcome => ({
+    damageEvents: [],
+    deaths: [],
+    deathDescriptions: [],
+    attackerLifeGained: 0,
+    defenderLifeGained: 0,
+    explanation: [],
+    deathIndex: {},
+    damageByCard: {}
+});
+
+// The per-card indexes of an outcome, rebuilt from its deaths and damage events.
+export const indexOutcome = (deaths: string[], damageEvents: DamageEvent[]): Pick<CombatOutcome, 'deathIndex' | 'damageByCard'> => {
+    const deathIndex: Record<string, true> = {};
+    deaths.forEach(id => {
+        deathIndex[id] = true;
+    });
+    const damageByCard: Record<string, number> = {};
+    damageEvents.forEach(e => {
+        if (e.type === 'toCreature') damageByCard[e.targetId] = (damageByCard[e.targetId] || 0) + e.damage;
+    });
+    return { deathIndex, damageByCard };
+};
+
+// Snapshot the combat-relevant slice of the game state. Returns null when there is no defending player.
+export const buildCombatBoard = (
+    state: Pick<GameState, 'players' | 'activePlayerId' | 'attackers' | 'blockers'>
+): CombatBoard | null => {
+    const attackerPlayer = state.players.find(p => p.id === state.activePlayerId);
+    const defenderPlayer = state.players.find(p => p.id !== state.activePlayerId);
+    if (!attackerPlayer || !defenderPlayer) return null;
+
+    return {
+        defenderPlayerId: defenderPlayer.id,
+        attackers: state.attackers,
+        blockers: state.blockers,
+        cards: [...attackerPlayer.battlefield, ...defenderPlayer.battlefield]
+    };
+};
+
+// Where each section of the two damage steps ends in `damageEvents` and `explanation`, in the order
+// first-strike attackers, first-strike blockers, normal attackers, normal blockers. Lets callers
+// splice outcomes of independent attacker groups back together (see incrementalCombat.ts).
+export interface StepMarks {
+    events: number[];
+    explanation: number[];
+}
+
+// Pure combat resolution: first strike step, then normal damage step, then state-based deaths.
+export const resolveCombatSteps = (board: CombatBoard): { outcome: CombatOutcome; marks: StepMarks } => {
+    const { defenderPlayerId, attackers, blockers } = board;
+
+    const damageEvents: DamageEvent[] = [];
+    const damageOnCard: Record<string, number> = {};
+    const hasDealtDamage = new Set<string>();
+    let attackerLifeGained = 0;
+    let defenderLifeGained = 0;
+    const deathDescriptions: string[] = [];
+    const deaths: string[] = [];
+    const explanation: string[] = [];
+    const marks: StepMarks = { events: [], explanation: [] };
+    const markSection = () => {
+        marks.events.push(damageEvents.length);
+        marks.explanation.push(explanation.length);
+    };
+
+    // Indexed once per resolution so lookups and lethality checks stay O(1) on large boards.
+    const allCombatants = board.cards;
+    const cardsById = new Map<string, Card>();
+    allCombatants.forEach(c => cardsById.set(c.id, c));
+    const getCard = (id: string) => cardsById.get(id);
+
+    // Targets that have taken non-zero deathtouch damage so far.
+    const deathtouched = new Set<string>();
+    const recordDamage = (event: DamageEvent) => {
+        damageEvents.push(event);
+        if (event.type === 'toCreature') {
+            damageOnCard[event.targetId] = (damageOnCard[event.targetId] || 0) + event.damage;
+            if (event.isDeathtouch && event.damage > 0) deathtouched.add(event.targetId);
+        }
+    };
+
+    const getActualToughness = (card: Card) => getCardStats(card).toughness;
+
+    const checkLethal = (cardId: string) => {
+        const card = getCard(cardId);
+        if (!card) return true;
+        const dmg = damageOnCard[cardId] || 0;
+        const tough = getActualToughness(card);
+        if (dmg >= tough) return true;
+        return dmg > 0 && deathtouched.has(cardId);
+    };
+
+    const resolveDamageStep = (isFirstStrikeStep: boolean) => {
+        // Take a snapshot of who is dead BEFORE this step begins.
+        // Damage dealt WITHIN this step is simultaneous.
+        const deadAtStartOfStep = new Set<string>();
+        allCombatants.forEach(c => {
+            if (checkLethal(c.id)) deadAtStartOfStep.add(c.id);
+        });
+
+        // 1. Attackers Assign Damage
+        attackers.forEach(attId => {
+            const attacker = getCard(attId);
+            // If attacker died in a PREVIOUS step, it cannot deal damage.
+            if (!attacker || deadAtStartOfStep.has(attId)) return;
+
+            const { power: attPower, keywordMask } = getCardStats(attacker);
+            const isFS = (keywordMask & KEYWORD_FLAGS['First Strike']) !== 0;
+            const isDS = (keywordMask & KEYWORD_FLAGS['Double Strike']) !== 0;
+
+            let attackerShouldDeal = false;
+            if (isFirstStrikeStep) {
+                if (isFS || isDS) attackerShouldDeal = true;
+            } else {
+                if (!hasDealtDamage.has(attId) || isDS) attackerShouldDeal = true;
+            }
+
+            if (!attackerShouldDeal) return;
+
+            const bIds = blockers[attId] || [];
+            const isLifelink = (keywordMask & KEYWORD_FLAGS['Lifelink']) !== 0;
+            const isDeathtouch = (keywordMask & KEYWORD_FLAGS['Deathtouch']) !== 0;
+            const isTrample = (keywordMask & KEYWORD_FLAGS['Trample']) !== 0;
+
+            if (bIds.length === 0) {
+                // Unblocked
+                explanation.push(`${attacker.name} deals ${attPower} damage to defender (${isFirstStrikeStep ? 'First Strike' : 'Normal'} Step).`);
+                recordDamage({
+                    sourceId: attId,
+                    targetId: defenderPlayerId,
+                    damage: attPower,
+                    type: 'toPlayer',
+                    isLifelink
+                });
+                if (isLifelink) attackerLifeGained += attPower;
+            } else {
+                let powerToAssign = attPower;
+                bIds.forEach(blkId => {
+                    const blocker = getCard(blkId);
+                    // We use checkLethal (live) here because one attacker assigns damage
+                    // to its blockers in order, and needs to know if the first is "done".
+                    if (!blocker || checkLethal(blkId)) return;
+
+                    const tough = getActualToughness(blocker);
+                    const alreadyTaken = damageOnCard[blkId] || 0;
+                    const lethalNeeded = isDeathtouch ? 1 : Math.max(0, tough - alreadyTaken);
+                    const assigned = isTrample ? Math.min(powerToAssign, lethalNeeded) : powerToAssign;
+
+                    if (assigned > 0) {
+                        explanation.push(`${attacker.name} deals ${assigned} damage to ${blocker.name} (${isFirstStrikeStep ? 'First Strike' : 'Normal'} Step).`);
+                        recordDamage({
+                            sourceId: attId,
+                            targetId: blkId,
+                            damage: assigned,
+                            type: 'toCreature',
+                            isLifelink,
+                            isDeathtouch
+                        });
+                        if (isLifelink) attackerLifeGained += assigned;
+                        powerToAssign -= assigned;
+                    }
+                });
+
+                // Carry over Trample
+                if (isTrample && powerToAssign > 0) {
+                    explanation.push(`${attacker.name} tramples for ${powerToAssign} damage to defender.`);
+                    recordDamage({
+                        sourceId: attId,
+                        targetId: defenderPlayerId,
+                        damage: powerToAssign,
+                        type: 'toPlayer',
+                        isLifelink
+                    });
+                    if (isLifelink) attackerLifeGained += powerToAssign;
+                }
+            }
+            hasDealtDamage.add(attId);
+        });
+
+        markSection();
+
+        // 2. Blockers Assign Damage
+        const blockerDamageResults: { targetId: string, damage: number, sourceId: string, isLifelink: boolean, isDeathtouch: boolean }[] = [];
+
+        Object.entries(blockers).forEach(([attId, bIds]) => {
+            bIds.forEach(blkId => {
+                const blocker = getCard(blkId);
+                const attacker = getCard(attId);
+                if (!blocker || !attacker) return;
+
+                // Blocker cannot deal damage if IT died in a previous step,
+                // OR if its ATTACKER died in a previous step.
+                if (deadAtStartOfStep.has(blkId)) {
+                    if (!isFirstStrikeStep && !hasDealtDamage.has(blkId)) {
+                        explanation.push(`${blocker.name} died in the First Strike step and cannot deal damage.`);
+                    }
+                    return;
+                }
+
+                if (deadAtStartOfStep.has(attId)) {
+                    // Attacker is already dead, blocker has nothing to hit.
+                    return;
+                }
+
+                const { power: blkPower, keywordMask } = getCardStats(blocker);
+                const isFS = (keywordMask & KEYWORD_FLAGS['First Strike']) !== 0;
+                const isDS = (keywordMask & KEYWORD_FLAGS['Double Strike']) !== 0;
+
+                let blockerShouldDeal = false;
+                if (isFirstStrikeStep) {
+                    if (isFS || isDS) blockerShouldDeal = true;
+                } else {
+                    if (!hasDealtDamage.has(blkId) || isDS) blockerShouldDeal = true;
+                }
+
+                if (!blockerShouldDeal) return;
+
+                const isLifelink = (keywordMask & KEYWORD_FLAGS['Lifelink']) !== 0;
+                const isDeathtouch = (keywordMask & KEYWORD_FLAGS['Deathtouch']) !== 0;
+
+                explanation.push(`${blocker.name} deals ${blkPower} damage to ${attacker.name} (${isFirstStrikeStep ? 'First Strike' : 'Normal'} Step).`);
+                blockerDamageResults.push({
+                    sourceId: blkId,
+                    targetId: attId,
+                    damage: blkPower,
+                    isLifelink,
+                    isDeathtouch
+                });
+                hasDealtDamage.add(blkId);
+            });
+        });
+
+        // Commit blocker damage AFTER the loop so it is truly simultaneous
+        blockerDamageResults.forEach(res => {
+            recordDamage({
+                sourceId: res.sourceId,
+                targetId: res.targetId,
+                damage: res.damage,
+                type: 'toCreature',
+                isLifelink: res.isLifelink,
+                isDeathtouch: res.isDeathtouch
+            });
+            if (res.isLifelink) defenderLifeGained += res.damage;
+        });
+
+        markSection();
+    };
+
+    // Step 1: First Strike Step
+    resolveDamageStep(true);
+
+    // Step 2: Normal Damage Step
+    resolveDamageStep(false);
+
+    // Finalize deaths
+    const deathIndex: Record<string, true> = {};
+    allCombatants.forEach(card => {
+        const tough = getActualToughness(card);
+        const dmg = damageOnCard[card.id] || 0;
+
+        if (dmg >= tough || deathtouched.has(card.id)) {
+            deaths.push(card.id);
+            deathIndex[card.id] = true;
+        }
+    });
+
+    // Generate descriptions
+    attackers.forEach(attId => {
+        const att = getCard(attId);
+        if (!att) return;
+        const bIds = blockers[attId] || [];
+
+        bIds.forEach(blkId => {
+            const blk = getCard(blkId);
+            if (!blk) return;
+
+            const attDies = !!deathIndex[attId];
+            const blkDies = !!deathIndex[blkId];
+
+            if (attDies && blkDies) deathDescriptions.push(`${att.name} and ${blk.name} killed each other.`);
+            else if (attDies) deathDescriptions.push(`${blk.name} killed ${att.name}.`);
+            else if (blkDies) deathDescriptions.push(`${att.name} killed ${blk.name}.`);
+        });
+    });
+
+    return {
+        outcome: { damageEvents, deaths, deathDescriptions, attackerLifeGained, defenderLifeGained, explanation, deathIndex, damageByCard: damageOnCard },
+        marks
+    };
+};
+
+export const calculateCombatOutcome = (board: CombatBoard): CombatOutcome => resolveCombatSteps(board).outcome;
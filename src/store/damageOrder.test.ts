@@ -0,0 +1,77 @@
+import { describe, it, expect } from 'vitest';
+import type { Card } from '../types';
+import { planDamageOrder, scoreDamageOrder } from './damageOrder';
+import type { DamageOrderValuation } from './damageOrder';
+import { calculateCombatOutcome } from './combatLogic';
+import { createRng } from './rng';
+import type { Rng } from './rng';
+import { creature } from './testCards';
+
+const valuation: DamageOrderValuation = { lostValue: card => Number(card.power) + Number(card.toughness) + 1, life: 0.5 };
+
+const KEYWORDS = ['First Strike', 'Double Strike', 'Deathtouch', 'Trample', 'Lifelink'];
+const randomCreature = (rng: Rng, id: string) =>
+    creature(id, rng.int(7), rng.int(7), KEYWORDS.filter(() => rng.next() < 0.3), 'p1', rng.int(5) - 2);
+
+// The block planner's group value, straight from the combat engine.
+const engineScore = (attacker: Card, blockers: Card[]) => {
+    const outcome = calculateCombatOutcome({
+        defenderPlayerId: 'defender',
+        attackers: [attacker.id],
+        blockers: { [attacker.id]: blockers.map(c => c.id) },
+        cards: [attacker, ...blockers]
+    });
+    let value = outcome.deathIndex[attacker.id] ? valuation.lostValue(attacker) : 0;
+    blockers.forEach(b => {
+        if (outcome.deathIndex[b.id]) value -= valuation.lostValue(b);
+    });
+    const damage = outcome.damageEvents.filter(e => e.type === 'toPlayer').reduce((sum, e) => sum + e.damage, 0);
+    return value - (damage - outcome.defenderLifeGained + outcome.attackerLifeGained) * valuation.life;
+};
+
+const permutations = <T,>(list: T[]): T[][] =>
+    list.length <= 1 ? [list] : list.flatMap((item, i) => permutations([...list.slice(0, i), ...list.slice(i + 1)]).map(rest => [item, ...rest]));
+
+describe('Damage Order', () => {
+    it('should find the best order for either side, as every permutation on the engine shows', () => {
+        const rng = createRng(23);
+        for (let round = 0; round < 300; round++) {
+            const attacker = randomCreature(rng, 'a');
+            const blockers = Array.from({ length: 2 + rng.int(4) }, (_, i) => randomCreature(rng, `b${i}`));
+            const scores = permutations(blockers).map(order => engineScore(attacker, order));
+
+            const defender = planDamageOrder(attacker, blockers, 'defender', valuation);
+            const attacking = planDamageOrder(attacker, blockers, 'attacker', valuation);
+            expect(defender.score).toBeCloseTo(Math.max(...scores));
+            expect(attacking.score).toBeCloseTo(Math.min(...scores));
+            expect(engineScore(attacker, defender.order.map(i => blockers[i]))).toBeCloseTo(defender.score);
+            expect(engineScore(attacker, attacking.order.map(i => blockers[i]))).toBeCloseTo(attacking.score);
+        }
+    });
+
+    it('should score any order the way the engine resolves it', () => {
+        const rng = createRng(5);
+        for (let round = 0; round < 300; round++) {
+            const attacker = randomCreature(rng, 'a');
+            const blockers = Array.from({ length: 1 + rng.int(5) }, (_, i) => randomCreature(rng, `b${i}`));
+            expect(scoreDamageOrder(attacker, blockers, valuation)).toBeCloseTo(engineScore(attacker, blockers));
+        }
+    });
+
+    it('should put the chump blocker first for the defender and the real threat first for the attacker', () => {
+        const attacker = creature('a', 4, 5);
+        const blockers = [creature('ogre', 3, 3), creature('squire', 1, 1)];
+
+        expect(planDamageOrder(attacker, blockers, 'defender', valuation).order).toEqual([1, 0]);
+        expect(planDamageOrder(attacker, blockers, 'attacker', valuation).order).toEqual([0, 1]);
+    });
+
+    it('should keep the given order when nothing beats it and only try one of identical blockers', () => {
+        const attacker = creature('a', 3, 3, ['Trample']);
+        const walls = Array.from({ length: 8 }, (_, i) => creature(`w${i}`, 0, 4));
+        const plan = planDamageOrder(attacker, walls, 'attacker', valuation);
+
+        expect(plan.order).toEqual([0, 1, 2, 3, 4, 5, 6, 7]);
+        expect(plan.nodes).toBeLessThanOrEqual(8);
+    });
+});
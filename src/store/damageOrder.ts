@@ -0,0 +1,206 @@
+import type { Card } from '../types';
+import { KEYWORD_FLAGS, getCardStats } from './cardStats.ts';
+
+// Best damage assignment order for one attacker and its blockers. The engine divides the attacker's
+// damage by that order (lethal damage to each living blocker in turn with trample, everything to the
+// first living one without), so choosing the order is choosing the division; it decides which blockers
+// die, which survive the first strike step to hit back, and how much tramples over.
+//
+// The search places blockers one at a time with both damage steps simulated as it goes, so a blocker's
+// result depends only on the blockers already placed. That makes it a DP over subsets: the state is the
+// set placed so far plus what it left behind (each step's unassigned damage and the damage dealt back to
+// the attacker), memoized, with two prunings:
+//   - blockers with the same stats, keywords and value are interchangeable, so only one is tried;
+//   - once no damage is left to assign in either step, the rest of the order no longer matters.
+// Scores use the block planner's scale: the defender's point of view, which the attacker minimizes.
+
+export type DamageOrderSide = 'attacker' | 'defender';
+
+export interface DamageOrderValuation {
+    lostValue: (card: Card) => number; // what a creature dying costs its controller
+    life: number; // per point of life lost or gained
+}
+
+export interface DamageOrderPlan {
+    order: number[]; // indices into the blockers, in damage assignment order
+    score: number; // defender's point of view
+    nodes: number;
+}
+
+// Beyond this many blockers the given order is kept; 8! orders collapse to at most 2^8 subsets here.
+export const MAX_ORDERED_BLOCKERS = 8;
+
+const FIRST = KEYWORD_FLAGS['First Strike'] | KEYWORD_FLAGS['Double Strike'];
+const DOUBLE = KEYWORD_FLAGS['Double Strike'];
+
+const lethal = (damage: number, toughness: number, deathtouched: boolean) =>
+    damage >= toughness || (damage > 0 && deathtouched);
+
+interface Fighter {
+    power: number;
+    toughness: number;
+    first: boolean;
+    double: boolean;
+    trample: boolean;
+    deathtouch: boolean;
+    lifelink: boolean;
+    lost: number;
+}
+
+const fighter = (card: Card, valuation: DamageOrderValuation): Fighter => {
+    const { power, toughness, keywordMask } = getCardStats(card);
+    return {
+        power,
+        toughness,
+        first: (keywordMask & FIRST) !== 0,
+        double: (keywordMask & DOUBLE) !== 0,
+        trample: (keywordMask & KEYWORD_FLAGS['Trample']) !== 0,
+        deathtouch: (keywordMask & KEYWORD_FLAGS['Deathtouch']) !== 0,
+        lifelink: (keywordMask & KEYWORD_FLAGS['Lifelink']) !== 0,
+        lost: valuation.lostValue(card)
+    };
+};
+
+// Everything about the combat that no order can change, then the effect of placing one blocker next.
+const createGroupModel = (attackerCard: Card, blockerCards: Card[], valuation: DamageOrderValuation) => {
+    const attacker = fighter(attackerCard, valuation);
+    const blockers = blockerCards.map(card => fighter(card, valuation));
+
+    // Who is alive at the start of each step: the first strike step only depends on printed stats.
+    const attackerAlive1 = attacker.toughness > 0;
+    const strikesFirst = blockers.map(b => attackerAlive1 && b.toughness > 0 && b.first);
+    const firstHits = blockers.reduce((sum, b, i) => sum + (strikesFirst[i] ? b.power : 0), 0);
+    const firstDeathtouch = blockers.some((b, i) => strikesFirst[i] && b.deathtouch && b.power > 0);
+    const attackerAlive2 = attackerAlive1 && !lethal(firstHits, attacker.toughness, firstDeathtouch);
+    const attackerDeals1 = attackerAlive1 && attacker.first;
+    const attackerDeals2 = attackerAlive2 && (!attackerDeals1 || attacker.double);
+
+    const assign = (remaining: number, toughness: number, taken: number) => {
+        const needed = attacker.deathtouch ? 1 : Math.max(0, toughness - taken);
+        const assigned = attacker.trample ? Math.min(remaining, needed) : remaining;
+        return assigned > 0 ? assigned : 0;
+    };
+
+    // Places blocker `i` after the ones already placed, with `r1`/`r2` left to assign in each step.
+    const place = (i: number, r1: number, r2: number) => {
+        const b = blockers[i];
+        let damage = 0;
+        let deathtouched = false;
+        if (attackerDeals1 && b.toughness > 0) {
+            damage = assign(r1, b.toughness, 0);
+            deathtouched = attacker.deathtouch && damage > 0;
+            r1 -= damage;
+        }
+        const alive2 = !lethal(damage, b.toughness, deathtouched);
+        if (attackerDeals2 && alive2) {
+            const assigned = assign(r2, b.toughness, damage);
+            damage += assigned;
+            deathtouched = deathtouched || (attacker.deathtouch && assigned > 0);
+            r2 -= assigned;
+        }
+        const hitsBack = alive2 && attackerAlive2 && (!strikesFirst[i] || b.double) ? b.power : 0;
+        const dealt = (strikesFirst[i] ? b.power : 0) + hitsBack;
+
+        let value = 0;
+        if (damage >= b.toughness || deathtouched) value -= b.lost;
+        if (b.lifelink) value += dealt * valuation.life;
+        if (attacker.lifelink) value -= damage * valuation.life;
+        return { r1, r2, hitsBack, deathtouchBack: b.deathtouch && hitsBack > 0, value };
+    };
+
+    // The attacker's fate and whatever tramples over once every blocker is placed.
+    const finish = (r1: number, r2: number, hitsBack: number, deathtouchBack: boolean) => {
+        const trampled = attacker.trample ? Math.max(r1, 0) + Math.max(r2, 0) : 0;
+        const damage = firstHits + hitsBack;
+        let value = -trampled * valuation.life * (attacker.lifelink ? 2 : 1);
+        if (damage >= attacker.toughness || firstDeathtouch || deathtouchBack) value += attacker.lost;
+        return value;
+    };
+
+    const start = { r1: attackerDeals1 ? attacker.power : 0, r2: attackerDeals2 ? attacker.power : 0 };
+    return { blockers, place, finish, start };
+};
+
+// Score of one order, on the same scale as the plans.
+export const scoreDamageOrder = (attacker: Card, blockers: Card[], valuation: DamageOrderValuation): number => {
+    const model = createGroupModel(attacker, blockers, valuation);
+    let { r1, r2 } = model.start;
+    let hitsBack = 0;
+    let deathtouchBack = false;
+    let value = 0;
+    blockers.forEach((_, i) => {
+        const placed = model.place(i, r1, r2);
+        ({ r1, r2 } = placed);
+        hitsBack += placed.hitsBack;
+        deathtouchBack = deathtouchBack || placed.deathtouchBack;
+        value += placed.value;
+    });
+    return value + model.finish(r1, r2, hitsBack, deathtouchBack);
+};
+
+export const planDamageOrder = (
+    attacker: Card,
+    blockers: Card[],
+    side: DamageOrderSide,
+    valuation: DamageOrderValuation
+): DamageOrderPlan => {
+    const n = blockers.length;
+    const given = blockers.map((_, i) => i);
+    if (n < 2 || n > MAX_ORDERED_BLOCKERS) return { order: given, score: scoreDamageOrder(attacker, blockers, valuation), nodes: 0 };
+
+    const model = createGroupModel(attacker, blockers, valuation);
+    const sign = side === 'defender' ? 1 : -1;
+    const full = (1 << n) - 1;
+
+    // Interchangeable blockers share a class; only the first unplaced one of a class is tried.
+    const classKeys = model.blockers.map(b => JSON.stringify(b));
+    const classOf = classKeys.map(key => classKeys.indexOf(key));
+
+    const memo = new Map<string, { value: number; next: number }>();
+    let nodes = 0;
+
+    const best = (mask: number, r1: number, r2: number, hitsBack: number, deathtouchBack: boolean): number => {
+        if (mask === full) return model.finish(r1, r2, hitsBack, deathtouchBack);
+        const key = `${mask},${r1},${r2},${hitsBack},${deathtouchBack ? 1 : 0}`;
+        const seen = memo.get(key);
+        if (seen) return seen.value;
+        nodes++;
+
+        const exhausted = r1 <= 0 && r2 <= 0;
+        const tried = new Set<number>();
+        let bestValue = -Infinity;
+        let bestNext = -1;
+        for (let i = 0; i < n; i++) {
+            if (mask & (1 << i) || tried.has(classOf[i])) continue;
+            tried.add(classOf[i]);
+            const placed = model.place(i, r1, r2);
+            const value = placed.value + best(mask | (1 << i), placed.r1, placed.r2, hitsBack + placed.hitsBack, deathtouchBack || placed.deathtouchBack);
+            if (sign * value > sign * bestValue || bestNext === -1) {
+                bestValue = value;
+                bestNext = i;
+            }
+            if (exhausted) break;
+        }
+        memo.set(key, { value: bestValue, next: bestNext });
+        return bestValue;
+    };
+
+    let { r1, r2 } = model.start;
+    const score = best(0, r1, r2, 0, false);
+
+    // Walk the memo from the root to read the order back.
+    const order: number[] = [];
+    let mask = 0;
+    let hitsBack = 0;
+    let deathtouchBack = false;
+    while (mask !== full) {
+        const { next } = memo.get(`${mask},${r1},${r2},${hitsBack},${deathtouchBack ? 1 : 0}`)!;
+        const placed = model.place(next, r1, r2);
+        order.push(next);
+        mask |= 1 << next;
+        ({ r1, r2 } = placed);
+        hitsBack += placed.hitsBack;
+        deathtouchBack = deathtouchBack || placed.deathtouchBack;
+    }
+    return { order, score, nodes };
+};
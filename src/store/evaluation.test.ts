@@ -0,0 +1,94 @@
+import { describe, it, expect } from 'vitest';
+import { createEvaluationHost, createEvaluationService } from './evaluation';
+import type { EvaluationRequest, EvaluationResponse, WorkerLike } from './evaluation';
+import { decodePlayers, encodePlayers } from './boardCodec';
+import { planBlocks } from './blockPlanner';
+import { createBattle, createPlayer } from './gameRules';
+import { createRng } from './rng';
+import { getCardStats } from './cardStats';
+
+const OPTIONS = { timeBudgetMs: Infinity, maxNodes: 300 };
+
+const battle = (seed: number) => {
+    const rng = createRng(seed);
+    return createBattle([createPlayer('player1', 'Player 1', rng), createPlayer('player2', 'Player 2', rng)], rng);
+};
+
+// Runs the worker host in-process, with the same structured cloning a real worker applies.
+const fakeWorker = () => {
+    const requests: EvaluationRequest[] = [];
+    const worker: WorkerLike = {
+        onmessage: null,
+        onerror: null,
+        postMessage: message => {
+            requests.push(message);
+            host(structuredClone(message));
+        },
+        terminate: () => { }
+    };
+    let evaluated = 0;
+    const host = createEvaluationHost(response => {
+        evaluated++;
+        worker.onmessage?.({ data: response } as MessageEvent<EvaluationResponse>);
+    });
+    return { worker, requests, evaluated: () => evaluated };
+};
+
+describe('Evaluation Service', () => {
+    it('should round-trip everything the engine reads through the board encoding', () => {
+        const players = battle(3);
+        const decoded = decodePlayers(encodePlayers(players));
+
+        decoded.forEach((player, i) => {
+            expect(player.life).toBe(players[i].life);
+            player.battlefield.forEach((card, j) => {
+                const original = players[i].battlefield[j];
+                expect(card.id).toBe(original.id);
+                expect(getCardStats(card)).toEqual(getCardStats(original));
+                expect([card.tapped, card.damageTaken, card.shieldCounters]).toEqual([original.tapped, original.damageTaken, original.shieldCounters]);
+            });
+        });
+    });
+
+    it('should plan the same blocks in the worker as on the main thread', async () => {
+        const players = battle(8);
+        const [attackerPlayer, defender] = players;
+        const attackers = attackerPlayer.battlefield.map(c => c.id);
+        const task = { attackers, attackerPlayerId: attackerPlayer.id, defenderPlayerId: defender.id, options: OPTIONS };
+        const expected = planBlocks({ attackers: attackerPlayer.battlefield, attackerPlayer, defender }, OPTIONS);
+
+        const { worker, requests } = fakeWorker();
+        const plan = await createEvaluationService(worker).planBlocks(task, players);
+        const fallback = await createEvaluationService(undefined).planBlocks(task, players);
+
+        expect(plan?.blockers).toEqual(expected.blockers);
+        expect(fallback?.blockers).toEqual(expected.blockers);
+        expect(requests[0].type === 'evaluate' && requests[0].players.numbers instanceof Int32Array).toBe(true);
+    });
+
+    it('should skip a request cancelled before the worker starts it', async () => {
+        const players = battle(11);
+        const { worker, requests, evaluated } = fakeWorker();
+        const service = createEvaluationService(worker);
+        const controller = new AbortController();
+
+        const stale = service.planAttacks({ attackerPlayerId: 'player1', defenderPlayerId: 'player2' }, players, controller.signal);
+        controller.abort();
+        const fresh = await service.planAttacks({ attackerPlayerId: 'player2', defenderPlayerId: 'player1' }, players);
+
+        expect(await stale).toBeNull();
+        expect(fresh).toBeDefined();
+        expect(requests.map(r => r.type)).toEqual(['evaluate', 'cancel', 'evaluate']);
+        expect(evaluated()).toBe(1);
+    });
+
+    it('should fall back to the main thread when the worker fails', async () => {
+        const players = battle(2);
+        const { worker } = fakeWorker();
+        worker.postMessage = () => worker.onerror?.({} as ErrorEvent);
+
+        const plan = await createEvaluationService(worker).planAttacks({ attackerPlayerId: 'player1', defenderPlayerId: 'player2' }, players);
+
+        expect(plan?.attackers).toBeDefined();
+    });
+});
@@ -0,0 +1,178 @@
+import type { Card, Player } from '../types';
+import { planAttacks } from './attackPlanner.ts';
+import type { AttackPlan, AttackPlanOptions } from './attackPlanner.ts';
+import { planBlocks } from './blockPlanner.ts';
+import type { BlockPlan, BlockPlanOptions } from './blockPlanner.ts';
+import { decodePlayers, encodePlayers } from './boardCodec.ts';
+import type { EncodedPlayers } from './boardCodec.ts';
+
+// Evaluation service: runs the AI planners off the main thread so animations keep running while the
+// opponent thinks. Requests carry the players in the compact transferable encoding from boardCodec;
+// the worker answers with the plan. Only the latest request matters to the store, so a request can be
+// cancelled (through an AbortSignal) when the board changes: its promise resolves to null at once and
+// the worker skips it if it hasn't started. Without worker support (tests, the simulator, a worker
+// that fails to load) the same code runs synchronously on the calling thread.
+
+export interface BlockTask {
+    kind: 'blocks';
+    attackers: string[];
+    attackerPlayerId: string;
+    defenderPlayerId: string;
+    options?: BlockPlanOptions;
+}
+
+export interface AttackTask {
+    kind: 'attacks';
+    attackerPlayerId: string;
+    defenderPlayerId: string;
+    options?: AttackPlanOptions;
+}
+
+export type EvaluationTask = BlockTask | AttackTask;
+export type EvaluationResult = BlockPlan | AttackPlan;
+
+export type EvaluationRequest =
+    | { type: 'evaluate'; id: number; task: EvaluationTask; players: EncodedPlayers }
+    | { type: 'cancel'; id: number };
+
+export type EvaluationResponse =
+    | { id: number; result: EvaluationResult }
+    | { id: number; error: string };
+
+// The part of a Worker the service uses, so tests can stand in for one.
+export interface WorkerLike {
+    postMessage: (message: EvaluationRequest, transfer: Transferable[]) => void;
+    onmessage: ((event: MessageEvent<EvaluationResponse>) => void) | null;
+    onerror: ((event: ErrorEvent) => void) | null;
+    terminate: () => void;
+}
+
+export const runEvaluation = (task: EvaluationTask, players: Player[]): EvaluationResult => {
+    const attackerPlayer = players.find(p => p.id === task.attackerPlayerId);
+    const defender = players.find(p => p.id === task.defenderPlayerId);
+    if (!attackerPlayer || !defender) throw new Error(`Unknown players ${task.attackerPlayerId}/${task.defenderPlayerId}`);
+
+    if (task.kind === 'attacks') return planAttacks({ attackerPlayer, defender }, task.options);
+    const attackers = task.attackers
+        .map(id => attackerPlayer.battlefield.find(c => c.id === id))
+        .filter((c): c is Card => !!c);
+    return planBlocks({ attackers, attackerPlayer, defender }, task.options);
+};
+
+// Worker side. Each request runs in its own task so cancellations posted meanwhile are seen first.
+export const createEvaluationHost = (post: (response: EvaluationResponse) => void) => {
+    const queue: Extract<EvaluationRequest, { type: 'evaluate' }>[] = [];
+    const cancelled = new Set<number>();
+
+    const drain = () => {
+        const request = queue.shift();
+        if (!request) return;
+        if (cancelled.delete(request.id)) {
+            setTimeout(drain, 0);
+            return;
+        }
+        try {
+            post({ id: request.id, result: runEvaluation(request.task, decodePlayers(request.players)) });
+        } catch (error) {
+            post({ id: request.id, error: error instanceof Error ? error.message : String(error) });
+        }
+        if (queue.length > 0) setTimeout(drain, 0);
+    };
+
+    return (request: EvaluationRequest) => {
+        if (request.type === 'cancel') {
+            if (queue.some(r => r.id === request.id)) cancelled.add(request.id);
+            return;
+        }
+        queue.push(request);
+        if (queue.length === 1) setTimeout(drain, 0);
+    };
+};
+
+export const spawnEvaluationWorker = (): WorkerLike | undefined => {
+    if (typeof Worker === 'undefined') return undefined;
+    try {
+        return new Worker(new URL('./evaluation.worker.ts', import.meta.url), { type: 'module' });
+    } catch {
+        return undefined;
+    }
+};
+
+export interface EvaluationService {
+    planBlocks: (task: Omit<BlockTask, 'kind'>, players: Player[], signal?: AbortSignal) => Promise<BlockPlan | null>;
+    planAttacks: (task: Omit<AttackTask, 'kind'>, players: Player[], signal?: AbortSignal) => Promise<AttackPlan | null>;
+    dispose: () => void;
+}
+
+interface Pending {
+    task: EvaluationTask;
+    players: Player[];
+    resolve: (result: EvaluationResult | null) => void;
+    reject: (error: Error) => void;
+}
+
+export const createEvaluationService = (worker: WorkerLike | undefined = spawnEvaluationWorker()): EvaluationService => {
+    const pending = new Map<number, Pending>();
+    let nextId = 0;
+
+    const runHere = ({ task, players, resolve, reject }: Pending) => {
+        try {
+            resolve(runEvaluation(task, players));
+        } catch (error) {
+            reject(error instanceof Error ? error : new Error(String(error)));
+        }
+    };
+
+    // A worker that fails to load or crashes hands everything in flight back to the main thread.
+    const abandonWorker = () => {
+        worker?.terminate();
+        worker = undefined;
+        const stranded = [...pending.values()];
+        pending.clear();
+        stranded.forEach(runHere);
+    };
+
+    if (worker) {
+        worker.onmessage = ({ data }) => {
+            const request = pending.get(data.id);
+            if (!request) return;
+            pending.delete(data.id);
+            if ('error' in data) request.reject(new Error(data.error));
+            else request.resolve(data.result);
+        };
+        worker.onerror = abandonWorker;
+    }
+
+    const evaluate = (task: EvaluationTask, players: Player[], signal?: AbortSignal) =>
+        new Promise<EvaluationResult | null>((resolve, reject) => {
+            if (signal?.aborted) {
+                resolve(null);
+                return;
+            }
+            if (!worker) {
+                runHere({ task, players, resolve, reject });
+                return;
+            }
+            const id = ++nextId;
+            pending.set(id, { task, players, resolve, reject });
+            signal?.addEventListener('abort', () => {
+                if (!pending.delete(id)) return;
+                worker?.postMessage({ type: 'cancel', id }, []);
+                resolve(null);
+            }, { once: true });
+
+            const encoded = encodePlayers(players);
+            worker.postMessage({ type: 'evaluate', id, task, players: encoded }, [encoded.numbers.buffer]);
+        });
+
+    return {
+        planBlocks: (task, players, signal) => evaluate({ kind: 'blocks', ...task }, players, signal) as Promise<BlockPlan | null>,
+        planAttacks: (task, players, signal) => evaluate({ kind: 'attacks', ...task }, players, signal) as Promise<AttackPlan | null>,
+        dispose: () => {
+            worker?.terminate();
+            worker = undefined;
+            pending.forEach(request => request.resolve(null));
+            pending.clear();
+        }
+    };
+};
@@ -0,0 +1,8 @@
+import { createEvaluationHost } from './evaluation.ts';
+import type { EvaluationRequest } from './evaluation.ts';
+
+// Entry point of the evaluation worker; see evaluation.ts.
+const scope = self as unknown as Worker;
+const handle = createEvaluationHost(response => scope.postMessage(response));
+
+scope.onmessage = (event: MessageEvent<EvaluationRequest>) => handle(event.data);
@@ -0,0 +1,54 @@
+import { describe, it, expect } from 'vitest';
+import { LOG_CHUNK_SIZE, appendLog, createGameLog, exportLog, logSlice, setLogArchiving } from './gameLog';
+
+const messages = (from: number, count: number) => Array.from({ length: count }, (_, i) => `entry ${from + i}`);
+
+describe('Game Log', () => {
+    it('should append in order across chunk boundaries', () => {
+        let log = createGameLog(messages(0, 3));
+        for (let i = 3; i < 200; i++) log = appendLog(log, [`entry ${i}`]);
+
+        expect(log.length).toBe(200);
+        expect(log.chunks).toHaveLength(Math.ceil(200 / LOG_CHUNK_SIZE));
+        expect(logSlice(log, 0, log.length)).toEqual(messages(0, 200));
+    });
+
+    it('should keep older versions intact when they share chunks', () => {
+        const base = createGameLog(messages(0, 10));
+        const newer = appendLog(base, ['newer']);
+        const branch = appendLog(base, ['branch']);
+
+        expect(logSlice(base, 0, base.length)).toEqual(messages(0, 10));
+        expect(logSlice(newer, 10, 11)).toEqual(['newer']);
+        expect(logSlice(branch, 10, 11)).toEqual(['branch']);
+    });
+
+    it('should evict whole chunks past capacity and archive them for export', () => {
+        let log = createGameLog([], 100, true);
+        for (let i = 0; i < 1000; i += 10) log = appendLog(log, messages(i, 10));
+
+        expect(log.length).toBeGreaterThanOrEqual(100);
+        expect(log.length).toBeLessThan(100 + LOG_CHUNK_SIZE);
+        expect(log.first + log.length).toBe(1000);
+        expect(logSlice(log, 0, 1)).toEqual([`entry ${log.first}`]);
+        expect(exportLog(log)).toEqual(messages(0, 1000));
+    });
+
+    it('should drop evicted entries when archiving is off', () => {
+        let log = createGameLog([], 100);
+        log = appendLog(log, messages(0, 500));
+
+        expect(log.archive).toBeNull();
+        expect(exportLog(log)).toEqual(messages(log.first, log.length));
+    });
+
+    it('should archive only what leaves the ring after archiving is turned on', () => {
+        let log = appendLog(createGameLog([], 100), messages(0, 500));
+        const first = log.first;
+        log = appendLog(setLogArchiving(log, true), messages(500, 500));
+
+        expect(exportLog(log)).toEqual(messages(first, 1000 - first));
+        expect(setLogArchiving(log, true)).toBe(log);
+        expect(setLogArchiving(log, false).archive).toBeNull();
+    });
+});
@@ -0,0 +1,73 @@
+import type { GameLog } from '../types';
+
+// The game log as a bounded, chunked ring. Entries live in fixed-size chunks; appending fills the
+// last chunk in place, so an append costs O(1) instead of copying the whole log. Each version only
+// reads up to its own length, which makes sharing chunks between versions safe as long as appends
+// go to the newest version (the store's); appending to an older one copies the chunk it would write.
+// Once the log holds more than `capacity` entries the oldest chunk leaves the ring, into the archive
+// when archiving is on or for good otherwise. The archive has no bound (and checkpoints persist it),
+// so it is off unless the player asks to keep the full log for download.
+
+export const LOG_CHUNK_SIZE = 64;
+export const DEFAULT_LOG_CAPACITY = 1000;
+
+export const createGameLog = (entries: string[] = [], capacity = DEFAULT_LOG_CAPACITY, archive = false): GameLog =>
+    appendLog({ chunks: [], length: 0, first: 0, capacity, archive: archive ? [] : null, archived: 0 }, entries);
+
+export const appendLog = (log: GameLog, messages: string[]): GameLog => {
+    if (messages.length === 0) return log;
+    const chunks = [...log.chunks];
+    let { length, first, archive, archived } = log;
+
+    let tail = chunks[chunks.length - 1];
+    const tailLength = length - (chunks.length - 1) * LOG_CHUNK_SIZE;
+    if (tail && tail.length !== tailLength) {
+        tail = tail.slice(0, tailLength);
+        chunks[chunks.length - 1] = tail;
+    }
+
+    messages.forEach(message => {
+        if (!tail || tail.length === LOG_CHUNK_SIZE) {
+            tail = [];
+            chunks.push(tail);
+        }
+        tail.push(message);
+        length++;
+    });
+
+    // Drop whole chunks, so eviction is amortised over LOG_CHUNK_SIZE appends.
+    while (length - LOG_CHUNK_SIZE >= log.capacity) {
+        const oldest = chunks.shift()!;
+        if (archive) {
+            if (archive.length !== archived) archive = archive.slice(0, archived);
+            archive.push(oldest);
+            archived++;
+        }
+        length -= LOG_CHUNK_SIZE;
+        first += LOG_CHUNK_SIZE;
+    }
+
+    return { ...log, chunks, length, first, archive, archived };
+};
+
+// Turns archiving on or off from this version on; turning it off lets go of what was archived.
+export const setLogArchiving = (log: GameLog, archive: boolean): GameLog => {
+    if (archive === (log.archive !== null)) return log;
+    return { ...log, archive: archive ? [] : null, archived: 0 };
+};
+
+// Entry `index` of the ring, 0 being the oldest still held.
+export const logEntry = (log: GameLog, index: number): string =>
+    log.chunks[Math.floor(index / LOG_CHUNK_SIZE)][index % LOG_CHUNK_SIZE];
+
+export const logSlice = (log: GameLog, start: number, end: number): string[] => {
+    const entries: string[] = [];
+    for (let i = Math.max(start, 0); i < Math.min(end, log.length); i++) entries.push(logEntry(log, i));
+    return entries;
+};
+
+// Every entry this version has seen: the archive followed by the ring.
+export const exportLog = (log: GameLog): string[] => [
+    ...(log.archive?.slice(0, log.archived).flat() ?? []),
+    ...logSlice(log, 0, log.length)
+];
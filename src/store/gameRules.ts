@@ -0,0 +1,341 @@
+import type { Card, CombatOutcome, Player } from '../types';
+import { CARD_POOL, COMMANDER_POOL, createCardInstance, getLegalCards } from './cards.ts';
+import type { CardTemplate } from './cards.ts';
+import { getCardStats, hasKeyword } from './cardStats.ts';
+import type { KeywordName } from './cardStats.ts';
+import type { Rng } from './rng.ts';
+import type { AttackPlanOptions } from './attackPlanner.ts';
+import type { BlockPlanOptions } from './blockPlanner.ts';
+import { mapCards, patchCard, patchPlayer } from './cardTable.ts';
+
+// Rules shared by the zustand store and the headless simulator. Everything here is pure:
+// it takes players in and hands new players (plus log lines) back. All randomness and card ids come
+// from the `Rng` passed in, so a seed replays the same game.
+
+export const INITIAL_LIFE = 40;
+export const VICTORY_GOLD_REWARD = 50;
+export const GOLD_PER_KILL = 25;
+export const MAX_BATTLEFIELD_SIZE = 6;
+export const MAX_GAMBLES_PER_GAME = 3;
+
+// How hard the AI searches, as node and evaluation caps instead of a clock, so a seed plays the same
+// on a fast machine and a slow one. The store and the simulator both plan with these.
+export const AI_BLOCK_OPTIONS: BlockPlanOptions = { timeBudgetMs: Infinity, maxNodes: 1000 };
+export const AI_ATTACK_OPTIONS: AttackPlanOptions = { timeBudgetMs: Infinity, maxEvaluations: 16, blockOptions: { timeBudgetMs: Infinity, maxNodes: 500 } };
+
+export const createPlayer = (id: string, name: string, rng: Rng): Player => {
+    // Default to a random commander for initial state
+    const randomComm = rng.pick(COMMANDER_POOL)!;
+    const commCard = createCardInstance(randomComm, `${id}-commander`, id);
+
+    return {
+        id,
+        name,
+        life: INITIAL_LIFE,
+        commander: commCard,
+        colorIdentity: randomComm.colors,
+        commanderDamage: {},
+        poisonCounters: 0,
+        library: [],
+        hand: [],
+        graveyard: [],
+        exile: [],
+        commandZone: [commCard],
+        battlefield: [],
+        gold: 0,
+    };
+};
+
+// Deal a fresh battle: new commanders and 1-5 color-legal creatures per player. Gold carries over.
+export const createBattle = (players: Player[], rng: Rng): Player[] => {
+    // Pick new commanders for each player
+    const shuffledCommanders = rng.shuffle(COMMANDER_POOL);
+
+    return players.map((p, index) => {
+        const commander = createCardInstance(shuffledCommanders[index % shuffledCommanders.length], rng.nextId(`${p.id}-commander`), p.id);
+
+        // Randomly determine how many creatures each player gets (1-5)
+        const count = rng.int(5) + 1;
+
+        // Shuffle and pick from legal pools
+        const cards = rng.shuffle(getLegalCards(commander.colors)).slice(0, count);
+        const battlefield = cards.map(c => createCardInstance(c, rng.nextId(`${p.id}-creature`), p.id));
+
+        return {
+            ...p,
+            life: INITIAL_LIFE,
+            commander: commander,
+            colorIdentity: commander.colors,
+            commandZone: [commander],
+            hand: [],
+            graveyard: [],
+            exile: [],
+            battlefield
+        };
+    });
+};
+
+export const summonCreature = (template: CardTemplate, playerId: string, rng: Rng): Card =>
+    createCardInstance(template, rng.nextId(`${playerId}-creature`), playerId, true);
+
+// Attacking creatures without vigilance become tapped.
+export const tapAttackers = (players: Player[], activePlayerId: string, attackers: string[]): Player[] =>
+    mapCards(players, (c, p) => {
+        if (p.id !== activePlayerId) return c;
+        const isAttacking = attackers.includes(c.id);
+        if (isAttacking && !hasKeyword(c, 'Vigilance') && !c.tapped) {
+            return { ...c, tapped: true };
+        }
+        return c;
+    });
+
+export const beginTurn = (players: Player[], nextActivePlayerId: string): Player[] =>
+    mapCards(players, (c, p) => {
+        // Only untap the incoming player's permanents
+        const tapped = p.id === nextActivePlayerId ? false : c.tapped;
+        // Clear summoning sickness for active player's creatures
+        const summoningSickness = p.id === nextActivePlayerId ? false : c.summoningSickness;
+        // ALL creatures have damage removed during cleanup step (MTG rule 514.2)
+        if (tapped === c.tapped && summoningSickness === c.summoningSickness && c.damageTaken === 0) return c;
+        return { ...c, tapped, damageTaken: 0, summoningSickness };
+    });
+
+export interface CombatApplication {
+    players: Player[];
+    log: string[];
+    damageToDefender: number;
+    killGold: number; // gold the attacking player earned from kills
+}
+
+// Apply life, gold, damage and deaths (with shield counters) from a resolved combat.
+export const applyCombatOutcome = (players: Player[], outcome: CombatOutcome, attackerPlayerId: string): CombatApplication => {
+    const log: string[] = [];
+    const { deathIndex, damageByCard } = outcome;
+    const defenderPlayerId = players.find(p => p.id !== attackerPlayerId)?.id;
+    const damageToDefender = outcome.damageEvents
+        .filter(e => e.targetId === defenderPlayerId && e.type === 'toPlayer')
+        .reduce((sum, e) => sum + e.damage, 0);
+    const defenderLost = players.find(p => p.id === defenderPlayerId)?.battlefield.filter(c => deathIndex[c.id]).length || 0;
+    const killGold = defenderLost * GOLD_PER_KILL;
+
+    const newPlayers = players.map(p => {
+        let newLife = p.life;
+        let newGold = p.gold;
+
+        if (p.id === attackerPlayerId) {
+            if (outcome.attackerLifeGained > 0) {
+                newLife += outcome.attackerLifeGained;
+                log.push(`${p.name} gains ${outcome.attackerLifeGained} life from Lifelink.`);
+            }
+        }
+
+        if (p.id === defenderPlayerId) {
+            if (damageToDefender > 0) {
+                newLife -= damageToDefender;
+                log.push(`${p.name} takes ${damageToDefender} damage. Life: ${newLife}`);
+            }
+
+            if (outcome.defenderLifeGained > 0) {
+                newLife += outcome.defenderLifeGained;
+                log.push(`${p.name} gains ${outcome.defenderLifeGained} life from Lifelink.`);
+            }
+        }
+
+        if (p.id === attackerPlayerId) {
+            // Award gold for kills
+            newGold += killGold;
+
+            // Award gold for damage dealt to opponent (1 gold per damage point)
+            if (damageToDefender > 0) {
+                newGold += damageToDefender;
+                log.push(`🪙 ${p.name} earns ${damageToDefender} gold from combat damage!`);
+            }
+        }
+
+        return newLife === p.life && newGold === p.gold ? p : { ...p, life: newLife, gold: newGold };
+    });
+
+    // Only creatures that were dealt damage are replaced.
+    const damagedPlayers = mapCards(newPlayers, card => {
+        const damageTaken = damageByCard[card.id] || 0;
+        return damageTaken > 0 ? { ...card, damageTaken: card.damageTaken + damageTaken } : card;
+    });
+
+    // Process deaths - check for shield counters
+    const finalPlayers = damagedPlayers.map(p => {
+        if (!p.battlefield.some(c => deathIndex[c.id])) return p;
+
+        const actualDeadCards: Card[] = [];
+        const savedByShieldCards: Card[] = [];
+
+        p.battlefield.forEach(c => {
+            if (deathIndex[c.id]) {
+                // Creature would die - check for shield counter
+                if (c.shieldCounters > 0) {
+                    // Shield counter saves it - remove one shield counter
+                    savedByShieldCards.push({ ...c, shieldCounters: c.shieldCounters - 1 });
+                    log.push(`🛡️ ${p.name}'s ${c.name} is saved by a shield counter!`);
+                } else {
+                    // No shield counter - creature dies
+                    actualDeadCards.push(c);
+                    log.push(`${p.name}'s ${c.name} dies.`);
+                }
+            }
+        });
+
+        const survivingCards = p.battlefield.filter(c => !deathIndex[c.id]);
+
+        return {
+            ...p,
+            battlefield: [...survivingCards, ...savedByShieldCards],
+            graveyard: [...p.graveyard, ...actualDeadCards]
+        };
+    });
+
+    return { players: finalPlayers, log, damageToDefender, killGold };
+};
+
+// A player loses when their army is wiped out or their life total hits 0.
+export const findWinner = (players: Player[]): string | null => {
+    if (players.length < 2) return null;
+    const [p1, p2] = players;
+    const p1Lost = p1.battlefield.length === 0 || p1.life <= 0;
+    const p2Lost = p2.battlefield.length === 0 || p2.life <= 0;
+    if (p1Lost) return p2.id;
+    if (p2Lost) return p1.id;
+    return null;
+};
+
+export const awardVictory = (players: Player[], winnerId: string): Player[] =>
+    patchPlayer(players, winnerId, p => ({ ...p, gold: p.gold + VICTORY_GOLD_REWARD }));
+
+export interface ShopItem {
+    id: string;
+    cost: number;
+    category: 'quick' | 'premium';
+    priority: number;
+}
+
+export const AI_SHOP_ITEMS: ShopItem[] = [
+    { id: 'plus_counter', cost: 24, category: 'quick', priority: 3 },
+    { id: 'life_gain', cost: 32, category: 'quick', priority: 2 },
+    { id: 'Flying', cost: 56, category: 'premium', priority: 5 },
+    { id: 'Vigilance', cost: 52, category: 'premium', priority: 4 },
+    { id: 'Trample', cost: 60, category: 'premium', priority: 5 },
+    { id: 'Lifelink', cost: 60, category: 'premium', priority: 6 },
+    { id: 'minus_counter', cost: 64, category: 'quick', priority: 7 },
+    { id: 'Deathtouch', cost: 64, category: 'premium', priority: 6 },
+    { id: 'First Strike', cost: 68, category: 'premium', priority: 5 },
+    { id: 'Double Strike', cost: 72, category: 'premium', priority: 8 },
+    { id: 'spawn_creature', cost: 80, category: 'quick', priority: 4 },
+    { id: 'shield_counter', cost: 85, category: 'premium', priority: 7 }
+];
+
+export const GRANTABLE_KEYWORDS = ['Flying', 'Trample', 'Deathtouch', 'First Strike', 'Lifelink', 'Vigilance', 'Double Strike'];
+
+export const pickAIShopItem = (player: Player, rng: Rng): ShopItem | null => {
+    // Filter affordable items
+    const affordable = AI_SHOP_ITEMS.filter(item => {
+        if (item.cost > player.gold) return false;
+        if (item.id === 'spawn_creature' && player.battlefield.length >= MAX_BATTLEFIELD_SIZE) return false;
+        return true;
+    });
+    if (affordable.length === 0) return null;
+
+    // AI strategy: Prefer higher priority items, but add some randomness
+    const sorted = [...affordable].sort((a, b) => b.priority - a.priority);
+
+    // 70% chance to pick top priority, 30% chance to pick any affordable
+    return rng.next() < 0.7
+        ? sorted[0]
+        : sorted[rng.int(sorted.length)];
+};
+
+// Apply an AI purchase for `playerId`. Gold is always deducted, even when the item finds no target.
+export const applyAIShopItem = (
+    players: Player[],
+    playerId: string,
+    item: ShopItem,
+    rng: Rng
+): { players: Player[]; message: string | null } => {
+    const buyer = players.find(p => p.id === playerId);
+    const opponentId = players.find(p => p.id !== playerId)?.id;
+    if (!buyer) return { players, message: null };
+
+    let updatedPlayers = players;
+    let message: string | null = null;
+
+    if (item.id === 'spawn_creature') {
+        // Spawn a random creature that matches color identity
+        const randomCard = rng.pick(getLegalCards(buyer.colorIdentity)) || CARD_POOL[0];
+        const newCreature = summonCreature(randomCard, playerId, rng);
+        updatedPlayers = players.map(p => p.id !== playerId ? p : { ...p, battlefield: [...p.battlefield, newCreature] });
+        message = `🤖 AI summoned ${newCreature.name}!`;
+    } else if (item.id === 'plus_counter') {
+        if (buyer.battlefield.length > 0) {
+            const randomCreature = rng.pick(buyer.battlefield)!;
+            updatedPlayers = patchCard(players, randomCreature.id, c => ({ ...c, plusOneCounters: c.plusOneCounters + 1 }));
+            message = `🤖 AI granted +1/+1 counter to ${randomCreature.name}!`;
+        }
+    } else if (item.id === 'minus_counter') {
+        const targetCreatures = players.find(p => p.id === opponentId)?.battlefield || [];
+        if (targetCreatures.length > 0) {
+            const randomCreature = rng.pick(targetCreatures)!;
+            updatedPlayers = patchCard(players, randomCreature.id, c => ({ ...c, minusOneCounters: c.minusOneCounters + 1 }))
+                .map(p => p.id !== opponentId || p.battlefield.every(c => getCardStats(c).toughness > 0)
+                    ? p
+                    : { ...p, battlefield: p.battlefield.filter(c => getCardStats(c).toughness > 0) });
+            message = `🤖 AI placed -1/-1 counter on your ${randomCreature.name}!`;
+        }
+    } else if (item.id === 'life_gain') {
+        updatedPlayers = patchPlayer(players, playerId, p => ({ ...p, life: p.life + 2 }));
+        message = `🤖 AI gained 2 life!`;
+    } else if (item.id === 'shield_counter') {
+        if (buyer.battlefield.length > 0) {
+            const randomCreature = rng.pick(buyer.battlefield)!;
+            updatedPlayers = patchCard(players, randomCreature.id, c => ({ ...c, shieldCounters: c.shieldCounters + 1 }));
+            message = `🤖 AI granted shield counter to ${randomCreature.name}!`;
+        }
+    } else if (GRANTABLE_KEYWORDS.includes(item.id)) {
+        const eligibleCreatures = buyer.battlefield.filter(c => !hasKeyword(c, item.id as KeywordName));
+        if (eligibleCreatures.length > 0) {
+            const randomCreature = rng.pick(eligibleCreatures)!;
+            updatedPlayers = patchCard(players, randomCreature.id, c => ({ ...c, keywords: [...c.keywords, item.id] }));
+            message = `🤖 AI granted ${item.id} to ${randomCreature.name}!`;
+        }
+    }
+
+    // Deduct gold from the buyer
+    return {
+        players: patchPlayer(updatedPlayers, playerId, p => ({ ...p, gold: p.gold - item.cost })),
+        message
+    };
+};
+
+// Gamble Spawn: the gambler earns 0-200 gold but the opponent gets a random creature.
+// Returns null when the opponent's battlefield is already full.
+export const gambleSpawn = (
+    players: Player[],
+    gamblerId: string,
+    rng: Rng
+): { players: Player[]; creature: Card; goldEarned: number } | null => {
+    const opponent = players.find(p => p.id !== gamblerId);
+    if (!opponent || opponent.battlefield.length >= MAX_BATTLEFIELD_SIZE) return null;
+
+    // Spawn a creature for opponent with summoning sickness
+    const randomCard = rng.pick(CARD_POOL)!;
+    const creature = summonCreature(randomCard, opponent.id, rng);
+
+    // Random gold between 0 and 200
+    const goldEarned = rng.int(201);
+
+    return {
+        players: players.map(p => {
+            if (p.id === opponent.id) return { ...p, battlefield: [...p.battlefield, creature] };
+            if (p.id === gamblerId) return { ...p, gold: p.gold + goldEarned };
+            return p;
+        }),
+        creature,
+        goldEarned
+    };
+};
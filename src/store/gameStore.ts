@@ -1,88 +1,100 @@
 import { create } from 'zustand';
-import type { GameState, Player, Phase, CombatPhaseStep, Card, CombatOutcome, DamageEvent } from '../types';
-
-const INITIAL_LIFE = 40;
-const VICTORY_GOLD_REWARD = 50;
-
-// Card Pool - ~20 varied creatures
-const CARD_POOL: Omit<Card, 'id' | 'controllerId' | 'ownerId' | 'tapped' | 'damageTaken' | 'plusOneCounters' | 'minusOneCounters' | 'summoningSickness' | 'shieldCounters'>[] = [
-    { name: "Serra Angel", manaCost: "{3}{W}{W}", typeLine: "Creature — Angel", oracleText: "Flying, Vigilance", power: "4", toughness: "4", colors: ["W"], keywords: ["Flying", "Vigilance"], imageUrl: "https://api.scryfall.com/cards/named?exact=Serra+Angel&format=image&version=normal" },
-    { name: "Shivan Dragon", manaCost: "{4}{R}{R}", typeLine: "Creature — Dragon", oracleText: "Flying", power: "5", toughness: "5", colors: ["R"], keywords: ["Flying"], imageUrl: "https://api.scryfall.com/cards/named?exact=Shivan+Dragon&format=image&version=normal" },
-    { name: "Elite Vanguard", manaCost: "{W}", typeLine: "Creature — Human Soldier", oracleText: "", power: "2", toughness: "1", colors: ["W"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Elite+Vanguard&format=image&version=normal" },
-    { name: "Goblin Piker", manaCost: "{1}{R}", typeLine: "Creature — Goblin", oracleText: "", power: "2", toughness: "1", colors: ["R"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Goblin+Piker&format=image&version=normal" },
-    { name: "Garruk's Companion", manaCost: "{G}{G}", typeLine: "Creature — Beast", oracleText: "Trample", power: "3", toughness: "2", colors: ["G"], keywords: ["Trample"], imageUrl: "https://api.scryfall.com/cards/named?exact=Garruk%27s+Companion&format=image&version=normal" },
-    { name: "Vampire Nighthawk", manaCost: "{1}{B}{B}", typeLine: "Creature — Vampire Shaman", oracleText: "Flying, Deathtouch, Lifelink", power: "2", toughness: "3", colors: ["B"], keywords: ["Flying", "Deathtouch", "Lifelink"], imageUrl: "https://api.scryfall.com/cards/named?exact=Vampire+Nighthawk&format=image&version=normal" },
-    { name: "Giant Spider", manaCost: "{3}{G}", typeLine: "Creature — Spider", oracleText: "Reach", power: "2", toughness: "4", colors: ["G"], keywords: ["Reach"], imageUrl: "https://api.scryfall.com/cards/named?exact=Giant+Spider&format=image&version=normal" },
-    { name: "Llanowar Elves", manaCost: "{G}", typeLine: "Creature — Elf Druid", oracleText: "", power: "1", toughness: "1", colors: ["G"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Llanowar+Elves&format=image&version=normal" },
-    { name: "Air Elemental", manaCost: "{3}{U}{U}", typeLine: "Creature — Elemental", oracleText: "Flying", power: "4", toughness: "4", colors: ["U"], keywords: ["Flying"], imageUrl: "https://api.scryfall.com/cards/named?exact=Air+Elemental&format=image&version=normal" },
-    { name: "Hypnotic Specter", manaCost: "{1}{B}{B}", typeLine: "Creature — Specter", oracleText: "Flying", power: "2", toughness: "2", colors: ["B"], keywords: ["Flying"], imageUrl: "https://api.scryfall.com/cards/named?exact=Hypnotic+Specter&format=image&version=normal" },
-    { name: "Craw Wurm", manaCost: "{4}{G}{G}", typeLine: "Creature — Wurm", oracleText: "", power: "6", toughness: "4", colors: ["G"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Craw+Wurm&format=image&version=normal" },
-    { name: "Savannah Lions", manaCost: "{W}", typeLine: "Creature — Cat", oracleText: "", power: "2", toughness: "1", colors: ["W"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Savannah+Lions&format=image&version=normal" },
-    { name: "Woolly Thoctar", manaCost: "{R}{G}{W}", typeLine: "Creature — Beast", oracleText: "", power: "5", toughness: "4", colors: ["R", "G", "W"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Woolly+Thoctar&format=image&version=normal" },
-    { name: "Storm Crow", manaCost: "{1}{U}", typeLine: "Creature — Bird", oracleText: "Flying", power: "1", toughness: "2", colors: ["U"], keywords: ["Flying"], imageUrl: "https://api.scryfall.com/cards/named?exact=Storm+Crow&format=image&version=normal" },
-    { name: "Dark Confidant", manaCost: "{1}{B}", typeLine: "Creature — Human Wizard", oracleText: "", power: "2", toughness: "1", colors: ["B"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Dark+Confidant&format=image&version=normal" },
-    { name: "Baneslayer Angel", manaCost: "{3}{W}{W}", typeLine: "Creature — Angel", oracleText: "Flying, First Strike, Lifelink", power: "5", toughness: "5", colors: ["W"], keywords: ["Flying", "First Strike", "Lifelink"], imageUrl: "https://api.scryfall.com/cards/named?exact=Baneslayer+Angel&format=image&version=normal" },
-    { name: "Stoneforge Mystic", manaCost: "{1}{W}", typeLine: "Creature — Kor Artificer", oracleText: "", power: "1", toughness: "2", colors: ["W"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Stoneforge+Mystic&format=image&version=normal" },
-    { name: "Gravecrawler", manaCost: "{B}", typeLine: "Creature — Zombie", oracleText: "", power: "2", toughness: "1", colors: ["B"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Gravecrawler&format=image&version=normal" },
-    { name: "Diregraf Ghoul", manaCost: "{B}", typeLine: "Creature — Zombie", oracleText: "", power: "2", toughness: "2", colors: ["B"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Diregraf+Ghoul&format=image&version=normal" },
-    { name: "Gray Merchant of Asphodel", manaCost: "{3}{B}{B}", typeLine: "Creature — Zombie Cleric", oracleText: "", power: "2", toughness: "4", colors: ["B"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Gray+Merchant+of+Asphodel&format=image&version=normal" },
-    { name: "Liliana's Reaver", manaCost: "{2}{B}{B}", typeLine: "Creature — Zombie", oracleText: "Deathtouch", power: "4", toughness: "3", colors: ["B"], keywords: ["Deathtouch"], imageUrl: "https://api.scryfall.com/cards/named?exact=Liliana%27s+Reaver&format=image&version=normal" },
-    { name: "Soul Warden", manaCost: "{W}", typeLine: "Creature — Human Cleric", oracleText: "", power: "1", toughness: "1", colors: ["W"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Soul+Warden&format=image&version=normal" },
-    { name: "Grand Abolisher", manaCost: "{W}{W}", typeLine: "Creature — Human Cleric", oracleText: "", power: "2", toughness: "2", colors: ["W"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Grand+Abolisher&format=image&version=normal" },
-    { name: "Thalia, Guardian of Thraben", manaCost: "{1}{W}", typeLine: "Legendary Creature — Human Soldier", oracleText: "First Strike", power: "2", toughness: "1", colors: ["W"], keywords: ["First Strike"], imageUrl: "https://api.scryfall.com/cards/named?exact=Thalia%2C+Guardian+of+Thraben&format=image&version=normal" },
-    { name: "Olivia Voldaren", manaCost: "{2}{B}{R}", typeLine: "Legendary Creature — Vampire", oracleText: "Flying", power: "3", toughness: "3", colors: ["B", "R"], keywords: ["Flying"], imageUrl: "https://api.scryfall.com/cards/named?exact=Olivia+Voldaren&format=image&version=normal" },
-    { name: "Aurelia, the Warleader", manaCost: "{2}{R}{R}{W}{W}", typeLine: "Legendary Creature — Angel", oracleText: "Flying, Vigilance, Haste", power: "3", toughness: "4", colors: ["R", "W"], keywords: ["Flying", "Vigilance", "Haste"], imageUrl: "https://api.scryfall.com/cards/named?exact=Aurelia%2C+the+Warleader&format=image&version=normal" },
-    { name: "Liliana's Standard Bearer", manaCost: "{2}{B}", typeLine: "Creature — Zombie Knight", oracleText: "", power: "3", toughness: "1", colors: ["B"], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Liliana%27s+Standard+Bearer&format=image&version=normal" },
-    { name: "Steel Overseer", manaCost: "{2}", typeLine: "Artifact Creature — Construct", oracleText: "", power: "1", toughness: "1", colors: [], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Steel+Overseer&format=image&version=normal" },
-    { name: "Solemn Simulacrum", manaCost: "{4}", typeLine: "Artifact Creature — Golem", oracleText: "", power: "2", toughness: "2", colors: [], keywords: [], imageUrl: "https://api.scryfall.com/cards/named?exact=Solemn+Simulacrum&format=image&version=normal" }
-].filter(c => c.typeLine.includes("Creature"));
-
-const COMMANDER_POOL: Omit<Card, 'id' | 'controllerId' | 'ownerId' | 'tapped' | 'damageTaken' | 'plusOneCounters' | 'minusOneCounters' | 'summoningSickness' | 'shieldCounters'>[] = [
-    { name: "Aurelia, the Warleader", manaCost: "{2}{R}{R}{W}{W}", typeLine: "Legendary Creature — Angel", oracleText: "Flying, Vigilance, Haste", power: "3", toughness: "4", colors: ["R", "W"], keywords: ["Flying", "Vigilance", "Haste"], imageUrl: "https://api.scryfall.com/cards/named?exact=Aurelia%2C+the+Warleader&format=image&version=normal" },
-    { name: "Olivia Voldaren", manaCost: "{2}{B}{R}", typeLine: "Legendary Creature — Vampire", oracleText: "Flying", power: "3", toughness: "3", colors: ["B", "R"], keywords: ["Flying"], imageUrl: "https://api.scryfall.com/cards/named?exact=Olivia+Voldaren&format=image&version=normal" },
-    { name: "Questing Beast", manaCost: "{2}{G}{G}", typeLine: "Legendary Creature — Beast", oracleText: "Vigilance, Deathtouch, Haste", power: "4", toughness: "4", colors: ["G"], keywords: ["Vigilance", "Deathtouch", "Haste"], imageUrl: "https://api.scryfall.com/cards/named?exact=Questing+Beast&format=image&version=normal" },
-    { name: "Talrand, Sky Summoner", manaCost: "{2}{U}{U}", typeLine: "Legendary Creature — Merfolk Wizard", oracleText: "Flying", power: "2", toughness: "2", colors: ["U"], keywords: ["Flying"], imageUrl: "https://api.scryfall.com/cards/named?exact=Talrand%2C+Sky+Summoner&format=image&version=normal" },
-    { name: "Thalia, Guardian of Thraben", manaCost: "{1}{W}", typeLine: "Legendary Creature — Human Soldier", oracleText: "First Strike", power: "2", toughness: "1", colors: ["W"], keywords: ["First Strike"], imageUrl: "https://api.scryfall.com/cards/named?exact=Thalia%2C+Guardian+of+Thraben&format=image&version=normal" }
-];
+import type { StateCreator } from 'zustand';
+import type { GameState, Phase, CombatPhaseStep, Card, CombatOutcome, DamageEvent } from '../types';
+import { buildCombatBoard, emptyCombatOutcome } from './combatLogic';
+import { liveCombat } from './incrementalCombat';
+import { DEFAULT_LOG_CAPACITY, appendLog, createGameLog, setLogArchiving } from './gameLog';
+import { indexCards, patchCard, patchPlayer } from './cardTable';
+import { canBlock, getCardStats, hasKeyword } from './cardStats';
+import { CARD_POOL, getLegalCards } from './cards';
+import { createEvaluationService } from './evaluation';
+import { profiler } from './profiler';
+import { startTurbo } from '../sim/turbo';
+import type { TurboCommit } from '../sim/turbo';
+import {
+    AI_ATTACK_OPTIONS, AI_BLOCK_OPTIONS, GOLD_PER_KILL, MAX_BATTLEFIELD_SIZE, MAX_GAMBLES_PER_GAME, VICTORY_GOLD_REWARD,
+    applyAIShopItem, applyCombatOutcome, beginTurn, createBattle, createPlayer, gambleSpawn, pickAIShopItem, summonCreature, tapAttackers
+} from './gameRules';
+import { createRng, randomSeed, restoreRng } from './rng';
+import { loadQuizBank } from '../quiz/bankLoader';
+import { dealScenario, drawScenario } from '../quiz/quizBank';
+import type { Rng } from './rng';
+import { createSessionHistory } from '../session/snapshots';
+import type { SessionState, SnapshotInfo } from '../session/snapshots';
+import { createIndexedDbSnapshotStore } from '../session/indexedDbStore';
+
+const initialRng = createRng(randomSeed());
+
+// AI planning runs in a worker. Only one decision is in flight at a time; starting another one, or
+// any change to the battlefield or the declared attackers, cancels it. A plan cancelled because the
+// board changed under it (the AI's own shop purchase, say) is made again from the new board if the
+// decision is still due; one cancelled for any other reason (undo, turbo) is dropped.
+const evaluation = createEvaluationService();
+let planning: AbortController | null = null;
+const BOARD_CHANGED = 'board changed';
+// The AI plans with the simulator's search caps, so a seed replays the same decisions anywhere. The
+// clock is only a safety net against a board the caps don't tame; normal boards finish well inside it.
+const AI_SAFETY_BUDGET_MS = 1000;
+
+const beginPlanning = () => {
+    planning?.abort();
+    planning = new AbortController();
+    return planning.signal;
+};
 
-const createPlayer = (id: string, name: string): Player => {
-    // Default to a random commander for initial state
-    const randomComm = COMMANDER_POOL[Math.floor(Math.random() * COMMANDER_POOL.length)];
-    const commCard = {
-        ...randomComm,
-        id: `${id}-commander`,
-        controllerId: id,
-        ownerId: id,
-        tapped: false,
-        damageTaken: 0,
-        plusOneCounters: 0,
-        minusOneCounters: 0,
-        summoningSickness: false,
-        shieldCounters: 0
-    };
+const cancelPlanning = (reason?: string) => {
+    planning?.abort(reason);
+    planning = null;
+};
 
-    return {
-        id,
-        name,
-        life: INITIAL_LIFE,
-        commander: commCard,
-        colorIdentity: randomComm.colors,
-        commanderDamage: {},
-        poisonCounters: 0,
-        library: [],
-        hand: [],
-        graveyard: [],
-        exile: [],
-        commandZone: [commCard],
-        battlefield: [],
-        gold: 0,
-    };
+// The running fast-forward, if any (see startTurbo), and what it took off the board, for stopping
+// before it has committed a turn.
+let turboRun: { stop: () => void } | null = null;
+let turboResume: Pick<GameStore, 'phase' | 'combatStep' | 'attackers' | 'blockers' | 'showQuiz' | 'pendingOutcome'> | null = null;
+
+// Checkpoints of the battle at each decision Player 1 makes, for undo and for surviving a reload;
+// saved to IndexedDB a moment after each one, when the browser has it (see session/snapshots.ts).
+const sessionHistory = createSessionHistory({ store: typeof indexedDB === 'undefined' ? null : createIndexedDbSnapshotStore() });
+const SESSION_SAVE_DELAY_MS = 500;
+let sessionSave: ReturnType<typeof setTimeout> | null = null;
+let restoringSnapshot = false;
+
+const scheduleSessionSave = () => {
+    if (sessionSave) clearTimeout(sessionSave);
+    sessionSave = setTimeout(() => {
+        sessionSave = null;
+        sessionHistory.save().catch(() => { }); // private windows and full disks just go without
+    }, SESSION_SAVE_DELAY_MS);
 };
 
+// Log messages written while a batch is open reach the store in one update when it closes.
+let logBatch: string[] | null = null;
+
+const batchLog = <A extends unknown[], R>(action: (...args: A) => R) => (...args: A): R => {
+    if (logBatch) return action(...args);
+    logBatch = [];
+    try {
+        return action(...args);
+    } finally {
+        const messages = logBatch;
+        logBatch = null;
+        if (messages.length > 0) useGameStore.setState(state => ({ log: profiler.section('appendLog', () => appendLog(state.log, messages)) }));
+    }
+};
+
+// Whether the battle is still waiting on the AI's blocks against `activePlayerId`'s attack, or on its attacks.
+const awaitsOpponentBlocks = (state: GameStore, activePlayerId: string) =>
+    !state.turbo && !state.winner && state.phase === 'combat' && state.combatStep === 'declareBlockers'
+    && state.activePlayerId === activePlayerId && state.attackers.length > 0 && Object.keys(state.blockers).length === 0;
+
+const awaitsOpponentAttacks = (state: GameStore) =>
+    !state.turbo && !state.winner && state.phase === 'combat' && state.combatStep === 'declareAttackers'
+    && state.activePlayerId === 'player2' && state.attackers.length === 0;
+
 interface GameStore extends GameState {
     resolveCombat: () => void;
-    shuffleBoard: () => void;
-    performOpponentBlocks: () => void;
+    shuffleBoard: (seed?: number) => void;
+    performOpponentBlocks: () => Promise<void>;
     getCombatHints: () => string[];
     combatStats: {
         damageDealt: number;
@@ -94,13 +106,48 @@ interface GameStore extends GameState {
     closeStartPrompt: () => void;
     enableAdminMode: () => void;
     isAdminMode: boolean;
+    // Source of every random decision and card id in the current battle; `seed` replays it.
+    rng: Rng;
+    seed: number;
+    // A d20 from the battle's rng, for the roll-off that decides who attacks first.
+    rollD20: () => number;
+    // Seed of the next New Battle, drawn in advance so the art of that board can be preloaded.
+    nextSeed: number;
+    // Fast-forward: the AI plays both seats with no timers, committing to the store every few turns.
+    turbo: boolean;
+    startTurbo: () => void;
+    stopTurbo: () => void;
+    // Deals a fresh battle straight into the combat damage quiz of a pre-solved bank scenario.
+    startQuizDrill: (level: number) => void;
+    // Checkpoints of this battle, oldest first, and the one the board was last at.
+    snapshots: SnapshotInfo[];
+    currentSnapshot: number | null;
+    restoreSnapshot: (id: number) => void;
+    // Keeps the entries that leave the log's ring, so the downloaded log covers the whole battle.
+    keepFullLog: boolean;
+    setKeepFullLog: (keep: boolean) => void;
 }
 
-export const useGameStore = create<GameStore>((set, get) => ({
-    players: [
-        createPlayer('player1', 'Player 1'),
-        createPlayer('player2', 'Player 2'),
-    ],
+// Every update that replaces `players` re-indexes them into `board`, reusing what didn't change.
+const withCardTable = (config: StateCreator<GameStore>): StateCreator<GameStore> => (set, get, api) => {
+    const indexed = ((partial: GameStore | Partial<GameStore> | ((state: GameStore) => GameStore | Partial<GameStore>), replace?: boolean) =>
+        set(state => {
+            const next = typeof partial === 'function' ? partial(state) : partial;
+            if (!next.players || next.players === state.players) return next;
+            return { ...next, board: profiler.section('indexCards', () => indexCards(next.players!, state.board)) };
+        }, replace as false)) as typeof set;
+    api.setState = indexed;
+    return config(indexed, get, api);
+};
+
+const initialPlayers = [
+    createPlayer('player1', 'Player 1', initialRng),
+    createPlayer('player2', 'Player 2', initialRng),
+];
+
+export const useGameStore = create<GameStore>()(withCardTable((set, get) => ({
+    players: initialPlayers,
+    board: indexCards(initialPlayers),
     activePlayerId: 'player1',
     priorityPlayerId: 'player1',
     phase: 'main1',
@@ -113,7 +160,7 @@ export const useGameStore = create<GameStore>((set, get) => ({
     combatStats: { damageDealt: 0, damageBlocked: 0, creaturesLost: 0 },
     lastCombatSummary: null,
     showSummary: false,
-    log: ["Welcome to the Battle Simulator!", "Click 'New Battle' to start."],
+    log: createGameLog(["Welcome to the Battle Simulator!", "Click 'New Battle' to start."]),
     quizMode: true, // Always on
     showQuiz: false,
     pendingOutcome: null,
@@ -127,6 +174,13 @@ export const useGameStore = create<GameStore>((set, get) => ({
     gambleCount: 0,
     penaltyNotice: null,
     isAdminMode: false,
+    rng: initialRng,
+    seed: initialRng.seed,
+    nextSeed: randomSeed(),
+    turbo: false,
+    snapshots: [],
+    currentSnapshot: null,
+    keepFullLog: false,
 
     enableAdminMode: () => set(state => ({
         isAdminMode: true,
@@ -135,13 +189,14 @@ export const useGameStore = create<GameStore>((set, get) => ({
         )
     })),
     closeStartPrompt: () => set({ showStartPrompt: false }),
+    rollD20: () => 1 + get().rng.int(20),
 
     startGame: (startingPlayerId: 'player1' | 'player2' | 'random') => {
-        const { addLog, players } = get();
+        const { addLog, players, rng } = get();
 
         let actualStarter = startingPlayerId;
         if (startingPlayerId === 'random') {
-            actualStarter = Math.random() > 0.5 ? 'player1' : 'player2';
+            actualStarter = rng.next() > 0.5 ? 'player1' : 'player2';
         }
 
         const starterName = players.find(p => p.id === actualStarter)?.name || actualStarter;
@@ -166,7 +221,17 @@ export const useGameStore = create<GameStore>((set, get) => ({
     toggleQuizMode: () => set(state => ({ quizMode: !state.quizMode })),
 
     closeQuiz: () => set({ showQuiz: false, pendingOutcome: null }),
-    cancelQuiz: () => set({ showQuiz: false, pendingOutcome: null, combatStep: 'declareBlockers' }),
+    // Back to the blocking checkpoint of this combat with the blocks as declared, so they can be revised.
+    cancelQuiz: () => {
+        const { blockers, turnCount, activePlayerId, restoreSnapshot } = get();
+        const checkpoint = sessionHistory.latest();
+        if (checkpoint?.combatStep === 'declareBlockers' && checkpoint.turnCount === turnCount && checkpoint.activePlayerId === activePlayerId) {
+            restoreSnapshot(checkpoint.id);
+            set({ blockers });
+            return;
+        }
+        set({ showQuiz: false, pendingOutcome: null, combatStep: 'declareBlockers' });
+    },
     closeSummary: () => {
         set({ showSummary: false, lastCombatSummary: null });
         // Always advance past the combatDamage step after summary is dismissed
@@ -179,18 +244,11 @@ export const useGameStore = create<GameStore>((set, get) => ({
         }, 300);
     },
 
-    submitQuiz: (userPredictions, _userTrample, userDamageGuesses) => {
+    submitQuiz: profiler.measure('submitQuiz', (userPredictions, _userTrample, userDamageGuesses) => {
         const { pendingOutcome, resolveCombat, addLog } = get();
         if (!pendingOutcome) return;
 
-        const getCardName = (id: string) => {
-            const players = get().players;
-            for (const p of players) {
-                const c = p.battlefield.find(card => card.id === id);
-                if (c) return c.name;
-            }
-            return "Unknown";
-        };
+        const getCardName = (id: string) => get().board.cards[id]?.name || "Unknown";
 
         const attackersCount = get().attackers.length;
         if (attackersCount === 0) {
@@ -203,10 +261,9 @@ export const useGameStore = create<GameStore>((set, get) => ({
         let correctCount = 0;
         const totalChecked = Object.keys(userPredictions).length;
 
-        // The actual results are in pendingOutcome.deaths
-        // A card dies if it's in the deaths array.
+        // Graded against the outcome's per-card indexes: one lookup per card.
         Object.entries(userPredictions).forEach(([cardId, prediction]) => {
-            const isDead = pendingOutcome.deaths.includes(cardId);
+            const isDead = !!pendingOutcome.deathIndex[cardId];
             const actualOutcome = isDead ? 'Dies' : 'Survives';
             if (prediction === actualOutcome) {
                 correctCount++;
@@ -219,9 +276,7 @@ export const useGameStore = create<GameStore>((set, get) => ({
         let damageGoldEarned = 0;
         if (userDamageGuesses) {
             Object.entries(userDamageGuesses).forEach(([cardId, guess]) => {
-                const actualDamage = pendingOutcome.damageEvents
-                    .filter(e => e.targetId === cardId)
-                    .reduce((sum, e) => sum + e.damage, 0);
+                const actualDamage = pendingOutcome.damageByCard[cardId] || 0;
 
                 if (guess === actualDamage) {
                     damageGoldEarned += 1;
@@ -254,11 +309,11 @@ export const useGameStore = create<GameStore>((set, get) => ({
                 }
                 if (p.id === 'player2' && incorrectCount > 0) {
                     // Add +1/+1 counters to random opponent creatures
-                    const availableCreatures = p.battlefield.filter(c => !pendingOutcome.deaths.includes(c.id));
+                    const availableCreatures = p.battlefield.filter(c => !pendingOutcome.deathIndex[c.id]);
                     if (availableCreatures.length > 0) {
                         const newBattlefield = [...p.battlefield];
                         for (let i = 0; i < incorrectCount; i++) {
-                            const randomIndex = Math.floor(Math.random() * availableCreatures.length);
+                            const randomIndex = state.rng.int(availableCreatures.length);
                             const randomCreature = availableCreatures[randomIndex];
                             const cardIndex = newBattlefield.findIndex(c => c.id === randomCreature.id);
                             if (cardIndex !== -1) {
@@ -287,88 +342,27 @@ export const useGameStore = create<GameStore>((set, get) => ({
         // After quiz feedback
         resolveCombat();
         set({ showQuiz: false, pendingOutcome: null });
-    },
+    }),
 
     addLog: (message: string) => {
-        set(state => ({ log: [...state.log, message] }));
+        if (logBatch) logBatch.push(message);
+        else set(state => ({ log: appendLog(state.log, [message]) }));
     },
 
-    shuffleBoard: () => {
-        // Pick new commanders for each player
-        const shuffledCommanders = [...COMMANDER_POOL].sort(() => 0.5 - Math.random());
-        const p1CommanderRaw = shuffledCommanders[0];
-        const p2CommanderRaw = shuffledCommanders[1];
-
-        const createCommInstance = (raw: any, playerId: string) => ({
-            ...raw,
-            id: `${playerId}-commander-${Date.now()}`,
-            controllerId: playerId,
-            ownerId: playerId,
-            tapped: false,
-            damageTaken: 0,
-            plusOneCounters: 0,
-            minusOneCounters: 0,
-            summoningSickness: false,
-            shieldCounters: 0
-        });
-
-        const p1Commander = createCommInstance(p1CommanderRaw, 'player1');
-        const p2Commander = createCommInstance(p2CommanderRaw, 'player2');
-
-        // Filter CARD_POOL based on Commander colors
-        // A card is legal if all its colors are within the commander's color identity
-        // Colorless cards are always legal
-        const getLegalCards = (identity: string[]) => {
-            return CARD_POOL.filter(card => {
-                if (card.colors.length === 0) return true; // Colorless
-                return card.colors.every(c => identity.includes(c));
-            });
-        };
-
-        const p1Pool = getLegalCards(p1Commander.colors);
-        const p2Pool = getLegalCards(p2Commander.colors);
-
-        // Randomly determine how many creatures each player gets (1-5)
-        const p1Count = Math.floor(Math.random() * 5) + 1;
-        const p2Count = Math.floor(Math.random() * 5) + 1;
-
-        // Shuffle and pick from legal pools
-        const p1Cards = [...p1Pool].sort(() => 0.5 - Math.random()).slice(0, p1Count);
-        const p2Cards = [...p2Pool].sort(() => 0.5 - Math.random()).slice(0, p2Count);
-
+    shuffleBoard: (seed?: number) => {
+        turboRun?.stop();
+        turboRun = null;
+        turboResume = null;
+        sessionHistory.reset();
+        scheduleSessionSave();
         set(state => {
-            const newPlayers = state.players.map(p => {
-                const isP1 = p.id === 'player1';
-                const cards = isP1 ? p1Cards : p2Cards;
-                const commander = isP1 ? p1Commander : p2Commander;
-
-                const battlefield = cards.map((c, i) => ({
-                    ...c,
-                    id: `${p.id}-creature-${i}-${Date.now()}`,
-                    controllerId: p.id,
-                    ownerId: p.id,
-                    tapped: false,
-                    damageTaken: 0,
-                    plusOneCounters: 0,
-                    minusOneCounters: 0,
-                    summoningSickness: false,
-                    shieldCounters: 0
-                }));
-
-                return {
-                    ...p,
-                    life: INITIAL_LIFE,
-                    commander: commander,
-                    colorIdentity: commander.colors,
-                    commandZone: [commander],
-                    hand: [],
-                    graveyard: [],
-                    exile: [],
-                    battlefield
-                };
-            });
+            const rng = createRng(seed ?? state.nextSeed);
+            const newPlayers = createBattle(state.players, rng);
 
             return {
+                rng,
+                seed: rng.seed,
+                nextSeed: seed === undefined ? randomSeed() : state.nextSeed,
                 players: newPlayers,
                 phase: 'beginning',
                 combatStep: undefined,
@@ -379,19 +373,58 @@ export const useGameStore = create<GameStore>((set, get) => ({
                 winner: null,
                 showStartPrompt: true,
                 gambleCount: 0,
+                turbo: false,
                 autoBattle: true,
                 autoBattleTimeout: null,
                 showSummary: false,
                 showQuiz: false,
                 pendingOutcome: null,
                 penaltyNotice: null,
-                log: ["--- NEW BATTLE PREPARED ---", `Player 1 spawns with ${p1Count} creatures.`, `Player 2 spawns with ${p2Count} creatures.`, "Who should attack first?"]
+                snapshots: [],
+                currentSnapshot: null,
+                log: createGameLog(["--- NEW BATTLE PREPARED ---", `Player 1 spawns with ${newPlayers[0].battlefield.length} creatures.`, `Player 2 spawns with ${newPlayers[1].battlefield.length} creatures.`, "Who should attack first?"], DEFAULT_LOG_CAPACITY, state.keepFullLog)
             };
         });
     },
 
-    performOpponentBlocks: () => {
-        const { players, activePlayerId, attackers, addLog } = get();
+    startQuizDrill: (level: number) => {
+        loadQuizBank().then(bank => {
+            const scenario = drawScenario(bank, { level }, get().rng);
+            if (!scenario) {
+                get().addLog(`No level ${level} drills in the quiz bank.`);
+                return;
+            }
+            const { autoBattleTimeout } = get();
+            if (autoBattleTimeout) clearTimeout(autoBattleTimeout);
+            get().shuffleBoard();
+
+            set(state => {
+                const attackerId = state.rng.next() > 0.5 ? 'player1' : 'player2';
+                const defenderId = attackerId === 'player1' ? 'player2' : 'player1';
+                const dealt = dealScenario(bank, scenario, attackerId, defenderId, state.rng.nextId);
+                // Attacking creatures tap as they would have when declared.
+                const attackerCards = dealt.attackerCards.map(c =>
+                    dealt.attackers.includes(c.id) && !hasKeyword(c, 'Vigilance') ? { ...c, tapped: true } : c
+                );
+                return {
+                    players: state.players.map(p => ({ ...p, battlefield: p.id === attackerId ? attackerCards : dealt.defenderCards })),
+                    activePlayerId: attackerId,
+                    phase: 'combat',
+                    combatStep: 'combatDamage',
+                    attackers: dealt.attackers,
+                    blockers: dealt.blockers,
+                    showStartPrompt: false,
+                    quizMode: true,
+                    log: createGameLog(['--- QUIZ DRILL ---', `Level ${level}: ${state.players.find(p => p.id === attackerId)?.name} attacks. Call the combat!`], DEFAULT_LOG_CAPACITY, state.keepFullLog)
+                };
+            });
+            get().resolveCombat();
+        }).catch(() => get().addLog('The quiz bank could not be loaded.'));
+    },
+
+    performOpponentBlocks: profiler.measure('performOpponentBlocks', async () => {
+        const { players, activePlayerId, attackers, addLog, turbo } = get();
+        if (turbo) return;
         // Opponent is the one who is NOT active
         const defender = players.find(p => p.id !== activePlayerId);
         const attackerPlayer = players.find(p => p.id === activePlayerId);
@@ -399,53 +432,29 @@ export const useGameStore = create<GameStore>((set, get) => ({
         if (!defender || !attackerPlayer) return;
         if (attackers.length === 0) return;
 
-        const newBlockers: Record<string, string[]> = {};
-        const availableBlockers = defender.battlefield.filter(c => !c.tapped);
-        const usedBlockers = new Set<string>();
-
-        attackers.forEach(attackerId => {
-            const attacker = attackerPlayer.battlefield.find(c => c.id === attackerId);
-            if (!attacker) return;
-
-            const attPower = parseInt(attacker.power || '0') + (attacker.plusOneCounters || 0);
-            const attToughness = parseInt(attacker.toughness || '0') + (attacker.plusOneCounters || 0);
-
-            // Find best blocker
-            // Strategy: 1. Kill and Survive, 2. Kill and Trade, 3. Survive (Stall), 4. Last Resort
-            const bestBlocker = availableBlockers.find(blocker => {
-                if (usedBlockers.has(blocker.id)) return false;
-
-                // Flying Logic
-                const attFlying = attacker.keywords?.includes('Flying');
-                const blkFlying = blocker.keywords?.includes('Flying');
-                const blkReach = blocker.keywords?.includes('Reach');
-                if (attFlying && !blkFlying && !blkReach) return false;
-
-                const blkPower = parseInt(blocker.power || '0') + (blocker.plusOneCounters || 0);
-                const blkToughness = parseInt(blocker.toughness || '0') + (blocker.plusOneCounters || 0);
-                const isBlkDeathtouch = blocker.keywords?.includes('Deathtouch');
-                const isAttDeathtouch = attacker.keywords?.includes('Deathtouch');
-
-                const blockerKills = blkPower >= attToughness || (isBlkDeathtouch && blkPower > 0);
-                const blockerSurvives = blkToughness > attPower && (attPower === 0 || !isAttDeathtouch);
-
-                // Kill and Survive
-                if (blockerKills && blockerSurvives) return true;
-
-                // Survive (Stall)
-                if (blockerSurvives) return true;
-
-                // Kill and Trade
-                if (blockerKills) return true;
-
-                return false;
+        const attackerCards = attackers
+            .map(id => attackerPlayer.battlefield.find(c => c.id === id))
+            .filter((c): c is Card => !!c);
+        const signal = beginPlanning();
+        const plan = await evaluation.planBlocks(
+            { attackers, attackerPlayerId: attackerPlayer.id, defenderPlayerId: defender.id, options: { ...AI_BLOCK_OPTIONS, timeBudgetMs: AI_SAFETY_BUDGET_MS } },
+            players,
+            signal
+        );
+        if (!plan || signal.aborted) {
+            if (signal.reason === BOARD_CHANGED && awaitsOpponentBlocks(get(), activePlayerId)) return get().performOpponentBlocks();
+            return;
+        }
+        planning = null;
+        const newBlockers = plan.blockers;
+
+        attackerCards.forEach(attacker => {
+            (newBlockers[attacker.id] || []).forEach(blockerId => {
+                const blocker = defender.battlefield.find(c => c.id === blockerId);
+                if (blocker) {
+                    addLog(`${defender.name}'s ${blocker.name} blocks ${attackerPlayer.name}'s ${attacker.name}.`);
+                }
             });
-
-            if (bestBlocker) {
-                newBlockers[attackerId] = [bestBlocker.id];
-                usedBlockers.add(bestBlocker.id);
-                addLog(`${defender.name}'s ${bestBlocker.name} blocks ${attackerPlayer.name}'s ${attacker.name}.`);
-            }
         });
 
         if (Object.keys(newBlockers).length > 0) {
@@ -453,26 +462,37 @@ export const useGameStore = create<GameStore>((set, get) => ({
         } else {
             addLog(`${defender.name} declares no blocks.`);
         }
-    },
+    }),
 
     resetBlockers: () => {
         set({ blockers: {} });
         get().addLog("🛡️ Blocking assignments reset.");
     },
 
-    performOpponentAttacks: () => {
-        const { players, activePlayerId } = get();
+    performOpponentAttacks: async () => {
+        const { players, activePlayerId, turbo } = get();
         const attacker = players.find(p => p.id === activePlayerId);
-        if (!attacker || activePlayerId !== 'player2') return;
+        if (!attacker || activePlayerId !== 'player2' || turbo) return;
 
-        // Simple AI: Just attack with everyone available
-        const availableAttackers = attacker.battlefield.filter(c => !c.tapped);
-        if (availableAttackers.length === 0) {
+        const defender = players.find(p => p.id !== activePlayerId);
+        if (!defender) return;
+
+        const signal = beginPlanning();
+        const plan = await evaluation.planAttacks(
+            { attackerPlayerId: attacker.id, defenderPlayerId: defender.id, options: { ...AI_ATTACK_OPTIONS, timeBudgetMs: AI_SAFETY_BUDGET_MS } },
+            players,
+            signal
+        );
+        if (!plan || signal.aborted) {
+            if (signal.reason === BOARD_CHANGED && awaitsOpponentAttacks(get())) return get().performOpponentAttacks();
+            return;
+        }
+        planning = null;
+        if (plan.attackers.length === 0) {
             return;
         }
 
-        const attackerIds = availableAttackers.map(c => c.id);
-        set({ attackers: attackerIds });
+        set({ attackers: plan.attackers });
     },
 
     getCombatHints: () => {
@@ -483,9 +503,6 @@ export const useGameStore = create<GameStore>((set, get) => ({
         const p2 = players.find(p => p.id === 'player2');
         if (!p1 || !p2) return [];
 
-        const hasKeyword = (card: Card, kw: string) =>
-            card.keywords?.some(k => k.toLowerCase() === kw.toLowerCase());
-
         if (activePlayerId === 'player1') {
             // Player's Turn Hints
             if (combatStep === 'declareAttackers') {
@@ -537,11 +554,9 @@ export const useGameStore = create<GameStore>((set, get) => ({
 
                 // Power Disparity
                 const strongCreatures = myCreatures.filter(c => {
-                    const power = parseInt(c.power || '0');
-                    const toughness = parseInt(c.toughness || '0');
+                    const { basePower: power, baseToughness: toughness } = getCardStats(c);
                     return oppCreatures.every(opp => {
-                        const oppToughness = parseInt(opp.toughness || '0');
-                        const oppPower = parseInt(opp.power || '0');
+                        const { basePower: oppPower, baseToughness: oppToughness } = getCardStats(opp);
                         return oppToughness <= power && oppPower < toughness && !hasKeyword(opp, 'Deathtouch');
                     });
                 });
@@ -559,24 +574,11 @@ export const useGameStore = create<GameStore>((set, get) => ({
             if (combatStep === 'declareBlockers') {
                 hints.push("🛡️ Defend! Pick your blocker first, then pick the attacker to intercept.");
 
-                // Calculate incoming damage
-                let totalIncoming = 0;
-                attackers.forEach(id => {
-                    const card = p2.battlefield.find(c => c.id === id);
-                    if (card) totalIncoming += parseInt(card.power || '0');
-                });
-
-                let blockedSoFar = 0;
-                Object.keys(blockers).forEach(attId => {
-                    const attacker = p2.battlefield.find(c => c.id === attId);
-                    if (!attacker) return;
-                    const bIds = blockers[attId] || [];
-                    if (bIds.length > 0) {
-                        blockedSoFar += parseInt(attacker.power || '0');
-                    }
-                });
-
-                const leaking = totalIncoming - blockedSoFar;
+                // Damage that gets through the current blocks (trample and double strike included).
+                // Hints re-render on every click; only the blocking group that changed is re-resolved.
+                const leaking = get().calculateCombatOutcome().damageEvents
+                    .filter(e => e.type === 'toPlayer')
+                    .reduce((sum, e) => sum + e.damage, 0);
                 if (leaking > 0) {
                     hints.push(`⚠️ WARNING: You are set to take ${leaking} damage this turn unless you block!`);
                 }
@@ -585,14 +587,14 @@ export const useGameStore = create<GameStore>((set, get) => ({
                 const myDeathtouch = p1.battlefield.filter(c => !c.tapped && hasKeyword(c, 'Deathtouch'));
                 if (myDeathtouch.length > 0) {
                     const strongAttackers = attackers.map(id => p2.battlefield.find(c => c.id === id))
-                        .filter(c => c && parseInt(c.power || '0') >= 4);
+                        .filter(c => c && getCardStats(c).basePower >= 4);
                     if (strongAttackers.length > 0) {
                         hints.push("💡 Tip: Use your Deathtouch blockers to kill the highest damage attackers (4+ power).");
                     }
                 }
 
                 // Strategy Tip: Value Trades
-                const myLowToughness = p1.battlefield.filter(c => !c.tapped && parseInt(c.toughness || '0') <= 2);
+                const myLowToughness = p1.battlefield.filter(c => !c.tapped && getCardStats(c).baseToughness <= 2);
                 if (myLowToughness.length > 0 && leaking > 10) {
                     hints.push("💡 Tip: Just because a character has low defense doesn't mean it's useless - sacrificing a small creature can save your life points.");
                 }
@@ -605,8 +607,8 @@ export const useGameStore = create<GameStore>((set, get) => ({
                         bIds.forEach(blkId => {
                             const blocker = p1.battlefield.find(c => c.id === blkId);
                             if (blocker && !hasKeyword(blocker, 'First Strike') && !hasKeyword(blocker, 'Double Strike')) {
-                                const attPower = parseInt(attacker.power || '0') + (attacker.plusOneCounters || 0);
-                                const blkToughness = parseInt(blocker.toughness || '0') + (blocker.plusOneCounters || 0);
+                                const attPower = getCardStats(attacker).power;
+                                const blkToughness = getCardStats(blocker).toughness;
                                 if (attPower >= blkToughness) {
                                     const otherAttackers = attackers.find(id => {
                                         const other = p2.battlefield.find(c => c.id === id);
@@ -626,239 +628,12 @@ export const useGameStore = create<GameStore>((set, get) => ({
         return hints;
     },
 
-    calculateCombatOutcome: (): CombatOutcome => {
-        const { activePlayerId, players, attackers, blockers } = get();
-        const defenderPlayerId = players.find(p => p.id !== activePlayerId)?.id;
-        if (!defenderPlayerId) return { damageEvents: [], deaths: [], deathDescriptions: [], attackerLifeGained: 0, defenderLifeGained: 0, explanation: [] };
-
-        const attackerPlayer = players.find(p => p.id === activePlayerId)!;
-        const defenderPlayer = players.find(p => p.id === defenderPlayerId)!;
-
-        const damageEvents: DamageEvent[] = [];
-        const damageOnCard: Record<string, number> = {};
-        const hasDealtDamage = new Set<string>();
-        let attackerLifeGained = 0;
-        let defenderLifeGained = 0;
-        const deathDescriptions: string[] = [];
-        const deaths: string[] = [];
-        const explanation: string[] = [];
-
-        const allCombatants = [...attackerPlayer.battlefield, ...defenderPlayer.battlefield];
-        const getCard = (id: string) => allCombatants.find(c => c.id === id);
-
-        const hasKeyword = (card: Card, keyword: string) =>
-            card.keywords?.some(k => k.toLowerCase() === keyword.toLowerCase());
-
-        const getActualPower = (card: Card) => parseInt(card.power || '0') + (card.plusOneCounters || 0) - (card.minusOneCounters || 0);
-        const getActualToughness = (card: Card) => parseInt(card.toughness || '0') + (card.plusOneCounters || 0) - (card.minusOneCounters || 0);
-
-        const checkLethal = (cardId: string) => {
-            const card = getCard(cardId);
-            if (!card) return true;
-            const dmg = damageOnCard[cardId] || 0;
-            const tough = getActualToughness(card);
-            if (dmg >= tough) return true;
-            if (dmg > 0) {
-                return damageEvents.some(e => e.targetId === cardId && e.isDeathtouch && e.damage > 0);
-            }
-            return false;
-        };
-
-        const resolveDamageStep = (isFirstStrikeStep: boolean) => {
-            // Take a snapshot of who is dead BEFORE this step begins.
-            // Damage dealt WITHIN this step is simultaneous.
-            const deadAtStartOfStep = new Set<string>();
-            allCombatants.forEach(c => {
-                if (checkLethal(c.id)) deadAtStartOfStep.add(c.id);
-            });
-
-            // 1. Attackers Assign Damage
-            attackers.forEach(attId => {
-                const attacker = getCard(attId);
-                // If attacker died in a PREVIOUS step, it cannot deal damage.
-                if (!attacker || deadAtStartOfStep.has(attId)) return;
-
-                const isFS = hasKeyword(attacker, 'First Strike');
-                const isDS = hasKeyword(attacker, 'Double Strike');
-
-                let attackerShouldDeal = false;
-                if (isFirstStrikeStep) {
-                    if (isFS || isDS) attackerShouldDeal = true;
-                } else {
-                    if (!hasDealtDamage.has(attId) || isDS) attackerShouldDeal = true;
-                }
-
-                if (!attackerShouldDeal) return;
-
-                const bIds = blockers[attId] || [];
-                const attPower = getActualPower(attacker);
-                const isLifelink = hasKeyword(attacker, 'Lifelink');
-                const isDeathtouch = hasKeyword(attacker, 'Deathtouch');
-                const isTrample = hasKeyword(attacker, 'Trample');
-
-                if (bIds.length === 0) {
-                    // Unblocked
-                    explanation.push(`${attacker.name} deals ${attPower} damage to defender (${isFirstStrikeStep ? 'First Strike' : 'Normal'} Step).`);
-                    damageEvents.push({
-                        sourceId: attId,
-                        targetId: defenderPlayerId,
-                        damage: attPower,
-                        type: 'toPlayer',
-                        isLifelink
-                    });
-                    if (isLifelink) attackerLifeGained += attPower;
-                } else {
-                    let powerToAssign = attPower;
-                    bIds.forEach(blkId => {
-                        const blocker = getCard(blkId);
-                        // We use checkLethal (live) here because one attacker assigns damage 
-                        // to its blockers in order, and needs to know if the first is "done".
-                        if (!blocker || checkLethal(blkId)) return;
-
-                        const tough = getActualToughness(blocker);
-                        const alreadyTaken = damageOnCard[blkId] || 0;
-                        const lethalNeeded = isDeathtouch ? 1 : Math.max(0, tough - alreadyTaken);
-                        const assigned = isTrample ? Math.min(powerToAssign, lethalNeeded) : powerToAssign;
-
-                        if (assigned > 0) {
-                            explanation.push(`${attacker.name} deals ${assigned} damage to ${blocker.name} (${isFirstStrikeStep ? 'First Strike' : 'Normal'} Step).`);
-                            damageEvents.push({
-                                sourceId: attId,
-                                targetId: blkId,
-                                damage: assigned,
-                                type: 'toCreature',
-                                isLifelink,
-                                isDeathtouch
-                            });
-                            damageOnCard[blkId] = (damageOnCard[blkId] || 0) + assigned;
-                            if (isLifelink) attackerLifeGained += assigned;
-                            powerToAssign -= assigned;
-                        }
-                    });
-
-                    // Carry over Trample
-                    if (isTrample && powerToAssign > 0) {
-                        explanation.push(`${attacker.name} tramples for ${powerToAssign} damage to defender.`);
-                        damageEvents.push({
-                            sourceId: attId,
-                            targetId: defenderPlayerId,
-                            damage: powerToAssign,
-                            type: 'toPlayer',
-                            isLifelink
-                        });
-                        if (isLifelink) attackerLifeGained += powerToAssign;
-                    }
-                }
-                hasDealtDamage.add(attId);
-            });
-
-            // 2. Blockers Assign Damage
-            const blockerDamageResults: { targetId: string, damage: number, sourceId: string, isLifelink: boolean, isDeathtouch: boolean }[] = [];
-
-            Object.entries(blockers).forEach(([attId, bIds]) => {
-                bIds.forEach(blkId => {
-                    const blocker = getCard(blkId);
-                    const attacker = getCard(attId);
-                    if (!blocker || !attacker) return;
-
-                    // Blocker cannot deal damage if IT died in a previous step,
-                    // OR if its ATTACKER died in a previous step.
-                    if (deadAtStartOfStep.has(blkId)) {
-                        if (!isFirstStrikeStep && !hasDealtDamage.has(blkId)) {
-                            explanation.push(`${blocker.name} died in the First Strike step and cannot deal damage.`);
-                        }
-                        return;
-                    }
-
-                    if (deadAtStartOfStep.has(attId)) {
-                        // Attacker is already dead, blocker has nothing to hit.
-                        return;
-                    }
+    calculateCombatOutcome: profiler.measure('calculateCombatOutcome', (): CombatOutcome => {
+        const board = buildCombatBoard(get());
+        return board ? liveCombat.resolve(board) : emptyCombatOutcome();
+    }),
 
-                    const isFS = hasKeyword(blocker, 'First Strike');
-                    const isDS = hasKeyword(blocker, 'Double Strike');
-
-                    let blockerShouldDeal = false;
-                    if (isFirstStrikeStep) {
-                        if (isFS || isDS) blockerShouldDeal = true;
-                    } else {
-                        if (!hasDealtDamage.has(blkId) || isDS) blockerShouldDeal = true;
-                    }
-
-                    if (!blockerShouldDeal) return;
-
-                    const blkPower = getActualPower(blocker);
-                    const isLifelink = hasKeyword(blocker, 'Lifelink');
-                    const isDeathtouch = hasKeyword(blocker, 'Deathtouch');
-
-                    explanation.push(`${blocker.name} deals ${blkPower} damage to ${attacker.name} (${isFirstStrikeStep ? 'First Strike' : 'Normal'} Step).`);
-                    blockerDamageResults.push({
-                        sourceId: blkId,
-                        targetId: attId,
-                        damage: blkPower,
-                        isLifelink,
-                        isDeathtouch
-                    });
-                    hasDealtDamage.add(blkId);
-                });
-            });
-
-            // Commit blocker damage AFTER the loop so it is truly simultaneous
-            blockerDamageResults.forEach(res => {
-                damageEvents.push({
-                    sourceId: res.sourceId,
-                    targetId: res.targetId,
-                    damage: res.damage,
-                    type: 'toCreature',
-                    isLifelink: res.isLifelink,
-                    isDeathtouch: res.isDeathtouch
-                });
-                damageOnCard[res.targetId] = (damageOnCard[res.targetId] || 0) + res.damage;
-                if (res.isLifelink) defenderLifeGained += res.damage;
-            });
-        };
-
-        // Step 1: First Strike Step
-        resolveDamageStep(true);
-
-        // Step 2: Normal Damage Step
-        resolveDamageStep(false);
-
-        // Finalize deaths
-        allCombatants.forEach(card => {
-            // Check for deathtouch from any event targeting this card
-            const tookDeathtouch = damageEvents.some(e => e.targetId === card.id && e.isDeathtouch && e.damage > 0);
-            const tough = getActualToughness(card);
-            const dmg = damageOnCard[card.id] || 0;
-
-            if (dmg >= tough || tookDeathtouch) {
-                deaths.push(card.id);
-            }
-        });
-
-        // Generate descriptions
-        attackers.forEach(attId => {
-            const att = getCard(attId);
-            if (!att) return;
-            const bIds = blockers[attId] || [];
-
-            bIds.forEach(blkId => {
-                const blk = getCard(blkId);
-                if (!blk) return;
-
-                const attDies = deaths.includes(attId);
-                const blkDies = deaths.includes(blkId);
-
-                if (attDies && blkDies) deathDescriptions.push(`${att.name} and ${blk.name} killed each other.`);
-                else if (attDies) deathDescriptions.push(`${blk.name} killed ${att.name}.`);
-                else if (blkDies) deathDescriptions.push(`${att.name} killed ${blk.name}.`);
-            });
-        });
-
-        return { damageEvents, deaths, deathDescriptions, attackerLifeGained, defenderLifeGained, explanation };
-    },
-
-    resolveCombat: () => {
+    resolveCombat: profiler.measure('resolveCombat', batchLog(() => {
         const { combatStep, activePlayerId, players, addLog, quizMode, pendingOutcome, attackers, blockers } = get();
 
         // Safety: Only resolve combat during the combat damage step
@@ -892,7 +667,7 @@ export const useGameStore = create<GameStore>((set, get) => ({
         attackers.forEach(id => {
             const card = attackerProp?.battlefield.find(c => c.id === id);
             if (card) {
-                const pwr = parseInt(card.power || '0') + (card.plusOneCounters || 0);
+                const pwr = getCardStats(card).power;
                 incomingDmg += pwr;
                 if (blockers[id] && blockers[id].length > 0) {
                     blockedDmg += pwr; // Simplified: if blocked, we count the whole power as "contained" for the ratio
@@ -907,13 +682,12 @@ export const useGameStore = create<GameStore>((set, get) => ({
         // Count deaths per player
         const p1 = players.find(p => p.id === 'player1');
         const p2 = players.find(p => p.id === 'player2');
-        const p1Lost = p1?.battlefield.filter(c => outcome.deaths.includes(c.id)).length || 0;
-        const p2Lost = p2?.battlefield.filter(c => outcome.deaths.includes(c.id)).length || 0;
+        const p1Lost = p1?.battlefield.filter(c => outcome.deathIndex[c.id]).length || 0;
+        const p2Lost = p2?.battlefield.filter(c => outcome.deathIndex[c.id]).length || 0;
 
         // Calculate gold earned from killing opponent creatures
-        const goldPerKill = 25;
-        const goldEarned = p2Lost * goldPerKill;
-        const opponentGoldFromKills = p1Lost * goldPerKill;
+        const goldEarned = p2Lost * GOLD_PER_KILL;
+        const opponentGoldFromKills = p1Lost * GOLD_PER_KILL;
 
         set({
             lastCombatSummary: {
@@ -941,90 +715,8 @@ export const useGameStore = create<GameStore>((set, get) => ({
 
         // Apply Damage Events and award gold in single state update
         set(state => {
-            const newPlayers = state.players.map(p => {
-                let newLife = p.life;
-                let newGold = p.gold;
-
-                if (p.id === attackerPlayerId) {
-                    if (outcome.attackerLifeGained > 0) {
-                        newLife += outcome.attackerLifeGained;
-                        addLog(`${p.name} gains ${outcome.attackerLifeGained} life from Lifelink.`);
-                    }
-                }
-
-                if (p.id === defenderPlayerId) {
-                    const totalToPlayer = outcome.damageEvents
-                        .filter((e: DamageEvent) => e.targetId === defenderPlayerId && e.type === 'toPlayer')
-                        .reduce((sum: number, e: DamageEvent) => sum + e.damage, 0);
-
-                    if (totalToPlayer > 0) {
-                        newLife -= totalToPlayer;
-                        addLog(`${p.name} takes ${totalToPlayer} damage. Life: ${newLife}`);
-                    }
-
-                    if (outcome.defenderLifeGained > 0) {
-                        newLife += outcome.defenderLifeGained;
-                        addLog(`${p.name} gains ${outcome.defenderLifeGained} life from Lifelink.`);
-                    }
-                }
-
-                // Award gold for kills
-                if (p.id === 'player1' && goldEarned > 0 && activePlayerId === 'player1') {
-                    newGold += goldEarned;
-                }
-                if (p.id === 'player2' && opponentGoldFromKills > 0 && activePlayerId === 'player2') {
-                    newGold += opponentGoldFromKills;
-                }
-
-                // Award gold for damage dealt to opponent (1 gold per damage point)
-                if (p.id === attackerPlayerId) {
-                    const damageToDefender = outcome.damageEvents
-                        .filter((e: DamageEvent) => e.targetId === defenderPlayerId && e.type === 'toPlayer')
-                        .reduce((sum: number, e: DamageEvent) => sum + e.damage, 0);
-                    if (damageToDefender > 0) {
-                        newGold += damageToDefender;
-                        addLog(`🪙 ${p.name} earns ${damageToDefender} gold from combat damage!`);
-                    }
-                }
-
-                const updatedBattlefield = p.battlefield.map(card => {
-                    const damageTaken = outcome.damageEvents
-                        .filter((e: DamageEvent) => e.targetId === card.id)
-                        .reduce((sum: number, e: DamageEvent) => sum + e.damage, 0);
-                    return { ...card, damageTaken: card.damageTaken + damageTaken };
-                });
-
-                return { ...p, life: newLife, gold: newGold, battlefield: updatedBattlefield };
-            });
-
-            // Process deaths - check for shield counters
-            const finalPlayers = newPlayers.map(p => {
-                const actualDeadCards: Card[] = [];
-                const savedByShieldCards: Card[] = [];
-
-                p.battlefield.forEach(c => {
-                    if (outcome.deaths.includes(c.id)) {
-                        // Creature would die - check for shield counter
-                        if (c.shieldCounters > 0) {
-                            // Shield counter saves it - remove one shield counter
-                            savedByShieldCards.push({ ...c, shieldCounters: c.shieldCounters - 1 });
-                            addLog(`🛡️ ${p.name}'s ${c.name} is saved by a shield counter!`);
-                        } else {
-                            // No shield counter - creature dies
-                            actualDeadCards.push(c);
-                            addLog(`${p.name}'s ${c.name} dies.`);
-                        }
-                    }
-                });
-
-                const survivingCards = p.battlefield.filter(c => !outcome.deaths.includes(c.id));
-
-                return {
-                    ...p,
-                    battlefield: [...survivingCards, ...savedByShieldCards],
-                    graveyard: [...p.graveyard, ...actualDeadCards]
-                };
-            });
+            const { players: finalPlayers, log } = profiler.section('applyCombatOutcome', () => applyCombatOutcome(state.players, outcome, attackerPlayerId));
+            log.forEach(msg => addLog(msg));
 
             // CHECK FOR VICTORY - only if we have valid player data
             if (finalPlayers && finalPlayers.length >= 2) {
@@ -1064,7 +756,7 @@ export const useGameStore = create<GameStore>((set, get) => ({
 
         // Log general results
         outcome.explanation.forEach((msg: string) => addLog(msg));
-    },
+    })),
 
     setShowSkipCombatConfirmation: (show: boolean) => set({ showSkipCombatConfirmation: show }),
 
@@ -1072,11 +764,11 @@ export const useGameStore = create<GameStore>((set, get) => ({
         penaltyNotice: state.penaltyNotice ? { ...state.penaltyNotice, visible: false } : null
     })),
 
-    nextPhase: () => {
-        const { phase, combatStep, activePlayerId, players, addLog, quizMode, autoBattle, autoBattleTimeout, showQuiz } = get();
+    nextPhase: profiler.measure('nextPhase', batchLog(() => {
+        const { phase, combatStep, activePlayerId, players, addLog, quizMode, autoBattle, autoBattleTimeout, showQuiz, turbo } = get();
 
-        // Block manual phase shifts if quiz is active
-        if (showQuiz) return;
+        // Block manual phase shifts if quiz is active or turbo is driving the game
+        if (showQuiz || turbo) return;
 
         // Clear any pending auto-advances since we are moving manually or now.
         if (autoBattleTimeout) clearTimeout(autoBattleTimeout);
@@ -1125,36 +817,14 @@ export const useGameStore = create<GameStore>((set, get) => ({
                     nextCombatStep = 'end';
                 }
 
-                set(state => {
-                    const attackingPlayer = state.players.find(p => p.id === activePlayerId);
-                    if (!attackingPlayer) return state;
-
-                    const newPlayers = state.players.map(p => {
-                        if (p.id !== activePlayerId) return p;
-                        return {
-                            ...p,
-                            battlefield: p.battlefield.map(c => {
-                                const isAttacking = state.attackers.includes(c.id);
-                                const hasVigilance = c.keywords?.some(k => k.toLowerCase() === 'vigilance');
-
-                                if (isAttacking && !hasVigilance && !c.tapped) {
-                                    // Creature is attacking and doesn't have vigilance, so it taps.
-                                    return { ...c, tapped: true };
-                                }
-                                return c;
-                            })
-                        };
-                    });
-
-                    return { players: newPlayers };
-                });
+                set(state => ({ players: tapAttackers(state.players, activePlayerId, state.attackers) }));
 
                 // Inform the user about tapping/vigilance if they have attackers
                 if (attackersCount > 0) {
                     const attackingPlayer = players.find(p => p.id === activePlayerId);
                     get().attackers.forEach(id => {
                         const card = attackingPlayer?.battlefield.find(c => c.id === id);
-                        if (card && card.keywords?.some(k => k.toLowerCase() === 'vigilance')) {
+                        if (card && hasKeyword(card, 'Vigilance')) {
                             addLog(`${card.name} attacks without tapping (Vigilance).`);
                         }
                     });
@@ -1211,20 +881,7 @@ export const useGameStore = create<GameStore>((set, get) => ({
                 }, 800);
             }
 
-            set(state => ({
-                players: state.players.map(p => ({
-                    ...p,
-                    battlefield: p.battlefield.map(c => ({
-                        ...c,
-                        // Only untap the incoming player's permanents
-                        tapped: p.id === nextActivePlayerId ? false : c.tapped,
-                        // ALL creatures have damage removed during cleanup step (MTG rule 514.2)
-                        damageTaken: 0,
-                        // Clear summoning sickness for active player's creatures
-                        summoningSickness: p.id === nextActivePlayerId ? false : c.summoningSickness
-                    }))
-                }))
-            }));
+            set(state => ({ players: beginTurn(state.players, nextActivePlayerId) }));
             addLog(`${nextPlayerName} untaps permanents.`);
         }
 
@@ -1316,7 +973,7 @@ export const useGameStore = create<GameStore>((set, get) => ({
 
             set({ autoBattleTimeout: timeoutId });
         }
-    },
+    })),
 
     passPriority: () => {
         console.log("Priority passed");
@@ -1359,19 +1016,11 @@ export const useGameStore = create<GameStore>((set, get) => ({
                 return {
                     attackers: newAttackers,
                     blockers: newBlockers,
-                    players: state.players.map(p => {
-                        if (p.id !== activePlayerId) return p;
-                        return {
-                            ...p,
-                            battlefield: p.battlefield.map(c => {
-                                if (c.id === cardId) {
-                                    const hasVigilance = c.keywords?.some(k => k.toLowerCase() === 'vigilance');
-                                    // If we are in blockers step, the creature was likely tapped. Untap it.
-                                    return { ...c, tapped: hasVigilance ? false : (combatStep === 'declareBlockers' ? false : c.tapped) };
-                                }
-                                return c;
-                            })
-                        };
+                    players: patchCard(state.players, cardId, c => {
+                        const hasVigilance = hasKeyword(c, 'Vigilance');
+                        // If we are in blockers step, the creature was likely tapped. Untap it.
+                        const tapped = hasVigilance ? false : (combatStep === 'declareBlockers' ? false : c.tapped);
+                        return tapped === c.tapped ? c : { ...c, tapped };
                     })
                 };
             });
@@ -1384,29 +1033,20 @@ export const useGameStore = create<GameStore>((set, get) => ({
             return;
         }
 
-        if (card.summoningSickness && !card.keywords?.includes('Haste')) {
+        if (card.summoningSickness && !hasKeyword(card, 'Haste')) {
             addLog(`${card.name} has summoning sickness and cannot attack.`);
             return;
         }
 
         // DECLARE
         set(state => {
-            const hasVigilance = card.keywords?.some(k => k.toLowerCase() === 'vigilance');
+            const hasVigilance = hasKeyword(card, 'Vigilance');
             return {
                 attackers: [...state.attackers, cardId],
-                players: state.players.map(p => {
-                    if (p.id !== activePlayerId) return p;
-                    return {
-                        ...p,
-                        battlefield: p.battlefield.map(c => {
-                            if (c.id === cardId && !hasVigilance && combatStep === 'declareBlockers') {
-                                // If joining attack LATE during blockers step, tap now.
-                                return { ...c, tapped: true };
-                            }
-                            return c;
-                        })
-                    };
-                })
+                // If joining attack LATE during blockers step, tap now.
+                players: !hasVigilance && combatStep === 'declareBlockers'
+                    ? patchCard(state.players, cardId, c => ({ ...c, tapped: true }))
+                    : state.players
             };
         });
         addLog(`${card.name} joins the attack!`);
@@ -1428,10 +1068,7 @@ export const useGameStore = create<GameStore>((set, get) => ({
             return;
         }
 
-        const attFlying = attackerCard?.keywords?.includes('Flying');
-        const blkFlying = blockerCard?.keywords?.includes('Flying');
-        const blkReach = blockerCard?.keywords?.includes('Reach');
-        if (attFlying && !blkFlying && !blkReach) {
+        if (!canBlock(attackerCard, blockerCard)) {
             addLog(`${blockerCard?.name} cannot block ${attackerCard?.name} (Flying).`);
             return;
         }
@@ -1509,6 +1146,14 @@ export const useGameStore = create<GameStore>((set, get) => ({
             set({ pendingOutcome: outcome });
         }
     },
+
+    // Applies a whole damage order at once (e.g. the suggested one); it must hold the same blockers.
+    setBlockerOrder: (attackerId, order) => {
+        const current = get().blockers[attackerId] || [];
+        if (order.length !== current.length || !order.every(id => current.includes(id))) return;
+        set(state => ({ blockers: { ...state.blockers, [attackerId]: [...order] } }));
+        if (get().showQuiz) set({ pendingOutcome: get().calculateCombatOutcome() });
+    },
     toggleShop: () => {
         set(state => ({ showShop: !state.showShop }));
     },
@@ -1523,39 +1168,22 @@ export const useGameStore = create<GameStore>((set, get) => ({
         }
 
         set(state => {
-            let updatedPlayers = [...state.players];
+            let updatedPlayers = state.players;
 
             if (upgrade === 'spawn_creature') {
-                if (player.battlefield.length >= 6) {
+                if (player.battlefield.length >= MAX_BATTLEFIELD_SIZE) {
                     addLog("⚠️ Battlefield is full! Maximum 6 creatures allowed.");
                     return state;
                 }
                 // Spawn a random creature for player1 that matches color identity
-                const legalPool = CARD_POOL.filter(card => {
-                    if (card.colors.length === 0) return true; // Colorless
-                    return card.colors.every(c => player.colorIdentity.includes(c));
-                });
-                const randomCard = legalPool[Math.floor(Math.random() * legalPool.length)] || CARD_POOL[0];
-                const newCreature = {
-                    ...randomCard,
-                    id: `player1-creature-${Date.now()}-${Math.random()}`,
-                    controllerId: 'player1',
-                    ownerId: 'player1',
-                    tapped: false,
-                    damageTaken: 0,
-                    plusOneCounters: 0,
-                    minusOneCounters: 0,
-                    summoningSickness: true,
-                    shieldCounters: 0
-                };
+                const legalPool = getLegalCards(player.colorIdentity);
+                const randomCard = state.rng.pick(legalPool) || CARD_POOL[0];
+                const newCreature = summonCreature(randomCard, 'player1', state.rng);
 
-                updatedPlayers = state.players.map(p => {
-                    if (p.id !== 'player1') return p;
-                    return {
-                        ...p,
-                        battlefield: [...p.battlefield, newCreature]
-                    };
-                });
+                updatedPlayers = patchPlayer(state.players, 'player1', p => ({
+                    ...p,
+                    battlefield: [...p.battlefield, newCreature]
+                }));
 
                 addLog(`✨ Summoned ${newCreature.name} to your battlefield!`);
             } else if (upgrade === 'plus_counter' || upgrade === 'minus_counter') {
@@ -1563,29 +1191,14 @@ export const useGameStore = create<GameStore>((set, get) => ({
                 const targetCreatures = state.players.find(pl => pl.id === targetPlayer)?.battlefield || [];
 
                 if (targetCreatures.length > 0) {
-                    const randomCreature = targetCreatures[Math.floor(Math.random() * targetCreatures.length)];
-                    updatedPlayers = state.players.map(pl => {
-                        if (pl.id !== targetPlayer) return pl;
-
-                        const updatedBattlefield = pl.battlefield.map(c => {
-                            if (c.id === randomCreature.id) {
-                                if (upgrade === 'plus_counter') {
-                                    return { ...c, plusOneCounters: c.plusOneCounters + 1 };
-                                } else {
-                                    return { ...c, minusOneCounters: c.minusOneCounters + 1 };
-                                }
-                            }
-                            return c;
-                        });
-
-                        return {
-                            ...pl,
-                            battlefield: updatedBattlefield
-                        };
-                    });
+                    const randomCreature = state.rng.pick(targetCreatures)!;
+                    updatedPlayers = patchCard(state.players, randomCreature.id, c =>
+                        upgrade === 'plus_counter'
+                            ? { ...c, plusOneCounters: c.plusOneCounters + 1 }
+                            : { ...c, minusOneCounters: c.minusOneCounters + 1 }
+                    );
 
-                    const baseToughness = parseInt(randomCreature.toughness || '0');
-                    const netToughness = baseToughness + (randomCreature.plusOneCounters || 0) - (randomCreature.minusOneCounters || 0) - (upgrade === 'minus_counter' ? 1 : 0);
+                    const netToughness = getCardStats(randomCreature).toughness - (upgrade === 'minus_counter' ? 1 : 0);
 
                     if (upgrade === 'minus_counter' && netToughness <= 0) {
                         addLog(`💀 -1/-1 counter applied to ${randomCreature.name} - creature dies!`);
@@ -1594,73 +1207,32 @@ export const useGameStore = create<GameStore>((set, get) => ({
                     }
                 }
             } else if (upgrade === 'life_gain') {
-                updatedPlayers = state.players.map(p =>
-                    p.id === 'player1' ? { ...p, life: p.life + 4 } : p
-                );
+                updatedPlayers = patchPlayer(state.players, 'player1', p => ({ ...p, life: p.life + 4 }));
                 addLog(`💖 You gained 4 life!`);
             } else if (upgrade === 'gamble_spawn') {
                 const opponentInfo = state.players.find(p => p.id === 'player2');
-                if (opponentInfo && opponentInfo.battlefield.length >= 6) {
+                if (opponentInfo && opponentInfo.battlefield.length >= MAX_BATTLEFIELD_SIZE) {
                     addLog("⚠️ Opponent battlefield is full! Gamble unavailable to prevent overflow.");
                     return state;
                 }
 
-                if (state.gambleCount >= 3) {
+                if (state.gambleCount >= MAX_GAMBLES_PER_GAME) {
                     addLog("⚠️ High Risk Gamble can only be used 3 times per game!");
                     return state;
                 }
-                // Spawn a creature for opponent with summoning sickness
-                const randomCard = CARD_POOL[Math.floor(Math.random() * CARD_POOL.length)];
-                const newCreature = {
-                    ...randomCard,
-                    id: `player2-creature-${Date.now()}-${Math.random()}`,
-                    controllerId: 'player2',
-                    ownerId: 'player2',
-                    tapped: false,
-                    damageTaken: 0,
-                    plusOneCounters: 0,
-                    minusOneCounters: 0,
-                    summoningSickness: true,
-                    shieldCounters: 0
-                };
 
-                // Random gold between 0 and 200
-                const goldEarned = Math.floor(Math.random() * 201);
-
-                updatedPlayers = state.players.map(p => {
-                    if (p.id === 'player2') {
-                        return {
-                            ...p,
-                            battlefield: [...p.battlefield, newCreature]
-                        };
-                    } else if (p.id === 'player1') {
-                        return {
-                            ...p,
-                            gold: p.gold + goldEarned
-                        };
-                    }
-                    return p;
-                });
+                const gamble = gambleSpawn(state.players, 'player1', state.rng);
+                if (!gamble) return state;
 
-                addLog(`🎲 GAMBLE! Spawned ${newCreature.name} for opponent - you earned ${goldEarned} gold!`);
+                addLog(`🎲 GAMBLE! Spawned ${gamble.creature.name} for opponent - you earned ${gamble.goldEarned} gold!`);
                 // No cost deduction, but we return the updated players AND increment the count
-                return { players: updatedPlayers, gambleCount: state.gambleCount + 1 };
+                return { players: gamble.players, gambleCount: state.gambleCount + 1 };
             } else if (upgrade === 'shield_counter') {
                 const targetCreatures = state.players.find(pl => pl.id === 'player1')?.battlefield || [];
 
                 if (targetCreatures.length > 0) {
-                    const randomCreature = targetCreatures[Math.floor(Math.random() * targetCreatures.length)];
-                    updatedPlayers = state.players.map(pl => {
-                        if (pl.id !== 'player1') return pl;
-                        return {
-                            ...pl,
-                            battlefield: pl.battlefield.map(c =>
-                                c.id === randomCreature.id
-                                    ? { ...c, shieldCounters: c.shieldCounters + 1 }
-                                    : c
-                            )
-                        };
-                    });
+                    const randomCreature = state.rng.pick(targetCreatures)!;
+                    updatedPlayers = patchCard(state.players, randomCreature.id, c => ({ ...c, shieldCounters: c.shieldCounters + 1 }));
 
                     addLog(`🛡️ Shield counter applied to ${randomCreature.name}!`);
                 }
@@ -1675,217 +1247,216 @@ export const useGameStore = create<GameStore>((set, get) => ({
                     return state; // Don't charge gold
                 }
 
-                updatedPlayers = state.players.map(p => {
-                    if (p.id !== 'player1') return p;
-
-                    if (availableCreatures.length > 0) {
-                        const randomCreature = availableCreatures[Math.floor(Math.random() * availableCreatures.length)];
-                        const newBattlefield = p.battlefield.map(c => {
-                            if (c.id === randomCreature.id) {
-                                return {
-                                    ...c,
-                                    keywords: [...c.keywords, upgrade]
-                                };
-                            }
-                            return c;
-                        });
+                if (availableCreatures.length > 0) {
+                    const randomCreature = state.rng.pick(availableCreatures)!;
+                    updatedPlayers = patchCard(state.players, randomCreature.id, c => ({
+                        ...c,
+                        keywords: [...c.keywords, upgrade]
+                    }));
 
-                        addLog(`✨ ${randomCreature.name} gains ${upgrade}!`);
-                        return { ...p, battlefield: newBattlefield };
-                    }
-                    return p;
-                });
+                    addLog(`✨ ${randomCreature.name} gains ${upgrade}!`);
+                }
             }
 
             // Deduct gold from player1
-            const finalPlayers = updatedPlayers.map(p =>
-                p.id === 'player1' ? { ...p, gold: p.gold - cost } : p
-            );
+            const finalPlayers = patchPlayer(updatedPlayers, 'player1', p => ({ ...p, gold: p.gold - cost }));
 
             return { players: finalPlayers };
         });
     },
 
-    performAIShopPurchases: () => {
-        const { players, addLog } = get();
-        const aiPlayer = players.find(p => p.id === 'player2');
+    startTurbo: () => {
+        const { phase, combatStep, showQuiz, activePlayerId, players, turnCount, rng, winner, showStartPrompt, autoBattleTimeout } = get();
+        if (turboRun || winner || showStartPrompt) return;
 
-        if (!aiPlayer || aiPlayer.gold < 24) return; // 24 is cheapest item
-
-        // Define shop items with their costs and IDs
-        const shopItems = [
-            { id: 'plus_counter', cost: 24, category: 'quick', priority: 3 },
-            { id: 'life_gain', cost: 32, category: 'quick', priority: 2 },
-            { id: 'Flying', cost: 56, category: 'premium', priority: 5 },
-            { id: 'Vigilance', cost: 52, category: 'premium', priority: 4 },
-            { id: 'Trample', cost: 60, category: 'premium', priority: 5 },
-            { id: 'Lifelink', cost: 60, category: 'premium', priority: 6 },
-            { id: 'minus_counter', cost: 64, category: 'quick', priority: 7 },
-            { id: 'Deathtouch', cost: 64, category: 'premium', priority: 6 },
-            { id: 'First Strike', cost: 68, category: 'premium', priority: 5 },
-            { id: 'Double Strike', cost: 72, category: 'premium', priority: 8 },
-            { id: 'spawn_creature', cost: 80, category: 'quick', priority: 4 },
-            { id: 'shield_counter', cost: 85, category: 'premium', priority: 7 }
-        ];
-
-        // Filter affordable items
-        const affordable = shopItems.filter(item => {
-            if (item.cost > aiPlayer.gold) return false;
-            if (item.id === 'spawn_creature' && aiPlayer.battlefield.length >= 6) return false;
-            return true;
-        });
-        if (affordable.length === 0) return;
-
-        // AI strategy: Prefer higher priority items, but add some randomness
-        const sorted = affordable.sort((a, b) => b.priority - a.priority);
-
-        // 70% chance to pick top priority, 30% chance to pick any affordable
-        const selectedItem = Math.random() < 0.7
-            ? sorted[0]
-            : affordable[Math.floor(Math.random() * affordable.length)];
-
-        // Process the purchase for AI (player2)
-        set(state => {
-            let updatedPlayers = [...state.players];
-
-            if (selectedItem.id === 'spawn_creature') {
-                // Spawn a random creature for player2 that matches color identity
-                const identity = aiPlayer.colorIdentity;
-                const legalPool = CARD_POOL.filter(card => {
-                    if (card.colors.length === 0) return true; // Colorless
-                    return card.colors.every(c => identity.includes(c));
-                });
-                const randomCard = legalPool[Math.floor(Math.random() * legalPool.length)] || CARD_POOL[0];
-                const newCreature = {
-                    ...randomCard,
-                    id: `player2-creature-${Date.now()}-${Math.random()}`,
-                    controllerId: 'player2',
-                    ownerId: 'player2',
-                    tapped: false,
-                    damageTaken: 0,
-                    plusOneCounters: 0,
-                    minusOneCounters: 0,
-                    summoningSickness: true,
-                    shieldCounters: 0
-                };
-
-                updatedPlayers = state.players.map(p => {
-                    if (p.id !== 'player2') return p;
-                    return {
-                        ...p,
-                        battlefield: [...p.battlefield, newCreature]
-                    };
-                });
-
-                addLog(`🤖 AI summoned ${newCreature.name}!`);
-            } else if (selectedItem.id === 'plus_counter') {
-                const targetCreatures = state.players.find(pl => pl.id === 'player2')?.battlefield || [];
-
-                if (targetCreatures.length > 0) {
-                    const randomCreature = targetCreatures[Math.floor(Math.random() * targetCreatures.length)];
-                    updatedPlayers = state.players.map(pl => {
-                        if (pl.id !== 'player2') return pl;
-
-                        const updatedBattlefield = pl.battlefield.map(c => {
-                            if (c.id === randomCreature.id) {
-                                return { ...c, plusOneCounters: c.plusOneCounters + 1 };
-                            }
-                            return c;
-                        });
-
-                        return { ...pl, battlefield: updatedBattlefield };
-                    });
-
-                    addLog(`🤖 AI granted +1/+1 counter to ${randomCreature.name}!`);
-                }
-            } else if (selectedItem.id === 'minus_counter') {
-                const targetCreatures = state.players.find(pl => pl.id === 'player1')?.battlefield || [];
-
-                if (targetCreatures.length > 0) {
-                    const randomCreature = targetCreatures[Math.floor(Math.random() * targetCreatures.length)];
-                    updatedPlayers = state.players.map(pl => {
-                        if (pl.id !== 'player1') return pl;
-
-                        const updatedBattlefield = pl.battlefield.map(c => {
-                            if (c.id === randomCreature.id) {
-                                return { ...c, minusOneCounters: c.minusOneCounters + 1 };
-                            }
-                            return c;
-                        }).filter(c => {
-                            const baseToughness = parseInt(c.toughness || '0');
-                            const netToughness = baseToughness + (c.plusOneCounters || 0) - (c.minusOneCounters || 0);
-                            return netToughness > 0;
-                        });
-
-                        return { ...pl, battlefield: updatedBattlefield };
-                    });
-
-                    addLog(`🤖 AI placed -1/-1 counter on your ${randomCreature.name}!`);
-                }
-            } else if (selectedItem.id === 'life_gain') {
-                updatedPlayers = state.players.map(p => {
-                    if (p.id !== 'player2') return p;
-                    return { ...p, life: p.life + 2 };
-                });
-                addLog(`🤖 AI gained 2 life!`);
-            } else if (selectedItem.id === 'shield_counter') {
-                const targetCreatures = state.players.find(pl => pl.id === 'player2')?.battlefield || [];
-
-                if (targetCreatures.length > 0) {
-                    const randomCreature = targetCreatures[Math.floor(Math.random() * targetCreatures.length)];
-                    updatedPlayers = state.players.map(pl => {
-                        if (pl.id !== 'player2') return pl;
+        if (autoBattleTimeout) clearTimeout(autoBattleTimeout);
+        cancelPlanning();
 
-                        const updatedBattlefield = pl.battlefield.map(c => {
-                            if (c.id === randomCreature.id) {
-                                return { ...c, shieldCounters: c.shieldCounters + 1 };
-                            }
-                            return c;
-                        });
+        // A turn whose combat hasn't been resolved is replayed from its combat (declarations are
+        // discarded); otherwise fast-forward starts with the next player's turn.
+        const combatResolved = phase === 'main2' || phase === 'end'
+            || (phase === 'combat' && (combatStep === 'end' || (combatStep === 'combatDamage' && !showQuiz)));
+        const nextPlayerId = combatResolved ? players.find(p => p.id !== activePlayerId)!.id : activePlayerId;
 
-                        return { ...pl, battlefield: updatedBattlefield };
-                    });
+        const { attackers, blockers, pendingOutcome } = get();
+        turboResume = { phase, combatStep, attackers, blockers, showQuiz, pendingOutcome };
+        set({
+            turbo: true,
+            autoBattleTimeout: null,
+            phase: 'combat',
+            combatStep: undefined,
+            attackers: [],
+            blockers: {},
+            selectedCardId: null,
+            showQuiz: false,
+            pendingOutcome: null,
+            showSummary: false,
+            lastCombatSummary: null,
+            showTurnBanner: null
+        });
+        get().addLog('⏩ Turbo: the AI plays both sides.');
+
+        turboRun = startTurbo(
+            { players, activePlayerId: nextPlayerId, turnCount, rng, resumeAtCombat: !combatResolved },
+            {
+                onCommit: batchLog((commit: TurboCommit) => {
+                    turboResume = null;
+                    // Each commit leaves the battle at the end of the turn just played.
+                    set(state => ({
+                        players: commit.players,
+                        activePlayerId: commit.activePlayerId,
+                        priorityPlayerId: commit.activePlayerId,
+                        turnCount: commit.turnCount,
+                        phase: 'end',
+                        log: appendLog(state.log, commit.log)
+                    }));
+                    if (!commit.done) return;
+
+                    turboRun = null;
+                    set({ turbo: false });
+                    if (commit.winner) {
+                        set({ winner: commit.winner, autoBattle: false });
+                        get().addLog(`🏆 ${commit.winner === 'player1' ? 'Player 1' : 'Player 2'} earns ${VICTORY_GOLD_REWARD} gold for winning!`);
+                        get().addLog(`--- BATTLE CONCLUDED: ${commit.winner === 'player1' ? 'VICTORY' : 'DEFEAT'} ---`);
+                    } else {
+                        get().addLog(`⏩ Turbo stopped after ${commit.turnsPlayed} turns without a winner.`);
+                        get().nextPhase();
+                    }
+                })
+            }
+        );
+    },
 
-                    addLog(`🤖 AI granted shield counter to ${randomCreature.name}!`);
-                }
-            } else if (['Flying', 'Trample', 'Deathtouch', 'First Strike', 'Lifelink', 'Vigilance', 'Double Strike'].includes(selectedItem.id)) {
-                const targetCreatures = state.players.find(pl => pl.id === 'player2')?.battlefield || [];
+    stopTurbo: () => {
+        if (!turboRun) return;
+        turboRun.stop();
+        turboRun = null;
+        set({ turbo: false });
+        get().addLog('⏩ Turbo off.');
+        const resume = turboResume;
+        turboResume = null;
+        if (!resume) {
+            // Carry on in normal mode from the end of the last turn turbo played.
+            get().nextPhase();
+            return;
+        }
 
-                if (targetCreatures.length > 0) {
-                    const eligibleCreatures = targetCreatures.filter(c =>
-                        !c.keywords?.some(k => k.toLowerCase() === selectedItem.id.toLowerCase())
-                    );
+        // Nothing was played yet: back to where turbo started, and pick up whatever was due there.
+        set(resume);
+        const state = get();
+        if (state.showQuiz || isCheckpoint(state)) return;
+        if (awaitsOpponentAttacks(state)) state.performOpponentAttacks();
+        else if (awaitsOpponentBlocks(state, state.activePlayerId)) state.performOpponentBlocks();
+        else state.nextPhase();
+    },
 
-                    if (eligibleCreatures.length > 0) {
-                        const randomCreature = eligibleCreatures[Math.floor(Math.random() * eligibleCreatures.length)];
+    // Puts the battle back at a checkpoint. Fast-forward, timers and AI planning stop, and whatever
+    // was on screen for the moments after it closes.
+    restoreSnapshot: (id: number) => {
+        const session = sessionHistory.restore(id);
+        if (!session) return;
+        turboRun?.stop();
+        turboRun = null;
+        turboResume = null;
+        cancelPlanning();
+        const { autoBattleTimeout } = get();
+        if (autoBattleTimeout) clearTimeout(autoBattleTimeout);
 
-                        updatedPlayers = state.players.map(p => {
-                            if (p.id !== 'player2') return p;
+        restoringSnapshot = true;
+        set({
+            ...session,
+            log: setLogArchiving(session.log, get().keepFullLog),
+            rng: restoreRng(session.rng),
+            turbo: false,
+            autoBattle: !session.winner,
+            autoBattleTimeout: null,
+            selectedCardId: null,
+            showQuiz: false,
+            pendingOutcome: null,
+            showSummary: false,
+            lastCombatSummary: null,
+            showShop: false,
+            showStartPrompt: false,
+            showSkipCombatConfirmation: false,
+            showTurnBanner: null,
+            penaltyNotice: null,
+            snapshots: sessionHistory.list(),
+            currentSnapshot: id
+        });
+        restoringSnapshot = false;
+        scheduleSessionSave();
+    },
 
-                            const newBattlefield = p.battlefield.map(c => {
-                                if (c.id === randomCreature.id) {
-                                    return {
-                                        ...c,
-                                        keywords: [...c.keywords, selectedItem.id]
-                                    };
-                                }
-                                return c;
-                            });
+    setKeepFullLog: (keep: boolean) => set(state => ({ keepFullLog: keep, log: setLogArchiving(state.log, keep) })),
 
-                            return { ...p, battlefield: newBattlefield };
-                        });
+    performAIShopPurchases: profiler.measure('performAIShopPurchases', () => {
+        const { players, addLog, rng, turbo } = get();
+        const aiPlayer = players.find(p => p.id === 'player2');
 
-                        addLog(`🤖 AI granted ${selectedItem.id} to ${randomCreature.name}!`);
-                    }
-                }
-            }
+        if (!aiPlayer || turbo) return;
 
-            // Deduct gold from player2
-            const finalPlayers = updatedPlayers.map(p =>
-                p.id === 'player2' ? { ...p, gold: p.gold - selectedItem.cost } : p
-            );
+        const selectedItem = pickAIShopItem(aiPlayer, rng);
+        if (!selectedItem) return;
 
+        // Process the purchase for AI (player2)
+        set(state => {
+            const { players: finalPlayers, message } = applyAIShopItem(state.players, 'player2', selectedItem, state.rng);
+            if (message) addLog(message);
             return { players: finalPlayers };
         });
+    })
+})));
+
+// A decision planned for a board that has since changed is stale.
+useGameStore.subscribe((state, previous) => {
+    if (state.players !== previous.players || state.attackers !== previous.attackers || state.activePlayerId !== previous.activePlayerId) {
+        cancelPlanning(BOARD_CHANGED);
     }
-}));
+});
+
+// The battle waits for Player 1 to declare attacks on their turn and blocks on the opponent's; those
+// are the checkpoints. Every other step runs on timers and isn't a place to resume from.
+const isCheckpoint = (state: GameStore) =>
+    state.phase === 'combat' && !state.turbo && !state.winner
+    && ((state.combatStep === 'declareAttackers' && state.activePlayerId === 'player1')
+        || (state.combatStep === 'declareBlockers' && state.activePlayerId === 'player2'));
+
+const sessionOf = (state: GameStore): SessionState => ({
+    players: state.players,
+    activePlayerId: state.activePlayerId,
+    priorityPlayerId: state.priorityPlayerId,
+    phase: state.phase,
+    combatStep: state.combatStep,
+    turnCount: state.turnCount,
+    attackers: state.attackers,
+    blockers: state.blockers,
+    log: state.log,
+    winner: state.winner,
+    gambleCount: state.gambleCount,
+    seed: state.seed,
+    rng: state.rng.save()
+});
+
+// Taken once the update that reached the step is done, so the log lines batched with it are in.
+const captureCheckpoint = () => {
+    const state = useGameStore.getState();
+    if (!isCheckpoint(state)) return;
+    const step = state.combatStep === 'declareAttackers' ? 'Your attack' : 'Your blocks';
+    const info = sessionHistory.capture(sessionOf(state), `Turn ${state.turnCount} · ${step}`);
+    useGameStore.setState({ snapshots: sessionHistory.list(), currentSnapshot: info.id });
+    scheduleSessionSave();
+};
+
+useGameStore.subscribe((state, previous) => {
+    const moved = state.combatStep !== previous.combatStep || state.phase !== previous.phase || state.activePlayerId !== previous.activePlayerId;
+    if (moved && !restoringSnapshot && isCheckpoint(state)) queueMicrotask(captureCheckpoint);
+});
+
+// Pick the last battle back up after a reload, unless a new one has been dealt in the meantime.
+sessionHistory.load().then(session => {
+    const { players, currentSnapshot, restoreSnapshot } = useGameStore.getState();
+    const latest = sessionHistory.latest();
+    if (!session || !latest) return;
+    if (players !== initialPlayers || currentSnapshot !== null) sessionHistory.reset();
+    else restoreSnapshot(latest.id);
+}).catch(() => { });
@@ -0,0 +1,64 @@
+import { describe, it, expect } from 'vitest';
+import { createIncrementalCombat } from './incrementalCombat';
+import { calculateCombatOutcome } from './combatLogic';
+import { createRng } from './rng';
+import type { Rng } from './rng';
+import { creature } from './testCards';
+import type { CombatBoard } from '../types';
+
+const KEYWORDS = ['Trample', 'Deathtouch', 'First Strike', 'Double Strike', 'Lifelink'];
+
+const randomCreature = (rng: Rng, id: string, controllerId: string) =>
+    creature(id, rng.int(6), 1 + rng.int(6), KEYWORDS.filter(() => rng.next() < 0.2), controllerId, rng.next() < 0.05 ? -7 : 0);
+
+// Random single, gang and missing blocks; a few creatures sit out and some have toughness below 1.
+const randomBoard = (rng: Rng, size: number): CombatBoard => {
+    const attackerCards = Array.from({ length: size }, (_, i) => randomCreature(rng, `a${i}`, 'p1'));
+    const defenderCards = Array.from({ length: size * 2 }, (_, i) => randomCreature(rng, `d${i}`, 'p2'));
+    const attackers = attackerCards.filter(() => rng.next() < 0.8).map(c => c.id);
+    const blockers: Record<string, string[]> = {};
+    rng.shuffle(defenderCards).forEach(blocker => {
+        if (attackers.length === 0 || rng.next() < 0.3) return;
+        (blockers[rng.pick(attackers)!] ||= []).push(blocker.id);
+    });
+    return { defenderPlayerId: 'p2', attackers, blockers, cards: [...attackerCards, ...defenderCards] };
+};
+
+describe('Incremental Combat Resolution', () => {
+    it('should match a full resolution on random boards', () => {
+        const rng = createRng(77);
+        const combat = createIncrementalCombat();
+        for (let i = 0; i < 200; i++) {
+            const board = randomBoard(rng, 1 + rng.int(8));
+            expect(combat.resolve(board)).toEqual(calculateCombatOutcome(board));
+        }
+    });
+
+    it('should re-resolve only the group that changed', () => {
+        const rng = createRng(5);
+        const combat = createIncrementalCombat();
+        const board = randomBoard(rng, 30);
+        const [attackerId, blockerIds] = Object.entries(board.blockers).find(([, ids]) => ids.length > 1)!;
+
+        combat.resolve(board);
+        const before = combat.stats();
+        const reordered = { ...board, blockers: { ...board.blockers, [attackerId]: [...blockerIds].reverse() } };
+
+        expect(combat.resolve(reordered)).toEqual(calculateCombatOutcome(reordered));
+        expect(combat.stats().resolved).toBe(before.resolved + 1);
+        expect(combat.stats().reused).toBe(before.reused + board.attackers.length - 1);
+
+        // Back to the original order: found by hash, nothing re-run.
+        expect(combat.resolve(board)).toEqual(calculateCombatOutcome(board));
+        expect(combat.stats().resolved).toBe(before.resolved + 1);
+    });
+
+    it('should fall back to a full resolution when a blocker is in two groups', () => {
+        const rng = createRng(9);
+        const board = randomBoard(rng, 4);
+        const [first, second] = board.attackers;
+        const shared = { ...board, blockers: { [first]: ['d0'], [second]: ['d0', 'd1'] } };
+
+        expect(createIncrementalCombat().resolve(shared)).toEqual(calculateCombatOutcome(shared));
+    });
+});
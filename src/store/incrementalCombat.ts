@@ -0,0 +1,163 @@
+import type { Card, CombatBoard, CombatOutcome, DamageEvent } from '../types';
+import { calculateCombatOutcome, indexOutcome, resolveCombatSteps } from './combatLogic.ts';
+import type { StepMarks } from './combatLogic.ts';
+import { getCardStats } from './cardStats.ts';
+import { createLruCache, hashCombatBoard } from './outcomeCache.ts';
+import type { CacheStats } from './outcomeCache.ts';
+
+// Incremental combat resolution for the live board. Damage only flows inside an attacker's group
+// (the attacker and its blockers), so each group is resolved on its own and the results are spliced
+// into the exact event order of a full resolution: first-strike attacker sections in attacker order,
+// first-strike blocker sections in blocker-map order, then the same for the normal step. Deaths follow
+// board order and life gained is summed.
+//
+// A group is reused while its attacker card, blocker array and blocker cards are the same objects as
+// last time; the store replaces only what changed, so a click re-resolves just the touched group.
+// Groups that come back to an earlier shape (reordering up then down) are found by board hash.
+
+interface GroupResolution {
+    outcome: CombatOutcome;
+    marks: StepMarks;
+}
+
+interface GroupEntry {
+    defenderPlayerId: string;
+    attacker: Card | undefined;
+    blockerIds: string[] | undefined;
+    blockerCards: (Card | undefined)[];
+    resolution: GroupResolution;
+}
+
+export interface IncrementalCombatStats {
+    resolved: number; // groups run through the engine
+    reused: number; // groups unchanged since the last resolution
+    transpositions: CacheStats; // groups found by board hash
+}
+
+// Groups must not share cards and every blocker entry must belong to an attacker; anything else falls
+// back to a full resolution.
+const isDecomposable = (board: CombatBoard, cardsById: Map<string, Card>): boolean => {
+    if (cardsById.size !== board.cards.length) return false;
+    const attackers = new Set(board.attackers);
+    if (attackers.size !== board.attackers.length) return false;
+
+    const seen = new Set<string>();
+    return Object.entries(board.blockers).every(([attackerId, blockerIds]) =>
+        attackers.has(attackerId) &&
+        blockerIds.every(id => {
+            if (seen.has(id) || attackers.has(id)) return false;
+            seen.add(id);
+            return true;
+        })
+    );
+};
+
+const sameCards = (a: (Card | undefined)[], b: (Card | undefined)[]) =>
+    a.length === b.length && a.every((card, i) => card === b[i]);
+
+export const createIncrementalCombat = (capacity = 1024) => {
+    let groups = new Map<string, GroupEntry>();
+    const transpositions = createLruCache<GroupResolution>(capacity);
+    let resolved = 0;
+    let reused = 0;
+
+    const resolveGroup = (board: CombatBoard, attackerId: string, cardsById: Map<string, Card>, next: Map<string, GroupEntry>) => {
+        const attacker = cardsById.get(attackerId);
+        const blockerIds = board.blockers[attackerId];
+        const blockerCards = (blockerIds || []).map(id => cardsById.get(id));
+
+        const last = groups.get(attackerId);
+        if (
+            last &&
+            last.defenderPlayerId === board.defenderPlayerId &&
+            last.attacker === attacker &&
+            last.blockerIds === blockerIds &&
+            sameCards(last.blockerCards, blockerCards)
+        ) {
+            reused++;
+            next.set(attackerId, last);
+            return last.resolution;
+        }
+
+        const group: CombatBoard = {
+            defenderPlayerId: board.defenderPlayerId,
+            attackers: [attackerId],
+            blockers: blockerIds ? { [attackerId]: blockerIds } : {},
+            cards: [attacker, ...blockerCards].filter((c): c is Card => !!c)
+        };
+        const key = hashCombatBoard(group);
+        let resolution = transpositions.get(key);
+        if (!resolution) {
+            resolution = resolveCombatSteps(group);
+            transpositions.set(key, resolution);
+            resolved++;
+        }
+        next.set(attackerId, { defenderPlayerId: board.defenderPlayerId, attacker, blockerIds, blockerCards, resolution });
+        return resolution;
+    };
+
+    const resolve = (board: CombatBoard): CombatOutcome => {
+        const cardsById = new Map<string, Card>();
+        board.cards.forEach(c => cardsById.set(c.id, c));
+        if (!isDecomposable(board, cardsById)) {
+            groups = new Map();
+            return calculateCombatOutcome(board);
+        }
+
+        // Only groups still on the board are kept for the next call.
+        const next = new Map<string, GroupEntry>();
+        const resolutions = new Map<string, GroupResolution>();
+        board.attackers.forEach(id => resolutions.set(id, resolveGroup(board, id, cardsById, next)));
+        groups = next;
+
+        const damageEvents: DamageEvent[] = [];
+        const explanation: string[] = [];
+        const blockerOrder = Object.keys(board.blockers);
+        const splice = (section: number, order: string[]) => {
+            order.forEach(id => {
+                const { outcome, marks } = resolutions.get(id)!;
+                const eventsFrom = section > 0 ? marks.events[section - 1] : 0;
+                const explanationFrom = section > 0 ? marks.explanation[section - 1] : 0;
+                for (let i = eventsFrom; i < marks.events[section]; i++) damageEvents.push(outcome.damageEvents[i]);
+                for (let i = explanationFrom; i < marks.explanation[section]; i++) explanation.push(outcome.explanation[i]);
+            });
+        };
+        splice(0, board.attackers);
+        splice(1, blockerOrder);
+        splice(2, board.attackers);
+        splice(3, blockerOrder);
+
+        // Cards outside every group take no damage, so they only die with toughness 0 or less.
+        const groupDeaths = new Set<string>();
+        const involved = new Set<string>(board.attackers);
+        const deathDescriptions: string[] = [];
+        let attackerLifeGained = 0;
+        let defenderLifeGained = 0;
+        resolutions.forEach(({ outcome }, attackerId) => {
+            outcome.deaths.forEach(id => groupDeaths.add(id));
+            (board.blockers[attackerId] || []).forEach(id => involved.add(id));
+            deathDescriptions.push(...outcome.deathDescriptions);
+            attackerLifeGained += outcome.attackerLifeGained;
+            defenderLifeGained += outcome.defenderLifeGained;
+        });
+        const deaths = board.cards
+            .filter(c => groupDeaths.has(c.id) || (!involved.has(c.id) && getCardStats(c).toughness <= 0))
+            .map(c => c.id);
+
+        return { damageEvents, deaths, deathDescriptions, attackerLifeGained, defenderLifeGained, explanation, ...indexOutcome(deaths, damageEvents) };
+    };
+
+    return {
+        resolve,
+        stats: (): IncrementalCombatStats => ({ resolved, reused, transpositions: transpositions.stats() }),
+        reset: () => {
+            groups = new Map();
+            transpositions.clear();
+            resolved = 0;
+            reused = 0;
+        }
+    };
+};
+
+// The store's live board: quiz preview, blocker reordering, hints and resolution.
+export const liveCombat = createIncrementalCombat();
@@ -0,0 +1,53 @@
+import { describe, it, expect } from 'vitest';
+import { createOutcomeCache, hashCombatBoard } from './outcomeCache';
+import { calculateCombatOutcome } from './combatLogic';
+import type { Card, CombatBoard } from '../types';
+import { creature } from './testCards';
+
+const board = (cards: Card[], blockers: Record<string, string[]> = { att: ['b1', 'b2'] }): CombatBoard => ({
+    defenderPlayerId: 'p2', attackers: ['att'], blockers, cards
+});
+
+describe('Combat Outcome Cache', () => {
+    const att = creature('att', 4, 4, ['Trample']);
+    const b1 = creature('b1', 1, 1, [], 'p2');
+    const b2 = creature('b2', 2, 2, [], 'p2');
+    const idle = creature('idle', 3, 3, [], 'p2');
+
+    it('should hash equal boards equally, even from fresh card objects', () => {
+        expect(hashCombatBoard(board([att, b1, b2]))).toBe(hashCombatBoard(board([{ ...att }, { ...b1 }, { ...b2 }])));
+    });
+
+    it('should ignore creatures that take no part in combat', () => {
+        const base = hashCombatBoard(board([att, b1, b2, idle]));
+
+        expect(hashCombatBoard(board([att, b1, b2, { ...idle, plusOneCounters: 2 }]))).toBe(base);
+        expect(hashCombatBoard(board([att, b1, b2, { ...idle, minusOneCounters: 3 }]))).not.toBe(base);
+    });
+
+    it('should change with blocker order, counters, keywords and damage taken', () => {
+        const base = hashCombatBoard(board([att, b1, b2]));
+
+        expect(hashCombatBoard(board([att, b1, b2], { att: ['b2', 'b1'] }))).not.toBe(base);
+        expect(hashCombatBoard(board([{ ...att, plusOneCounters: 1 }, b1, b2]))).not.toBe(base);
+        expect(hashCombatBoard(board([{ ...att, keywords: ['Deathtouch'] }, b1, b2]))).not.toBe(base);
+        expect(hashCombatBoard(board([att, { ...b1, damageTaken: 1 }, b2]))).not.toBe(base);
+    });
+
+    it('should serve repeats from the cache and evict the least recently used board', () => {
+        const cache = createOutcomeCache(2);
+        const first = board([att, b1, b2]);
+        const outcome = cache.resolve(first);
+
+        expect(outcome).toEqual(calculateCombatOutcome(first));
+        expect(cache.resolve(board([att, b1, b2]))).toBe(outcome);
+
+        cache.resolve(board([att, b1, b2], { att: ['b2', 'b1'] }));
+        cache.resolve(first); // refresh, so the reordered board is now the oldest
+        cache.resolve(board([att, b1, b2], { att: ['b1'] }));
+
+        expect(cache.get(hashCombatBoard(first))).toBe(outcome);
+        expect(cache.get(hashCombatBoard(board([att, b1, b2], { att: ['b2', 'b1'] })))).toBeUndefined();
+        expect(cache.stats()).toMatchObject({ hits: 3, misses: 4, evictions: 1, size: 2 });
+    });
+});
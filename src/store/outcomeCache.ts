@@ -0,0 +1,112 @@
+import type { Card, CombatBoard, CombatOutcome } from '../types';
+import { calculateCombatOutcome } from './combatLogic.ts';
+import { getCardStats } from './cardStats.ts';
+
+// Transposition cache for combat outcomes. Boards are keyed by a canonical string covering everything
+// calculateCombatOutcome reads: the defender, attacker order, the blocker map in its iteration order,
+// and, in board order, each card that takes part (id, name, effective power/toughness after counters,
+// keywords, damage taken). Uninvolved cards only matter when their toughness is 0 or less (they are
+// reported as deaths), so creatures that sit out can change without invalidating the entry.
+
+// Cards are replaced rather than mutated, so a card's key segment can be cached by identity.
+const cardKeys = new WeakMap<Card, string>();
+
+const cardKey = (card: Card): string => {
+    let key = cardKeys.get(card);
+    if (key === undefined) {
+        const { power, toughness, keywordMask } = getCardStats(card);
+        key = `${card.id}|${card.name}|${power}|${toughness}|${keywordMask}|${card.damageTaken}`;
+        cardKeys.set(card, key);
+    }
+    return key;
+};
+
+export const hashCombatBoard = (board: CombatBoard): string => {
+    const involved = new Set(board.attackers);
+    const blockerParts: string[] = [];
+    Object.entries(board.blockers).forEach(([attackerId, blockerIds]) => {
+        involved.add(attackerId);
+        blockerIds.forEach(id => involved.add(id));
+        blockerParts.push(`${attackerId}>${blockerIds.join(',')}`);
+    });
+
+    const cardParts: string[] = [];
+    board.cards.forEach(card => {
+        if (involved.has(card.id) || getCardStats(card).toughness <= 0) cardParts.push(cardKey(card));
+    });
+
+    return `${board.defenderPlayerId}#${board.attackers.join(',')}#${blockerParts.join(';')}#${cardParts.join(';')}`;
+};
+
+export interface CacheStats {
+    hits: number;
+    misses: number;
+    evictions: number;
+    size: number;
+    capacity: number;
+}
+
+export interface LruCache<T> {
+    get: (key: string) => T | undefined;
+    set: (key: string, value: T) => void;
+    stats: () => CacheStats;
+    clear: () => void;
+}
+
+// Bounded LRU: a Map keeps insertion order, so re-inserting on a hit makes the first key the oldest.
+export const createLruCache = <T>(capacity = 256): LruCache<T> => {
+    const entries = new Map<string, T>();
+    let hits = 0;
+    let misses = 0;
+    let evictions = 0;
+
+    return {
+        get: key => {
+            const value = entries.get(key);
+            if (value === undefined) {
+                misses++;
+                return undefined;
+            }
+            hits++;
+            entries.delete(key);
+            entries.set(key, value);
+            return value;
+        },
+        set: (key, value) => {
+            entries.delete(key);
+            entries.set(key, value);
+            if (entries.size > capacity) {
+                entries.delete(entries.keys().next().value!);
+                evictions++;
+            }
+        },
+        stats: () => ({ hits, misses, evictions, size: entries.size, capacity }),
+        clear: () => {
+            entries.clear();
+            hits = 0;
+            misses = 0;
+            evictions = 0;
+        }
+    };
+};
+
+export interface OutcomeCache extends LruCache<CombatOutcome> {
+    // Cached outcomes are shared between callers and must be treated as read-only.
+    resolve: (board: CombatBoard) => CombatOutcome;
+}
+
+export const createOutcomeCache = (capacity = 256): OutcomeCache => {
+    const cache = createLruCache<CombatOutcome>(capacity);
+    return {
+        ...cache,
+        resolve: board => {
+            const key = hashCombatBoard(board);
+            let outcome = cache.get(key);
+            if (!outcome) {
+                outcome = calculateCombatOutcome(board);
+                cache.set(key, outcome);
+            }
+            return outcome;
+        }
+    };
+};
@@ -0,0 +1,67 @@
+import { describe, it, expect } from 'vitest';
+import { HISTOGRAM_BOUNDS_MS, createProfiler, histogramPercentile } from './profiler';
+
+// A clock that advances by the given steps, one per reading.
+const steppingClock = (...steps: number[]) => {
+    let time = 0;
+    let i = 0;
+    return () => (time += steps[i++ % steps.length]);
+};
+
+describe('Profiler', () => {
+    it('should pass calls straight through while disabled', () => {
+        const profiler = createProfiler();
+        const double = profiler.measure('double', (n: number) => n * 2);
+
+        expect(double(21)).toBe(42);
+        expect(profiler.snapshot()).toEqual({});
+        expect(profiler.exportTrace().traceEvents).toEqual([]);
+    });
+
+    it('should record calls, durations and buckets per action', () => {
+        const profiler = createProfiler({ enabled: true, now: steppingClock(1, 0.2, 1, 30), heapUsed: () => undefined });
+        const action = profiler.measure('nextPhase', () => 'done');
+        action();
+        action();
+
+        const h = profiler.snapshot().nextPhase;
+        expect(h.count).toBe(2);
+        expect(h.totalMs).toBeCloseTo(30.2);
+        expect(h.minMs).toBeCloseTo(0.2);
+        expect(h.maxMs).toBeCloseTo(30);
+        expect(h.buckets[HISTOGRAM_BOUNDS_MS.indexOf(0.25)]).toBe(1);
+        expect(h.buckets[HISTOGRAM_BOUNDS_MS.indexOf(50)]).toBe(1);
+        expect(histogramPercentile(h, 0.5)).toBe(0.25);
+        expect(histogramPercentile(h, 0.95)).toBe(50);
+    });
+
+    it('should export nested sections and async actions as trace events', async () => {
+        const profiler = createProfiler({ enabled: true, now: steppingClock(1), heapUsed: () => undefined });
+        const resolve = profiler.measure('resolveCombat', () => profiler.section('indexCards', () => 1));
+        const plan = profiler.measure('performOpponentBlocks', async () => 2);
+        resolve();
+        await plan();
+
+        const { traceEvents } = profiler.exportTrace();
+        expect(traceEvents.map(e => [e.name, e.cat, e.ph])).toEqual([
+            ['indexCards', 'section', 'X'],
+            ['resolveCombat', 'action', 'X'],
+            ['performOpponentBlocks', 'async', 'X']
+        ]);
+        const [inner, outer] = traceEvents;
+        expect(inner.ts).toBeGreaterThanOrEqual(outer.ts);
+        expect(inner.ts + inner.dur).toBeLessThanOrEqual(outer.ts + outer.dur);
+        expect(outer.dur).toBe(3000); // microseconds
+    });
+
+    it('should sum heap growth where the runtime reports it', () => {
+        let heap = 1000;
+        const profiler = createProfiler({ enabled: true, now: steppingClock(1), heapUsed: () => (heap += 500) });
+        profiler.section('appendLog', () => undefined);
+
+        expect(profiler.snapshot().appendLog.heapBytes).toBe(500);
+        expect(profiler.exportTrace().traceEvents[0].args).toEqual({ heapDelta: 500 });
+        profiler.reset();
+        expect(profiler.snapshot()).toEqual({});
+    });
+});
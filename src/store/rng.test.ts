@@ -0,0 +1,59 @@
+import { describe, it, expect } from 'vitest';
+import { createRng, restoreRng } from './rng';
+import { createBattle, createPlayer } from './gameRules';
+import { useGameStore } from './gameStore';
+
+describe('Seedable RNG', () => {
+    it('should produce the same sequence for the same seed', () => {
+        const a = createRng(42);
+        const b = createRng(42);
+        const seqA = Array.from({ length: 5 }, () => a.next());
+
+        expect(Array.from({ length: 5 }, () => b.next())).toEqual(seqA);
+        expect(createRng(43).next()).not.toBe(seqA[0]);
+        seqA.forEach(x => expect(x >= 0 && x < 1).toBe(true));
+    });
+
+    it('should shuffle into a permutation without touching the input', () => {
+        const list = [1, 2, 3, 4, 5, 6, 7, 8];
+        const shuffled = createRng(7).shuffle(list);
+
+        expect(list).toEqual([1, 2, 3, 4, 5, 6, 7, 8]);
+        expect([...shuffled].sort((x, y) => x - y)).toEqual(list);
+    });
+
+    it('should resume from a saved state and fork independent streams', () => {
+        const rng = createRng(1);
+        rng.next();
+        rng.nextId('card');
+        const resumed = restoreRng(rng.save());
+
+        expect(resumed.next()).toBe(rng.next());
+        expect(resumed.nextId('card')).toBe('card-2');
+        expect(createRng(1).fork(0).next()).toBe(createRng(1).fork(0).next());
+        expect(createRng(1).fork(0).next()).not.toBe(createRng(1).fork(1).next());
+    });
+
+    it('should deal identical battles with identical card ids for a seed', () => {
+        const deal = (seed: number) => {
+            const rng = createRng(seed);
+            return createBattle([createPlayer('player1', 'Player 1', rng), createPlayer('player2', 'Player 2', rng)], rng);
+        };
+
+        expect(deal(99)).toEqual(deal(99));
+        expect(deal(99)[0].battlefield[0].id).toBe('player1-creature-2');
+    });
+
+    it('should replay the roll-off for who attacks first from the battle seed', () => {
+        const rollOff = (seed: number) => {
+            const { shuffleBoard } = useGameStore.getState();
+            shuffleBoard(seed);
+            const { rollD20 } = useGameStore.getState();
+            return [rollD20(), rollD20()];
+        };
+
+        const rolls = rollOff(7);
+        expect(rollOff(7)).toEqual(rolls);
+        rolls.forEach(roll => expect(roll >= 1 && roll <= 20).toBe(true));
+    });
+});
@@ -0,0 +1,67 @@
+// Seedable PRNG (mulberry32) plus a counter for deterministic card ids.
+// Every random decision in a game goes through one of these so a seed fully determines the game.
+
+export interface RngState {
+    seed: number;
+    state: number;
+    idCounter: number;
+}
+
+export interface Rng {
+    readonly seed: number;
+    next: () => number; // uniform in [0, 1)
+    int: (max: number) => number; // uniform integer in [0, max)
+    pick: <T>(list: readonly T[]) => T | undefined;
+    shuffle: <T>(list: readonly T[]) => T[]; // Fisher–Yates, returns a new array
+    nextId: (prefix: string) => string;
+    fork: (stream: number) => Rng; // independent stream, e.g. one per simulated game or worker
+    save: () => RngState;
+}
+
+// splitmix32 finaliser: spreads nearby seeds/stream numbers across the whole state space.
+const mix32 = (value: number): number => {
+    let z = (value + 0x9e3779b9) | 0;
+    z = Math.imul(z ^ (z >>> 16), 0x85ebca6b);
+    z = Math.imul(z ^ (z >>> 13), 0xc2b2ae35);
+    return (z ^ (z >>> 16)) >>> 0;
+};
+
+export const restoreRng = ({ seed, state, idCounter }: RngState): Rng => {
+    let a = state | 0;
+    let counter = idCounter;
+
+    const next = () => {
+        a = (a + 0x6d2b79f5) | 0;
+        let t = a;
+        t = Math.imul(t ^ (t >>> 15), t | 1);
+        t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+        return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+    };
+    const int = (max: number) => Math.floor(next() * max);
+
+    return {
+        seed,
+        next,
+        int,
+        pick: list => (list.length > 0 ? list[int(list.length)] : undefined),
+        shuffle: list => {
+            const result = [...list];
+            for (let i = result.length - 1; i > 0; i--) {
+                const j = int(i + 1);
+                [result[i], result[j]] = [result[j], result[i]];
+            }
+            return result;
+        },
+        nextId: prefix => `${prefix}-${++counter}`,
+        fork: stream => createRng(mix32(seed ^ mix32(stream))),
+        save: () => ({ seed, state: a, idCounter: counter })
+    };
+};
+
+export const createRng = (seed: number): Rng => {
+    const normalized = seed >>> 0;
+    return restoreRng({ seed: normalized, state: mix32(normalized), idCounter: 0 });
+};
+
+// Fresh seed for a session that was not given one explicitly.
+export const randomSeed = (): number => Math.floor(Math.random() * 4294967296);
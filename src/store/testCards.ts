@@ -0,0 +1,11 @@
+import type { Card } from '../types';
+
+// Bare creatures for the engine and planner tests and benchmarks: untapped, undamaged, with the given
+// printed stats and keywords. `counters` is the net counter balance, +n as +1/+1 counters and -n as
+// -1/-1 counters.
+export const creature = (id: string, power: number, toughness: number, keywords: string[] = [], controllerId = 'p1', counters = 0): Card => ({
+    id, name: id, manaCost: '', typeLine: 'Creature', oracleText: '',
+    power: String(power), toughness: String(toughness), colors: [], keywords,
+    tapped: false, damageTaken: 0, controllerId, ownerId: controllerId,
+    plusOneCounters: Math.max(counters, 0), minusOneCounters: Math.max(-counters, 0), summoningSickness: false, shieldCounters: 0
+});
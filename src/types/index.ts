@@ -57,6 +57,33 @@ export interface CombatOutcome {
     attackerLifeGained: number;
     defenderLifeGained: number;
     explanation: string[];
+    // Per-card indexes over `deaths` and `damageEvents`, so a card's result is one lookup.
+    deathIndex: Record<string, true>;
+    damageByCard: Record<string, number>; // combat damage dealt to each creature that was dealt any
+}
+
+// Everything the combat engine needs to resolve one combat, detached from the store.
+export interface CombatBoard {
+    defenderPlayerId: string;
+    attackers: string[]; // attacker IDs in declaration order
+    blockers: Record<string, string[]>; // attacker ID -> blocker IDs in damage assignment order
+    cards: Card[]; // attacking player's battlefield followed by the defending player's
+}
+
+// Battlefield cards normalized by id, derived from `players`; see store/cardTable.ts.
+export interface CardTable {
+    cards: Record<string, Card>;
+    battlefields: Record<string, string[]>; // player ID -> card IDs in battlefield order
+}
+
+// The game log as a chunked ring; see store/gameLog.ts.
+export interface GameLog {
+    chunks: string[][]; // oldest first; every chunk but the last is full
+    length: number; // entries in the ring
+    first: number; // sequence number of the oldest entry in the ring, counting from 0
+    capacity: number;
+    archive: string[][] | null; // chunks that left the ring, when archiving
+    archived: number; // archive chunks that belong to this version
 }
 
 export interface GameState {
@@ -95,7 +122,8 @@ export interface GameState {
     autoBattleTimeout: any | null;
     showTurnBanner: string | null;
     selectedCardId: string | null;
-    log: string[];
+    log: GameLog;
+    board: CardTable;
     winner: string | null;
     showStartPrompt: boolean;
     showSkipCombatConfirmation: boolean;
@@ -113,8 +141,8 @@ export interface GameState {
     ) => void;
     closeQuiz: () => void;
     cancelQuiz: () => void;
-    performOpponentAttacks: () => void;
-    performOpponentBlocks: () => void;
+    performOpponentAttacks: () => Promise<void>;
+    performOpponentBlocks: () => Promise<void>;
     resetBlockers: () => void;
     getCombatHints: () => string[];
     shuffleBoard: () => void;
@@ -136,4 +164,5 @@ export interface GameState {
     declareBlocker: (attackerId: string, blockerId: string) => void;
     unassignBlocker: (blockerId: string) => void;
     reorderBlockers: (attackerId: string, blockerId: string, direction: 'up' | 'down') => void;
+    setBlockerOrder: (attackerId: string, order: string[]) => void;
 }
@@ -8,4 +8,15 @@ export default defineConfig({
     react(),
     tailwindcss(),
   ],
+  build: {
+    // dist/.vite/manifest.json is what scripts/bundleReport.ts reads to size the startup chunks.
+    manifest: true,
+    rollupOptions: {
+      // The card art service worker is its own entry and must live at a fixed URL at the site root.
+      input: { main: 'index.html', sw: 'src/images/serviceWorker.ts' },
+      output: {
+        entryFileNames: chunk => (chunk.name === 'sw' ? 'sw.js' : 'assets/[name]-[hash].js'),
+      },
+    },
+  },
 })